@@ -0,0 +1,278 @@
+#! /usr/bin/env python3
+"""
+Benchmarks the pipeline on synthetic address registers of growing size:
+
+    python benchmark.py run                                  # 10k, 100k and 1M addresses
+    python benchmark.py run --sizes 10000 --latency 0.2 --error-rate 0.05
+
+For every size it generates a register shaped like Adres_uniwersalny, scrapes a sample of it against
+mock_maps_server.py, fills a travel_info database with every address and builds each map from it.
+Every step runs in its own process, so its wall time and peak RSS are measured separately.
+Results are printed and written to <out>/report.json.
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from create_map import MAPS, build_map, cached_travel_info
+from mock_maps_server import travel_seconds
+from scrape_addresses import CITY_SUFFIX, initialize_database
+
+SIZES = [10_000, 100_000, 1_000_000]
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+# South, west, north, east
+WARSAW_BBOX = (52.10, 20.85, 52.37, 21.27)
+HOUSES_PER_STREET = 200
+
+
+def synthetic_register(rows, seed=0):
+    """
+    `rows` addresses along straight streets scattered over Warsaw, as a DataFrame with the 12 columns
+    of the register. Only the street, number and coordinates (columns 6, 7, 10 and 11) carry data.
+    """
+    rng = np.random.default_rng(seed)
+    streets = -(-rows // HOUSES_PER_STREET)
+    south, west, north, east = WARSAW_BBOX
+    start_latitudes = rng.uniform(south, north, streets)
+    start_longitudes = rng.uniform(west, east, streets)
+    bearings = rng.uniform(0, np.pi, streets)
+    lengths = rng.uniform(0.003, 0.02, streets)
+
+    street = np.arange(rows) // HOUSES_PER_STREET
+    number = np.arange(rows) % HOUSES_PER_STREET + 1
+    along = lengths[street] * number / HOUSES_PER_STREET
+    # A degree of longitude is about 0.6 of a degree of latitude here
+    latitudes = np.clip(start_latitudes[street] + np.sin(bearings[street]) * along + rng.normal(0, 1e-4, rows),
+                        south, north)
+    longitudes = np.clip(start_longitudes[street] + np.cos(bearings[street]) * along / 0.6 + rng.normal(0, 1e-4, rows),
+                         west, east)
+
+    def decimal_comma(values):
+        return pd.Series(values).map('{:.7f}'.format).str.replace('.', ',', regex=False)
+
+    filler = np.full(rows, '', dtype=object)
+    return pd.DataFrame({
+        'id': np.arange(1, rows + 1), 'teryt': filler, 'gmina': 'Warszawa', 'miejscowosc': 'Warszawa',
+        'kod_pocztowy': filler, 'ulica': 'ulica Próbna ' + pd.Series(street).astype(str),
+        'numer': pd.Series(number).astype(str), 'status': filler, 'zrodlo': filler,
+        'szerokosc': decimal_comma(latitudes), 'dlugosc': decimal_comma(longitudes), 'data': filler,
+    })
+
+
+def fill_travel_info(db_path, register):
+    """
+    A travel_info row for every register address, with the travel times mock_maps_server.py would answer,
+    so maps are built at the full register size without scraping all of it.
+    """
+    origins = (register['ulica'] + ', ' + register['numer']).tolist()
+    # The scraper sends the origin with the city appended
+    seeds = [origin + CITY_SUFFIX for origin in origins]
+    transit = (np.array([travel_seconds(seed, 'transit') for seed in seeds]) / 60).round()
+    # Average of the free-flow and the 20% longer in-traffic car durations
+    car = (np.array([travel_seconds(seed, 'driving') for seed in seeds]) / 60 * 1.1).round()
+    # One to three rides per trip
+    transfers = np.array([zlib.crc32(seed.encode('utf-8')) % 3 for seed in seeds])
+    latitudes = register['szerokosc'].str.replace(',', '.').astype(float)
+    longitudes = register['dlugosc'].str.replace(',', '.').astype(float)
+    conn = initialize_database(db_path)
+    conn.executemany(
+        "INSERT INTO travel_info (street, latitude, longitude, transit_duration, transfers, car_duration_avg) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        zip(origins, latitudes.tolist(), longitudes.tolist(), transit.tolist(), transfers.tolist(), car.tolist()))
+    conn.commit()
+    conn.close()
+
+
+def run_measured(command, log_path):
+    """Runs a command with its output in `log_path`, returns its wall time, peak RSS in MB and exit code"""
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(process.pid, 0)
+    return {
+        'seconds': round(time.perf_counter() - start, 2),
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': round(usage.ru_maxrss / 1024, 1),
+        'exit_code': os.waitstatus_to_exitcode(status),
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+def start_mock_server(args):
+    port = free_port()
+    server = subprocess.Popen([
+        sys.executable, os.path.join(REPO_DIR, 'mock_maps_server.py'), '--port', str(port),
+        '--latency', str(args.latency), '--error-rate', str(args.error_rate),
+        '--no-route-rate', str(args.no_route_rate), '--seed', str(args.seed),
+    ], stdout=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            socket.create_connection(('localhost', port), timeout=0.1).close()
+            return server, f'http://localhost:{port}/maps/api'
+        except OSError:
+            time.sleep(0.05)
+    server.kill()
+    raise RuntimeError('The mock Maps API server did not start')
+
+
+def file_mb(path):
+    """Size of a file in MB, together with its SQLite write-ahead log if it has one"""
+    if not os.path.exists(path):
+        return None
+    size = sum(os.path.getsize(p) for p in (path, f'{path}-wal') if os.path.exists(p))
+    return round(size / 1024 / 1024, 2)
+
+
+def benchmark_size(rows, args, endpoint):
+    """Runs every step for a register of `rows` addresses, returns their measurements"""
+    directory = os.path.join(args.out, str(rows))
+    os.makedirs(os.path.join(directory, 'maps'), exist_ok=True)
+    csv_path, scrape_db, maps_db = (os.path.join(directory, name) for name in ('register.csv', 'scrape.db', 'maps.db'))
+    for path in (scrape_db, maps_db):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+    result = {'rows': rows}
+
+    start = time.perf_counter()
+    register = synthetic_register(rows, args.seed)
+    register.to_csv(csv_path, sep=';', index=False)
+    result['register'] = {'seconds': round(time.perf_counter() - start, 2), 'csv_mb': file_mb(csv_path)}
+    print(f"📄 {rows} addresses, {result['register']['csv_mb']} MB")
+
+    metrics_path = os.path.join(directory, 'scrape_metrics.json')
+    scrape = run_measured([
+        sys.executable, os.path.join(REPO_DIR, 'scrape_addresses.py'), '--csv', csv_path, '--db', scrape_db,
+        '--no-cache', '--sample-rate', str(args.sample_rate), '--seed', str(args.seed), '--workers', str(args.workers),
+        '--qps', str(args.qps), '--backend', args.backend, '--endpoint', f'{endpoint}/directions/json',
+        '--matrix-endpoint', f'{endpoint}/distancematrix/json', '--metrics-json', metrics_path,
+        '--metrics-interval', '3600',
+    ], os.path.join(directory, 'scrape.log'))
+    if os.path.exists(metrics_path):
+        with open(metrics_path, encoding='utf-8') as f:
+            metrics = json.load(f)
+        scrape.update({key: metrics[key] for key in ('rows_stored', 'rows_per_minute', 'api_requests_per_row',
+                                                     'no_routes_found', 'http_statuses', 'latency_seconds')})
+    scrape['db_mb'] = file_mb(scrape_db)
+    result['scrape'] = scrape
+    print(f"🕸️  Scraped {scrape.get('rows_stored')} rows in {scrape['seconds']} s "
+          f"({scrape.get('rows_per_minute')}/min, peak RSS {scrape['peak_rss_mb']} MB)")
+
+    start = time.perf_counter()
+    fill_travel_info(maps_db, register)
+    result['travel_info'] = {'seconds': round(time.perf_counter() - start, 2), 'db_mb': file_mb(maps_db)}
+    for script, data_file in (('districts.py', 'warszawa-dzielnice.geojson'), ('metro.py', 'metro-stations.csv')):
+        if os.path.exists(data_file):
+            step = run_measured([sys.executable, os.path.join(REPO_DIR, script), '--db', maps_db],
+                                os.path.join(directory, script.replace('.py', '.log')))
+            result[script.replace('.py', '')] = step
+    result['travel_info']['db_mb_with_side_tables'] = file_mb(maps_db)
+
+    result['maps'] = {}
+    for name, spec in MAPS.items():
+        missing = [path for path in spec.get('files', []) if not os.path.exists(path)]
+        if missing:
+            print(f"⏭️  {name}: missing {', '.join(missing)}")
+            continue
+        timings_path = os.path.join(directory, 'maps', f'{name}.json')
+        step = run_measured([sys.executable, os.path.abspath(__file__), 'plot', name, '--db', maps_db,
+                             '--output-dir', os.path.join(directory, 'maps'), '--timings', timings_path],
+                            os.path.join(directory, 'maps', f'{name}.log'))
+        if os.path.exists(timings_path):
+            with open(timings_path, encoding='utf-8') as f:
+                step.update(json.load(f))
+        step['html_mb'] = file_mb(os.path.join(directory, 'maps', f'{name}.html'))
+        result['maps'][name] = step
+        if step['exit_code']:
+            print(f"💥 {name}: exit code {step['exit_code']}, peak RSS {step['peak_rss_mb']} MB")
+        else:
+            print(f"🗺️  {name}: {step['plot_seconds']} s, peak RSS {step['peak_rss_mb']} MB, {step['html_mb']} MB")
+    return result
+
+
+def print_report(results):
+    print("📊 Seconds / peak RSS MB / output MB per size:")
+    print(f"   {'step':<32}" + ''.join(f"{result['rows']:>26}" for result in results))
+
+    def line(label, cells):
+        print(f"   {label:<32}" + ''.join(f"{cell:>26}" for cell in cells))
+
+    line('scrape', [f"{r['scrape']['seconds']} / {r['scrape']['peak_rss_mb']} / {r['scrape']['db_mb']}" for r in results])
+    line('scrape rows per minute', [str(r['scrape'].get('rows_per_minute')) for r in results])
+    line('travel_info', [f"{r['travel_info']['seconds']} / - / {r['travel_info']['db_mb']}" for r in results])
+    for step in ('districts', 'metro'):
+        if all(step in r for r in results):
+            line(step, [f"{r[step]['seconds']} / {r[step]['peak_rss_mb']} / -" for r in results])
+
+    def map_cell(step):
+        if step['exit_code']:
+            return f"exit {step['exit_code']} / {step['peak_rss_mb']} / -"
+        return f"{step['plot_seconds']} / {step['peak_rss_mb']} / {step['html_mb']}"
+
+    for name in results[0]['maps']:
+        line(name, [map_cell(r['maps'][name]) if name in r['maps'] else '-' for r in results])
+
+
+def plot(args):
+    """Child process of one map: times loading travel_info and building the map separately"""
+    start = time.perf_counter()
+    if 'columns' in MAPS[args.map]:
+        cached_travel_info(args.db, None)
+    load_seconds = time.perf_counter() - start
+    _, plot_seconds = build_map(args.map, args.db, True, None, args.output_dir)
+    with open(args.timings, 'w', encoding='utf-8') as f:
+        json.dump({'load_seconds': round(load_seconds, 2), 'plot_seconds': round(plot_seconds, 2)}, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scraping and map builds on synthetic registers')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run_parser = subparsers.add_parser('run', help='run the benchmark')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='register sizes in addresses')
+    run_parser.add_argument('--out', default='benchmark_runs', help='directory of generated data and the report')
+    run_parser.add_argument('--sample-rate', type=float, default=0.01, help='fraction of the register scraped')
+    run_parser.add_argument('--workers', type=int, default=8, help='scraper workers')
+    run_parser.add_argument('--qps', type=float, default=1000, help='scraper request rate limit')
+    run_parser.add_argument('--backend', choices=['directions', 'matrix'], default='directions')
+    run_parser.add_argument('--latency', type=float, default=0.05, help='mean mock API latency in seconds')
+    run_parser.add_argument('--error-rate', type=float, default=0.01, help='fraction of mock API requests failing')
+    run_parser.add_argument('--no-route-rate', type=float, default=0.01, help='fraction of origins without a route')
+    run_parser.add_argument('--seed', type=int, default=0, help='seed of the register, sampling and mock failures')
+    plot_parser = subparsers.add_parser('plot', help='build one map and record its timings (used by run)')
+    plot_parser.add_argument('map')
+    plot_parser.add_argument('--db', required=True)
+    plot_parser.add_argument('--output-dir', required=True)
+    plot_parser.add_argument('--timings', required=True)
+    args = parser.parse_args()
+
+    if args.command == 'plot':
+        plot(args)
+        return
+
+    server, endpoint = start_mock_server(args)
+    try:
+        results = [benchmark_size(rows, args, endpoint) for rows in args.sizes]
+    finally:
+        server.terminate()
+    with open(os.path.join(args.out, 'report.json'), 'w', encoding='utf-8') as f:
+        json.dump({'settings': {key: value for key, value in vars(args).items() if key != 'command'},
+                   'results': results}, f, indent=2, ensure_ascii=False)
+    print_report(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,312 @@
+import json
+
+import folium
+from folium.elements import MacroElement
+from folium.plugins import HeatMap
+from folium.vector_layers import path_options
+from jinja2 import Template
+
+import palettes
+
+
+def compact_json(rows):
+    # Six decimals is about 10 cm, more precision only inflates the file
+    return json.dumps([[round(row[0], 6), round(row[1], 6), *row[2:]] for row in rows],
+                      ensure_ascii=False, separators=(',', ':'))
+
+
+class CompactCircleLayer(folium.map.Layer):
+    """
+    Draws many circle markers from one embedded JSON array instead of a JavaScript object per marker.
+    Each row starts with latitude and longitude; `style` and `popup` are JavaScript functions of a row
+    returning Leaflet path options and popup HTML, so colors and popups are computed in the browser.
+    Popups are built lazily on click and markers are drawn on a canvas, which keeps large maps responsive.
+    `rows` may also be a JavaScript expression evaluating to the rows, see shared_rows().
+    """
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = (function() {
+                function hex2(value) {
+                    return ('0' + value.toString(16)).slice(-2);
+                }
+                function pyFloat(value) {
+                    return Number.isInteger(value) ? value.toFixed(1) : String(value);
+                }
+                function escapeHtml(text) {
+                    return String(text).replace(/[&<>"']/g, function(c) {
+                        return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+                    });
+                }
+                var rows = {{ this.rows }};
+                var options = {{ this.options|tojson }};
+                var popupOptions = {{ this.popup_options|tojson }};
+                var style = {{ this.style }};
+                var popup = {{ this.popup }};
+                var renderer = L.canvas();
+                var group = L.featureGroup();
+                rows.forEach(function(row) {
+                    var marker = L.circleMarker([row[0], row[1]], Object.assign({renderer: renderer}, options, style(row)));
+                    marker.bindPopup(function() { return popup(row); }, popupOptions);
+                    group.addLayer(marker);
+                });
+                return group;
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, rows, style, popup, popup_options=None, name=None, overlay=True, control=False,
+                 show=True, **kwargs):
+        super().__init__(name=name, overlay=overlay, control=control, show=show)
+        self._name = 'CompactCircleLayer'
+        self.rows = rows if isinstance(rows, str) else compact_json(rows)
+        self.options = path_options(line=False, **kwargs)
+        self.popup_options = popup_options or {}
+        self.style = style
+        self.popup = popup
+
+
+class SharedDataset(MacroElement):
+    """
+    Row arrays (each row starting with latitude and longitude) and GeoJSON embedded once in a map as one
+    JavaScript object, e.g. {addresses: [...], districts: {...}}. Layers built on it with shared_rows()
+    pick and reshape their rows in the browser instead of embedding their own copy of the data.
+    Must be added to the map before those layers.
+    """
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = {{ this.payload }};
+        {% endmacro %}
+    """)
+
+    def __init__(self, geojson=None, **sources):
+        super().__init__()
+        self._name = 'SharedDataset'
+        parts = {name: compact_json(rows) for name, rows in sources.items()}
+        parts.update({name: json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+                      for name, data in (geojson or {}).items()})
+        self.payload = '{' + ','.join(f'{json.dumps(name)}:{text}' for name, text in parts.items()) + '}'
+
+
+def shared_rows(dataset, source, select):
+    """
+    JavaScript expression of the rows a layer derives from `source` of a SharedDataset:
+    `select` is a JavaScript function of a row returning the layer's row, or null to leave it out.
+    """
+    return f"{dataset.get_name()}[{json.dumps(source)}].map({select}).filter(function(row) {{ return row !== null; }})"
+
+
+class SharedHeatMap(HeatMap):
+    """HeatMap of [latitude, longitude] rows given as a JavaScript expression, see shared_rows()"""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = L.heatLayer(
+                {{ this.rows }},
+                {{ this.options|tojson }}
+            );
+        {% endmacro %}
+    """)
+
+    def __init__(self, rows, **kwargs):
+        super().__init__([], **kwargs)
+        self.rows = rows
+
+
+class SharedGeoJson(folium.map.Layer):
+    """
+    GeoJSON layer of a SharedDataset entry with a fixed style and a tooltip of one feature property,
+    like folium.GeoJson with a style_function and GeoJsonTooltip, without embedding the geometry again.
+    """
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }} = L.geoJson({{ this.dataset.get_name() }}[{{ this.source|tojson }}], {
+                style: function() { return {{ this.style|tojson }}; },
+                onEachFeature: function(feature, layer) {
+                    var text = String((feature.properties || {})[{{ this.field|tojson }}]).replace(/[&<>"']/g, function(c) {
+                        return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+                    });
+                    layer.bindTooltip('<b>' + {{ this.alias|tojson }} + '</b> ' + text, {sticky: true});
+                }
+            });
+        {% endmacro %}
+    """)
+
+    def __init__(self, dataset, source, style, field='name', alias='District:', name=None, overlay=True,
+                 control=True, show=True):
+        super().__init__(name=name, overlay=overlay, control=control, show=show)
+        self._name = 'SharedGeoJson'
+        self.dataset = dataset
+        self.source = source
+        self.style = style
+        self.field = field
+        self.alias = alias
+
+
+class LayerLegend(MacroElement):
+    """Legend HTML shown only while `layer` is on the map, following the layer control"""
+
+    _template = Template("""
+        {% macro html(this, kwargs) %}
+            <div id="{{ this.get_name() }}">{{ this.html }}</div>
+        {% endmacro %}
+        {% macro script(this, kwargs) %}
+            (function() {
+                var map = {{ this._parent.get_name() }}, layer = {{ this.layer.get_name() }};
+                var legend = document.getElementById({{ this.get_name()|tojson }});
+                function update() {
+                    legend.style.display = map.hasLayer(layer) ? '' : 'none';
+                }
+                map.on('overlayadd overlayremove', update);
+                update();
+            })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, layer, html):
+        super().__init__()
+        self._name = 'LayerLegend'
+        self.layer = layer
+        self.html = html
+
+
+# Rows: [latitude, longitude, transit_duration, street]
+DURATION_STYLE_JS = f"""function(row) {{
+    var t = row[2], color, v;
+    if (t === null) {{
+        color = 'gray';
+    }} else if (t < {palettes.MIN_TIME_GREEN}) {{
+        color = '#0c0';
+    }} else if (t > {palettes.MAX_TIME_BLACK}) {{
+        color = 'black';
+    }} else if (t > {palettes.MID_TIME_RED}) {{
+        v = Math.trunc((t - {palettes.MID_TIME_RED}) / {palettes.MAX_TIME_BLACK - palettes.MID_TIME_RED} * {palettes.MAX_COLOR_VAL});
+        color = '#' + hex2({palettes.MAX_COLOR_VAL} - v) + '0000';
+    }} else if (t > {palettes.MID_TIME_YELLOW}) {{
+        v = Math.trunc((t - {palettes.MID_TIME_YELLOW}) / {palettes.MID_TIME_RED - palettes.MID_TIME_YELLOW} * {palettes.MAX_COLOR_VAL});
+        color = '#' + hex2({palettes.MAX_COLOR_VAL}) + hex2({palettes.MAX_COLOR_VAL} - v) + '00';
+    }} else {{
+        v = Math.trunc((t - {palettes.MIN_TIME_GREEN}) / {palettes.MID_TIME_YELLOW - palettes.MIN_TIME_GREEN} * {palettes.MAX_COLOR_VAL});
+        color = '#' + hex2(v) + hex2({palettes.MAX_COLOR_VAL}) + '00';
+    }}
+    return {{color: color, fillColor: color}};
+}}"""
+
+DURATION_POPUP_JS = """function(row) {
+    return 'Address: ' + escapeHtml(row[3]) + ' (' + (row[2] === null ? 'N/A' : pyFloat(row[2])) + ' min)';
+}"""
+
+
+def transfer_style_js(transfer_colors):
+    """Rows: [latitude, longitude, transit_duration, transfers, street]"""
+    return f"""function(row) {{
+    var colors = {json.dumps({str(k): v for k, v in transfer_colors.items()})};
+    var transfers = row[3], color;
+    if (transfers in colors) {{
+        color = colors[transfers];
+    }} else if (transfers >= 3) {{
+        color = colors[3];
+    }} else {{
+        color = '#808080';
+    }}
+    return {{fillColor: color, radius: Math.min(10, Math.max(4, 4 + (row[2] || 0) / 10))}};
+}}"""
+
+
+TRANSFER_POPUP_JS = """function(row) {
+    var transfers = row[3], text;
+    if (transfers === 0) {
+        text = '🚊 Direct connection (no transfers)';
+    } else if (transfers === 1) {
+        text = '🔄 1 transfer required';
+    } else if (transfers === 2) {
+        text = '🔄🔄 2 transfers required';
+    } else {
+        text = '🔄 ' + transfers + ' transfers required';
+    }
+    var time = row[2] === null ? 'N/A' : row[2].toFixed(1);
+    return '<b>' + escapeHtml(row[4]) + '</b><br>🚊 Transit time: ' + time + ' min<br>' + text + '<br>';
+}"""
+
+
+def comparison_style_js(thresholds, colors):
+    """Rows: [latitude, longitude, transit_duration, car_duration_avg, street]"""
+    return f"""function(row) {{
+    var thresholds = {json.dumps(thresholds)};
+    var colors = {json.dumps(colors)};
+    function interpolate(color1, color2, ratio) {{
+        var result = '#';
+        for (var i = 1; i < 7; i += 2) {{
+            var a = parseInt(color1.slice(i, i + 2), 16), b = parseInt(color2.slice(i, i + 2), 16);
+            result += hex2(Math.trunc(a + (b - a) * ratio));
+        }}
+        return result;
+    }}
+    var diff = row[2] - row[3], color;
+    if (diff < thresholds.excellent) {{
+        color = colors.excellent;
+    }} else if (diff < thresholds.good) {{
+        color = interpolate(colors.excellent, colors.good, diff / thresholds.good);
+    }} else if (diff < thresholds.acceptable) {{
+        color = interpolate(colors.good, colors.acceptable, (diff - thresholds.good) / (thresholds.acceptable - thresholds.good));
+    }} else if (diff < thresholds.poor) {{
+        color = interpolate(colors.acceptable, colors.poor, (diff - thresholds.acceptable) / (thresholds.poor - thresholds.acceptable));
+    }} else if (diff < thresholds.very_poor) {{
+        color = interpolate(colors.poor, colors.very_poor, (diff - thresholds.poor) / (thresholds.very_poor - thresholds.poor));
+    }} else {{
+        color = interpolate(colors.very_poor, colors.extreme, Math.min(1.0, (diff - 20) / 20));
+    }}
+    return {{fillColor: color, radius: Math.min(12, Math.max(6, 6 + Math.abs(diff) / 8))}};
+}}"""
+
+
+COMPARISON_POPUP_JS = """function(row) {
+    var transit = row[2], car = row[3], diff = transit - car, status;
+    if (diff < 0) {
+        status = '🚊 Public transport faster by ' + Math.abs(diff).toFixed(1) + ' min';
+    } else if (diff < 10) {
+        status = '🚊 Public transport slightly slower by ' + diff.toFixed(1) + ' min';
+    } else if (diff < 15) {
+        status = '🚗 Car moderately faster by ' + diff.toFixed(1) + ' min';
+    } else if (diff < 20) {
+        status = '🚗 Car significantly faster by ' + diff.toFixed(1) + ' min';
+    } else {
+        status = '🚗 Car much faster by ' + diff.toFixed(1) + ' min';
+    }
+    return '<b>' + escapeHtml(row[4]) + '</b><br>🚊 Public transport: ' + transit.toFixed(1) + ' min<br>' +
+        '🚗 Car: ' + car.toFixed(1) + ' min<br><b>' + status + '</b>';
+}"""
+
+
+def catchment_style_js(color, max_distance_m):
+    """Rows: [latitude, longitude, station_distance_m, transit_duration, station, street]"""
+    return f"""function(row) {{
+    return {{fillColor: '{color}', fillOpacity: 0.9 - 0.6 * Math.min(1, row[2] / {max_distance_m})}};
+}}"""
+
+
+CATCHMENT_POPUP_JS = """function(row) {
+    var time = row[3] === null ? 'N/A' : row[3].toFixed(1);
+    return '<b>' + escapeHtml(row[5]) + '</b><br>🚇 ' + escapeHtml(row[4]) + ': ' + row[2] + ' m<br>' +
+        '🚊 Transit time: ' + time + ' min';
+}"""
+
+
+# Dashboard address rows: [latitude, longitude, transit_duration, transfers, car_duration_avg, street],
+# reshaped into the rows of the style and popup functions above
+DASHBOARD_DURATION_JS = "function(r) { return [r[0], r[1], r[2], r[5]]; }"
+DASHBOARD_TRANSFER_JS = "function(r) { return r[3] === null ? null : [r[0], r[1], r[2], r[3], r[5]]; }"
+DASHBOARD_COMPARISON_JS = "function(r) { return r[2] === null || r[4] === null ? null : [r[0], r[1], r[2], r[4], r[5]]; }"
+
+
+def dashboard_short_time_js(limit):
+    """[latitude, longitude] of addresses under `limit` minutes, as map_data.short_time_rows"""
+    return f"function(r) {{ return r[2] !== null && r[2] < {limit} ? [r[0], r[1]] : null; }}"
+
+
+# Rows: [latitude, longitude, name, line]
+STATION_POPUP_JS = """function(row) {
+    return escapeHtml(row[2]) + ' (' + escapeHtml(row[3]) + ')';
+}"""
@@ -1,113 +1,252 @@
+import argparse
+import functools
+import inspect
+import math
+import os
 import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import folium
 from folium.plugins import HeatMap
-import pandas as pd
-import math
-import json
+import numpy as np
+
+from tiles import TILE_LAYERS, DEFAULT_ZOOMS, update_tiles
+from compact_layers import (CompactCircleLayer, DURATION_STYLE_JS, DURATION_POPUP_JS, transfer_style_js,
+                            TRANSFER_POPUP_JS, comparison_style_js, COMPARISON_POPUP_JS, catchment_style_js,
+                            CATCHMENT_POPUP_JS, SharedDataset, SharedHeatMap, SharedGeoJson, LayerLegend, shared_rows,
+                            DASHBOARD_DURATION_JS, DASHBOARD_TRANSFER_JS, DASHBOARD_COMPARISON_JS,
+                            dashboard_short_time_js, STATION_POPUP_JS)
+from map_data import (load_travel_info, records, transfer_rows, comparison_rows, short_time_rows,
+                      transfer_counts, SHORT_TIME_MINUTES)
+from palettes import (MIN_TIME_GREEN, MID_TIME_YELLOW, MID_TIME_RED, MAX_TIME_BLACK, MAX_COLOR_VAL, TRANSFER_COLORS,
+                      COMPARISON_THRESHOLDS, COMPARISON_COLORS, METRO_LINE_COLORS, duration_colors, transfer_colors,
+                      comparison_colors)
+from districts import DISTRICTS_GEOJSON, SIMPLIFY_TOLERANCE_M, district_geometry, district_stats, update_districts
+from metro import STATIONS_CSV, WALKING_DISTANCE_M, load_stations, update_metro
+from snapshot import is_snapshot
+from fingerprints import FingerprintStore, frame_digest, file_digest, combine
+
+
+def add_duration_points(m, frame, compact):
+    """Circle per address colored by transit duration, shared by the all-points maps"""
+    data = records(frame, ['latitude', 'longitude', 'transit_duration', 'street'])
+    if compact:
+        CompactCircleLayer(data, DURATION_STYLE_JS, DURATION_POPUP_JS, radius=4, fill=True, fill_opacity=0.7).add_to(m)
+        return
+
+    colors = duration_colors(frame['transit_duration'])
+    for (lat, lon, travel_time, address), color in zip(data, colors):
+        # Add a label with address and travel time
+        label = f"Address: {address} ({travel_time if travel_time is not None else 'N/A'} min)"
+        folium.CircleMarker(location=[lat, lon], radius=4, color=color, fill=True, fill_opacity=0.7, popup=label).add_to(m)
+
+
+def get_status_text(time_diff):
+    """Get descriptive text for the time difference"""
+    if time_diff < 0:
+        return f"🚊 Public transport faster by {abs(time_diff):.1f} min"
+    elif time_diff < 10:
+        return f"🚊 Public transport slightly slower by {time_diff:.1f} min"
+    elif time_diff < 15:
+        return f"🚗 Car moderately faster by {time_diff:.1f} min"
+    elif time_diff < 20:
+        return f"🚗 Car significantly faster by {time_diff:.1f} min"
+    else:
+        return f"🚗 Car much faster by {time_diff:.1f} min"
+
+
+def add_comparison_points(m, frame, compact):
+    """Circle per address colored by the transit minus car time difference, shared by the comparison maps"""
+    frame = comparison_rows(frame)
+    data = records(frame, ['latitude', 'longitude', 'transit_duration', 'car_duration_avg', 'street'])
+    if compact:
+        CompactCircleLayer(data, comparison_style_js(COMPARISON_THRESHOLDS, COMPARISON_COLORS), COMPARISON_POPUP_JS,
+                           popup_options={'maxWidth': 300}, weight=0, fill=True, fill_opacity=0.9).add_to(m)
+        return
+
+    time_diffs = (frame['transit_duration'] - frame['car_duration_avg']).to_numpy()
+    # Circle size grows with the difference magnitude
+    radii = np.clip(6 + np.abs(time_diffs) / 8, 6, 12)
+    for (lat, lon, transit_time, car_time, address), time_diff, color, radius in zip(
+            data, time_diffs, comparison_colors(time_diffs), radii):
+        # Create popup with detailed information
+        popup_text = f"""
+        <b>{address}</b><br>
+        🚊 Public transport: {transit_time:.1f} min<br>
+        🚗 Car: {car_time:.1f} min<br>
+        <b>{get_status_text(time_diff)}</b>
+        """
+
+        folium.CircleMarker(
+            location=[lat, lon],
+            radius=radius,
+            weight=0,
+            fill=True,
+            fillColor=color,
+            fillOpacity=0.9,
+            popup=folium.Popup(popup_text, max_width=300)
+        ).add_to(m)
 
 
-def plot_all_points():
-    # Connect to the SQLite database
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
+def add_comparison_legend(m, side='left', layer=None):
+    colors = COMPARISON_COLORS
+    legend_html = f'''
+    <div style="position: fixed;
+                bottom: 50px; {side}: 50px; width: 200px; height: 180px;
+                background-color: white; border:2px solid grey; z-index:9999;
+                font-size:14px; padding: 10px">
+    <p><b>Transport Comparison</b></p>
+    <p><i class="fa fa-circle" style="color:{colors['excellent']}"></i> Public transport faster</p>
+    <p><i class="fa fa-circle" style="color:{colors['good']}"></i> Slightly slower (0-10 min)</p>
+    <p><i class="fa fa-circle" style="color:{colors['acceptable']}"></i> Moderate difference (10-15 min)</p>
+    <p><i class="fa fa-circle" style="color:{colors['poor']}"></i> Significant difference (15-20 min)</p>
+    <p><i class="fa fa-circle" style="color:{colors['very_poor']}"></i> Very poor (20+ min)</p>
+    </div>
+    '''
+    if layer is not None:
+        LayerLegend(layer, legend_html).add_to(m)
+    else:
+        m.get_root().html.add_child(folium.Element(legend_html))
+
+
+def add_transfer_legend(m, side='left', layer=None):
+    legend_html = f'''
+    <div style="position: fixed;
+                bottom: 50px; {side}: 50px; width: 220px; height: 150px;
+                background-color: white; border:2px solid grey; z-index:9999;
+                font-size:14px; padding: 10px">
+    <p><b>Transfer Analysis</b></p>
+    <p><i class="fa fa-circle" style="color:{TRANSFER_COLORS[0]}"></i> 0 transfers (direct)</p>
+    <p><i class="fa fa-circle" style="color:{TRANSFER_COLORS[1]}"></i> 1 transfer</p>
+    <p><i class="fa fa-circle" style="color:{TRANSFER_COLORS[2]}"></i> 2 transfers</p>
+    <p><i class="fa fa-circle" style="color:{TRANSFER_COLORS[3]}"></i> 3+ transfers</p>
+    <p><small>Fewer transfers = better service</small></p>
+    </div>
+    '''
+    if layer is not None:
+        LayerLegend(layer, legend_html).add_to(m)
+    else:
+        m.get_root().html.add_child(folium.Element(legend_html))
+
+
+def add_district_borders(m, tolerance_m=SIMPLIFY_TOLERANCE_M):
+    """Add district borders on top, simplified to `tolerance_m` meters"""
+    geojson_data = district_geometry(DISTRICTS_GEOJSON, tolerance_m)
+
+    def district_style(feature):
+        return {
+            'fillColor': 'transparent',
+            'color': '#1e3a5f',  # Dark blue border
+            'weight': 2.5,
+            'fillOpacity': 0
+        }
+
+    folium.GeoJson(
+        geojson_data,
+        name='Warsaw Districts',
+        style_function=district_style,
+        tooltip=folium.GeoJsonTooltip(
+            fields=['name'],
+            aliases=['District:'],
+            style='background-color: white; color: #333; font-weight: bold;'
+        )
+    ).add_to(m)
 
-    # Query to get the data including address
-    cursor.execute('SELECT latitude, longitude, transit_duration, street FROM travel_info')
-    data = cursor.fetchall()
 
-    # Close the database connection
-    conn.close()
+def plot_all_points(frame=None, compact=True, output='static/public_transport.html'):
+    """
+    Creates a map of all addresses colored by public transport travel time.
+    With compact=True the points are embedded as a single data array and colored in the browser,
+    which looks the same but makes the HTML much smaller than one CircleMarker per point.
+    """
+    frame = frame if frame is not None else load_travel_info()
 
     # Create a base map
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
-    min_time_green = 10
-    mid_time_yellow = 25
-    mid_time_red = 40
-    max_time_black = 55
-    max_color_val=204
-
-    for lat, lon, travel_time, address in data:
-        if travel_time is not None:
-            # Determine color based on travel time
-            if travel_time < min_time_green:
-                color = '#0c0'
-            elif travel_time > max_time_black:
-                color = 'black'
-            elif travel_time > mid_time_red:
-                # Red to black
-                color_value = int((travel_time - mid_time_red) / (max_time_black - mid_time_red) * max_color_val)
-                color = f'#{max_color_val - color_value:02x}0000'
-            elif travel_time > mid_time_yellow:
-                # Yellow to red
-                color_value = int((travel_time - mid_time_yellow) / (mid_time_red - mid_time_yellow) * max_color_val)
-                color = f'#{max_color_val:02x}{max_color_val - color_value:02x}00'
-            else:
-                # Green to yellow
-                color_value = int((travel_time - min_time_green) / (mid_time_yellow - min_time_green) * max_color_val)
-                color = f'#{color_value:02x}{max_color_val:02x}00'
-        else:
-            color = 'gray'  # Neutral color for missing data
-        # Add a label with address and travel time
-        label = f"Address: {address} ({travel_time if travel_time is not None else 'N/A'} min)"
-        folium.CircleMarker(location=[lat, lon], radius=4, color=color, fill=True, fill_opacity=0.7, popup=label).add_to(m)
+    add_duration_points(m, frame, compact)
+
+    m.save(output)
+
+
+def tiles_directory(output):
+    return os.path.join(os.path.dirname(output), 'tiles')
 
-    m.save('static/public_transport.html')
 
+def render_surface_tiles(frame, output, workers=None):
+    """Brings the tiles of the travel_time_surface map saved to `output` up to date with travel_info"""
+    rendered, unchanged, removed = update_tiles(frame, tiles_directory(output), workers=workers)
+    if rendered or removed:
+        print(f"🧱 Rendered {rendered} tiles ({unchanged} unchanged, {removed} removed)")
+
+
+def plot_travel_time_surface(frame=None, output='static/travel_time_surface.html'):
+    """
+    Creates a map of transit travel times, and of transit vs car, interpolated between the sampled addresses
+    (inverse-distance weighting), drawn from pre-rendered XYZ tiles in the `tiles/` directory next to it.
+    The browser only fetches the tiles in view, and only tiles whose samples changed are rendered again.
+    """
+    frame = frame if frame is not None else load_travel_info()
+
+    m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
+
+    # A no-op when create_map.py main() rendered them already
+    render_surface_tiles(frame, output)
+    for i, (layer, spec) in enumerate(TILE_LAYERS.items()):
+        folium.TileLayer(
+            tiles=f'tiles/{layer}/{{z}}/{{x}}/{{y}}.png',
+            attr='Travel times: Google Maps Directions API',
+            name=spec['title'],
+            overlay=True,
+            show=i == 0,
+            opacity=0.7,
+            # Outside the rendered zoom range Leaflet scales the nearest tiles instead
+            min_native_zoom=DEFAULT_ZOOMS[0],
+            max_native_zoom=DEFAULT_ZOOMS[1],
+            max_zoom=18
+        ).add_to(m)
 
-def plot_points_short_time():
-    # Connect to the SQLite database
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
+    folium.LayerControl().add_to(m)
+    m.save(output)
+    print(f"🗺️  Travel time surface map saved to {output}")
 
-    # Query to get the data including address
-    cursor.execute('SELECT latitude, longitude, transit_duration, street FROM travel_info WHERE transit_duration < 25')
-    data = cursor.fetchall()
 
-    # Close the database connection
-    conn.close()
+def plot_points_short_time(frame=None, output='static/short_transport.html'):
+    frame = frame if frame is not None else load_travel_info()
 
     # Create a base map
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
     # Prepare data for heatmap
-    heat_data = [[lat, lon] for lat, lon, travel_time, address in data]
+    heat_data = records(short_time_rows(frame), ['latitude', 'longitude'])
 
     # Add heatmap to the map
     HeatMap(heat_data).add_to(m)
 
-    m.save('static/short_transport.html')
-
-
-def plot_heatmap_with_metro_stations():
-    # Connect to the SQLite database
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
+    m.save(output)
 
-    # Query to get the data including address
-    cursor.execute('SELECT latitude, longitude, transit_duration, street FROM travel_info WHERE transit_duration < 25')
-    data = cursor.fetchall()
 
-    # Close the database connection
-    conn.close()
+def plot_heatmap_with_metro_stations(frame=None, output='static/heatmap_with_metro.html'):
+    frame = frame if frame is not None else load_travel_info()
 
     # Create a base map
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
     # Prepare data for heatmap
-    heat_data = [[lat, lon] for lat, lon, travel_time, address in data]
+    heat_data = records(short_time_rows(frame), ['latitude', 'longitude'])
 
     # Add heatmap to the map
     HeatMap(heat_data).add_to(m)
 
     # Read metro stations from CSV and add as blue circles
-    metro_df = pd.read_csv('metro-stations.csv')
+    metro_df = load_stations()
 
-    for index, row in metro_df.iterrows():
+    for name, lat, lon, line in metro_df[['Name', 'Latitude', 'Longitude', 'Line']].itertuples(index=False):
         folium.CircleMarker(
-            location=[row['Latitude'], row['Longitude']],
+            location=[lat, lon],
             radius=5,
-            popup=f"{row['Name']} ({row['Line']})",
+            popup=f"{name} ({line})",
             color='blue',
             fill=True,
             fillColor='blue',
@@ -115,10 +254,10 @@ def plot_heatmap_with_metro_stations():
             weight=2
         ).add_to(m)
 
-    m.save('static/heatmap_with_metro.html')
+    m.save(output)
 
 
-def plot_transfer_analysis():
+def plot_transfer_analysis(frame=None, compact=True, output='static/transfer_analysis.html'):
     """
     Creates a map showing public transport connections/transfers needed.
     Uses color coding where fewer transfers are better:
@@ -127,41 +266,12 @@ def plot_transfer_analysis():
     - Orange: 2 transfers
     - Red: 3+ transfers (though none exist in current data)
     """
-    # Connect to the SQLite database
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
-
-    # Query to get data with transfer information
-    cursor.execute('''
-        SELECT latitude, longitude, transit_duration, transfers, street
-        FROM travel_info
-        WHERE transfers IS NOT NULL
-        AND latitude IS NOT NULL
-        AND longitude IS NOT NULL
-    ''')
-    data = cursor.fetchall()
-    conn.close()
+    frame = frame if frame is not None else load_travel_info()
+    transfers_frame = transfer_rows(frame)
 
     # Create a base map centered on Warsaw
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
-    # Color palette for transfers (fewer is better)
-    transfer_colors = {
-        0: '#2d8030',    # Deep green (excellent - no transfers)
-        1: '#ffd700',    # Gold/yellow (good - 1 transfer)
-        2: '#ff8c00',    # Dark orange (moderate - 2 transfers)
-        3: '#dc143c'     # Crimson red (poor - 3+ transfers, if any)
-    }
-
-    def get_transfer_color(transfers):
-        """Get color based on number of transfers"""
-        if transfers in transfer_colors:
-            return transfer_colors[transfers]
-        elif transfers >= 3:
-            return transfer_colors[3]  # Use red for 3+ transfers
-        else:
-            return '#808080'  # Gray for unknown/null values
-
     def get_transfer_text(transfers):
         """Get descriptive text for transfer count"""
         if transfers == 0:
@@ -174,64 +284,46 @@ def plot_transfer_analysis():
             return f"🔄 {transfers} transfers required"
 
     # Plot points on the map
-    for lat, lon, transit_time, transfers, address in data:
-        color = get_transfer_color(transfers)
-        transfer_desc = get_transfer_text(transfers)
-
-        # Create popup with detailed information
-        popup_text = f"""
-        <b>{address}</b><br>
-        🚊 Transit time: {transit_time:.1f} min<br>
-        {transfer_desc}<br>
-        """
-
-        # Add circle marker with size based on transit time
-        radius = min(10, max(4, 4 + (transit_time or 0) / 10))
-
-        folium.CircleMarker(
-            location=[lat, lon],
-            radius=radius,
-            weight=0,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.8,
-            popup=folium.Popup(popup_text, max_width=300)
-        ).add_to(m)
+    data = records(transfers_frame, ['latitude', 'longitude', 'transit_duration', 'transfers', 'street'])
+    if compact:
+        CompactCircleLayer(data, transfer_style_js(TRANSFER_COLORS), TRANSFER_POPUP_JS, popup_options={'maxWidth': 300},
+                           weight=0, fill=True, fill_opacity=0.8).add_to(m)
+    else:
+        # Circle size grows with transit time
+        radii = np.clip(4 + transfers_frame['transit_duration'].fillna(0).to_numpy() / 10, 4, 10)
+        for (lat, lon, transit_time, transfers, address), color, radius in zip(
+                data, transfer_colors(transfers_frame['transfers']), radii):
+            # Create popup with detailed information
+            popup_text = f"""
+            <b>{address}</b><br>
+            🚊 Transit time: {transit_time:.1f} min<br>
+            {get_transfer_text(transfers)}<br>
+            """
+
+            folium.CircleMarker(
+                location=[lat, lon],
+                radius=radius,
+                weight=0,
+                fill=True,
+                fillColor=color,
+                fillOpacity=0.8,
+                popup=folium.Popup(popup_text, max_width=300)
+            ).add_to(m)
 
     # Add a legend
-    legend_html = f'''
-    <div style="position: fixed;
-                bottom: 50px; left: 50px; width: 220px; height: 150px;
-                background-color: white; border:2px solid grey; z-index:9999;
-                font-size:14px; padding: 10px">
-    <p><b>Transfer Analysis</b></p>
-    <p><i class="fa fa-circle" style="color:{transfer_colors[0]}"></i> 0 transfers (direct)</p>
-    <p><i class="fa fa-circle" style="color:{transfer_colors[1]}"></i> 1 transfer</p>
-    <p><i class="fa fa-circle" style="color:{transfer_colors[2]}"></i> 2 transfers</p>
-    <p><i class="fa fa-circle" style="color:{transfer_colors[3]}"></i> 3+ transfers</p>
-    <p><small>Fewer transfers = better service</small></p>
-    </div>
-    '''
-    m.get_root().html.add_child(folium.Element(legend_html))
+    add_transfer_legend(m)
 
     # Save the map
-    m.save('static/transfer_analysis.html')
-    print("🔄 Transfer analysis map saved to static/transfer_analysis.html")
+    m.save(output)
+    print(f"🔄 Transfer analysis map saved to {output}")
     print("📊 Transfer distribution:")
 
     # Print transfer statistics
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
-    cursor.execute("SELECT transfers, COUNT(*) FROM travel_info GROUP BY transfers ORDER BY transfers")
-    stats = cursor.fetchall()
-    conn.close()
-
-    for transfers, count in stats:
-        if transfers is not None:
-            print(f"   {transfers} transfers: {count} locations")
+    for transfers, count in transfer_counts(frame):
+        print(f"   {transfers} transfers: {count} locations")
 
 
-def plot_transport_comparison():
+def plot_transport_comparison(frame=None, compact=True, output='static/transport_comparison.html'):
     """
     Creates a map showing comparison between car and public transport times.
     Uses a creative color palette:
@@ -242,367 +334,69 @@ def plot_transport_comparison():
     - Deep crimson: Very poor public transport (40-60 min)
     - Black: Extremely poor public transport (60+ min)
     """
-    # Connect to the SQLite database
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
-
-    # Query to get data where both car and transit durations exist
-    cursor.execute('''
-        SELECT latitude, longitude, transit_duration, car_duration_avg, street
-        FROM travel_info
-        WHERE transit_duration IS NOT NULL
-        AND car_duration_avg IS NOT NULL
-    ''')
-    data = cursor.fetchall()
-    conn.close()
+    frame = frame if frame is not None else load_travel_info()
 
     # Create a base map centered on Warsaw
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
-    # Color palette thresholds (difference = transit_time - car_time)
-    thresholds = {
-        'excellent': 0,      # Public transport faster (green)
-        'good': 10,         # Slightly slower (0-10 min) (light green)
-        'acceptable': 15,   # Moderate difference (10-15 min) (amber)
-        'poor': 20,         # Significant difference (15-20 min) (orange)
-        'very_poor': 100    # Very poor (20+ min) (red to black)
-    }
-
-    # Creative color palette inspired by Warsaw nature and urban themes
-    colors = {
-        'excellent': '#006837',     # Deep forest green (Łazienki Park)
-        'good': '#31a354',          # Sage green (Vistula riverbank)
-        'acceptable': '#feb24c',     # Warm amber (Warsaw sunset)
-        'poor': '#fd8d3c',          # Sunset orange
-        'very_poor': '#bd0026',     # Deep crimson (Palace of Culture red brick)
-        'extreme': '#000000'        # Black (coal/industry)
-    }
-
-    def get_color(time_diff):
-        """Get color based on time difference (transit - car)"""
-        if time_diff < thresholds['excellent']:
-            return colors['excellent']
-        elif time_diff < thresholds['good']:
-            # Gradient from excellent to good
-            ratio = time_diff / thresholds['good']
-            return interpolate_color(colors['excellent'], colors['good'], ratio)
-        elif time_diff < thresholds['acceptable']:
-            # Gradient from good to acceptable
-            ratio = (time_diff - thresholds['good']) / (thresholds['acceptable'] - thresholds['good'])
-            return interpolate_color(colors['good'], colors['acceptable'], ratio)
-        elif time_diff < thresholds['poor']:
-            # Gradient from acceptable to poor
-            ratio = (time_diff - thresholds['acceptable']) / (thresholds['poor'] - thresholds['acceptable'])
-            return interpolate_color(colors['acceptable'], colors['poor'], ratio)
-        elif time_diff < thresholds['very_poor']:
-            # Gradient from poor to very poor
-            ratio = (time_diff - thresholds['poor']) / (thresholds['very_poor'] - thresholds['poor'])
-            return interpolate_color(colors['poor'], colors['very_poor'], ratio)
-        else:
-            # Gradient from very poor to extreme (black)
-            ratio = min(1.0, (time_diff - 20) / 20)  # Cap at 40 min total diff (20 + 20)
-            return interpolate_color(colors['very_poor'], colors['extreme'], ratio)
-
-    def interpolate_color(color1, color2, ratio):
-        """Interpolate between two hex colors"""
-        # Convert hex to RGB
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-
-        # Interpolate
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def get_status_text(time_diff):
-        """Get descriptive text for the time difference"""
-        if time_diff < 0:
-            return f"🚊 Public transport faster by {abs(time_diff):.1f} min"
-        elif time_diff < 10:
-            return f"🚊 Public transport slightly slower by {time_diff:.1f} min"
-        elif time_diff < 15:
-            return f"🚗 Car moderately faster by {time_diff:.1f} min"
-        elif time_diff < 20:
-            return f"🚗 Car significantly faster by {time_diff:.1f} min"
-        else:
-            return f"🚗 Car much faster by {time_diff:.1f} min"
-
-    # Plot points on the map
-    for lat, lon, transit_time, car_time, address in data:
-        time_diff = transit_time - car_time
-        color = get_color(time_diff)
-        status = get_status_text(time_diff)
-
-        # Create popup with detailed information
-        popup_text = f"""
-        <b>{address}</b><br>
-        🚊 Public transport: {transit_time:.1f} min<br>
-        🚗 Car: {car_time:.1f} min<br>
-        <b>{status}</b>
-        """
-
-        # Add circle marker with size based on difference magnitude
-        radius = min(12, max(6, 6 + abs(time_diff) / 8))
-
-        folium.CircleMarker(
-            location=[lat, lon],
-            radius=radius,
-            weight=0,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.9,
-            popup=folium.Popup(popup_text, max_width=300)
-        ).add_to(m)
+    add_comparison_points(m, frame, compact)
 
     # Add a legend
-    legend_html = f'''
-    <div style="position: fixed;
-                bottom: 50px; left: 50px; width: 200px; height: 180px;
-                background-color: white; border:2px solid grey; z-index:9999;
-                font-size:14px; padding: 10px">
-    <p><b>Transport Comparison</b></p>
-    <p><i class="fa fa-circle" style="color:{colors['excellent']}"></i> Public transport faster</p>
-    <p><i class="fa fa-circle" style="color:{colors['good']}"></i> Slightly slower (0-10 min)</p>
-    <p><i class="fa fa-circle" style="color:{colors['acceptable']}"></i> Moderate difference (10-15 min)</p>
-    <p><i class="fa fa-circle" style="color:{colors['poor']}"></i> Significant difference (15-20 min)</p>
-    <p><i class="fa fa-circle" style="color:{colors['very_poor']}"></i> Very poor (20+ min)</p>
-    </div>
-    '''
-    m.get_root().html.add_child(folium.Element(legend_html))
+    add_comparison_legend(m)
 
     # Save the map
-    m.save('static/transport_comparison.html')
-    print("🗺️  Transport comparison map saved to static/transport_comparison.html")
+    m.save(output)
+    print(f"🗺️  Transport comparison map saved to {output}")
     print("🎨 Color palette:")
     print(f"   🟢 Green: Public transport competitive")
     print(f"   🟡 Amber: Moderate car advantage")
     print(f"   🔴 Red-Black: Poor public transport performance")
 
 
-def plot_all_points_with_districts():
+def plot_all_points_with_districts(frame=None, compact=True, output='static/public_transport_districts.html',
+                                   district_tolerance_m=SIMPLIFY_TOLERANCE_M):
     """
     Creates a map showing all public transport travel times with Warsaw district borders.
     """
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT latitude, longitude, transit_duration, street FROM travel_info')
-    data = cursor.fetchall()
-    conn.close()
+    frame = frame if frame is not None else load_travel_info()
 
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
-    min_time_green = 10
-    mid_time_yellow = 25
-    mid_time_red = 40
-    max_time_black = 55
-    max_color_val = 204
-
-    for lat, lon, travel_time, address in data:
-        if travel_time is not None:
-            if travel_time < min_time_green:
-                color = '#0c0'
-            elif travel_time > max_time_black:
-                color = 'black'
-            elif travel_time > mid_time_red:
-                color_value = int((travel_time - mid_time_red) / (max_time_black - mid_time_red) * max_color_val)
-                color = f'#{max_color_val - color_value:02x}0000'
-            elif travel_time > mid_time_yellow:
-                color_value = int((travel_time - mid_time_yellow) / (mid_time_red - mid_time_yellow) * max_color_val)
-                color = f'#{max_color_val:02x}{max_color_val - color_value:02x}00'
-            else:
-                color_value = int((travel_time - min_time_green) / (mid_time_yellow - min_time_green) * max_color_val)
-                color = f'#{color_value:02x}{max_color_val:02x}00'
-        else:
-            color = 'gray'
-        label = f"Address: {address} ({travel_time if travel_time is not None else 'N/A'} min)"
-        folium.CircleMarker(location=[lat, lon], radius=4, color=color, fill=True, fill_opacity=0.7, popup=label).add_to(m)
-
-    # Load and add district borders on top
-    with open('warszawa-dzielnice.geojson', 'r', encoding='utf-8') as f:
-        geojson_data = json.load(f)
-
-    def district_style(feature):
-        return {
-            'fillColor': 'transparent',
-            'color': '#1e3a5f',
-            'weight': 2.5,
-            'fillOpacity': 0
-        }
-
-    folium.GeoJson(
-        geojson_data,
-        name='Warsaw Districts',
-        style_function=district_style,
-        tooltip=folium.GeoJsonTooltip(
-            fields=['name'],
-            aliases=['District:'],
-            style='background-color: white; color: #333; font-weight: bold;'
-        )
-    ).add_to(m)
+    add_duration_points(m, frame, compact)
+    add_district_borders(m, district_tolerance_m)
 
     folium.LayerControl().add_to(m)
-    m.save('static/public_transport_districts.html')
-    print("🗺️  Public transport with districts map saved to static/public_transport_districts.html")
+    m.save(output)
+    print(f"🗺️  Public transport with districts map saved to {output}")
 
 
-def plot_transport_comparison_with_districts():
+def plot_transport_comparison_with_districts(frame=None, compact=True,
+                                             output='static/transport_comparison_districts.html',
+                                             district_tolerance_m=SIMPLIFY_TOLERANCE_M):
     """
     Creates a map showing comparison between car and public transport times
     with Warsaw district borders overlaid on top.
     """
-    # Connect to the SQLite database
-    conn = sqlite3.connect('travel_info.db')
-    cursor = conn.cursor()
-
-    # Query to get data where both car and transit durations exist
-    cursor.execute('''
-        SELECT latitude, longitude, transit_duration, car_duration_avg, street
-        FROM travel_info
-        WHERE transit_duration IS NOT NULL
-        AND car_duration_avg IS NOT NULL
-    ''')
-    data = cursor.fetchall()
-    conn.close()
+    frame = frame if frame is not None else load_travel_info()
 
     # Create a base map centered on Warsaw
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
 
-    # Color palette thresholds (difference = transit_time - car_time)
-    thresholds = {
-        'excellent': 0,      # Public transport faster (green)
-        'good': 10,         # Slightly slower (0-10 min) (light green)
-        'acceptable': 15,   # Moderate difference (10-15 min) (amber)
-        'poor': 20,         # Significant difference (15-20 min) (orange)
-        'very_poor': 100    # Very poor (20+ min) (red to black)
-    }
-
-    # Creative color palette inspired by Warsaw nature and urban themes
-    colors = {
-        'excellent': '#006837',     # Deep forest green (Łazienki Park)
-        'good': '#31a354',          # Sage green (Vistula riverbank)
-        'acceptable': '#feb24c',     # Warm amber (Warsaw sunset)
-        'poor': '#fd8d3c',          # Sunset orange
-        'very_poor': '#bd0026',     # Deep crimson (Palace of Culture red brick)
-        'extreme': '#000000'        # Black (coal/industry)
-    }
-
-    def get_color(time_diff):
-        """Get color based on time difference (transit - car)"""
-        if time_diff < thresholds['excellent']:
-            return colors['excellent']
-        elif time_diff < thresholds['good']:
-            ratio = time_diff / thresholds['good']
-            return interpolate_color(colors['excellent'], colors['good'], ratio)
-        elif time_diff < thresholds['acceptable']:
-            ratio = (time_diff - thresholds['good']) / (thresholds['acceptable'] - thresholds['good'])
-            return interpolate_color(colors['good'], colors['acceptable'], ratio)
-        elif time_diff < thresholds['poor']:
-            ratio = (time_diff - thresholds['acceptable']) / (thresholds['poor'] - thresholds['acceptable'])
-            return interpolate_color(colors['acceptable'], colors['poor'], ratio)
-        elif time_diff < thresholds['very_poor']:
-            ratio = (time_diff - thresholds['poor']) / (thresholds['very_poor'] - thresholds['poor'])
-            return interpolate_color(colors['poor'], colors['very_poor'], ratio)
-        else:
-            ratio = min(1.0, (time_diff - 20) / 20)
-            return interpolate_color(colors['very_poor'], colors['extreme'], ratio)
-
-    def interpolate_color(color1, color2, ratio):
-        """Interpolate between two hex colors"""
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def get_status_text(time_diff):
-        """Get descriptive text for the time difference"""
-        if time_diff < 0:
-            return f"🚊 Public transport faster by {abs(time_diff):.1f} min"
-        elif time_diff < 10:
-            return f"🚊 Public transport slightly slower by {time_diff:.1f} min"
-        elif time_diff < 15:
-            return f"🚗 Car moderately faster by {time_diff:.1f} min"
-        elif time_diff < 20:
-            return f"🚗 Car significantly faster by {time_diff:.1f} min"
-        else:
-            return f"🚗 Car much faster by {time_diff:.1f} min"
-
-    # Plot points on the map
-    for lat, lon, transit_time, car_time, address in data:
-        time_diff = transit_time - car_time
-        color = get_color(time_diff)
-        status = get_status_text(time_diff)
-
-        popup_text = f"""
-        <b>{address}</b><br>
-        🚊 Public transport: {transit_time:.1f} min<br>
-        🚗 Car: {car_time:.1f} min<br>
-        <b>{status}</b>
-        """
-
-        radius = min(12, max(6, 6 + abs(time_diff) / 8))
-
-        folium.CircleMarker(
-            location=[lat, lon],
-            radius=radius,
-            weight=0,
-            fill=True,
-            fillColor=color,
-            fillOpacity=0.9,
-            popup=folium.Popup(popup_text, max_width=300)
-        ).add_to(m)
-
-    # Load and add district borders on top
-    with open('warszawa-dzielnice.geojson', 'r', encoding='utf-8') as f:
-        geojson_data = json.load(f)
-
-    def district_style(feature):
-        return {
-            'fillColor': 'transparent',
-            'color': '#1e3a5f',  # Dark blue border
-            'weight': 2.5,
-            'fillOpacity': 0
-        }
-
-    folium.GeoJson(
-        geojson_data,
-        name='Warsaw Districts',
-        style_function=district_style,
-        tooltip=folium.GeoJsonTooltip(
-            fields=['name'],
-            aliases=['District:'],
-            style='background-color: white; color: #333; font-weight: bold;'
-        )
-    ).add_to(m)
+    add_comparison_points(m, frame, compact)
+    add_district_borders(m, district_tolerance_m)
 
     # Add a legend
-    legend_html = f'''
-    <div style="position: fixed;
-                bottom: 50px; left: 50px; width: 200px; height: 180px;
-                background-color: white; border:2px solid grey; z-index:9999;
-                font-size:14px; padding: 10px">
-    <p><b>Transport Comparison</b></p>
-    <p><i class="fa fa-circle" style="color:{colors['excellent']}"></i> Public transport faster</p>
-    <p><i class="fa fa-circle" style="color:{colors['good']}"></i> Slightly slower (0-10 min)</p>
-    <p><i class="fa fa-circle" style="color:{colors['acceptable']}"></i> Moderate difference (10-15 min)</p>
-    <p><i class="fa fa-circle" style="color:{colors['poor']}"></i> Significant difference (15-20 min)</p>
-    <p><i class="fa fa-circle" style="color:{colors['very_poor']}"></i> Very poor (20+ min)</p>
-    </div>
-    '''
-    m.get_root().html.add_child(folium.Element(legend_html))
+    add_comparison_legend(m)
 
     # Add layer control
     folium.LayerControl().add_to(m)
 
     # Save the map
-    m.save('static/transport_comparison_districts.html')
-    print("🗺️  Transport comparison with districts map saved to static/transport_comparison_districts.html")
+    m.save(output)
+    print(f"🗺️  Transport comparison with districts map saved to {output}")
 
 
-def plot_warsaw_districts():
+def plot_warsaw_districts(output='static/warsaw_districts.html', district_tolerance_m=SIMPLIFY_TOLERANCE_M):
     """
     Creates a map showing Warsaw districts with their borders drawn.
     Uses the warszawa-dzielnice.geojson file.
@@ -611,8 +405,7 @@ def plot_warsaw_districts():
     m = folium.Map(location=[52.2297, 21.0122], zoom_start=11)
 
     # Load GeoJSON file
-    with open('warszawa-dzielnice.geojson', 'r', encoding='utf-8') as f:
-        geojson_data = json.load(f)
+    geojson_data = district_geometry(DISTRICTS_GEOJSON, district_tolerance_m)
 
     # Style function for district borders
     def style_function(feature):
@@ -639,16 +432,331 @@ def plot_warsaw_districts():
     folium.LayerControl().add_to(m)
 
     # Save the map
-    m.save('static/warsaw_districts.html')
-    print("🗺️  Warsaw districts map saved to static/warsaw_districts.html")
-
-
-# Call the functions
-plot_all_points()
-plot_points_short_time()
-plot_heatmap_with_metro_stations()
-plot_transport_comparison()
-plot_transfer_analysis()
-plot_warsaw_districts()
-plot_all_points_with_districts()
-plot_transport_comparison_with_districts()
\ No newline at end of file
+    m.save(output)
+    print(f"🗺️  Warsaw districts map saved to {output}")
+
+
+def plot_district_stats(frame=None, output='static/district_stats.html', district_tolerance_m=SIMPLIFY_TOLERANCE_M):
+    """
+    Creates a choropleth of Warsaw districts colored by their median public transport travel time,
+    with per-district statistics in the tooltip instead of a marker per address.
+    """
+    frame = frame if frame is not None else load_travel_info()
+    stats = district_stats(frame)
+
+    m = folium.Map(location=[52.2297, 21.0122], zoom_start=11)
+
+    geojson_data = district_geometry(DISTRICTS_GEOJSON, district_tolerance_m)
+
+    colors = dict(zip(stats.index, duration_colors(stats['median_transit'])))
+    for feature in geojson_data['features']:
+        name = feature['properties']['name']
+        row = stats.loc[name] if name in stats.index else None
+        feature['properties'].update({
+            'addresses': int(row['addresses']) if row is not None else 0,
+            'median_transit': f"{row['median_transit']:.1f} min" if row is not None else 'N/A',
+            'p90_transit': f"{row['p90_transit']:.1f} min" if row is not None else 'N/A',
+            'transfer_mix': (f"{row['direct']:.0%} / {row['one_transfer']:.0%} / {row['two_plus_transfers']:.0%}"
+                             if row is not None else 'N/A'),
+            'car_gap': f"{row['car_gap']:+.1f} min" if row is not None and not math.isnan(row['car_gap']) else 'N/A',
+        })
+
+    def district_style(feature):
+        return {
+            'fillColor': colors.get(feature['properties']['name'], 'gray'),
+            'color': '#1e3a5f',
+            'weight': 1.5,
+            'fillOpacity': 0.6
+        }
+
+    folium.GeoJson(
+        geojson_data,
+        name='District statistics',
+        style_function=district_style,
+        tooltip=folium.GeoJsonTooltip(
+            fields=['name', 'addresses', 'median_transit', 'p90_transit', 'transfer_mix', 'car_gap'],
+            aliases=['District:', 'Addresses:', 'Median transit:', '90th percentile:',
+                     'Transfers 0 / 1 / 2+:', 'Transit vs car (median):'],
+            style='background-color: white; color: #333;'
+        )
+    ).add_to(m)
+
+    folium.LayerControl().add_to(m)
+    m.save(output)
+    print(f"🗺️  District statistics map saved to {output}")
+    print("📊 Median / p90 transit time per district:")
+    for name, row in stats.sort_values('median_transit').iterrows():
+        print(f"   {name}: {row['median_transit']:.1f} / {row['p90_transit']:.1f} min ({int(row['addresses'])} addresses)")
+
+
+def plot_metro_catchment(frame=None, output='static/metro_catchment.html'):
+    """
+    Creates a map of metro station catchments: every address within walking distance of its nearest station,
+    colored by the station's line and fading with distance, one toggleable layer per line.
+    Station popups summarize their catchment.
+    """
+    frame = frame if frame is not None else load_travel_info()
+    stations = load_stations()
+    catchment = frame[frame['station_distance_m'] <= WALKING_DISTANCE_M]
+
+    m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
+
+    for line, addresses in catchment.groupby('line'):
+        data = records(addresses.round({'station_distance_m': 0}),
+                       ['latitude', 'longitude', 'station_distance_m', 'transit_duration', 'station', 'street'])
+        layer = folium.FeatureGroup(name=f'{line} catchment ({WALKING_DISTANCE_M} m)')
+        CompactCircleLayer(data, catchment_style_js(METRO_LINE_COLORS.get(line, 'gray'), WALKING_DISTANCE_M),
+                           CATCHMENT_POPUP_JS, radius=4, weight=0, fill=True).add_to(layer)
+        layer.add_to(m)
+
+    per_station = catchment.groupby(['station', 'line'])['transit_duration'].agg(['size', 'median'])
+    for name, lat, lon, line in stations[['Name', 'Latitude', 'Longitude', 'Line']].itertuples(index=False):
+        count, median = per_station.loc[(name, line)] if (name, line) in per_station.index else (0, math.nan)
+        median_text = f"{median:.1f} min" if not math.isnan(median) else 'N/A'
+        folium.CircleMarker(
+            location=[lat, lon],
+            radius=6,
+            popup=f"<b>{name} ({line})</b><br>{int(count)} addresses within {WALKING_DISTANCE_M} m<br>"
+                  f"Median transit: {median_text}",
+            color='white',
+            fill=True,
+            fillColor=METRO_LINE_COLORS.get(line, 'gray'),
+            fillOpacity=1,
+            weight=2
+        ).add_to(m)
+
+    folium.LayerControl().add_to(m)
+    m.save(output)
+    print(f"🗺️  Metro catchment map saved to {output}")
+    print(f"🚇 Addresses within {WALKING_DISTANCE_M} m of a station:")
+    for line, count in catchment['line'].value_counts().sort_index().items():
+        print(f"   {line}: {count} addresses")
+
+
+def plot_dashboard(frame=None, output='static/dashboard.html', district_tolerance_m=SIMPLIFY_TOLERANCE_M):
+    """
+    Creates one map with the views of the point maps as toggleable layers: travel times, the short trips
+    heatmap, transfers, transit vs car, metro stations and district borders.
+    The addresses, stations and district geometry are embedded once, every layer derives its rows from them
+    in the browser, so the file is about the size of the largest single map instead of all of them together.
+    """
+    frame = frame if frame is not None else load_travel_info()
+    located = frame[frame['latitude'].notna() & frame['longitude'].notna()]
+    geojson_data = district_geometry(DISTRICTS_GEOJSON, district_tolerance_m)
+
+    m = folium.Map(location=[52.2297, 21.0122], zoom_start=12)
+
+    dataset = SharedDataset(addresses=records(located, DASHBOARD_COLUMNS),
+                            stations=records(load_stations(), ['Latitude', 'Longitude', 'Name', 'Line']),
+                            geojson={'districts': geojson_data})
+    dataset.add_to(m)
+
+    CompactCircleLayer(shared_rows(dataset, 'addresses', DASHBOARD_DURATION_JS), DURATION_STYLE_JS, DURATION_POPUP_JS,
+                       name='Transit travel time', control=True, radius=4, fill=True, fill_opacity=0.7).add_to(m)
+    SharedHeatMap(shared_rows(dataset, 'addresses', dashboard_short_time_js(SHORT_TIME_MINUTES)),
+                  name=f'Under {SHORT_TIME_MINUTES} min (heatmap)', show=False).add_to(m)
+    transfers = CompactCircleLayer(shared_rows(dataset, 'addresses', DASHBOARD_TRANSFER_JS),
+                                   transfer_style_js(TRANSFER_COLORS), TRANSFER_POPUP_JS, popup_options={'maxWidth': 300},
+                                   name='Transfers', control=True, show=False, weight=0, fill=True, fill_opacity=0.8)
+    transfers.add_to(m)
+    comparison = CompactCircleLayer(shared_rows(dataset, 'addresses', DASHBOARD_COMPARISON_JS),
+                                    comparison_style_js(COMPARISON_THRESHOLDS, COMPARISON_COLORS), COMPARISON_POPUP_JS,
+                                    popup_options={'maxWidth': 300}, name='Transit vs car', control=True, show=False,
+                                    weight=0, fill=True, fill_opacity=0.9)
+    comparison.add_to(m)
+    CompactCircleLayer(shared_rows(dataset, 'stations', 'function(r) { return r; }'), 'function(row) { return {}; }',
+                       STATION_POPUP_JS, name='Metro stations', control=True, show=False, radius=5, color='blue',
+                       fill=True, fill_color='blue', fill_opacity=0.7, weight=2).add_to(m)
+    SharedGeoJson(dataset, 'districts', {'fillColor': 'transparent', 'color': '#1e3a5f', 'weight': 2.5, 'fillOpacity': 0},
+                  name='Warsaw Districts', show=False).add_to(m)
+
+    add_comparison_legend(m, layer=comparison)
+    add_transfer_legend(m, side='right', layer=transfers)
+
+    folium.LayerControl(collapsed=False).add_to(m)
+    m.save(output)
+    print(f"🗺️  Dashboard saved to {output}")
+
+
+DURATION_PALETTE = {'min_time_green': MIN_TIME_GREEN, 'mid_time_yellow': MID_TIME_YELLOW, 'mid_time_red': MID_TIME_RED,
+                    'max_time_black': MAX_TIME_BLACK, 'max_color_val': MAX_COLOR_VAL}
+COMPARISON_PALETTE = {'thresholds': COMPARISON_THRESHOLDS, 'colors': COMPARISON_COLORS}
+TRANSFER_PALETTE = {'colors': TRANSFER_COLORS}
+CATCHMENT_PALETTE = {'lines': METRO_LINE_COLORS, 'walking_distance_m': WALKING_DISTANCE_M}
+
+DURATION_COLUMNS = ['latitude', 'longitude', 'transit_duration', 'street']
+COMPARISON_COLUMNS = ['latitude', 'longitude', 'transit_duration', 'car_duration_avg', 'street']
+DASHBOARD_COLUMNS = ['latitude', 'longitude', 'transit_duration', 'transfers', 'car_duration_avg', 'street']
+
+# Maps by the name of their static/*.html output, in the order they are built.
+# Besides the plot function each map declares its inputs: the travel_info rows and columns it reads,
+# the files it loads and its palette settings. A map is only rebuilt when one of them changes.
+MAPS = {
+    'public_transport': {'plot': plot_all_points, 'columns': DURATION_COLUMNS, 'palette': DURATION_PALETTE},
+    'travel_time_surface': {'plot': plot_travel_time_surface,
+                            'columns': ['latitude', 'longitude', 'transit_duration', 'car_duration_avg'],
+                            'palette': {'duration': DURATION_PALETTE, 'comparison': COMPARISON_PALETTE}},
+    'short_transport': {'plot': plot_points_short_time, 'rows': short_time_rows, 'columns': ['latitude', 'longitude']},
+    'heatmap_with_metro': {'plot': plot_heatmap_with_metro_stations, 'rows': short_time_rows,
+                           'columns': ['latitude', 'longitude'], 'files': ['metro-stations.csv']},
+    'transport_comparison': {'plot': plot_transport_comparison, 'rows': comparison_rows,
+                             'columns': COMPARISON_COLUMNS, 'palette': COMPARISON_PALETTE},
+    'transfer_analysis': {'plot': plot_transfer_analysis,
+                          'columns': ['latitude', 'longitude', 'transit_duration', 'transfers', 'street'],
+                          'palette': TRANSFER_PALETTE},
+    'warsaw_districts': {'plot': plot_warsaw_districts, 'files': ['warszawa-dzielnice.geojson']},
+    'public_transport_districts': {'plot': plot_all_points_with_districts, 'columns': DURATION_COLUMNS,
+                                   'files': ['warszawa-dzielnice.geojson'], 'palette': DURATION_PALETTE},
+    'transport_comparison_districts': {'plot': plot_transport_comparison_with_districts, 'rows': comparison_rows,
+                                       'columns': COMPARISON_COLUMNS, 'files': ['warszawa-dzielnice.geojson'],
+                                       'palette': COMPARISON_PALETTE},
+    'district_stats': {'plot': plot_district_stats,
+                       'columns': ['district', 'transit_duration', 'transfers', 'car_duration_avg'],
+                       'files': [DISTRICTS_GEOJSON], 'palette': DURATION_PALETTE},
+    'metro_catchment': {'plot': plot_metro_catchment,
+                        'columns': ['latitude', 'longitude', 'station', 'line', 'station_distance_m',
+                                    'transit_duration', 'street'],
+                        'files': [STATIONS_CSV], 'palette': CATCHMENT_PALETTE},
+    'dashboard': {'plot': plot_dashboard, 'columns': DASHBOARD_COLUMNS, 'files': [DISTRICTS_GEOJSON, STATIONS_CSV],
+                  'palette': {'duration': DURATION_PALETTE, 'transfers': TRANSFER_PALETTE,
+                              'comparison': COMPARISON_PALETTE}},
+}
+
+OUTPUT_DIR = 'static'
+# Maps of a departure slot (see departure_sweep.py) go to their own directory, with their own fingerprints
+SLOT_OUTPUT_DIR = 'static/slots'
+
+
+def fingerprints_path(directory=OUTPUT_DIR):
+    return os.path.join(directory, '.fingerprints.json')
+
+
+def map_output(name, directory=OUTPUT_DIR):
+    return os.path.join(directory, f'{name}.html')
+
+
+def map_fingerprint(name, frame, compact=True, district_tolerance_m=SIMPLIFY_TOLERANCE_M):
+    """Hash of everything the map is built from, see MAPS"""
+    spec = MAPS[name]
+    parts = {'files': {path: file_digest(path) for path in spec.get('files', [])},
+             'palette': spec.get('palette')}
+    if 'columns' in spec:
+        rows = spec.get('rows', lambda f: f)(frame)
+        parts['data'] = frame_digest(rows, spec['columns'])
+    parameters = inspect.signature(spec['plot']).parameters
+    if 'compact' in parameters:
+        parts['compact'] = compact
+    if 'district_tolerance_m' in parameters:
+        parts['district_tolerance_m'] = district_tolerance_m
+    return combine(parts)
+
+
+# Each worker process reads travel_info at most once, however many maps it builds
+cached_travel_info = functools.lru_cache(load_travel_info)
+
+
+def build_map(name, db_path='travel_info.db', compact=True, slot=None, directory=OUTPUT_DIR,
+              district_tolerance_m=SIMPLIFY_TOLERANCE_M, frame=None):
+    """Builds one map, from `frame` when given, and returns its name with the time it took in seconds"""
+    start = time.perf_counter()
+    plot = MAPS[name]['plot']
+    parameters = inspect.signature(plot).parameters
+    kwargs = {'output': map_output(name, directory)}
+    if 'frame' in parameters:
+        kwargs['frame'] = frame if frame is not None else cached_travel_info(db_path, slot)
+    if 'compact' in parameters:
+        kwargs['compact'] = compact
+    if 'district_tolerance_m' in parameters:
+        kwargs['district_tolerance_m'] = district_tolerance_m
+    plot(**kwargs)
+    return name, time.perf_counter() - start
+
+
+def build_maps(names, db_path='travel_info.db', compact=True, workers=None, slot=None, directory=OUTPUT_DIR,
+               district_tolerance_m=SIMPLIFY_TOLERANCE_M, frame=None):
+    """
+    Builds the given maps in a process pool, each writing its own *.html file to `directory`.
+    Built in this process, the maps share `frame` when the caller has loaded travel_info already.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(names))
+    if workers <= 1:
+        return [build_map(name, db_path, compact, slot, directory, district_tolerance_m, frame) for name in names]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(build_map, name, db_path, compact, slot, directory, district_tolerance_m)
+                   for name in names]
+        return [future.result() for future in futures]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the static/*.html maps')
+    parser.add_argument('maps', nargs='*', metavar='MAP', help=f"maps to build (default: all): {', '.join(MAPS)}")
+    parser.add_argument('--db', default='travel_info.db', help='database or snapshot (*.snap) to read')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='parallel map builds')
+    parser.add_argument('--no-compact', dest='compact', action='store_false',
+                        help='one CircleMarker per point instead of a single data array colored in the browser')
+    parser.add_argument('--force', action='store_true', help='rebuild even the maps whose inputs did not change')
+    parser.add_argument('--slot', help=f'use the latest travel times sampled at this departure slot '
+                                       f'(see departure_sweep.py), written to {SLOT_OUTPUT_DIR}/SLOT/')
+    parser.add_argument('--district-tolerance', type=float, default=SIMPLIFY_TOLERANCE_M, metavar='METERS',
+                        help='simplify the district borders drawn on maps to this many meters (0 keeps their shape exact)')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.maps if name not in MAPS]
+    if unknown:
+        parser.error(f"unknown map(s): {', '.join(unknown)} (choose from {', '.join(MAPS)})")
+    if args.slot and is_snapshot(args.db):
+        parser.error('--slot needs the database, restore the snapshot first')
+    names = args.maps or list(MAPS)
+    directory = os.path.join(SLOT_OUTPUT_DIR, args.slot) if args.slot else OUTPUT_DIR
+    os.makedirs(directory, exist_ok=True)
+
+    # Bring the side tables the selected maps read up to date with travel_info
+    # (snapshots have none, load_travel_info computes those columns in memory)
+    needed = {column for name in names for column in MAPS[name].get('columns', [])}
+    if not is_snapshot(args.db):
+        conn = sqlite3.connect(args.db)
+        if 'district' in needed:
+            assigned = update_districts(conn)
+            if assigned:
+                print(f"🏙️  Assigned {assigned} addresses to districts")
+        if needed & {'station', 'line', 'station_distance_m'}:
+            located = update_metro(conn)
+            if located:
+                print(f"🚇 Found the nearest metro station of {located} addresses")
+        conn.close()
+
+    # Rebuild only the maps whose inputs changed since they were last built
+    frame = None
+    if any('columns' in MAPS[name] for name in names):
+        try:
+            frame = load_travel_info(args.db, args.slot)
+        except ValueError as e:
+            parser.error(str(e))
+    store = FingerprintStore(fingerprints_path(directory))
+    fingerprints = {name: map_fingerprint(name, frame, args.compact, args.district_tolerance) for name in names}
+    stale = [name for name in names
+             if args.force or not store.is_fresh(name, map_output(name, directory), fingerprints[name])]
+    if len(stale) < len(names):
+        print(f"✅ Up to date: {', '.join(name for name in names if name not in stale)}")
+    if not stale:
+        return
+
+    start = time.perf_counter()
+    # Tiles are rendered here by a pool of their own, rather than by another pool nested in a map build worker
+    if 'travel_time_surface' in stale:
+        render_surface_tiles(frame, map_output('travel_time_surface', directory), args.workers)
+    timings = build_maps(stale, args.db, args.compact, args.workers, args.slot, directory, args.district_tolerance,
+                         frame)
+    elapsed = time.perf_counter() - start
+    for name, _ in timings:
+        store.update(name, fingerprints[name])
+    store.save()
+
+    print("⏱️  Build times:")
+    for name, seconds in timings:
+        print(f"   {name:<32} {seconds:6.2f} s")
+    print(f"   {'total':<32} {elapsed:6.2f} s ({len(timings)} maps)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+#! /usr/bin/env python3
+
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from directions_cache import DirectionsCache
+from scrape_addresses import (
+    DIRECTIONS_ENDPOINT, BatchWriter, DirectionsClient, DirectionsError, TokenBucket, average_car_duration,
+    get_car_travel_time, get_transit_info, initialize_database, next_departure, outcome,
+)
+
+WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+# Departure slots sampled by default, by name: weekday and local time
+DEFAULT_SLOTS = {
+    'weekday_peak': 'mon@08:00',
+    'weekday_offpeak': 'tue@13:00',
+    'weekday_evening': 'wed@21:00',
+    'weekend': 'sat@11:00',
+}
+# Every sample is one transit and one driving request
+CALLS_PER_SAMPLE = 2
+
+
+def parse_slot(text):
+    """'mon@08:00' as (weekday, hour, minute), Monday being 0"""
+    day, _, clock = text.partition('@')
+    hour, _, minute = clock.partition(':')
+    if day.lower() not in WEEKDAYS or not hour.isdigit() or not (minute or '0').isdigit():
+        raise ValueError(f"Invalid departure slot {text!r}, expected e.g. mon@08:00")
+    weekday, hour, minute = WEEKDAYS.index(day.lower()), int(hour), int(minute or 0)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Invalid departure slot {text!r}, expected e.g. mon@08:00")
+    return weekday, hour, minute
+
+
+def ensure_slots_table(conn):
+    """
+    One row per origin, slot and departure time, so resampling a slot in later weeks builds a time series.
+    Samples without a route keep NULL durations and the error, so they are not looked up again until due.
+    """
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS travel_time_slots (
+            street TEXT,
+            slot TEXT,
+            departure_time INTEGER,
+            transit_duration REAL,
+            transfers INTEGER,
+            car_duration_avg REAL,
+            error TEXT,
+            fetched_at INTEGER,
+            PRIMARY KEY (street, slot, departure_time)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS travel_time_slots_slot ON travel_time_slots (slot, street, departure_time);
+    ''')
+
+
+class SlotWriter(BatchWriter):
+    """BatchWriter of travel_time_slots rows"""
+
+    statement = (
+        "INSERT INTO travel_time_slots (street, slot, departure_time, transit_duration, transfers, car_duration_avg, error, fetched_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (street, slot, departure_time) DO UPDATE SET transit_duration = excluded.transit_duration, "
+        "transfers = excluded.transfers, car_duration_avg = excluded.car_duration_avg, error = excluded.error, "
+        "fetched_at = excluded.fetched_at"
+    )
+
+
+def due_samples(conn, slots, max_age_days):
+    """
+    (street, slot) pairs of measured travel_info origins without a sample fetched in the last `max_age_days`.
+    Slots are interleaved origin by origin, so a sweep cut short still covers every slot about equally.
+    """
+    cutoff = int(time.time() - max_age_days * 86400)
+    fresh = set(conn.execute("SELECT street, slot FROM travel_time_slots WHERE fetched_at >= ?", (cutoff,)))
+    origins = [street for street, in conn.execute(
+        "SELECT street FROM travel_info WHERE inferred_from IS NULL ORDER BY street")]
+    return [(street, slot) for street in origins for slot in slots if (street, slot) not in fresh]
+
+
+def finish_sample(writer, sample, transit_info, car_info):
+    """Stores a sample, or leaves it due for the next run when a lookup failed and may succeed later"""
+    street, slot, departure_time = sample
+    errors = [info for info in (transit_info, car_info) if isinstance(info, DirectionsError)]
+    if any(error.retryable for error in errors):
+        print(f"{street}\t{slot}\t{errors[0]}")
+        writer.tick()
+        return
+    transit_duration, transfers, _ = transit_info if not isinstance(transit_info, DirectionsError) else (None, None, None)
+    car_duration_avg = average_car_duration(car_info) if not isinstance(car_info, DirectionsError) else None
+    error = '; '.join(str(error) for error in errors) or None
+    print(f"{street}\t{slot}\t{transfers}\t{transit_duration}\t{car_duration_avg}")
+    writer.add((street, slot, departure_time, transit_duration, transfers, car_duration_avg, error, int(time.time())))
+
+
+def sweep(client, samples, slots, destination, writer, workers):
+    """
+    Looks up the due (street, slot) samples with up to `workers` in flight, like scrape_addresses.scrape().
+    Transit and driving are both asked for the next departure of the slot, so the two are comparable.
+    """
+    with ThreadPoolExecutor(max_workers=2 * workers) as executor:
+        in_flight = deque()
+        for street, slot in samples:
+            departure_time = next_departure(*slots[slot])
+            transit = executor.submit(get_transit_info, client, street, destination, departure_time)
+            car = executor.submit(get_car_travel_time, client, street, destination, departure_time)
+            in_flight.append(((street, slot, departure_time), transit, car))
+            if len(in_flight) >= workers:
+                sample, transit, car = in_flight.popleft()
+                finish_sample(writer, sample, outcome(transit), outcome(car))
+        while in_flight:
+            sample, transit, car = in_flight.popleft()
+            finish_sample(writer, sample, outcome(transit), outcome(car))
+
+
+def origin_history(conn, street):
+    """All samples of one origin as (slot, departure_time, transit_duration, transfers, car_duration_avg)"""
+    return conn.execute('''
+        SELECT slot, departure_time, transit_duration, transfers, car_duration_avg
+        FROM travel_time_slots WHERE street = ?
+        ORDER BY slot, departure_time
+    ''', (street,)).fetchall()
+
+
+def slot_summary(conn):
+    """(slot, origins, samples, average transit duration, latest departure time) of every sampled slot"""
+    return conn.execute('''
+        SELECT slot, COUNT(DISTINCT street), COUNT(*), AVG(transit_duration), MAX(departure_time)
+        FROM travel_time_slots GROUP BY slot ORDER BY slot
+    ''').fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Sample travel times of measured origins at several departure times, within a daily quota')
+    parser.add_argument('--db', default='travel_info.db', help='SQLite database file')
+    parser.add_argument('--slot', action='append', metavar='NAME=DAY@HH:MM',
+                        help=f"departure slot, repeatable (default: {', '.join(f'{n}={s}' for n, s in DEFAULT_SLOTS.items())})")
+    parser.add_argument('--refresh-days', type=float, default=7,
+                        help='resample an origin and slot once its latest sample is this old')
+    parser.add_argument('--daily-quota', type=int,
+                        help='API requests per day, spread evenly over the day (default: --qps without a daily limit)')
+    parser.add_argument('--qps', type=float, default=50, help='API requests per second without --daily-quota')
+    parser.add_argument('--limit', type=int, help='sample at most this many origin and slot pairs in this run')
+    parser.add_argument('--workers', type=int, default=8, help='Number of samples looked up concurrently')
+    parser.add_argument('--batch-size', type=int, default=100, help='Rows written per transaction')
+    parser.add_argument('--flush-interval', type=float, default=10.0, help='Maximum seconds between commits')
+    parser.add_argument('--endpoint', default=DIRECTIONS_ENDPOINT, help='Directions API URL, e.g. a local stand-in')
+    parser.add_argument('--cache-dir', default='directions_cache', help='Directory of cached raw API responses')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached responses')
+    parser.add_argument('--status', action='store_true', help='only print what has been sampled per slot')
+    args = parser.parse_args()
+
+    slots = {}
+    for text in args.slot or [f'{name}={spec}' for name, spec in DEFAULT_SLOTS.items()]:
+        name, _, spec = text.partition('=')
+        try:
+            slots[name] = parse_slot(spec)
+        except ValueError as e:
+            parser.error(str(e))
+
+    conn = initialize_database(args.db)
+    ensure_slots_table(conn)
+    if args.status:
+        for slot, origins, samples, average, latest in slot_summary(conn):
+            print(f"🕗 {slot}: {origins} origins, {samples} samples, {average or 0:.1f} min on average, "
+                  f"latest departure {time.strftime('%Y-%m-%d %H:%M', time.localtime(latest))}")
+        conn.close()
+        return
+
+    samples = due_samples(conn, slots, args.refresh_days)[:args.limit]
+    if args.daily_quota:
+        limiter = TokenBucket(args.daily_quota / 86400, capacity=1)
+        print(f"Sampling {len(samples)} origin and slot pairs, about "
+              f"{CALLS_PER_SAMPLE * len(samples) / args.daily_quota * 24:.1f} hours at {args.daily_quota} requests per day")
+    else:
+        limiter = TokenBucket(args.qps)
+        print(f"Sampling {len(samples)} origin and slot pairs")
+
+    cache = None if args.no_cache else DirectionsCache(args.cache_dir)
+    client = DirectionsClient(os.getenv('API_KEY'), pool_size=2 * args.workers, limiter=limiter,
+                              endpoint=args.endpoint, cache=cache)
+    writer = SlotWriter(conn, batch_size=args.batch_size, flush_interval=args.flush_interval)
+    try:
+        sweep(client, samples, slots, "Metro Świętokrzyska", writer, args.workers)
+    finally:
+        writer.flush()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
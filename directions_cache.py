@@ -0,0 +1,104 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+
+
+def normalize_request(endpoint, params):
+    """
+    Canonical form of a Directions request used as the cache key.
+    The API key is dropped and addresses are case- and whitespace-normalized,
+    so the same lookup always maps to the same entry.
+    """
+    normalized = {'endpoint': endpoint.rstrip('/').lower()}
+    for name, value in params.items():
+        if name == 'key':
+            continue
+        value = ' '.join(str(value).split())
+        if name in ('origin', 'destination'):
+            value = value.casefold()
+        normalized[name] = value
+    return normalized
+
+
+def cache_key(endpoint, params):
+    normalized = normalize_request(endpoint, params)
+    payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class DirectionsCache:
+    """
+    Content-addressed store of raw Directions API responses.
+    Each entry is a gzip-compressed JSON document holding the original request
+    parameters and the full response, stored under <directory>/<key[:2]>/<key>.json.gz.
+    When max_bytes is set, evict() removes least recently used entries above that size.
+    """
+
+    def __init__(self, directory, max_bytes=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    def get(self, endpoint, params):
+        """Returns the cached response or None"""
+        path = self._path(cache_key(endpoint, params))
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, EOFError, json.JSONDecodeError):
+            return None
+        # Refresh the access time used for LRU eviction
+        os.utime(path)
+        return entry['response']
+
+    def put(self, endpoint, params, response):
+        key = cache_key(endpoint, params)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            'request': {name: value for name, value in params.items() if name != 'key'},
+            'fetched_at': int(time.time()),
+            'response': response,
+        }
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _files(self):
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for file in os.scandir(shard.path):
+                if file.name.endswith('.json.gz'):
+                    yield file
+
+    def entries(self):
+        """Yields every cached entry as a dict with 'request', 'fetched_at' and 'response'"""
+        for file in self._files():
+            try:
+                with gzip.open(file.path, 'rt', encoding='utf-8') as f:
+                    yield json.load(f)
+            except (EOFError, json.JSONDecodeError):
+                continue
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in max_bytes"""
+        if self.max_bytes is None:
+            return 0
+        files = [(file.stat().st_mtime, file.stat().st_size, file.path) for file in self._files()]
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            removed += 1
+        return removed
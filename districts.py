@@ -0,0 +1,353 @@
+import argparse
+import functools
+import json
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from fingerprints import combine, file_digest
+from spatial_db import reset_if_source_changed, stale_rows
+from spatial_index import project
+
+DISTRICTS_GEOJSON = 'warszawa-dzielnice.geojson'
+# Points times polygon edges compared at once, bounds the memory of a single ray casting step
+CHUNK_ELEMENTS = 4_000_000
+# Map overlays draw district borders simplified to this many meters and rounded to this many decimals (about 1 m)
+SIMPLIFY_TOLERANCE_M = 10
+COORDINATE_DECIMALS = 5
+GEOMETRY_CACHE_DIR = 'geometry_cache'
+
+
+def geometry_rings(geometry):
+    """Rings of a Polygon or MultiPolygon as (n, 2) arrays of [longitude, latitude]"""
+    polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+    return [np.asarray(ring, dtype=float)[:, :2] for polygon in polygons for ring in polygon]
+
+
+def ring_area(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    return abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2
+
+
+def load_districts(path=DISTRICTS_GEOJSON):
+    """
+    Districts of a GeoJSON file, largest first. Each is a dict with the feature `name`, the `edges`
+    of all its rings as an (n, 4) array of [lon1, lat1, lon2, lat2], their `bbox` (south, west, north, east)
+    and an approximate `area` in square degrees.
+    """
+    with open(path, encoding='utf-8') as f:
+        features = json.load(f)['features']
+    districts = []
+    for feature in features:
+        rings = geometry_rings(feature['geometry'])
+        edges = np.concatenate([np.hstack([ring, np.roll(ring, -1, axis=0)]) for ring in rings])
+        points = np.concatenate(rings)
+        districts.append({
+            'name': (feature.get('properties') or {}).get('name'),
+            'edges': edges,
+            'bbox': (points[:, 1].min(), points[:, 0].min(), points[:, 1].max(), points[:, 0].max()),
+            # Holes are ignored, the area only orders overlapping features
+            'area': sum(ring_area(ring) for ring in rings),
+        })
+    return sorted(districts, key=lambda district: -district['area'])
+
+
+def points_in_polygon(latitudes, longitudes, edges, bbox=None):
+    """
+    Even-odd ray casting of many points against one polygon given by its edges (see load_districts),
+    so holes and multi-part polygons need no special handling.
+    Points outside the bounding box are rejected before any edge is looked at.
+    """
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    inside = np.zeros(latitudes.shape, dtype=bool)
+    if bbox is not None:
+        south, west, north, east = bbox
+        candidates = np.flatnonzero((latitudes >= south) & (latitudes <= north) &
+                                    (longitudes >= west) & (longitudes <= east))
+    else:
+        candidates = np.arange(latitudes.size)
+
+    x1, y1, x2, y2 = (edges[:, i] for i in range(4))
+    # Horizontal edges never cross the ray, their slope is replaced to avoid dividing by zero
+    slope = (x2 - x1) / np.where(y1 == y2, 1.0, y2 - y1)
+    chunk = max(1, CHUNK_ELEMENTS // max(1, len(edges)))
+    for start in range(0, candidates.size, chunk):
+        index = candidates[start:start + chunk]
+        px, py = longitudes[index, None], latitudes[index, None]
+        crosses = ((y1 > py) != (y2 > py)) & (px < x1 + (py - y1) * slope)
+        inside[index] = np.count_nonzero(crosses, axis=1) % 2 == 1
+    return inside
+
+
+def assign_districts(latitudes, longitudes, districts):
+    """
+    Name of the district containing each point, None outside all of them.
+    Districts are tested largest first, so a point covered by overlapping features (e.g. a city outline)
+    ends up in the smallest one.
+    """
+    names = np.full(np.shape(latitudes), None, dtype=object)
+    for district in districts:
+        names[points_in_polygon(latitudes, longitudes, district['edges'], district['bbox'])] = district['name']
+    return names
+
+
+def bbox_polygon(south, west, north, east):
+    """A bounding box in the form of load_districts, so it can be tested like any other polygon"""
+    ring = np.array([[west, south], [east, south], [east, north], [west, north]], dtype=float)
+    return {'name': None, 'edges': np.hstack([ring, np.roll(ring, -1, axis=0)]), 'bbox': (south, west, north, east),
+            'area': ring_area(ring)}
+
+
+def parse_bbox(text):
+    """'south,west,north,east' in degrees"""
+    try:
+        south, west, north, east = (float(value) for value in text.split(','))
+    except ValueError:
+        raise ValueError(f"Invalid bounding box {text!r}, expected south,west,north,east")
+    if south >= north or west >= east:
+        raise ValueError(f"Empty bounding box {text!r}, expected south,west,north,east")
+    return south, west, north, east
+
+
+def select_area(names=(), polygon_path=None, bbox=None, path=DISTRICTS_GEOJSON):
+    """
+    Polygons of the named districts of `path`, of every feature of the GeoJSON file `polygon_path`
+    and of a (south, west, north, east) box; a point is in the area when it is inside any of them.
+    """
+    area = []
+    if names:
+        districts = {district['name']: district for district in load_districts(path)}
+        unknown = [name for name in names if name not in districts]
+        if unknown:
+            raise ValueError(f"Unknown district(s) {', '.join(unknown)}, choose from {', '.join(sorted(districts))}")
+        area += [districts[name] for name in names]
+    if polygon_path:
+        area += load_districts(polygon_path)
+    if bbox:
+        area.append(bbox_polygon(*bbox))
+    return area
+
+
+def points_in_area(latitudes, longitudes, area):
+    """Whether each point is inside any polygon of an area (see select_area)"""
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    inside = np.zeros(latitudes.shape, dtype=bool)
+    for polygon in area:
+        # Points already known to be inside skip the remaining polygons
+        pending = np.flatnonzero(~inside)
+        inside[pending] = points_in_polygon(latitudes[pending], longitudes[pending], polygon['edges'], polygon['bbox'])
+    return inside
+
+
+def area_bbox(area):
+    """(south, west, north, east) enclosing all polygons of an area"""
+    boxes = np.array([polygon['bbox'] for polygon in area])
+    return boxes[:, 0].min(), boxes[:, 1].min(), boxes[:, 2].max(), boxes[:, 3].max()
+
+
+def ensure_district_table(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS travel_info_district (
+            street TEXT PRIMARY KEY,
+            latitude REAL,
+            longitude REAL,
+            district TEXT
+        )
+    ''')
+
+
+def update_districts(conn, path=DISTRICTS_GEOJSON):
+    """
+    Assigns travel_info rows to districts in the travel_info_district side table.
+    Only rows that are new or moved since the last run are tested; a changed GeoJSON file reassigns all.
+    Returns the number of rows assigned.
+    """
+    ensure_district_table(conn)
+    reset_if_source_changed(conn, 'travel_info_district', file_digest(path))
+    pending = stale_rows(conn, 'travel_info_district')
+    if pending:
+        # Missing coordinates become NaN and fall outside every district
+        latitudes = np.array([row[1] for row in pending], dtype=float)
+        longitudes = np.array([row[2] for row in pending], dtype=float)
+        names = assign_districts(latitudes, longitudes, load_districts(path))
+        conn.executemany('''
+            INSERT INTO travel_info_district (street, latitude, longitude, district) VALUES (?, ?, ?, ?)
+            ON CONFLICT(street) DO UPDATE SET
+                latitude = excluded.latitude, longitude = excluded.longitude, district = excluded.district
+        ''', [(*row, name) for row, name in zip(pending, names)])
+    conn.commit()
+    return len(pending)
+
+
+def district_stats(frame):
+    """
+    Per-district aggregates of a travel_info frame with a `district` column: number of addresses,
+    median and 90th percentile transit time, share of trips with 0, 1 and 2+ transfers,
+    and the median transit minus car time.
+    """
+    frame = frame[frame['district'].notna()]
+    grouped = frame.groupby('district')
+    transfer_mix = (pd.crosstab(frame['district'], frame['transfers'].clip(upper=2), normalize='index')
+                    .reindex(columns=[0, 1, 2], fill_value=0.0))
+    stats = pd.DataFrame({
+        'addresses': grouped.size(),
+        'median_transit': grouped['transit_duration'].median(),
+        'p90_transit': grouped['transit_duration'].quantile(0.9),
+        'direct': transfer_mix[0],
+        'one_transfer': transfer_mix[1],
+        'two_plus_transfers': transfer_mix[2],
+        'car_gap': (frame['transit_duration'] - frame['car_duration_avg']).groupby(frame['district']).median(),
+    })
+    return stats.fillna({'direct': 0.0, 'one_transfer': 0.0, 'two_plus_transfers': 0.0})
+
+
+def douglas_peucker(x, y, tolerance):
+    """Indices of the points of a polyline kept by Douglas-Peucker simplification, both ends included"""
+    keep = np.zeros(len(x), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(x) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        dx, dy = x[end] - x[start], y[end] - y[start]
+        px, py = x[start + 1:end] - x[start], y[start + 1:end] - y[start]
+        length = np.hypot(dx, dy)
+        distances = np.abs(dx * py - dy * px) / length if length else np.hypot(px, py)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack += [(start, split), (split, end)]
+    return np.flatnonzero(keep)
+
+
+def map_rings(geometry, function):
+    """A Polygon or MultiPolygon with `function` applied to each of its rings"""
+    if geometry['type'] == 'MultiPolygon':
+        coordinates = [[function(ring) for ring in polygon] for polygon in geometry['coordinates']]
+    else:
+        coordinates = [function(ring) for ring in geometry['coordinates']]
+    return {**geometry, 'coordinates': coordinates}
+
+
+def simplify_districts(geojson, tolerance_m=SIMPLIFY_TOLERANCE_M, decimals=COORDINATE_DECIMALS):
+    """
+    Simplifies the rings of a GeoJSON FeatureCollection without opening gaps between neighbours:
+    rings are cut into arcs wherever the set of rings sharing a vertex changes, every arc is simplified
+    once (Douglas-Peucker, `tolerance_m` meters) and the same result is used by all rings sharing it.
+    Coordinates are then rounded to `decimals`. Rings that would collapse keep all their points.
+    """
+    # Rings sharing each vertex, compared exactly as neighbouring borders are drawn through the same points
+    members = {}
+    for i, ring in enumerate(ring for feature in geojson['features'] for ring in geometry_rings(feature['geometry'])):
+        for lon, lat in ring:
+            members.setdefault((float(lon), float(lat)), set()).add(i)
+
+    arcs = {}
+
+    def simplify_arc(arc):
+        # Neighbours walk a shared arc in opposite directions, both must get the same points
+        canonical = min(arc, arc[::-1])
+        if canonical not in arcs:
+            x, y = project([lat for _, lat in canonical], [lon for lon, _ in canonical])
+            arcs[canonical] = [canonical[i] for i in douglas_peucker(x, y, tolerance_m)]
+        return arcs[canonical] if canonical == arc else arcs[canonical][::-1]
+
+    def simplify_ring(ring):
+        points = [(float(point[0]), float(point[1])) for point in ring]
+        if points[0] == points[-1]:
+            points = points[:-1]
+        n = len(points)
+        if n < 4:
+            return ring
+        cuts = [i for i in range(n)
+                if members[points[i]] != members[points[i - 1]] or members[points[i]] != members[points[(i + 1) % n]]]
+        if len(cuts) < 2:
+            # A ring nobody shares, cut it where it is widest so both halves are simplified as lines
+            start = cuts[0] if cuts else 0
+            x, y = project([lat for _, lat in points], [lon for lon, _ in points])
+            cuts = sorted({start, int(np.argmax(np.hypot(x - x[start], y - y[start])))})
+        simplified = []
+        for start, end in zip(cuts, cuts[1:] + [cuts[0] + n]):
+            arc = tuple(points[i % n] for i in range(start, end + 1))
+            simplified += simplify_arc(arc)[:-1]
+        quantized = []
+        for lon, lat in simplified:
+            point = [round(lon, decimals), round(lat, decimals)]
+            if not quantized or point != quantized[-1]:
+                quantized.append(point)
+        if len(quantized) > 1 and quantized[-1] == quantized[0]:
+            quantized.pop()
+        if len(quantized) < 3:
+            return ring
+        return quantized + [quantized[0]]
+
+    return {**geojson, 'features': [{**feature, 'geometry': map_rings(feature['geometry'], simplify_ring)}
+                                    for feature in geojson['features']]}
+
+
+@functools.lru_cache(maxsize=None)
+def simplified_geojson_text(path, tolerance_m, decimals, digest):
+    """
+    Simplified GeoJSON of `path` as text, read from GEOMETRY_CACHE_DIR when that file was simplified
+    before with the same settings; `digest` is the hash of the file, so an edited file is simplified again.
+    """
+    key = combine({'file': digest, 'tolerance_m': tolerance_m, 'decimals': decimals})[:16]
+    cache_path = os.path.join(GEOMETRY_CACHE_DIR, f'{os.path.splitext(os.path.basename(path))[0]}-{key}.json')
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+    with open(path, encoding='utf-8') as f:
+        geojson = json.load(f)
+    text = json.dumps(simplify_districts(geojson, tolerance_m, decimals), ensure_ascii=False, separators=(',', ':'))
+    os.makedirs(GEOMETRY_CACHE_DIR, exist_ok=True)
+    # Map builds running in parallel may write the same file, each replaces it whole
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, cache_path)
+    return text
+
+
+def district_geometry(path=DISTRICTS_GEOJSON, tolerance_m=SIMPLIFY_TOLERANCE_M, decimals=COORDINATE_DECIMALS):
+    """
+    District borders for map overlays: the GeoJSON simplified by simplify_districts(), parsed and simplified
+    once per file version and settings. Returns a new object on every call, callers may modify it.
+    Assigning addresses to districts keeps using the full geometry (load_districts).
+    """
+    return json.loads(simplified_geojson_text(path, tolerance_m, decimals, file_digest(path)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Assign travel_info addresses to districts')
+    parser.add_argument('--db', default='travel_info.db')
+    parser.add_argument('--geojson', default=DISTRICTS_GEOJSON)
+    parser.add_argument('--simplify', type=float, metavar='METERS',
+                        help='only simplify the district borders drawn on maps and compare their size')
+    args = parser.parse_args()
+
+    if args.simplify is not None:
+        with open(args.geojson, encoding='utf-8') as f:
+            original = json.load(f)
+        simplified = district_geometry(args.geojson, args.simplify)
+        sizes = [len(json.dumps(geojson, ensure_ascii=False, separators=(',', ':'))) for geojson in (original, simplified)]
+        points = [sum(len(ring) for feature in geojson['features'] for ring in geometry_rings(feature['geometry']))
+                  for geojson in (original, simplified)]
+        print(f"🗜️  {points[0]} → {points[1]} points, {sizes[0] / 1024:.0f} → {sizes[1] / 1024:.0f} KB "
+              f"at {args.simplify:g} m (cached in {GEOMETRY_CACHE_DIR}/)")
+        return
+
+    conn = sqlite3.connect(args.db)
+    print(f"🏙️  Assigned {update_districts(conn, args.geojson)} addresses to districts")
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
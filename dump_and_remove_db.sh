@@ -1,7 +1,9 @@
 #!/bin/bash
+set -e
 
-# Dump the SQLite database to an SQL file
-sqlite3 travel_info.db .dump > travel_info.sql
+# Dump travel_info and the other collected tables (scrape queue, departure slots, route legs) to a snapshot,
+# uncompressed so the maps can memory-map it
+python snapshot.py dump --db travel_info.db --snapshot travel_info.snap
 
 # Remove the original SQLite database file
-rm travel_info.db 
\ No newline at end of file
+rm travel_info.db
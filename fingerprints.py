@@ -0,0 +1,51 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+
+def frame_digest(frame, columns):
+    """Content hash of the given columns of a DataFrame, independent of its index"""
+    hashes = pd.util.hash_pandas_object(frame[columns], index=False).to_numpy()
+    return hashlib.sha256(json.dumps(columns).encode() + hashes.tobytes()).hexdigest()
+
+
+def file_digest(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def combine(parts):
+    """Single fingerprint of a JSON-serializable description of inputs"""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class FingerprintStore:
+    """
+    Remembers the input fingerprint each output was last built from, in a small JSON file.
+    An output is stale when it is missing or its inputs hash differently than when it was built.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.fingerprints = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.fingerprints = {}
+
+    def is_fresh(self, name, output, fingerprint):
+        return self.fingerprints.get(name) == fingerprint and os.path.exists(output)
+
+    def update(self, name, fingerprint):
+        self.fingerprints[name] = fingerprint
+
+    def save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.fingerprints, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
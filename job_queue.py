@@ -0,0 +1,112 @@
+import random
+import time
+
+
+class JobQueue:
+    """
+    SQLite-backed queue of origins to scrape, stored next to travel_info so a run can resume after a crash.
+    Every origin moves through pending -> in_flight -> done, or back to pending with an
+    exponentially growing, jittered delay after a retryable error, until it ends up failed.
+
+    The queue never commits: its updates become durable together with the travel_info
+    rows in the same transaction, so an origin is never marked done without its result.
+    """
+
+    def __init__(self, conn, max_attempts=5, base_delay=2.0, max_delay=600.0):
+        self.conn = conn
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_jobs (
+                street TEXT PRIMARY KEY,
+                latitude REAL,
+                longitude REAL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                updated_at REAL
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS scrape_jobs_status ON scrape_jobs (status, next_attempt_at)")
+
+    def enqueue(self, origins, requeue=False):
+        """
+        Adds (street, latitude, longitude) tuples as pending jobs, ignoring streets already queued,
+        or with `requeue` making done and failed ones pending again with a fresh set of attempts.
+        """
+        conflict = ("ON CONFLICT (street) DO UPDATE SET status = 'pending', attempts = 0, next_attempt_at = 0, "
+                    "last_error = NULL, updated_at = excluded.updated_at WHERE status IN ('done', 'failed')"
+                    if requeue else "ON CONFLICT (street) DO NOTHING")
+        self.conn.executemany(
+            f"INSERT INTO scrape_jobs (street, latitude, longitude, updated_at) VALUES (?, ?, ?, ?) {conflict}",
+            [(street, latitude, longitude, time.time()) for street, latitude, longitude in origins]
+        )
+
+    def streets(self, status=None):
+        if status is not None:
+            return {street for street, in self.conn.execute("SELECT street FROM scrape_jobs WHERE status = ?", (status,))}
+        return {street for street, in self.conn.execute("SELECT street FROM scrape_jobs")}
+
+    def recover(self):
+        """Returns jobs left in flight by an interrupted run to the pending state"""
+        return self.conn.execute(
+            "UPDATE scrape_jobs SET status = 'pending', updated_at = ? WHERE status = 'in_flight'", (time.time(),)
+        ).rowcount
+
+    def retry_failed(self):
+        """Gives every failed job a fresh set of attempts"""
+        return self.conn.execute(
+            "UPDATE scrape_jobs SET status = 'pending', attempts = 0, next_attempt_at = 0, updated_at = ? "
+            "WHERE status = 'failed'", (time.time(),)
+        ).rowcount
+
+    def claim(self, limit):
+        """Marks up to `limit` due pending jobs as in flight and returns them as (street, latitude, longitude)"""
+        now = time.time()
+        jobs = self.conn.execute(
+            "SELECT street, latitude, longitude FROM scrape_jobs "
+            "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at, rowid LIMIT ?",
+            (now, limit)
+        ).fetchall()
+        self.conn.executemany(
+            "UPDATE scrape_jobs SET status = 'in_flight', updated_at = ? WHERE street = ?",
+            [(now, street) for street, _, _ in jobs]
+        )
+        return jobs
+
+    def complete(self, street):
+        self.conn.execute(
+            "UPDATE scrape_jobs SET status = 'done', attempts = attempts + 1, last_error = NULL, updated_at = ? "
+            "WHERE street = ?", (time.time(), street)
+        )
+
+    def fail(self, street, error, retryable):
+        attempts, = self.conn.execute("SELECT attempts FROM scrape_jobs WHERE street = ?", (street,)).fetchone()
+        attempts += 1
+        now = time.time()
+        if retryable and attempts < self.max_attempts:
+            delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+            # Jitter spreads retries out so a burst of 429s does not come back as another burst
+            next_attempt_at = now + delay * random.uniform(0.5, 1.0)
+            status = 'pending'
+        else:
+            next_attempt_at = now
+            status = 'failed'
+        self.conn.execute(
+            "UPDATE scrape_jobs SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, updated_at = ? "
+            "WHERE street = ?", (status, attempts, next_attempt_at, error, now, street)
+        )
+
+    def seconds_until_next_attempt(self):
+        """Seconds until the earliest pending job is due, or None if nothing is pending"""
+        next_attempt_at, = self.conn.execute(
+            "SELECT MIN(next_attempt_at) FROM scrape_jobs WHERE status = 'pending'"
+        ).fetchone()
+        if next_attempt_at is None:
+            return None
+        return max(0.0, next_attempt_at - time.time())
+
+    def counts(self):
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM scrape_jobs GROUP BY status").fetchall())
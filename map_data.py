@@ -0,0 +1,123 @@
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from districts import DISTRICTS_GEOJSON, assign_districts, load_districts
+from metro import STATIONS_CSV, load_stations, nearest_stations
+from snapshot import is_snapshot, load_frame
+
+TRAVEL_INFO_COLUMNS = ['street', 'latitude', 'longitude', 'transit_duration', 'transfers', 'car_duration_avg']
+# Per-address values precomputed by districts.update_districts() and metro.update_metro()
+SIDE_TABLE_COLUMNS = {
+    'travel_info_district': ['district'],
+    'travel_info_metro': ['station', 'line', 'station_distance_m'],
+}
+
+
+def snapshot_side_columns(frame):
+    """
+    Snapshots carry travel_info only, so the district and nearest metro station of every row
+    are computed in memory instead of read from the side tables.
+    """
+    latitudes = frame['latitude'].to_numpy(dtype=float)
+    longitudes = frame['longitude'].to_numpy(dtype=float)
+    frame['district'] = (assign_districts(latitudes, longitudes, load_districts())
+                         if os.path.exists(DISTRICTS_GEOJSON) else None)
+    if os.path.exists(STATIONS_CSV):
+        stations = load_stations()
+        nearest, distances = nearest_stations(latitudes, longitudes, stations)
+        located = nearest >= 0
+        for column, source in (('station', 'Name'), ('line', 'Line')):
+            values = np.full(len(frame), None, dtype=object)
+            values[located] = stations[source].to_numpy(dtype=object)[nearest[located]]
+            frame[column] = values
+        frame['station_distance_m'] = distances
+    else:
+        frame['station'], frame['line'], frame['station_distance_m'] = None, None, np.nan
+    return frame
+
+
+# Columns of travel_info replaced by those of a departure slot sample, see departure_sweep.py
+SLOT_COLUMNS = ['transit_duration', 'transfers', 'car_duration_avg']
+
+
+def load_travel_info(db_path='travel_info.db', slot=None):
+    """
+    Reads travel_info once into a DataFrame shared by all maps, from the database or a snapshot (*.snap).
+    Columns of the derived side tables (SIDE_TABLE_COLUMNS) are joined in, or NULL until those tables exist.
+    With a `slot`, only origins sampled at that departure slot are read, with the travel times
+    of their latest sample (SLOT_COLUMNS) in place of those of travel_info.
+    """
+    if is_snapshot(db_path):
+        frame = snapshot_side_columns(load_frame(db_path, TRAVEL_INFO_COLUMNS)[TRAVEL_INFO_COLUMNS])
+        frame['transfers'] = frame['transfers'].astype(float)
+        return frame
+
+    conn = sqlite3.connect(db_path)
+    existing = {name for name, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    selected = [f's.{column}' if slot is not None and column in SLOT_COLUMNS else f't.{column}'
+                for column in TRAVEL_INFO_COLUMNS]
+    joins, params = [], ()
+    if slot is not None:
+        if 'travel_time_slots' not in existing:
+            conn.close()
+            raise ValueError(f'{db_path} has no departure slot samples, run departure_sweep.py first')
+        joins.append(f'''JOIN (
+            SELECT street, {', '.join(SLOT_COLUMNS)},
+                   ROW_NUMBER() OVER (PARTITION BY street ORDER BY departure_time DESC) AS recency
+            FROM travel_time_slots WHERE slot = ?
+        ) s ON s.street = t.street AND s.recency = 1''')
+        params = (slot,)
+    for table, columns in SIDE_TABLE_COLUMNS.items():
+        if table in existing:
+            selected += [f'{table}.{column}' for column in columns]
+            joins.append(f'LEFT JOIN {table} USING (street)')
+        else:
+            selected += [f'NULL AS {column}' for column in columns]
+    frame = pd.read_sql_query(f"SELECT {', '.join(selected)} FROM travel_info t {' '.join(joins)}", conn,
+                              params=params)
+    conn.close()
+    if slot is not None and frame.empty:
+        raise ValueError(f'No samples of departure slot {slot!r} in {db_path}')
+    # Keep transfers numeric even when some are NULL, so comparisons stay vectorized
+    frame['transfers'] = frame['transfers'].astype(float)
+    frame['station_distance_m'] = frame['station_distance_m'].astype(float)
+    return frame
+
+
+def records(frame, columns):
+    """Rows of the given columns as plain lists, with NaN turned into None (null in JSON)"""
+    subset = frame[columns].astype(object)
+    return subset.where(subset.notna(), None).values.tolist()
+
+
+def transfer_rows(frame):
+    """Rows with a known transfer count and location, as in the transfer analysis map, with integer transfers"""
+    rows = frame[frame['transfers'].notna() & frame['latitude'].notna() & frame['longitude'].notna()]
+    return rows.astype({'transfers': np.int64})
+
+
+def comparison_rows(frame):
+    """Rows with both transit and car durations, as in the transport comparison maps"""
+    return frame[frame['transit_duration'].notna() & frame['car_duration_avg'].notna()]
+
+
+SHORT_TIME_MINUTES = 25
+
+
+def short_time_rows(frame, limit=SHORT_TIME_MINUTES):
+    return frame[frame['transit_duration'] < limit]
+
+
+def located_durations(frame):
+    """(latitudes, longitudes, transit durations) of rows where all three are known"""
+    known = frame[['latitude', 'longitude', 'transit_duration']].dropna()
+    return tuple(known[column].to_numpy(dtype=float) for column in known.columns)
+
+
+def transfer_counts(frame):
+    """Number of locations per known transfer count, in ascending order"""
+    counts = frame['transfers'].dropna().astype(np.int64).value_counts().sort_index()
+    return list(counts.items())
@@ -0,0 +1,139 @@
+import argparse
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from fingerprints import file_digest
+from spatial_db import reset_if_source_changed, stale_rows
+from spatial_index import GridIndex, haversine_m
+
+STATIONS_CSV = 'metro-stations.csv'
+# Rough limit of what people walk to a metro station
+WALKING_DISTANCE_M = 1000
+MAX_SEARCH_RADIUS_M = 50_000
+
+
+def load_stations(path=STATIONS_CSV):
+    """Metro stations with Name, Latitude, Longitude and Line columns"""
+    return pd.read_csv(path)
+
+
+def nearest_stations(latitudes, longitudes, stations, initial_radius_m=2000):
+    """
+    Nearest station to every point by haversine distance.
+    Candidates come from a GridIndex over the stations; points with no station in range are retried with a
+    doubled radius (and a coarser grid, so each round looks at the same few cells) up to MAX_SEARCH_RADIUS_M.
+    Returns (positional indices into `stations`, distances in meters); -1 and NaN where none was found.
+    """
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    station_latitudes = stations['Latitude'].to_numpy(dtype=float)
+    station_longitudes = stations['Longitude'].to_numpy(dtype=float)
+    nearest = np.full(latitudes.shape, -1, dtype=np.int64)
+    distances = np.full(latitudes.shape, np.nan)
+    pending = np.flatnonzero(~np.isnan(latitudes) & ~np.isnan(longitudes))
+    radius_m = initial_radius_m
+    while pending.size:
+        index = GridIndex(station_latitudes, station_longitudes, cell_size_m=radius_m / 2)
+        queries, candidates, _ = index.pairs_within(latitudes[pending], longitudes[pending], radius_m)
+        d = haversine_m(latitudes[pending[queries]], longitudes[pending[queries]],
+                        station_latitudes[candidates], station_longitudes[candidates])
+        # Farthest first, so the closest candidate of every point is written last
+        order = np.argsort(-d, kind='stable')
+        best = np.full(pending.size, np.inf)
+        best_station = np.full(pending.size, -1, dtype=np.int64)
+        best[queries[order]] = d[order]
+        best_station[queries[order]] = candidates[order]
+        # The grid measures planar distances, a margin keeps points near the search edge for the next round
+        found = best <= radius_m * 0.95
+        nearest[pending[found]] = best_station[found]
+        distances[pending[found]] = best[found]
+        pending = pending[~found]
+        if radius_m >= MAX_SEARCH_RADIUS_M:
+            break
+        radius_m = min(radius_m * 2, MAX_SEARCH_RADIUS_M)
+    return nearest, distances
+
+
+def ensure_metro_table(conn):
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS travel_info_metro (
+            street TEXT PRIMARY KEY,
+            latitude REAL,
+            longitude REAL,
+            station TEXT,
+            line TEXT,
+            station_distance_m REAL
+        );
+
+        CREATE INDEX IF NOT EXISTS travel_info_metro_distance ON travel_info_metro (station_distance_m);
+    ''')
+
+
+def update_metro(conn, path=STATIONS_CSV):
+    """
+    Stores the nearest metro station, its line and the distance to it for travel_info rows in the
+    travel_info_metro side table. Only rows that are new or moved since the last run are looked up;
+    a changed stations file recomputes all. Returns the number of rows updated.
+    """
+    ensure_metro_table(conn)
+    reset_if_source_changed(conn, 'travel_info_metro', file_digest(path))
+    pending = stale_rows(conn, 'travel_info_metro')
+    if pending:
+        stations = load_stations(path)
+        latitudes = np.array([row[1] for row in pending], dtype=float)
+        longitudes = np.array([row[2] for row in pending], dtype=float)
+        nearest, distances = nearest_stations(latitudes, longitudes, stations)
+        names = stations['Name'].to_numpy(dtype=object)
+        lines = stations['Line'].to_numpy(dtype=object)
+        conn.executemany('''
+            INSERT INTO travel_info_metro (street, latitude, longitude, station, line, station_distance_m)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(street) DO UPDATE SET
+                latitude = excluded.latitude, longitude = excluded.longitude, station = excluded.station,
+                line = excluded.line, station_distance_m = excluded.station_distance_m
+        ''', [
+            (*row, names[i], lines[i], float(d)) if i >= 0 else (*row, None, None, None)
+            for row, i, d in zip(pending, nearest, distances)
+        ])
+    conn.commit()
+    return len(pending)
+
+
+def addresses_near_line(conn, line, max_distance_m=WALKING_DISTANCE_M,
+                        columns=('street', 'latitude', 'longitude', 'transit_duration')):
+    """
+    travel_info rows whose nearest metro station is on `line` and at most `max_distance_m` away,
+    each with the station and distance appended, nearest first.
+    Interchange stations list their lines as e.g. 'M1/M2' and count for each of them.
+    """
+    selected = ', '.join(f't.{column}' for column in columns)
+    return conn.execute(f'''
+        SELECT {selected}, m.station, m.station_distance_m
+        FROM travel_info_metro m JOIN travel_info t ON t.street = m.street
+        WHERE m.station_distance_m <= ? AND '/' || m.line || '/' LIKE '%/' || ? || '/%'
+        ORDER BY m.station_distance_m
+    ''', (max_distance_m, line)).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find the nearest metro station of travel_info addresses')
+    parser.add_argument('--db', default='travel_info.db')
+    parser.add_argument('--stations', default=STATIONS_CSV)
+    parser.add_argument('--line', help='list addresses near this line, e.g. M2')
+    parser.add_argument('--within', type=float, default=WALKING_DISTANCE_M, help='distance to the station in meters')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    print(f"🚇 Found the nearest station of {update_metro(conn, args.stations)} addresses")
+    if args.line:
+        rows = addresses_near_line(conn, args.line, args.within)
+        for street, _, _, transit_duration, station, distance in rows:
+            print(f"   {street}: {station} {distance:.0f} m, {transit_duration} min")
+        print(f"📊 {len(rows)} addresses within {args.within:.0f} m of {args.line}")
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+#! /usr/bin/env python3
+"""
+Local stand-in for the Google Directions and Distance Matrix APIs.
+Responses mimic the shape of the real ones, with travel times derived
+deterministically from the origin address, so scraper runs are repeatable.
+Latency, failed requests and origins without routes can be simulated for benchmarks:
+
+    python mock_maps_server.py --port 8000 --latency 0.1 --error-rate 0.02
+    python scrape_addresses.py --no-cache \
+        --endpoint http://localhost:8000/maps/api/directions/json \
+        --matrix-endpoint http://localhost:8000/maps/api/distancematrix/json
+"""
+
+import argparse
+import json
+import random
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+def duration(seconds):
+    minutes = round(seconds / 60)
+    if minutes >= 60:
+        text = f"{minutes // 60} hour {minutes % 60} mins"
+    else:
+        text = f"{minutes} mins"
+    return {'text': text, 'value': seconds}
+
+
+def distance(meters):
+    text = f"{meters / 1000:.1f} km" if meters >= 1000 else f"{meters} m"
+    return {'text': text, 'value': meters}
+
+
+def travel_seconds(origin, mode):
+    """Stable pseudo-random travel time between 10 and 60 minutes for transit, shorter by car"""
+    seed = zlib.crc32(origin.encode('utf-8'))
+    transit = 600 + seed % 3000
+    if mode == 'transit':
+        return transit
+    return int(transit * 0.7)
+
+
+def transit_steps(origin, total, departure):
+    """Walk, one to three rides each after a one minute wait, then walk, starting at `departure`"""
+    seed = zlib.crc32(origin.encode('utf-8'))
+    rides = 1 + seed % 3
+    walk, wait = 300, 60
+    ride = (total - 2 * walk) // rides - wait
+    clock = departure + walk
+    steps = [{'travel_mode': 'WALKING', 'distance': distance(400), 'duration': duration(walk)}]
+    for i in range(rides):
+        vehicle, line = [('BUS', str(100 + seed % 90)), ('TRAM', str(1 + seed % 35)), ('SUBWAY', 'M1')][(seed + i) % 3]
+        steps.append({
+            'travel_mode': 'TRANSIT',
+            'distance': distance(ride * 8),
+            'duration': duration(ride),
+            'transit_details': {
+                'line': {'name': line, 'short_name': line, 'vehicle': {'type': vehicle}},
+                'num_stops': 3 + i,
+                'departure_time': {'value': clock + wait},
+                'arrival_time': {'value': clock + wait + ride},
+            },
+        })
+        clock += wait + ride
+    steps.append({'travel_mode': 'WALKING', 'distance': distance(400), 'duration': duration(walk)})
+    return steps
+
+
+def has_no_route(origin, rate):
+    """The same origins are always unreachable for a given rate"""
+    return zlib.crc32(origin.encode('utf-8'), 1) % 10_000 < rate * 10_000
+
+
+def directions_response(query, no_route_rate=0.0):
+    origin, mode = query['origin'], query.get('mode', 'driving')
+    if has_no_route(origin, no_route_rate):
+        return {'status': 'ZERO_RESULTS', 'routes': []}
+    seconds = travel_seconds(origin, mode)
+    leg = {'duration': duration(seconds), 'distance': distance(seconds * 8), 'steps': []}
+    if mode == 'transit':
+        departure = int(query.get('departure_time', time.time()))
+        leg['departure_time'] = {'value': departure}
+        leg['steps'] = transit_steps(origin, seconds, departure)
+    elif 'departure_time' in query:
+        leg['duration_in_traffic'] = duration(int(seconds * 1.2))
+        leg['steps'] = [{'travel_mode': 'DRIVING', 'distance': leg['distance'], 'duration': leg['duration']}]
+    return {'status': 'OK', 'routes': [{'legs': [leg]}]}
+
+
+def matrix_response(query, no_route_rate=0.0):
+    origins = query['origins'].split('|')
+    mode = query.get('mode', 'driving')
+    rows = []
+    for origin in origins:
+        if has_no_route(origin, no_route_rate):
+            rows.append({'elements': [{'status': 'ZERO_RESULTS'}]})
+            continue
+        seconds = travel_seconds(origin, mode)
+        element = {'status': 'OK', 'duration': duration(seconds), 'distance': distance(seconds * 8)}
+        if mode == 'driving' and 'departure_time' in query:
+            element['duration_in_traffic'] = duration(int(seconds * 1.2))
+        rows.append({'elements': [element]})
+    return {
+        'status': 'OK',
+        'origin_addresses': origins,
+        'destination_addresses': [query['destinations']],
+        'rows': rows,
+    }
+
+
+class MockMapsServer(ThreadingHTTPServer):
+    """
+    Each request waits `latency` seconds on average (uniformly within +/- `jitter` of it), and fails with
+    `error_rate` probability as an HTTP 500, an HTTP 429 or an OVER_QUERY_LIMIT response.
+    A `no_route_rate` fraction of origins has no route at all.
+    """
+
+    def __init__(self, address, latency=0.0, jitter=0.5, error_rate=0.0, no_route_rate=0.0, seed=None):
+        super().__init__(address, MockMapsHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.no_route_rate = no_route_rate
+        self.random = random.Random(seed)
+
+
+class MockMapsHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency * server.random.uniform(1 - server.jitter, 1 + server.jitter))
+        if server.random.random() < server.error_rate:
+            failure = server.random.choice(['500', '429', 'OVER_QUERY_LIMIT'])
+            if failure == 'OVER_QUERY_LIMIT':
+                self.send_json(200, {'status': failure, 'routes': []})
+            else:
+                self.send_json(int(failure), {'status': 'UNKNOWN_ERROR'})
+        elif url.path.endswith('/directions/json'):
+            self.send_json(200, directions_response(query, server.no_route_rate))
+        elif url.path.endswith('/distancematrix/json'):
+            self.send_json(200, matrix_response(query, server.no_route_rate))
+        else:
+            self.send_json(404, {'status': 'NOT_FOUND'})
+
+    def send_json(self, status_code, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Google Directions and Distance Matrix API')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help='mean seconds before each response')
+    parser.add_argument('--jitter', type=float, default=0.5, help='latency varies by up to this fraction of it')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests that fail')
+    parser.add_argument('--no-route-rate', type=float, default=0.0, help='fraction of origins without any route')
+    parser.add_argument('--seed', type=int, help='seed of the latency and failure draws')
+    args = parser.parse_args()
+
+    server = MockMapsServer((args.host, args.port), args.latency, args.jitter, args.error_rate,
+                            args.no_route_rate, args.seed)
+    print(f"Mock Maps API listening on http://{args.host}:{args.port}/maps/api/")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
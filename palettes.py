@@ -0,0 +1,135 @@
+import numpy as np
+
+# Transit duration ramp of the point maps: green below 10 min, through yellow (25) and red (40), to black above 55
+MIN_TIME_GREEN = 10
+MID_TIME_YELLOW = 25
+MID_TIME_RED = 40
+MAX_TIME_BLACK = 55
+MAX_COLOR_VAL = 204
+
+
+def duration_rgb(travel_times):
+    """
+    Vectorized form of the plot_all_points color ladder.
+    Returns an (..., 3) uint8 array; missing (NaN) travel times come out black and should be masked by the caller.
+    """
+    t = np.nan_to_num(np.asarray(travel_times, dtype=float), nan=np.inf)
+
+    def ramp(low, high):
+        # Truncated like int() in the original ladder, all values here are non-negative
+        return np.floor((t - low) / (high - low) * MAX_COLOR_VAL)
+
+    to_yellow = (t >= MIN_TIME_GREEN) & (t <= MID_TIME_YELLOW)
+    to_red = (t > MID_TIME_YELLOW) & (t <= MID_TIME_RED)
+    to_black = (t > MID_TIME_RED) & (t <= MAX_TIME_BLACK)
+    green = t < MIN_TIME_GREEN
+
+    rgb = np.zeros(t.shape + (3,), dtype=np.uint8)
+    rgb[..., 0] = np.select(
+        [to_yellow, to_red, to_black],
+        [ramp(MIN_TIME_GREEN, MID_TIME_YELLOW), MAX_COLOR_VAL, MAX_COLOR_VAL - ramp(MID_TIME_RED, MAX_TIME_BLACK)],
+        0
+    )
+    rgb[..., 1] = np.select(
+        [green | to_yellow, to_red],
+        [MAX_COLOR_VAL, MAX_COLOR_VAL - ramp(MID_TIME_YELLOW, MID_TIME_RED)],
+        0
+    )
+    return rgb
+
+
+# Transfer palette (fewer is better)
+TRANSFER_COLORS = {
+    0: '#2d8030',    # Deep green (excellent - no transfers)
+    1: '#ffd700',    # Gold/yellow (good - 1 transfer)
+    2: '#ff8c00',    # Dark orange (moderate - 2 transfers)
+    3: '#dc143c'     # Crimson red (poor - 3+ transfers, if any)
+}
+
+# Transit vs car palette thresholds (difference = transit_time - car_time)
+COMPARISON_THRESHOLDS = {
+    'excellent': 0,      # Public transport faster (green)
+    'good': 10,         # Slightly slower (0-10 min) (light green)
+    'acceptable': 15,   # Moderate difference (10-15 min) (amber)
+    'poor': 20,         # Significant difference (15-20 min) (orange)
+    'very_poor': 100    # Very poor (20+ min) (red to black)
+}
+
+# Creative color palette inspired by Warsaw nature and urban themes
+COMPARISON_COLORS = {
+    'excellent': '#006837',     # Deep forest green (Łazienki Park)
+    'good': '#31a354',          # Sage green (Vistula riverbank)
+    'acceptable': '#feb24c',     # Warm amber (Warsaw sunset)
+    'poor': '#fd8d3c',          # Sunset orange
+    'very_poor': '#bd0026',     # Deep crimson (Palace of Culture red brick)
+    'extreme': '#000000'        # Black (coal/industry)
+}
+
+# Official line colors of the Warsaw metro
+METRO_LINE_COLORS = {
+    'M1': '#0055a4',
+    'M2': '#e30613',
+    'M1/M2': '#7a2a8f',    # Interchange (Świętokrzyska)
+}
+
+HEX_BYTES = np.array([f'{value:02x}' for value in range(256)], dtype=object)
+
+
+def to_hex(rgb):
+    """Formats an (..., 3) uint8 array as '#rrggbb' strings"""
+    rgb = np.asarray(rgb, dtype=np.uint8)
+    return '#' + HEX_BYTES[rgb[..., 0]] + HEX_BYTES[rgb[..., 1]] + HEX_BYTES[rgb[..., 2]]
+
+
+def hex_to_rgb(color):
+    return np.array([int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)], dtype=float)
+
+
+def duration_colors(travel_times):
+    """Marker colors of plot_all_points: the duration ramp, with 'gray' for missing travel times"""
+    t = np.asarray(travel_times, dtype=float)
+    colors = to_hex(duration_rgb(t))
+    with np.errstate(invalid='ignore'):
+        colors[t < MIN_TIME_GREEN] = '#0c0'
+        colors[t > MAX_TIME_BLACK] = 'black'
+    colors[np.isnan(t)] = 'gray'
+    return colors
+
+
+def transfer_colors(transfers):
+    """Marker colors of plot_transfer_analysis, red for 3+ and gray for unknown transfer counts"""
+    t = np.asarray(transfers, dtype=float)
+    colors = np.full(t.shape, '#808080', dtype=object)
+    for count, color in TRANSFER_COLORS.items():
+        colors[t == count] = color
+    colors[t > 3] = TRANSFER_COLORS[3]
+    return colors
+
+
+def comparison_rgb(time_diffs):
+    """
+    Vectorized transit-minus-car gradient: solid green when transit is faster, then interpolated between
+    the palette colors at each threshold, and black from the 'very_poor' threshold on.
+    """
+    d = np.asarray(time_diffs, dtype=float)
+    th, c = COMPARISON_THRESHOLDS, {name: hex_to_rgb(color) for name, color in COMPARISON_COLORS.items()}
+    segments = [
+        (d < th['excellent'], 'excellent', 'excellent', np.zeros_like(d)),
+        ((d >= th['excellent']) & (d < th['good']), 'excellent', 'good', d / th['good']),
+        ((d >= th['good']) & (d < th['acceptable']), 'good', 'acceptable',
+         (d - th['good']) / (th['acceptable'] - th['good'])),
+        ((d >= th['acceptable']) & (d < th['poor']), 'acceptable', 'poor',
+         (d - th['acceptable']) / (th['poor'] - th['acceptable'])),
+        ((d >= th['poor']) & (d < th['very_poor']), 'poor', 'very_poor',
+         (d - th['poor']) / (th['very_poor'] - th['poor'])),
+        (d >= th['very_poor'], 'very_poor', 'extreme', np.minimum(1.0, (d - 20) / 20)),
+    ]
+    rgb = np.zeros(d.shape + (3,), dtype=np.uint8)
+    for mask, start, end, ratio in segments:
+        # Truncated towards zero like int() in the original interpolate_color
+        rgb[mask] = np.trunc(c[start] + (c[end] - c[start]) * ratio[mask][:, None])
+    return rgb
+
+
+def comparison_colors(time_diffs):
+    return to_hex(comparison_rgb(time_diffs))
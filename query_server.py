@@ -0,0 +1,290 @@
+#! /usr/bin/env python3
+"""
+Local HTTP service answering travel time queries from travel_info held in memory:
+    python query_server.py --port 8080
+    curl 'http://localhost:8080/point?lat=52.2297&lon=21.0122'
+    curl 'http://localhost:8080/bbox?bbox=52.20,20.95,52.25,21.05&limit=10'
+    curl 'http://localhost:8080/district?name=Mokotów'
+The database is reloaded in the background when it changes, queries are answered from the previous data meanwhile.
+"""
+import argparse
+import functools
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import numpy as np
+
+from districts import DISTRICTS_GEOJSON, district_stats, parse_bbox, update_districts
+from map_data import load_travel_info
+from snapshot import is_snapshot
+from spatial_index import GridIndex
+from tiles import RADIUS_M, POWER
+from travel_surface import idw_values
+
+POINT_COLUMNS = ['street', 'latitude', 'longitude', 'transit_duration', 'transfers', 'car_duration_avg', 'district']
+MAX_RADIUS_M = 5000
+MAX_BBOX_ROWS = 10_000
+
+
+def json_value(value):
+    """NumPy scalars as plain Python values, NaN and missing values as None (null in JSON)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, np.generic):
+        return json_value(value.item())
+    return value
+
+
+def database_version(db_path):
+    """Changes whenever the database (or its write-ahead log) is written to"""
+    version = []
+    for path in (db_path, f'{db_path}-wal'):
+        try:
+            stat = os.stat(path)
+            version.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            version.append(None)
+    return tuple(version)
+
+
+def transfer_mix(transfers):
+    """Shares of known transfer counts that are 0, 1 and 2 or more"""
+    known = transfers[~np.isnan(transfers)]
+    if not len(known):
+        return None
+    return {'direct': float(np.mean(known == 0)), 'one_transfer': float(np.mean(known == 1)),
+            'two_plus_transfers': float(np.mean(known >= 2))}
+
+
+def nan_statistic(function, values, *args):
+    known = values[~np.isnan(values)]
+    return float(function(known, *args)) if len(known) else None
+
+
+class TravelData:
+    """
+    One version of travel_info in memory, never modified after loading: column arrays, spatial indexes
+    of the located addresses and the per-district aggregates. Query results are memoized in LRU caches
+    that belong to this version, so a reload starts with empty caches instead of stale answers.
+    """
+
+    def __init__(self, frame, version, cache_size=65536):
+        frame = frame[frame['latitude'].notna() & frame['longitude'].notna()].reset_index(drop=True)
+        self.version = version
+        self.loaded_at = time.time()
+        self.rows = len(frame)
+        self.columns = {column: frame[column].to_numpy() for column in POINT_COLUMNS}
+        self.latitudes = frame['latitude'].to_numpy(dtype=float)
+        self.longitudes = frame['longitude'].to_numpy(dtype=float)
+        self.transit = frame['transit_duration'].to_numpy(dtype=float)
+        self.transfers = frame['transfers'].to_numpy(dtype=float)
+        self.car_gap = (frame['transit_duration'] - frame['car_duration_avg']).to_numpy(dtype=float)
+        # Cells as large as the default radius keep a lookup to the 3x3 cells around the point
+        self.index = GridIndex(self.latitudes, self.longitudes, cell_size_m=RADIUS_M)
+        # Interpolation only weighs addresses where the interpolated value is known
+        self.surfaces = {}
+        for name, values in (('transit_duration', self.transit), ('car_gap', self.car_gap)):
+            known = ~np.isnan(values)
+            self.surfaces[name] = (GridIndex(self.latitudes[known], self.longitudes[known], cell_size_m=RADIUS_M),
+                                   values[known])
+        # Bounding box queries binary-search the addresses sorted by latitude
+        self.by_latitude = np.argsort(self.latitudes, kind='stable')
+        self.sorted_latitudes = self.latitudes[self.by_latitude]
+        located = frame[frame['district'].notna()]
+        self.districts = {
+            district: {name: json_value(value) for name, value in stats.items()}
+            for district, stats in (district_stats(located).to_dict('index').items() if len(located) else [])
+        }
+        self.point = functools.lru_cache(maxsize=cache_size)(self.point_query)
+        self.bbox = functools.lru_cache(maxsize=cache_size)(self.bbox_query)
+
+    def row(self, i):
+        return {column: json_value(values[i]) for column, values in self.columns.items()}
+
+    def point_query(self, latitude, longitude, radius_m=RADIUS_M):
+        """
+        The nearest address within `radius_m` meters, with its distance, and the transit time and
+        transit minus car gap interpolated at the point like the travel_time_surface tiles.
+        """
+        nearest, distance = self.index.nearest([latitude], [longitude], radius_m)
+        sample = None
+        if nearest[0] >= 0:
+            sample = {**self.row(nearest[0]), 'car_gap': json_value(self.car_gap[nearest[0]]),
+                      'distance_m': round(float(distance[0]), 1)}
+        interpolated = {'radius_m': radius_m}
+        for name, (index, values) in self.surfaces.items():
+            value = idw_values(index, values, np.array([latitude]), np.array([longitude]), radius_m, POWER)[0]
+            interpolated[name] = None if np.isnan(value) else round(float(value), 1)
+        return {'latitude': latitude, 'longitude': longitude, 'nearest': sample, 'interpolated': interpolated}
+
+    def bbox_query(self, bbox, limit=100):
+        """Aggregates of the addresses within bbox = (south, west, north, east) and up to `limit` of them"""
+        south, west, north, east = bbox
+        start = np.searchsorted(self.sorted_latitudes, south, side='left')
+        end = np.searchsorted(self.sorted_latitudes, north, side='right')
+        candidates = self.by_latitude[start:end]
+        inside = candidates[(self.longitudes[candidates] >= west) & (self.longitudes[candidates] <= east)]
+        inside.sort()
+        return {
+            'bbox': list(bbox),
+            'addresses': len(inside),
+            'median_transit': nan_statistic(np.median, self.transit[inside]),
+            'p90_transit': nan_statistic(np.quantile, self.transit[inside], 0.9),
+            'median_car_gap': nan_statistic(np.median, self.car_gap[inside]),
+            'transfers': transfer_mix(self.transfers[inside]),
+            'points': [self.row(i) for i in inside[:limit]],
+        }
+
+
+def load_data(db_path, cache_size=65536):
+    """Loads the current travel_info, assigning new addresses to districts first like create_map.py"""
+    if not is_snapshot(db_path) and os.path.exists(DISTRICTS_GEOJSON):
+        conn = sqlite3.connect(db_path)
+        update_districts(conn)
+        conn.close()
+    # Taken after the district update, so its own write does not look like a change of the data
+    version = database_version(db_path)
+    return TravelData(load_travel_info(db_path), version, cache_size)
+
+
+class QueryServer(ThreadingHTTPServer):
+    """
+    Serves the current TravelData. Every `reload_interval` seconds a background thread checks whether
+    the database changed and loads it again; the new version replaces the old one in a single assignment,
+    so each request is answered entirely from one version.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, db_path, cache_size=65536, reload_interval=5.0):
+        super().__init__(address, QueryHandler)
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self.reload_interval = reload_interval
+        self.data = load_data(db_path, cache_size)
+        self.stopped = threading.Event()
+        self.watcher = threading.Thread(target=self.watch, daemon=True)
+
+    def watch(self):
+        while not self.stopped.wait(self.reload_interval):
+            if database_version(self.db_path) == self.data.version:
+                continue
+            try:
+                data = load_data(self.db_path, self.cache_size)
+            except (sqlite3.Error, ValueError, OSError) as e:
+                # E.g. the database being replaced mid-read, the next check tries again
+                print(f"⚠️  Reloading {self.db_path} failed: {e}")
+                continue
+            self.data = data
+            print(f"🔄 Reloaded {data.rows} addresses from {self.db_path}")
+
+    def serve_forever(self, poll_interval=0.5):
+        self.watcher.start()
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self.stopped.set()
+
+
+class QueryError(ValueError):
+    pass
+
+
+def float_parameter(query, name, default=None):
+    if name not in query:
+        if default is None:
+            raise QueryError(f"Missing parameter {name!r}")
+        return default
+    try:
+        value = float(query[name])
+    except ValueError:
+        raise QueryError(f"Parameter {name!r} must be a number, got {query[name]!r}")
+    if not math.isfinite(value):
+        raise QueryError(f"Parameter {name!r} must be a finite number")
+    return value
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes, with Nagle's algorithm every keep-alive response would wait for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        # http.server decodes the request line as Latin-1, undo that for unescaped UTF-8 (e.g. district names from curl)
+        url = urlparse(self.path.encode('latin-1').decode('utf-8', errors='replace'))
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        # Hold on to one version for the whole request, a reload may swap it meanwhile
+        data = self.server.data
+        try:
+            if url.path == '/point':
+                radius_m = float_parameter(query, 'radius', RADIUS_M)
+                if not 0 < radius_m <= MAX_RADIUS_M:
+                    raise QueryError(f"radius must be within (0, {MAX_RADIUS_M}] meters")
+                latitude, longitude = float_parameter(query, 'lat'), float_parameter(query, 'lon')
+                if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+                    raise QueryError("lat must be within [-90, 90] and lon within [-180, 180]")
+                # Rounded to about a meter, so nearby repeated lookups share cache entries
+                self.send_json(200, data.point(round(latitude, 5), round(longitude, 5), radius_m))
+            elif url.path == '/bbox':
+                try:
+                    bbox = tuple(round(value, 5) for value in parse_bbox(query.get('bbox', '')))
+                except ValueError as e:
+                    raise QueryError(str(e))
+                limit = int(float_parameter(query, 'limit', 100))
+                self.send_json(200, data.bbox(bbox, max(0, min(limit, MAX_BBOX_ROWS))))
+            elif url.path == '/district':
+                name = query.get('name')
+                if name is None:
+                    self.send_json(200, data.districts)
+                    return
+                matches = [district for district in data.districts if district.casefold() == name.casefold()]
+                if not matches:
+                    self.send_json(404, {'error': f"Unknown district {name!r}", 'districts': sorted(data.districts)})
+                    return
+                self.send_json(200, {'district': matches[0], **data.districts[matches[0]]})
+            elif url.path == '/health':
+                self.send_json(200, {
+                    'addresses': data.rows,
+                    'loaded_at': data.loaded_at,
+                    'point_cache': data.point.cache_info()._asdict(),
+                    'bbox_cache': data.bbox.cache_info()._asdict(),
+                })
+            else:
+                self.send_json(404, {'error': 'Not found, use /point, /bbox, /district or /health'})
+        except QueryError as e:
+            self.send_json(400, {'error': str(e)})
+
+    def send_json(self, status_code, body):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json; charset=UTF-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP service answering travel time queries from travel_info')
+    parser.add_argument('--db', default='travel_info.db', help='database or snapshot (*.snap) to serve')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--cache-size', type=int, default=65536, help='cached answers per query type')
+    parser.add_argument('--reload-interval', type=float, default=5.0,
+                        help='seconds between checks whether the database changed')
+    args = parser.parse_args()
+
+    server = QueryServer((args.host, args.port), args.db, args.cache_size, args.reload_interval)
+    print(f"📍 Serving {server.data.rows} addresses on http://{args.host}:{args.port}/ (/point, /bbox, /district)")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
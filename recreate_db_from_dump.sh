@@ -1,4 +1,4 @@
 #!/bin/bash
 
-# Recreate the SQLite database from the SQL dump
-sqlite3 travel_info.db < travel_info.sql 
\ No newline at end of file
+# Recreate the SQLite database from the snapshot
+python snapshot.py restore --snapshot travel_info.snap --db travel_info.db
@@ -0,0 +1,142 @@
+import argparse
+import os
+import sqlite3
+
+from districts import DISTRICTS_GEOJSON, update_districts
+
+ROUTE_LEG_COLUMNS = ['mode', 'line', 'vehicle', 'distance_m', 'duration_s', 'wait_s', 'in_vehicle_s']
+
+
+def parse_steps(leg):
+    """
+    Steps of a Directions route leg as tuples of ROUTE_LEG_COLUMNS, from the numeric values of the response.
+    Transit steps carry the line (short name if there is one) and vehicle type; the wait is the time between
+    reaching the stop and the scheduled departure, None when the response has no schedule.
+    """
+    clock = leg.get('departure_time', {}).get('value')
+    steps = []
+    for step in leg['steps']:
+        mode = step['travel_mode']
+        duration_s = step['duration']['value']
+        line = vehicle = wait_s = in_vehicle_s = None
+        if mode == 'TRANSIT':
+            details = step['transit_details']
+            line = details['line'].get('short_name') or details['line'].get('name')
+            vehicle = details['line'].get('vehicle', {}).get('type')
+            departure = details.get('departure_time', {}).get('value')
+            arrival = details.get('arrival_time', {}).get('value')
+            if departure is not None and arrival is not None:
+                in_vehicle_s = arrival - departure
+                wait_s = max(0, departure - clock) if clock is not None else None
+                clock = arrival
+            else:
+                in_vehicle_s = duration_s
+                clock = None
+        elif clock is not None:
+            clock += duration_s
+        steps.append((mode, line, vehicle, step['distance']['value'], duration_s, wait_s, in_vehicle_s))
+    return steps
+
+
+def ensure_route_legs_table(conn):
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS route_legs (
+            street TEXT,
+            step INTEGER,
+            mode TEXT,
+            line TEXT,
+            vehicle TEXT,
+            distance_m INTEGER,
+            duration_s INTEGER,
+            wait_s INTEGER,
+            in_vehicle_s INTEGER,
+            PRIMARY KEY (street, step)
+        ) WITHOUT ROWID;
+
+        CREATE INDEX IF NOT EXISTS route_legs_line ON route_legs (line, vehicle, street);
+    ''')
+
+
+def store_route_legs(conn, street, steps):
+    """Replaces the stored steps of the fastest transit route of `street`"""
+    conn.execute("DELETE FROM route_legs WHERE street = ?", (street,))
+    conn.executemany(f'''
+        INSERT INTO route_legs (street, step, {', '.join(ROUTE_LEG_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [(street, i, *step) for i, step in enumerate(steps)])
+
+
+def addresses_on_line(conn, line, vehicle=None):
+    """
+    Measured travel_info addresses whose fastest transit route rides `line` (e.g. '17', optionally
+    only as a 'TRAM'), as (street, latitude, longitude, transit_duration, in-vehicle minutes on the line).
+    """
+    return conn.execute('''
+        SELECT t.street, t.latitude, t.longitude, t.transit_duration, SUM(r.in_vehicle_s) / 60.0
+        FROM route_legs r JOIN travel_info t ON t.street = r.street
+        WHERE r.line = ? AND (? IS NULL OR r.vehicle = ?)
+        GROUP BY t.street
+        ORDER BY t.transit_duration
+    ''', (line, vehicle, vehicle)).fetchall()
+
+
+def line_usage(conn, limit=20):
+    """(vehicle, line, number of addresses riding it) of the most used lines"""
+    return conn.execute('''
+        SELECT vehicle, line, COUNT(DISTINCT street) AS addresses
+        FROM route_legs WHERE mode = 'TRANSIT'
+        GROUP BY vehicle, line
+        ORDER BY addresses DESC
+        LIMIT ?
+    ''', (limit,)).fetchall()
+
+
+def walking_by_district(conn):
+    """
+    Per district (see districts.update_districts): addresses with a stored route, the share of walking
+    in their total route time, mean walking meters and mean waiting minutes per trip.
+    """
+    return conn.execute('''
+        SELECT d.district, COUNT(DISTINCT r.street),
+               1.0 * SUM(CASE WHEN r.mode = 'WALKING' THEN r.duration_s ELSE 0 END) / SUM(r.duration_s),
+               1.0 * SUM(CASE WHEN r.mode = 'WALKING' THEN r.distance_m ELSE 0 END) / COUNT(DISTINCT r.street),
+               SUM(r.wait_s) / 60.0 / COUNT(DISTINCT r.street)
+        FROM route_legs r JOIN travel_info_district d ON d.street = r.street
+        WHERE d.district IS NOT NULL
+        GROUP BY d.district
+        ORDER BY d.district
+    ''').fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query the stored transit routes of travel_info addresses')
+    parser.add_argument('--db', default='travel_info.db')
+    parser.add_argument('--line', help='list addresses riding this line, e.g. 17')
+    parser.add_argument('--vehicle', help='only rides of this vehicle type, e.g. TRAM')
+    parser.add_argument('--districts', action='store_true', help='walking share and waiting time per district')
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    ensure_route_legs_table(conn)
+    if args.line:
+        rows = addresses_on_line(conn, args.line, args.vehicle)
+        for street, _, _, transit_duration, riding in rows:
+            print(f"   {street}: {transit_duration} min, {riding:.0f} min on {args.line}")
+        print(f"🚋 {len(rows)} addresses ride {args.vehicle or 'line'} {args.line}")
+    elif args.districts:
+        if os.path.exists(DISTRICTS_GEOJSON):
+            update_districts(conn)
+        elif not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'travel_info_district'").fetchone():
+            conn.close()
+            parser.error(f'{args.db} has no district assignments and {DISTRICTS_GEOJSON} was not found to compute them')
+        for district, addresses, walking_share, walking_m, waiting in walking_by_district(conn):
+            print(f"   {district}: {walking_share:.0%} of route time walking, {walking_m:.0f} m walked"
+                  f" and {waiting or 0:.1f} min waited per trip ({addresses} addresses)")
+    else:
+        print("🚋 Most ridden lines:")
+        for vehicle, line, addresses in line_usage(conn):
+            print(f"   {vehicle} {line}: {addresses} addresses")
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from spatial_index import METERS_PER_DEGREE
+
+
+def grid_cells(latitudes, longitudes, cell_size_m, origin=(52.0, 20.8)):
+    """
+    Assigns every coordinate to a square cell of roughly `cell_size_m` meters.
+    Returns an integer array of cell ids, equal for points sharing a cell.
+    """
+    lat0, lon0 = origin
+    lat_step = cell_size_m / METERS_PER_DEGREE
+    lon_step = cell_size_m / (METERS_PER_DEGREE * np.cos(np.radians(lat0 + 0.25)))
+    rows = np.floor((np.asarray(latitudes, dtype=float) - lat0) / lat_step).astype(np.int64)
+    columns = np.floor((np.asarray(longitudes, dtype=float) - lon0) / lon_step).astype(np.int64)
+    # Warsaw spans far fewer than a million cells in either direction
+    return rows * 1_000_000 + columns
+
+
+def stratified_sample(candidates, budget, sampled_latitudes, sampled_longitudes, cell_size_m=500, rng=None):
+    """
+    Picks up to `budget` rows of `candidates` (a DataFrame with latitude and longitude columns)
+    so that samples are spread evenly over a lat/lon grid.
+
+    Each candidate's level is the number of samples its cell would hold before it: the cell's
+    existing samples plus its rank among the cell's shuffled candidates. Taking the lowest levels
+    first fills empty cells before adding a second sample anywhere, and so on.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if budget <= 0 or candidates.empty:
+        return candidates.iloc[:0]
+
+    cells = grid_cells(candidates['latitude'], candidates['longitude'], cell_size_m)
+    sampled_cells = grid_cells(sampled_latitudes, sampled_longitudes, cell_size_m)
+    existing = pd.Series(sampled_cells).value_counts()
+
+    order = rng.permutation(len(candidates))
+    shuffled_cells = pd.Series(cells[order])
+    rank = shuffled_cells.groupby(shuffled_cells).cumcount().to_numpy()
+    level = existing.reindex(shuffled_cells).fillna(0).to_numpy() + rank
+
+    chosen = order[np.argsort(level, kind='stable')[:budget]]
+    return candidates.iloc[np.sort(chosen)]
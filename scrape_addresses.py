@@ -1,110 +1,260 @@
 #! /usr/bin/env python3
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
 from datetime import datetime, timedelta
-import csv
-import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import argparse
 import os
 import sqlite3
+import threading
 
+import numpy as np
+import pandas as pd
 
-def convert_duration_to_minutes(duration_text):
-    duration_parts = duration_text.split()
-    total_minutes = 0
-    for i in range(0, len(duration_parts), 2):
-        value = int(duration_parts[i])
-        unit = duration_parts[i + 1]
-        if 'hour' in unit:
-            total_minutes += value * 60
-        elif 'min' in unit:
-            total_minutes += value
-    return total_minutes
+from directions_cache import DirectionsCache
+from districts import area_bbox, parse_bbox, points_in_area, select_area
+from job_queue import JobQueue
+from route_legs import ensure_route_legs_table, parse_steps, store_route_legs
+from scrape_metrics import MetricsReporter, ScrapeMetrics
+from sampling import stratified_sample
+from spatial_index import GridIndex
+from spatial_db import ensure_spatial_index, query_bbox
 
 
-def get_transit_info(api_key, origin, destination):
-    endpoint = "https://maps.googleapis.com/maps/api/directions/json"
+DIRECTIONS_ENDPOINT = "https://maps.googleapis.com/maps/api/directions/json"
+DISTANCE_MATRIX_ENDPOINT = "https://maps.googleapis.com/maps/api/distancematrix/json"
+# Distance Matrix accepts at most 25 origins per request
+MAX_MATRIX_ORIGINS = 25
+# API statuses worth retrying later, see https://developers.google.com/maps/documentation/directions/get-directions#DirectionsStatus
+RETRYABLE_STATUSES = {'OVER_QUERY_LIMIT', 'UNKNOWN_ERROR'}
+CACHEABLE_STATUSES = {'OK', 'ZERO_RESULTS', 'NOT_FOUND'}
+CITY_SUFFIX = ", Warsaw"
+
+
+class DirectionsError(Exception):
+    """A lookup that produced no travel time; `retryable` tells whether trying again later may help"""
+
+    def __init__(self, message, retryable):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many requests are sent per second.
+    Tokens refill continuously at `rate` per second, up to `capacity`.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class DirectionsClient:
+    """
+    Sends Directions and Distance Matrix API requests over a pooled keep-alive session,
+    throttled by an optional TokenBucket shared by all worker threads.
+    Successful responses are served from and saved to the optional DirectionsCache;
+    with `read_cache` off they are only saved, so every lookup reaches the API.
+    Latencies, statuses and cache hits are recorded in the optional ScrapeMetrics.
+    """
+
+    def __init__(self, api_key, pool_size=10, limiter=None, endpoint=DIRECTIONS_ENDPOINT, cache=None,
+                 matrix_endpoint=DISTANCE_MATRIX_ENDPOINT, metrics=None, read_cache=True):
+        self.api_key = api_key
+        self.limiter = limiter
+        self.endpoint = endpoint
+        self.matrix_endpoint = matrix_endpoint
+        self.cache = cache
+        self.read_cache = read_cache
+        self.metrics = metrics
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def directions(self, params):
+        """Returns the parsed JSON response, raises DirectionsError when the request failed"""
+        return self.get(self.endpoint, params)
+
+    def matrix(self, params):
+        return self.get(self.matrix_endpoint, params)
+
+    def get(self, endpoint, params):
+        reading = self.cache is not None and self.read_cache
+        data = self.cache.get(endpoint, params) if reading else None
+        if reading and self.metrics is not None:
+            self.metrics.inc('scrape_cache_lookups_total', result='miss' if data is None else 'hit')
+        if data is None:
+            data = self.fetch(endpoint, params)
+            if self.cache is not None and data['status'] in CACHEABLE_STATUSES:
+                self.cache.put(endpoint, params, data)
+            if self.metrics is not None:
+                self.metrics.inc('scrape_api_statuses_total', endpoint=self.endpoint_name(endpoint), status=data['status'])
+        if data['status'] not in CACHEABLE_STATUSES:
+            raise DirectionsError(f"Error: {data['status']}", retryable=data['status'] in RETRYABLE_STATUSES)
+        return data
+
+    def endpoint_name(self, endpoint):
+        return 'matrix' if endpoint == self.matrix_endpoint else 'directions'
+
+    def fetch(self, endpoint, params):
+        if self.limiter is not None:
+            self.limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = self.session.get(endpoint, params={**params, "key": self.api_key}, timeout=30)
+        except requests.RequestException as e:
+            if self.metrics is not None:
+                self.metrics.observe_request(self.endpoint_name(endpoint), params.get('mode'),
+                                             time.perf_counter() - start, e.__class__.__name__)
+            raise DirectionsError(f"Error: {e.__class__.__name__}", retryable=True)
+        if self.metrics is not None:
+            self.metrics.observe_request(self.endpoint_name(endpoint), params.get('mode'),
+                                         time.perf_counter() - start, response.status_code)
+        if response.status_code != 200:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            raise DirectionsError(f"Error: {response.status_code}", retryable=retryable)
+        try:
+            return response.json()
+        except ValueError:
+            # E.g. an HTML error page from a proxy, the next attempt may get a proper response
+            raise DirectionsError("Error: response is not JSON", retryable=True)
+
+
+def duration_minutes(duration):
+    """Minutes of an API duration, from its seconds rather than the localized display text"""
+    return round(duration['value'] / 60, 1)
+
+
+def next_departure(weekday, hour, minute=0):
+    """Timestamp of the next given weekday (0 is Monday) at hour:minute local time, never today"""
     now = datetime.now()
-    # Calculate the number of days until next Monday
-    days_until_monday = (7 - now.weekday()) % 7
-    if days_until_monday == 0:
-        days_until_monday = 7
-    next_monday = now + timedelta(days=days_until_monday)
-    eight_am_next_monday = datetime(next_monday.year, next_monday.month, next_monday.day, 8, 0)
-    departure_time = int(eight_am_next_monday.timestamp())
+    # Calculate the number of days until that weekday
+    days_until = (weekday - now.weekday()) % 7
+    if days_until == 0:
+        days_until = 7
+    day = now + timedelta(days=days_until)
+    return int(datetime(day.year, day.month, day.day, hour, minute).timestamp())
 
-    params = {
-        "origin": origin + ", Warsaw",
-        "destination": destination + ", Warsaw",
+
+def next_monday_eight_am():
+    return next_departure(0, 8)
+
+
+def transit_params(origin, destination, departure_time=None):
+    return {
+        "origin": origin + CITY_SUFFIX,
+        "destination": destination + CITY_SUFFIX,
         "mode": "transit",
-        "departure_time": departure_time,
-        "key": api_key
+        "departure_time": departure_time if departure_time is not None else next_monday_eight_am(),
     }
-    response = requests.get(endpoint, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if data['routes']:
-            # Sort routes by shortest total travel time
-            sorted_routes = sorted(data['routes'], key=lambda r: r['legs'][0]['duration']['value'])
-            fastest_route = sorted_routes[0]
-            duration = fastest_route['legs'][0]['duration']['text']
-            total_minutes = convert_duration_to_minutes(duration)
-            steps = fastest_route['legs'][0]['steps']
-            
-            # Extract route and count transfers
-            route_info = []
-            transfers = 0
-            for step in steps:
-                travel_mode = step['travel_mode']
-                if travel_mode == 'TRANSIT':
-                    transit_details = step['transit_details']
-                    if 'name' in transit_details['line']:
-                        line_name = transit_details['line']['name']
-                        vehicle_type = transit_details['line']['vehicle']['type']
-                        route_info.append(f"Take {vehicle_type} {line_name}")
-                    else:
-                        route_info.append(step['transit_details'])
-                    transfers += 1
-                else:
-                    route_info.append(f"Walk {step['distance']['text']}")
-            # Adjust transfers count (transfers are one less than the number of transit steps)
-            transfers = max(0, transfers - 1)
-            return total_minutes, transfers
-        else:
-            return "No routes found", 0
+
+
+def parse_transit_response(data):
+    """(minutes, transfers, steps of the route as in route_legs.parse_steps) of the fastest route"""
+    if data['routes']:
+        # Sort routes by shortest total travel time
+        sorted_routes = sorted(data['routes'], key=lambda r: r['legs'][0]['duration']['value'])
+        fastest_route = sorted_routes[0]
+        total_minutes = duration_minutes(fastest_route['legs'][0]['duration'])
+        steps = parse_steps(fastest_route['legs'][0])
+        # Transfers are one less than the number of transit steps
+        transfers = max(0, sum(step[0] == 'TRANSIT' for step in steps) - 1)
+        return total_minutes, transfers, steps
     else:
-        return f"Error: {response.status_code}", 0
+        raise DirectionsError("No routes found", retryable=False)
 
-def get_car_travel_time(api_key, origin, destination):
-    endpoint = "https://maps.googleapis.com/maps/api/directions/json"
-    now = datetime.now()
-    params = {
-        "origin": origin + ", Warsaw",
-        "destination": destination + ", Warsaw",
+
+def get_transit_info(client, origin, destination, departure_time=None):
+    return parse_transit_response(client.directions(transit_params(origin, destination, departure_time)))
+
+def car_params(origin, destination, departure_time="now"):
+    return {
+        "origin": origin + CITY_SUFFIX,
+        "destination": destination + CITY_SUFFIX,
         "mode": "driving",
-        "departure_time": "now",
+        "departure_time": departure_time,
         "traffic_model": "best_guess",
-        "key": api_key
     }
-    response = requests.get(endpoint, params=params)
-    if response.status_code == 200:
-        data = response.json()
-        if data['routes']:
-            # Sort routes by shortest total travel time
-            sorted_routes = sorted(data['routes'], key=lambda r: r['legs'][0]['duration']['value'])
-            fastest_route = sorted_routes[0]
-            duration = fastest_route['legs'][0]['duration']['text']
-            total_minutes = convert_duration_to_minutes(duration)
-            # Check for duration in traffic
-            if 'duration_in_traffic' in fastest_route['legs'][0]:
-                duration_in_traffic = fastest_route['legs'][0]['duration_in_traffic']['text']
-                max_duration_minutes = convert_duration_to_minutes(duration_in_traffic)
-                return total_minutes, max_duration_minutes
-            return total_minutes, None
-        else:
-            return "No routes found", None
+
+
+def parse_car_response(data):
+    if data['routes']:
+        # Sort routes by shortest total travel time
+        sorted_routes = sorted(data['routes'], key=lambda r: r['legs'][0]['duration']['value'])
+        fastest_route = sorted_routes[0]
+        total_minutes = duration_minutes(fastest_route['legs'][0]['duration'])
+        # Check for duration in traffic
+        if 'duration_in_traffic' in fastest_route['legs'][0]:
+            max_duration_minutes = duration_minutes(fastest_route['legs'][0]['duration_in_traffic'])
+            return total_minutes, max_duration_minutes
+        return total_minutes, None
     else:
-        return f"Error: {response.status_code}", None
+        raise DirectionsError("No routes found", retryable=False)
+
+
+def get_car_travel_time(client, origin, destination, departure_time="now"):
+    return parse_car_response(client.directions(car_params(origin, destination, departure_time)))
+
+def matrix_params(origins, destination, mode):
+    params = {
+        "origins": "|".join(origin + CITY_SUFFIX for origin in origins),
+        "destinations": destination + CITY_SUFFIX,
+        "mode": mode,
+    }
+    if mode == 'transit':
+        params["departure_time"] = next_monday_eight_am()
+    else:
+        params["departure_time"] = "now"
+        params["traffic_model"] = "best_guess"
+    return params
+
+
+def parse_matrix_response(data, mode):
+    """
+    Returns one result per origin, in request order, or a DirectionsError for origins without a route.
+    Distance Matrix does not return route steps, so for transit transfers and steps are unknown (None)
+    in the (minutes, transfers, steps) result; for driving it is (minutes, duration in traffic), like get_car_travel_time.
+    """
+    results = []
+    for row in data['rows']:
+        element = row['elements'][0]
+        if element['status'] != 'OK':
+            results.append(DirectionsError("No routes found", retryable=False))
+            continue
+        total_minutes = duration_minutes(element['duration'])
+        if mode == 'transit':
+            results.append((total_minutes, None, None))
+        elif 'duration_in_traffic' in element:
+            results.append((total_minutes, duration_minutes(element['duration_in_traffic'])))
+        else:
+            results.append((total_minutes, None))
+    return results
+
+
+def get_matrix_travel_times(client, origins, destination, mode):
+    return parse_matrix_response(client.matrix(matrix_params(origins, destination, mode)), mode)
+
 
 def initialize_database(db_name):
     conn = sqlite3.connect(db_name)
@@ -116,62 +266,406 @@ def initialize_database(db_name):
             longitude REAL,
             transit_duration REAL,
             transfers INTEGER,
-            car_duration_avg REAL
+            car_duration_avg REAL,
+            inferred_from TEXT
         )
     ''')
+    # Databases created before results could be inferred from a nearby address lack the column
+    columns = {column[1] for column in cursor.execute("PRAGMA table_info(travel_info)")}
+    if 'inferred_from' not in columns:
+        cursor.execute("ALTER TABLE travel_info ADD COLUMN inferred_from TEXT")
+    ensure_spatial_index(conn)
+    ensure_route_legs_table(conn)
+    # WAL lets map builds read while a scrape is committing batches
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
     conn.commit()
     return conn
 
-# Example usage
-api_key = os.getenv('API_KEY')
-# origin = "Elektry 1"
-destination = "Metro Świętokrzyska"
-# duration, transfers = get_transit_info(api_key, origin, destination)
-# print(f"{origin}\t{transfers}\t{duration} minutes")
 
-csv_file_path = 'Adres_uniwersalny_2022.02.08.csv'
+def load_register(csv_file_path):
+    """Reads the address register into a DataFrame with origin, latitude and longitude columns"""
+    # Columns 6 and 7 hold the street and house number, 10 and 11 the coordinates
+    register = pd.read_csv(csv_file_path, sep=';', usecols=[5, 6, 9, 10], dtype=str, keep_default_na=False)
+    street, number, latitude, longitude = (register.iloc[:, i] for i in range(4))
+    register = pd.DataFrame({
+        'origin': street + ', ' + number,
+        'latitude': pd.to_numeric(latitude.str.replace(',', '.'), errors='coerce'),
+        'longitude': pd.to_numeric(longitude.str.replace(',', '.'), errors='coerce'),
+    })
+    return register.dropna(subset=['latitude', 'longitude']).drop_duplicates('origin')
 
-# Initialize database
-conn = initialize_database('travel_info.db')
-cursor = conn.cursor()
 
-# Print the number of records already in the database
-cursor.execute("SELECT COUNT(*) FROM travel_info")
-record_count = cursor.fetchone()[0]
-print(f"Number of records already in the database: {record_count}")
+def load_existing_streets(conn, bbox=None):
+    """Streets in travel_info, only those inside a (south, west, north, east) box when given"""
+    if bbox is not None:
+        return {street for street, in query_bbox(conn, *bbox, columns=('street',))}
+    return {street for street, in conn.execute("SELECT street FROM travel_info")}
 
-with open(csv_file_path, newline='', encoding='utf-8') as csvfile:
-    reader = csv.reader(csvfile, delimiter=';')
-    count = 0
-    for i, row in enumerate(reader):
-        if i == 0:
-            continue  # Skip header
-        origin = f"{row[5]}, {row[6]}"  # Use columns 6 and 7 as origin
-        
-        # Check if the address already exists in the database
-        cursor.execute("SELECT * FROM travel_info WHERE street = ?", (origin,))
-        result = cursor.fetchone()
-        if result is not None:
-            continue
-        if random.random() > 0.01:
+
+def load_sampled_coordinates(conn):
+    """Coordinates of origins already scraped or waiting in the job queue"""
+    coordinates = np.array(conn.execute(
+        "SELECT latitude, longitude FROM travel_info "
+        "UNION ALL SELECT latitude, longitude FROM scrape_jobs WHERE status IN ('pending', 'in_flight')"
+    ).fetchall(), dtype=float).reshape(-1, 2)
+    return coordinates[:, 0], coordinates[:, 1]
+
+
+def select_origins(register, existing, sample_rate, rng=None):
+    """Drops addresses already scraped or queued and randomly samples the rest"""
+    rng = rng if rng is not None else np.random.default_rng()
+    candidates = register[~register['origin'].isin(existing)]
+    return candidates[rng.random(len(candidates)) < sample_rate]
+
+
+def select_origins_by_grid(register, existing, conn, budget, cell_size_m, rng=None):
+    """Drops addresses already scraped or queued and picks `budget` of the rest, spread evenly over a grid"""
+    candidates = register[~register['origin'].isin(existing)]
+    latitudes, longitudes = load_sampled_coordinates(conn)
+    return stratified_sample(candidates, budget, latitudes, longitudes, cell_size_m=cell_size_m, rng=rng)
+
+
+def infer_from_neighbours(conn, writer, origins, radius_m):
+    """
+    Stores a copy of the nearest measured result within `radius_m` meters for every origin that has one,
+    with inferred_from set to the measured address, and returns the origins that still need API calls.
+    When refreshing, origins measured before are always measured again, and no origin copies the result
+    of another one that is about to be replaced.
+    """
+    measured = pd.read_sql_query(
+        "SELECT street, latitude, longitude, transit_duration, transfers, car_duration_avg FROM travel_info "
+        "WHERE inferred_from IS NULL AND transit_duration IS NOT NULL", conn
+    )
+    remeasured = origins['origin'].isin(measured['street']).to_numpy()
+    measured = measured[~measured['street'].isin(origins['origin'])].reset_index(drop=True)
+    index = GridIndex(measured['latitude'], measured['longitude'], cell_size_m=radius_m)
+    nearest, _ = index.nearest(origins['latitude'], origins['longitude'], radius_m)
+    found = (nearest >= 0) & ~remeasured
+    for (origin, latitude, longitude), source in zip(origins[found].itertuples(index=False),
+                                                     measured.iloc[nearest[found]].itertuples(index=False)):
+        writer.add((origin, latitude, longitude, source.transit_duration, source.transfers,
+                    source.car_duration_avg, source.street))
+    writer.flush()
+    return origins[~found]
+
+
+def replay_from_cache(cache, csv_file_path, destination, writer):
+    """
+    Rebuilds travel_info purely from cached Directions responses, without any network calls.
+    The most recently fetched transit and driving response of every origin is parsed again.
+    """
+    latest = {}
+    for entry in cache.entries():
+        request = entry['request']
+        if 'origin' not in request:
+            continue  # Distance Matrix responses have no route steps to re-parse
+        if not request['destination'].startswith(destination):
             continue
+        origin = request['origin'].removesuffix(CITY_SUFFIX)
+        key = (origin, request['mode'])
+        if key not in latest or latest[key]['fetched_at'] < entry['fetched_at']:
+            latest[key] = entry
 
-        transit_duration, transfers = get_transit_info(api_key, origin, destination)
-        car_duration, max_duration_minutes = get_car_travel_time(api_key, origin, destination)
-        # Calculate average car duration
-        car_duration_avg = (car_duration + max_duration_minutes) / 2
-        # Extract latitude and longitude from the CSV file
-        latitude = float(row[9].replace(',', '.'))
-        longitude = float(row[10].replace(',', '.'))
-        print(f"{origin}\t{latitude}\t{longitude}\t{transfers}\t{transit_duration}\t{car_duration_avg}")
+    origins = {origin for origin, mode in latest if (origin, 'transit') in latest and (origin, 'driving') in latest}
+    register = load_register(csv_file_path)
+    register = register[register['origin'].isin(origins)]
+    count = 0
+    for origin, latitude, longitude in register.itertuples(index=False):
+        try:
+            transit_info = parse_transit_response(latest[(origin, 'transit')]['response'])
+            car_info = parse_car_response(latest[(origin, 'driving')]['response'])
+        except DirectionsError:
+            continue  # No routes found
+        store_result(writer, origin, latitude, longitude, transit_info, car_info)
         count += 1
+    return count
+
+
+class BatchWriter:
+    """
+    Writes travel_info rows and commits them in a single transaction every `batch_size` rows
+    or `flush_interval` seconds, whichever comes first. A crash loses at most the last batch.
+    Job queue updates made on the same connection are committed in the same transaction.
+    """
+
+    # An upsert rather than INSERT OR REPLACE, so the row keeps its rowid in travel_info_rtree
+    statement = (
+        "INSERT INTO travel_info (street, latitude, longitude, transit_duration, transfers, car_duration_avg, inferred_from) VALUES (?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT (street) DO UPDATE SET latitude = excluded.latitude, longitude = excluded.longitude, "
+        "transit_duration = excluded.transit_duration, transfers = excluded.transfers, "
+        "car_duration_avg = excluded.car_duration_avg, inferred_from = excluded.inferred_from"
+    )
+
+    def __init__(self, conn, batch_size=100, flush_interval=10.0):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = 0
+        self.flushed = time.monotonic()
+
+    def add(self, row):
+        self.conn.execute(self.statement, row)
+        self.pending += 1
+        self.tick()
+
+    def tick(self):
+        """Commits if the batch is full or the flush interval has passed"""
+        if self.pending >= self.batch_size or time.monotonic() - self.flushed >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self.conn.commit()
+        self.pending = 0
+        self.flushed = time.monotonic()
+
+
+def average_car_duration(car_info):
+    car_duration, max_duration_minutes = car_info
+    # Average of the free-flow and in-traffic durations, when the latter is known
+    if max_duration_minutes is not None:
+        return (car_duration + max_duration_minutes) / 2
+    return car_duration
+
+
+def store_result(writer, origin, latitude, longitude, transit_info, car_info):
+    transit_duration, transfers, steps = transit_info
+    car_duration_avg = average_car_duration(car_info)
+    print(f"{origin}\t{latitude}\t{longitude}\t{transfers}\t{transit_duration}\t{car_duration_avg}")
+
+    # Store the result in the database, with the route in the same transaction
+    if steps is not None:
+        store_route_legs(writer.conn, origin, steps)
+    writer.add((origin, latitude, longitude, transit_duration, transfers, car_duration_avg, None))
+
+
+def finish_job(writer, queue, job, transit_info, car_info, metrics=None):
+    """Stores a looked up origin and marks its job done, or schedules a retry"""
+    origin, latitude, longitude = job
+    errors = [info for info in (transit_info, car_info) if isinstance(info, DirectionsError)]
+    error = errors[0] if errors else None
+    if metrics is not None:
+        for lookup_error in errors:
+            metrics.inc('scrape_lookup_errors_total', error=str(lookup_error),
+                        retryable=str(lookup_error.retryable).lower())
+        if error is None:
+            metrics.inc('scrape_rows_stored_total', source='measured')
+    if error is None:
+        store_result(writer, origin, latitude, longitude, transit_info, car_info)
+        queue.complete(origin)
+    else:
+        print(f"{origin}\t{error}")
+        queue.fail(origin, str(error), error.retryable)
+    writer.tick()
+
+
+def outcome(future):
+    """Result of a lookup future, with a DirectionsError returned rather than raised"""
+    try:
+        return future.result()
+    except DirectionsError as e:
+        return e
+
+
+def scrape(client, jobs, destination, writer, queue, workers):
+    """
+    Runs the transit and driving lookups of up to `workers` origins concurrently.
+    Only the calling thread touches the database, so SQLite is never contended.
+    """
+    with ThreadPoolExecutor(max_workers=2 * workers) as executor:
+        in_flight = deque()
+        for job in jobs:
+            origin = job[0]
+            transit = executor.submit(get_transit_info, client, origin, destination)
+            car = executor.submit(get_car_travel_time, client, origin, destination)
+            in_flight.append((job, transit, car))
+            if len(in_flight) >= workers:
+                job, transit, car = in_flight.popleft()
+                finish_job(writer, queue, job, outcome(transit), outcome(car), client.metrics)
+        while in_flight:
+            job, transit, car = in_flight.popleft()
+            finish_job(writer, queue, job, outcome(transit), outcome(car), client.metrics)
+
+
+def scrape_matrix(client, jobs, destination, writer, queue, workers):
+    """
+    Alternative to scrape() that looks up MAX_MATRIX_ORIGINS origins per Distance Matrix request,
+    for transit and driving alike, with up to `workers` batches in flight.
+    """
+    def finish_batch(batch, transit, car):
+        transit_infos, car_infos = outcome(transit), outcome(car)
+        if isinstance(transit_infos, DirectionsError):
+            transit_infos = [transit_infos] * len(batch)
+        if isinstance(car_infos, DirectionsError):
+            car_infos = [car_infos] * len(batch)
+        for job, transit_info, car_info in zip(batch, transit_infos, car_infos):
+            finish_job(writer, queue, job, transit_info, car_info, client.metrics)
+
+    with ThreadPoolExecutor(max_workers=2 * workers) as executor:
+        in_flight = deque()
+        for start in range(0, len(jobs), MAX_MATRIX_ORIGINS):
+            batch = jobs[start:start + MAX_MATRIX_ORIGINS]
+            names = [origin for origin, _, _ in batch]
+            transit = executor.submit(get_matrix_travel_times, client, names, destination, 'transit')
+            car = executor.submit(get_matrix_travel_times, client, names, destination, 'driving')
+            in_flight.append((batch, transit, car))
+            if len(in_flight) >= workers:
+                finish_batch(*in_flight.popleft())
+        while in_flight:
+            finish_batch(*in_flight.popleft())
+
+
+def run_queue(queue, writer, process, claim_size):
+    """Feeds due jobs to `process` until none are pending, sleeping while only backed-off retries remain"""
+    while True:
+        jobs = queue.claim(claim_size)
+        writer.flush()
+        if jobs:
+            process(jobs)
+            continue
+        wait = queue.seconds_until_next_attempt()
+        if wait is None:
+            return
+        time.sleep(wait)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scrape transit and car travel times to Metro Świętokrzyska')
+    parser.add_argument('--csv', default='Adres_uniwersalny_2022.02.08.csv', help='Address register CSV')
+    parser.add_argument('--db', default='travel_info.db', help='SQLite database file')
+    parser.add_argument('--workers', type=int, default=8, help='Number of origins looked up concurrently')
+    parser.add_argument('--sample-rate', type=float, default=0.01, help='Fraction of new register addresses to scrape')
+    parser.add_argument('--sampler', choices=['random', 'grid'], default='random',
+                        help='grid spreads the budget evenly over --cell-size cells, filling empty cells first')
+    parser.add_argument('--budget', type=int,
+                        help='Number of new origins for the grid sampler (default: --sample-rate of the candidates)')
+    parser.add_argument('--cell-size', type=float, default=500, help='Grid sampler cell size in meters')
+    parser.add_argument('--reuse-radius', type=float,
+                        help='Copy the result of a measured address within this many meters instead of calling the API')
+    parser.add_argument('--batch-size', type=int, default=100, help='Rows written per transaction')
+    parser.add_argument('--flush-interval', type=float, default=10.0, help='Maximum seconds between commits')
+    parser.add_argument('--qps', type=float, default=50,
+                        help='Directions API requests per second (default quota is 3000 per minute)')
+    parser.add_argument('--backend', choices=['directions', 'matrix'], default='directions',
+                        help='matrix looks up many origins per Distance Matrix call, but cannot count transfers')
+    parser.add_argument('--endpoint', default=DIRECTIONS_ENDPOINT, help='Directions API URL, e.g. a local stand-in')
+    parser.add_argument('--matrix-endpoint', default=DISTANCE_MATRIX_ENDPOINT, help='Distance Matrix API URL')
+    parser.add_argument('--cache-dir', default='directions_cache', help='Directory of cached raw API responses')
+    parser.add_argument('--cache-max-mb', type=float, help='Evict least recently used responses above this size')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write cached responses')
+    parser.add_argument('--replay', action='store_true',
+                        help='Rebuild travel_info from cached responses only, without network calls')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='Only re-drive jobs that failed in earlier runs instead of sampling new origins')
+    parser.add_argument('--max-attempts', type=int, default=5, help='Attempts per origin before it is marked failed')
+    parser.add_argument('--seed', type=int, help='Seed of the origin sampling, for repeatable runs')
+    parser.add_argument('--metrics-interval', type=float, default=60, help='Seconds between metrics reports')
+    parser.add_argument('--metrics-prom', help='Prometheus text file rewritten with every metrics report')
+    parser.add_argument('--metrics-json', help='JSON summary file rewritten with every metrics report')
+    parser.add_argument('--district', action='append', default=[],
+                        help='Only sample origins inside this district of warszawa-dzielnice.geojson (repeatable)')
+    parser.add_argument('--polygon', help='Only sample origins inside the polygons of this GeoJSON file')
+    parser.add_argument('--bbox', help='Only sample origins inside south,west,north,east')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Scrape sampled origins again even if they are already in the database, '
+                             'calling the API instead of reading cached responses')
+    args = parser.parse_args()
+
+    area = None
+    if args.district or args.polygon or args.bbox:
+        try:
+            area = select_area(args.district, args.polygon, parse_bbox(args.bbox) if args.bbox else None)
+        except (ValueError, OSError) as e:
+            parser.error(str(e))
+
+    api_key = os.getenv('API_KEY')
+    destination = "Metro Świętokrzyska"
+
+    # Initialize database
+    conn = initialize_database(args.db)
+    cursor = conn.cursor()
+
+    # Print the number of records already in the database
+    cursor.execute("SELECT COUNT(*) FROM travel_info")
+    record_count = cursor.fetchone()[0]
+    print(f"Number of records already in the database: {record_count}")
+
+    cache = None
+    if not args.no_cache:
+        max_bytes = int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb is not None else None
+        cache = DirectionsCache(args.cache_dir, max_bytes=max_bytes)
+
+    writer = BatchWriter(conn, batch_size=args.batch_size, flush_interval=args.flush_interval)
+    try:
+        if args.replay:
+            if cache is None:
+                parser.error('--replay requires the response cache')
+            count = replay_from_cache(cache, args.csv, destination, writer)
+            print(f"Replayed {count} records from {args.cache_dir}")
+        else:
+            metrics = ScrapeMetrics()
+            reporter = MetricsReporter(metrics, args.metrics_interval, args.metrics_prom, args.metrics_json)
+            client = DirectionsClient(api_key, pool_size=2 * args.workers, limiter=TokenBucket(args.qps),
+                                      endpoint=args.endpoint, cache=cache, matrix_endpoint=args.matrix_endpoint,
+                                      metrics=metrics, read_cache=not args.refresh)
+            queue = JobQueue(conn, max_attempts=args.max_attempts)
+            recovered = queue.recover()
+            if args.retry_failed:
+                print(f"Retrying {queue.retry_failed()} failed origins")
+            elif queue.seconds_until_next_attempt() is not None:
+                print(f"Resuming {queue.counts().get('pending', 0)} pending origins ({recovered} were in flight)")
+            else:
+                register = load_register(args.csv)
+                if area is not None:
+                    register = register[points_in_area(register['latitude'], register['longitude'], area)]
+                    print(f"Kept {len(register)} register addresses inside the area")
+                if args.refresh:
+                    # Only origins still pending are skipped, done and failed ones are queued again
+                    existing = queue.streets(status='pending')
+                else:
+                    existing = (load_existing_streets(conn, area_bbox(area) if area is not None else None)
+                                | queue.streets())
+                rng = np.random.default_rng(args.seed)
+                if args.sampler == 'grid':
+                    budget = args.budget
+                    if budget is None:
+                        # Only register addresses not scraped or queued yet, `existing` may hold streets outside the area
+                        budget = round(args.sample_rate * (~register['origin'].isin(existing)).sum())
+                    origins = select_origins_by_grid(register, existing, conn, budget, args.cell_size, rng)
+                else:
+                    origins = select_origins(register, existing, args.sample_rate, rng)
+                metrics.inc('scrape_origins_selected_total', len(origins))
+                if args.reuse_radius:
+                    selected = len(origins)
+                    origins = infer_from_neighbours(conn, writer, origins, args.reuse_radius)
+                    print(f"Inferred {selected - len(origins)} origins from measured neighbours")
+                    metrics.inc('scrape_origins_skipped_total', selected - len(origins), reason='inferred')
+                    metrics.inc('scrape_rows_stored_total', selected - len(origins), source='inferred')
+                queue.enqueue(origins.itertuples(index=False), requeue=args.refresh)
+                print(f"Queued {len(origins)} {'origins to refresh' if args.refresh else 'new origins'}")
+            writer.flush()
+
+            if args.backend == 'matrix':
+                process = lambda jobs: scrape_matrix(client, jobs, destination, writer, queue, args.workers)
+                claim_size = MAX_MATRIX_ORIGINS * args.workers
+            else:
+                process = lambda jobs: scrape(client, jobs, destination, writer, queue, args.workers)
+                claim_size = 16 * args.workers
+            reporter.start()
+            try:
+                run_queue(queue, writer, process, claim_size)
+            finally:
+                reporter.stop()
+            print(f"Jobs by status: {queue.counts()}")
+    finally:
+        writer.flush()
+
+    if cache is not None:
+        cache.evict()
+
+    # Close the database connection
+    conn.close()
 
-        # Store the result in the database
-        cursor.execute(
-            "INSERT INTO travel_info (street, latitude, longitude, transit_duration, transfers, car_duration_avg) VALUES (?, ?, ?, ?, ?, ?)",
-            (origin, latitude, longitude, transit_duration, transfers, car_duration_avg)
-        )
-        conn.commit()
 
-# Close the database connection
-conn.close()
+if __name__ == '__main__':
+    main()
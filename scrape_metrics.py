@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+# Upper bounds in seconds of the request latency histogram buckets, as in Prometheus client libraries
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def label_text(labels):
+    return '{' + ','.join(f'{name}="{label_value(value)}"' for name, value in labels) + '}' if labels else ''
+
+
+class ScrapeMetrics:
+    """
+    Thread-safe counters and request latency histograms of a scrape.
+    Counters are keyed by name and a sorted tuple of (label, value) pairs, like Prometheus series.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.started = time.monotonic()
+        self.lock = threading.Lock()
+        self.counters = Counter()
+        # Per (endpoint, mode): observations per bucket (the last one is +Inf) and their sum
+        self.latencies = {}
+        self.latency_sums = Counter()
+
+    def inc(self, name, amount=1, **labels):
+        with self.lock:
+            self.counters[name, tuple(sorted(labels.items()))] += amount
+
+    def observe_request(self, endpoint, mode, seconds, status):
+        """One API request: its latency and HTTP status code (or the exception it failed with)"""
+        key = (('endpoint', endpoint), ('mode', mode))
+        with self.lock:
+            counts = self.latencies.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))] += 1
+            self.latency_sums[key] += seconds
+            self.counters['scrape_requests_total', key + (('status', str(status)),)] += 1
+
+    def total(self, name, **labels):
+        """Sum of a counter over all series matching the given labels"""
+        with self.lock:
+            return sum(value for (counter, series), value in self.counters.items()
+                       if counter == name and labels.items() <= dict(series).items())
+
+    def latency_quantile(self, key, q):
+        """Estimated from the histogram buckets by linear interpolation, None without observations"""
+        with self.lock:
+            counts = list(self.latencies.get(key, []))
+        if not sum(counts):
+            return None
+        rank, seen, lower = q * sum(counts), 0, 0.0
+        for bound, count in zip(self.buckets + (self.buckets[-1],), counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1]
+
+    def summary(self):
+        """Rates derived from the counters, as a JSON-serializable dict"""
+        elapsed = time.monotonic() - self.started
+        rows = self.total('scrape_rows_stored_total')
+        selected = self.total('scrape_origins_selected_total')
+        skipped = self.total('scrape_origins_skipped_total')
+        requests = self.total('scrape_requests_total')
+        hits, misses = (self.total('scrape_cache_lookups_total', result=result) for result in ('hit', 'miss'))
+        with self.lock:
+            statuses = Counter()
+            for (name, series), value in self.counters.items():
+                if name == 'scrape_requests_total':
+                    statuses[dict(series)['status']] += value
+            errors = Counter()
+            for (name, series), value in self.counters.items():
+                if name == 'scrape_lookup_errors_total':
+                    errors[dict(series)['error']] += value
+            keys = sorted(self.latencies)
+        return {
+            'elapsed_seconds': round(elapsed, 1),
+            'rows_stored': rows,
+            'rows_per_minute': round(rows / elapsed * 60, 1) if elapsed else 0.0,
+            'api_requests': requests,
+            'api_requests_per_row': round(requests / rows, 2) if rows else None,
+            'http_statuses': dict(statuses),
+            'lookup_errors': dict(errors),
+            'no_routes_found': errors['No routes found'],
+            'cache_hit_rate': round(hits / (hits + misses), 3) if hits + misses else None,
+            'skip_rate': round(skipped / selected, 3) if selected else None,
+            'latency_seconds': {
+                f"{dict(key)['endpoint']}/{dict(key)['mode']}": {
+                    'p50': round(self.latency_quantile(key, 0.5), 3), 'p95': round(self.latency_quantile(key, 0.95), 3)}
+                for key in keys
+            },
+        }
+
+    def prometheus_text(self):
+        """All series in the Prometheus text exposition format, e.g. for node_exporter's textfile collector"""
+        lines = []
+        with self.lock:
+            for name in sorted({name for name, _ in self.counters}):
+                lines.append(f'# TYPE {name} counter')
+                for (counter, series), value in sorted(self.counters.items()):
+                    if counter == name:
+                        lines.append(f'{name}{label_text(series)} {value}')
+            lines.append('# TYPE scrape_request_duration_seconds histogram')
+            for key, counts in sorted(self.latencies.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), counts):
+                    cumulative += count
+                    lines.append(f'scrape_request_duration_seconds_bucket{label_text(key + (("le", bound),))} {cumulative}')
+                lines.append(f'scrape_request_duration_seconds_sum{label_text(key)} {self.latency_sums[key]:.6f}')
+                lines.append(f'scrape_request_duration_seconds_count{label_text(key)} {cumulative}')
+        lines.append('# TYPE scrape_uptime_seconds gauge')
+        lines.append(f'scrape_uptime_seconds {time.monotonic() - self.started:.1f}')
+        return '\n'.join(lines) + '\n'
+
+
+def write_atomically(path, text):
+    # Scrapers of the file never see a partially written report
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class MetricsReporter:
+    """
+    Every `interval` seconds, and once more when stopped, prints a one-line summary of the metrics
+    and rewrites the optional Prometheus text file and JSON summary file.
+    """
+
+    def __init__(self, metrics, interval=60.0, prometheus_path=None, json_path=None):
+        self.metrics = metrics
+        self.interval = interval
+        self.prometheus_path = prometheus_path
+        self.json_path = json_path
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        # (time, rows stored) at the previous report, for the rate over the last interval
+        self.previous = (time.monotonic(), 0)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        self.report()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.report()
+
+    def report(self):
+        summary = self.metrics.summary()
+        now, (then, rows) = time.monotonic(), self.previous
+        summary['recent_rows_per_minute'] = round((summary['rows_stored'] - rows) / (now - then) * 60, 1) if now > then else 0.0
+        self.previous = (now, summary['rows_stored'])
+        if self.prometheus_path:
+            write_atomically(self.prometheus_path, self.metrics.prometheus_text())
+        if self.json_path:
+            write_atomically(self.json_path, json.dumps(summary, indent=2, ensure_ascii=False))
+        cache_hit_rate = summary['cache_hit_rate']
+        latencies = ', '.join(f"{name} p95 {values['p95']:.2f} s" for name, values in summary['latency_seconds'].items())
+        print(f"Metrics: {summary['rows_stored']} rows ({summary['recent_rows_per_minute']}/min lately, "
+              f"{summary['rows_per_minute']}/min overall), "
+              f"{summary['api_requests']} requests ({summary['api_requests_per_row'] or 0} per row), "
+              f"statuses {summary['http_statuses']}, {summary['no_routes_found']} without routes, "
+              f"cache hits {0 if cache_hit_rate is None else cache_hit_rate:.0%}"
+              + (f", {latencies}" if latencies else ""))
@@ -0,0 +1,251 @@
+import argparse
+import json
+import os
+import sqlite3
+import struct
+import zlib
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_FILE = 'travel_info.snap'
+MAGIC = b'TRAVSNAP'
+VERSION = 2
+# Buffers start on 64-byte boundaries so memory-mapped columns are aligned for NumPy
+ALIGNMENT = 64
+
+
+def is_snapshot(path):
+    return str(path).endswith('.snap')
+
+
+def snapshot_tables(conn):
+    """
+    Tables holding collected data: travel_info, the scrape queue, departure slots, route legs, ...
+    Side tables named travel_info_* (districts, metro stations, the R*Tree index) are left out,
+    they are recomputed from travel_info.
+    """
+    return [name for name, in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND sql LIKE 'CREATE TABLE%' "
+        "AND name NOT LIKE 'sqlite%' AND name NOT LIKE 'travel_info\\_%' ESCAPE '\\' ORDER BY rowid"
+    )]
+
+
+def column_types(conn, table):
+    """Declared SQLite type of every column, reduced to REAL, INTEGER or TEXT"""
+    types = {}
+    for _, name, declared, *_ in conn.execute(f'PRAGMA table_info({table})'):
+        declared = declared.upper()
+        types[name] = 'INTEGER' if 'INT' in declared else 'REAL' if declared in ('REAL', 'FLOAT', 'DOUBLE') else 'TEXT'
+    return types
+
+
+def encode_column(values, kind):
+    """
+    Buffers of one column: REAL as float64 with NaN for NULL, INTEGER as int64 plus a null bitmap
+    when there are NULLs, TEXT as int32 codes (-1 for NULL) into a table of distinct strings
+    stored as int64 offsets into one UTF-8 blob.
+    """
+    if kind == 'REAL':
+        # NumPy turns None into NaN when converting to float
+        return {'values': np.array(values, dtype='<f8')}
+    if kind == 'INTEGER':
+        values = np.array(values, dtype=object)
+        nulls = values == None  # noqa: E711, elementwise on an object array
+        buffers = {'values': np.where(nulls, 0, values).astype('<i8')}
+        if nulls.any():
+            buffers['nulls'] = np.packbits(nulls)
+        return buffers
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    encoded = [str(value).encode('utf-8') for value in uniques]
+    offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return {'codes': codes.astype('<i4'), 'offsets': offsets, 'data': np.frombuffer(b''.join(encoded), dtype='u1')}
+
+
+def write_snapshot(path, tables, compress=False):
+    """
+    Writes a columnar snapshot: the magic bytes, the length of a JSON header describing every table
+    and buffer, the header itself, then the raw buffers (zlib-compressed when `compress` is set).
+    `tables` are dicts with the table name, its schema and indexes, the row count and its columns.
+    """
+    header = {'version': VERSION, 'tables': []}
+    blobs, position = [], 0
+    for table in tables:
+        described_columns = []
+        for name, (kind, buffers) in table['columns'].items():
+            described = {}
+            for buffer_name, array in buffers.items():
+                raw = np.ascontiguousarray(array).tobytes()
+                stored = zlib.compress(raw, 6) if compress else raw
+                position += -position % ALIGNMENT
+                described[buffer_name] = {'offset': position, 'length': len(stored), 'dtype': array.dtype.str,
+                                          'count': len(array), 'compression': 'zlib' if compress else None}
+                blobs.append((position, stored))
+                position += len(stored)
+            described_columns.append({'name': name, 'type': kind, 'buffers': described})
+        header['tables'].append({**table, 'columns': described_columns})
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    data_start = len(MAGIC) + 8 + len(header_bytes)
+    data_start += -data_start % ALIGNMENT
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<Q', len(header_bytes)) + header_bytes)
+        for offset, stored in blobs:
+            f.seek(data_start + offset)
+            f.write(stored)
+        f.truncate(data_start + position)
+    os.replace(tmp_path, path)
+
+
+def read_header(path):
+    """(header, offset of the first buffer in the file)"""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not a travel_info snapshot')
+        header_length, = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    if header['version'] != VERSION:
+        raise ValueError(f"Unsupported snapshot version {header['version']}")
+    data_start = len(MAGIC) + 8 + header_length
+    return header, data_start + (-data_start % ALIGNMENT)
+
+
+def table_header(path, header, table):
+    for described in header['tables']:
+        if described['table'] == table:
+            return described
+    raise ValueError(f'{path} has no {table} table')
+
+
+def read_buffer(path, data_start, described):
+    """Uncompressed buffers are memory-mapped, so their pages are only read when touched"""
+    dtype = np.dtype(described['dtype'])
+    if described['count'] == 0:
+        return np.empty(0, dtype=dtype)
+    if described['compression'] == 'zlib':
+        with open(path, 'rb') as f:
+            f.seek(data_start + described['offset'])
+            return np.frombuffer(zlib.decompress(f.read(described['length'])), dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode='r', offset=data_start + described['offset'],
+                     shape=(described['count'],))
+
+
+def decode_column(kind, buffers):
+    """Column as a NumPy array; INTEGER columns with NULLs become float64 with NaN, TEXT becomes objects"""
+    if kind == 'REAL':
+        return buffers['values']
+    if kind == 'INTEGER':
+        if 'nulls' not in buffers:
+            return buffers['values']
+        values = buffers['values'].astype(float)
+        values[np.unpackbits(buffers['nulls'], count=len(values)).astype(bool)] = np.nan
+        return values
+    blob, offsets = bytes(buffers['data']), buffers['offsets']
+    # The trailing None is what code -1 (NULL) selects
+    strings = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)] + [None]
+    return np.array(strings, dtype=object)[buffers['codes']]
+
+
+def load_columns(path, columns=None, table='travel_info'):
+    """Reads the requested columns (default all) of a snapshot table into a dict of NumPy arrays"""
+    header, data_start = read_header(path)
+    loaded = {}
+    for column in table_header(path, header, table)['columns']:
+        if columns is not None and column['name'] not in columns:
+            continue
+        buffers = {name: read_buffer(path, data_start, described) for name, described in column['buffers'].items()}
+        loaded[column['name']] = decode_column(column['type'], buffers)
+    return loaded
+
+
+def load_frame(path, columns=None, table='travel_info'):
+    """Snapshot table as a DataFrame; numeric columns stay views of the memory-mapped file"""
+    return pd.DataFrame(load_columns(path, columns, table), copy=False)
+
+
+def dump(conn, path, tables=None, compress=False):
+    """Writes tables (default all in snapshot_tables) to a snapshot, returns the number of rows of each"""
+    described = []
+    for table in tables or snapshot_tables(conn):
+        types = column_types(conn, table)
+        schema, = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+        indexes = [sql for sql, in conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (table,))]
+        rows = conn.execute(f"SELECT {', '.join(types)} FROM {table}").fetchall()
+        values = list(zip(*rows)) if rows else [()] * len(types)
+        columns = {name: (kind, encode_column(list(column), kind)) for (name, kind), column in zip(types.items(), values)}
+        described.append({'table': table, 'schema': schema, 'indexes': indexes, 'rows': len(rows), 'columns': columns})
+    write_snapshot(path, described, compress)
+    return {table['table']: table['rows'] for table in described}
+
+
+def restore(path, db_path):
+    """
+    Creates a database holding the tables of a snapshot, with the schemas they were dumped with.
+    Rows are loaded without a journal and before any index or trigger exists, which is what makes
+    the bulk load fast. Returns the number of rows of each table.
+    """
+    header, _ = read_header(path)
+    conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=OFF')
+    conn.execute('PRAGMA synchronous=OFF')
+    for table in header['tables']:
+        columns = load_columns(path, table=table['table'])
+        names = list(columns)
+        kinds = {column['name']: column['type'] for column in table['columns']}
+
+        def to_sql(name, array):
+            # NaN is how NULLs of REAL and nullable INTEGER columns come back
+            if kinds[name] == 'TEXT':
+                return array.tolist()
+            values = array.astype(object)
+            values[np.isnan(array.astype(float))] = None
+            return [int(v) if kinds[name] == 'INTEGER' and v is not None else v for v in values.tolist()]
+
+        values = [to_sql(name, columns[name]) for name in names]
+        conn.execute(table['schema'])
+        conn.executemany(f"INSERT INTO {table['table']} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+                         zip(*values))
+        for index in table['indexes']:
+            conn.execute(index)
+    conn.commit()
+    conn.close()
+    return {table['table']: table['rows'] for table in header['tables']}
+
+
+def format_rows(rows):
+    return ', '.join(f'{count} {table} rows' for table, count in rows.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dump the database to a columnar snapshot or restore it')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    dump_parser = subparsers.add_parser('dump', help='write travel_info and the other collected tables to a snapshot')
+    dump_parser.add_argument('--db', default='travel_info.db')
+    dump_parser.add_argument('--snapshot', default=SNAPSHOT_FILE)
+    dump_parser.add_argument('--compress', action='store_true', help='zlib-compress the columns (no memory mapping)')
+    restore_parser = subparsers.add_parser('restore', help='create a database from a snapshot')
+    restore_parser.add_argument('--snapshot', default=SNAPSHOT_FILE)
+    restore_parser.add_argument('--db', default='travel_info.db')
+    args = parser.parse_args()
+
+    if args.command == 'dump':
+        conn = sqlite3.connect(args.db)
+        rows = dump(conn, args.snapshot, compress=args.compress)
+        conn.close()
+        print(f"💾 Dumped {format_rows(rows)} to {args.snapshot} ({os.path.getsize(args.snapshot) / 1024:.0f} KB)")
+    else:
+        if os.path.exists(args.db):
+            parser.error(f'{args.db} already exists')
+        rows = restore(args.snapshot, args.db)
+        # Imported here so dumping and map builds do not need the scraper's dependencies
+        from scrape_addresses import initialize_database
+        # Adds the columns and spatial index of the current schema, then switches to WAL
+        initialize_database(args.db).close()
+        print(f"💾 Restored {format_rows(rows)} from {args.snapshot} into {args.db}")
+
+
+if __name__ == '__main__':
+    main()
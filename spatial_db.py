@@ -0,0 +1,115 @@
+import math
+
+import numpy as np
+
+from spatial_index import METERS_PER_DEGREE, haversine_m
+
+DEFAULT_COLUMNS = ('street', 'latitude', 'longitude', 'transit_duration', 'transfers', 'car_duration_avg')
+
+
+def ensure_spatial_index(conn):
+    """
+    Creates the travel_info_rtree R*Tree index over travel_info coordinates, keyed by travel_info rowid,
+    with triggers keeping it in sync, and indexes any rows added before the index existed.
+    """
+    conn.executescript('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS travel_info_rtree USING rtree(
+            id, min_lat, max_lat, min_lon, max_lon
+        );
+
+        CREATE TRIGGER IF NOT EXISTS travel_info_rtree_insert AFTER INSERT ON travel_info
+        WHEN NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+        BEGIN
+            INSERT OR REPLACE INTO travel_info_rtree VALUES (NEW.rowid, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS travel_info_rtree_update AFTER UPDATE OF latitude, longitude ON travel_info
+        BEGIN
+            DELETE FROM travel_info_rtree WHERE id = OLD.rowid;
+            INSERT INTO travel_info_rtree
+            SELECT NEW.rowid, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+            WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS travel_info_rtree_delete AFTER DELETE ON travel_info
+        BEGIN
+            DELETE FROM travel_info_rtree WHERE id = OLD.rowid;
+        END;
+    ''')
+    conn.execute('''
+        INSERT INTO travel_info_rtree
+        SELECT rowid, latitude, latitude, longitude, longitude FROM travel_info
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+        AND rowid NOT IN (SELECT id FROM travel_info_rtree)
+    ''')
+    conn.commit()
+
+
+def query_bbox(conn, south, west, north, east, columns=DEFAULT_COLUMNS):
+    """Rows of travel_info inside the bounding box"""
+    selected = ', '.join(f't.{column}' for column in columns)
+    return conn.execute(f'''
+        SELECT {selected}
+        FROM travel_info_rtree r JOIN travel_info t ON t.rowid = r.id
+        WHERE r.max_lat >= ? AND r.min_lat <= ? AND r.max_lon >= ? AND r.min_lon <= ?
+    ''', (south, north, west, east)).fetchall()
+
+
+def radius_bbox(latitude, longitude, radius_m):
+    """(south, west, north, east) of the box enclosing a circle"""
+    lat_delta = radius_m / METERS_PER_DEGREE
+    lon_delta = radius_m / (METERS_PER_DEGREE * math.cos(math.radians(latitude)))
+    return latitude - lat_delta, longitude - lon_delta, latitude + lat_delta, longitude + lon_delta
+
+
+def query_radius(conn, latitude, longitude, radius_m, columns=DEFAULT_COLUMNS):
+    """Rows within `radius_m` meters, nearest first, each with its distance in meters appended"""
+    requested = len(columns)
+    columns = tuple(columns) + tuple(c for c in ('latitude', 'longitude') if c not in columns)
+    rows = query_bbox(conn, *radius_bbox(latitude, longitude, radius_m), columns=columns)
+    if not rows:
+        return []
+    lat_column, lon_column = columns.index('latitude'), columns.index('longitude')
+    coordinates = np.array([(row[lat_column], row[lon_column]) for row in rows], dtype=float)
+    distances = haversine_m(latitude, longitude, coordinates[:, 0], coordinates[:, 1])
+    order = np.argsort(distances, kind='stable')
+    return [rows[i][:requested] + (float(distances[i]),) for i in order if distances[i] <= radius_m]
+
+
+def query_nearest(conn, latitude, longitude, k=1, columns=DEFAULT_COLUMNS, initial_radius_m=250,
+                  max_radius_m=50_000):
+    """
+    The `k` rows nearest to a point, each with its distance in meters appended.
+    The search radius doubles until it holds k rows, so only a small neighbourhood is read.
+    """
+    radius_m = initial_radius_m
+    while True:
+        rows = query_radius(conn, latitude, longitude, radius_m, columns=columns)
+        if len(rows) >= k or radius_m >= max_radius_m:
+            return rows[:k]
+        radius_m *= 2
+
+
+def reset_if_source_changed(conn, table, digest):
+    """
+    Side tables derived from travel_info and an input file remember the file's content hash in
+    `<table>_source`; when it differs, every derived row is dropped so it gets recomputed.
+    """
+    conn.execute(f'CREATE TABLE IF NOT EXISTS {table}_source (digest TEXT)')
+    if conn.execute(f'SELECT digest FROM {table}_source').fetchone() != (digest,):
+        conn.execute(f'DELETE FROM {table}')
+        conn.execute(f'DELETE FROM {table}_source')
+        conn.execute(f'INSERT INTO {table}_source VALUES (?)', (digest,))
+
+
+def stale_rows(conn, table):
+    """
+    (street, latitude, longitude) of travel_info rows that are missing from a derived side table keyed
+    by street, or whose coordinates changed since it was computed. Rows gone from travel_info are dropped.
+    """
+    conn.execute(f'DELETE FROM {table} WHERE street NOT IN (SELECT street FROM travel_info)')
+    return conn.execute(f'''
+        SELECT t.street, t.latitude, t.longitude
+        FROM travel_info t LEFT JOIN {table} d ON d.street = t.street
+        WHERE d.street IS NULL OR d.latitude IS NOT t.latitude OR d.longitude IS NOT t.longitude
+    ''').fetchall()
@@ -0,0 +1,97 @@
+import numpy as np
+
+METERS_PER_DEGREE = 111_320
+EARTH_RADIUS_M = 6_371_008.8
+# Warsaw is small enough for an equirectangular projection around its center latitude
+REFERENCE_LATITUDE = 52.23
+
+
+def project(latitudes, longitudes):
+    """Projects coordinates to planar meters, accurate to well under 1% across Warsaw"""
+    x = np.asarray(longitudes, dtype=float) * METERS_PER_DEGREE * np.cos(np.radians(REFERENCE_LATITUDE))
+    y = np.asarray(latitudes, dtype=float) * METERS_PER_DEGREE
+    return x, y
+
+
+def haversine_m(lat1, lon1, lat2, lon2):
+    """Great-circle distance in meters, broadcasting over NumPy arrays"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(value, dtype=float)) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+class GridIndex:
+    """
+    In-memory nearest-neighbour index over lat/lon points.
+    Points are bucketed into square cells of `cell_size_m` and sorted by cell, so every query
+    is answered with a few binary searches and array operations instead of a Python loop per point.
+    """
+
+    def __init__(self, latitudes, longitudes, cell_size_m=250):
+        self.cell_size_m = cell_size_m
+        x, y = project(latitudes, longitudes)
+        cells = self._cells(x, y)
+        self.order = np.lexsort((cells[1], cells[0]))
+        self.cell_keys = self._keys(cells[0][self.order], cells[1][self.order])
+        self.x = x[self.order]
+        self.y = y[self.order]
+
+    def __len__(self):
+        return len(self.order)
+
+    def _cells(self, x, y):
+        return np.floor(x / self.cell_size_m).astype(np.int64), np.floor(y / self.cell_size_m).astype(np.int64)
+
+    @staticmethod
+    def _keys(columns, rows):
+        return columns * 10_000_000 + rows
+
+    def _candidates(self, x, y, rings):
+        """
+        Pairs every query point with the indexed points of the (2 * rings + 1)^2 cells around it.
+        Returns (query positions, sorted point positions) of equal length.
+        """
+        columns, rows = self._cells(x, y)
+        queries, points = [], []
+        for dc in range(-rings, rings + 1):
+            for dr in range(-rings, rings + 1):
+                keys = self._keys(columns + dc, rows + dr)
+                start = np.searchsorted(self.cell_keys, keys, side='left')
+                end = np.searchsorted(self.cell_keys, keys, side='right')
+                counts = end - start
+                query = np.repeat(np.arange(len(keys)), counts)
+                # Position of every matched point: its range start plus its offset within the range
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                queries.append(query)
+                points.append(np.repeat(start, counts) + offsets)
+        return np.concatenate(queries), np.concatenate(points)
+
+    def pairs_within(self, latitudes, longitudes, radius_m):
+        """
+        All (query, point) pairs closer than `radius_m` meters.
+        Returns (query positions, indices into the original arrays, distances in meters).
+        """
+        x, y = project(np.atleast_1d(latitudes), np.atleast_1d(longitudes))
+        if len(self) == 0 or len(x) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([])
+        queries, points = self._candidates(x, y, int(np.ceil(radius_m / self.cell_size_m)))
+        d = np.hypot(self.x[points] - x[queries], self.y[points] - y[queries])
+        close = d <= radius_m
+        return queries[close], self.order[points[close]], d[close]
+
+    def nearest(self, latitudes, longitudes, max_distance_m):
+        """
+        Finds the closest indexed point within `max_distance_m` meters of every query point.
+        Returns (indices into the original arrays, distances in meters); the index is -1 and the
+        distance inf where no point is close enough.
+        """
+        count = len(np.atleast_1d(latitudes))
+        indices = np.full(count, -1, dtype=np.int64)
+        distances = np.full(count, np.inf)
+        queries, points, d = self.pairs_within(latitudes, longitudes, max_distance_m)
+
+        # Sort by distance descending so the closest point of each query is assigned last
+        order = np.argsort(-d, kind='stable')
+        indices[queries[order]] = points[order]
+        distances[queries[order]] = d[order]
+        return indices, distances
@@ -0,0 +1,257 @@
+import argparse
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from folium.utilities import write_png
+
+from fingerprints import FingerprintStore, combine
+from map_data import comparison_rows, load_travel_info, located_durations
+from palettes import (MIN_TIME_GREEN, MID_TIME_YELLOW, MID_TIME_RED, MAX_TIME_BLACK, MAX_COLOR_VAL,
+                      COMPARISON_THRESHOLDS, COMPARISON_COLORS, duration_rgb, comparison_rgb)
+from snapshot import is_snapshot
+from spatial_index import GridIndex
+from travel_surface import idw_values, surface_rgba
+
+TILE_SIZE = 256
+TILES_DIR = 'static/tiles'
+DEFAULT_ZOOMS = (10, 15)
+EQUATOR_M = 40_075_016.686
+# Interpolation settings of the tiled surfaces, the defaults of travel_surface.idw_values
+RADIUS_M = 1000
+POWER = 2
+# Surfaces are interpolated on a grid no finer than this and upsampled to the tile's pixels,
+# a 1 km weighting radius has no sharper detail to show at street zoom
+MIN_CELL_M = 20
+
+
+def transit_samples(frame):
+    return located_durations(frame)
+
+
+def comparison_samples(frame):
+    """(latitudes, longitudes, transit minus car minutes) as in the transport comparison maps"""
+    rows = comparison_rows(frame).dropna(subset=['latitude', 'longitude'])
+    return (rows['latitude'].to_numpy(dtype=float), rows['longitude'].to_numpy(dtype=float),
+            (rows['transit_duration'] - rows['car_duration_avg']).to_numpy(dtype=float))
+
+
+# Tile layers by the name of their directory: the sampled values and the palette coloring them
+TILE_LAYERS = {
+    'transit': {'title': 'Transit travel time', 'samples': transit_samples, 'rgb': duration_rgb,
+                'palette': {'min_time_green': MIN_TIME_GREEN, 'mid_time_yellow': MID_TIME_YELLOW,
+                            'mid_time_red': MID_TIME_RED, 'max_time_black': MAX_TIME_BLACK,
+                            'max_color_val': MAX_COLOR_VAL}},
+    'transit_vs_car': {'title': 'Transit vs car', 'samples': comparison_samples, 'rgb': comparison_rgb,
+                       'palette': {'thresholds': COMPARISON_THRESHOLDS, 'colors': COMPARISON_COLORS}},
+}
+
+
+def tile_xy(latitudes, longitudes, zoom):
+    """Fractional Web Mercator (XYZ) tile coordinates of points at `zoom`"""
+    n = 2 ** zoom
+    x = (np.asarray(longitudes, dtype=float) + 180) / 360 * n
+    y = (1 - np.arcsinh(np.tan(np.radians(latitudes))) / np.pi) / 2 * n
+    return x, y
+
+
+def tile_latitudes(y, zoom):
+    return np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y, dtype=float) / 2 ** zoom))))
+
+
+def tile_longitudes(x, zoom):
+    return np.asarray(x, dtype=float) / 2 ** zoom * 360 - 180
+
+
+def tile_width_m(zoom, y):
+    """Ground width of the tiles in row `y`"""
+    return EQUATOR_M * np.cos(np.radians(tile_latitudes(y + 0.5, zoom))) / 2 ** zoom
+
+
+def tile_path(directory, layer, zoom, x, y):
+    return os.path.join(directory, layer, str(zoom), str(x), f'{y}.png')
+
+
+def tile_fingerprints(latitudes, longitudes, values, zoom, radius_m=RADIUS_M):
+    """
+    Fingerprint of the samples every tile at `zoom` interpolates from, by (x, y) of the tiles within
+    `radius_m` of a sample. A tile covers its own samples and those of the tiles around it up to the
+    radius, a superset of what its pixels reach, so a changed sample only invalidates the tiles nearby.
+    """
+    x, y = tile_xy(latitudes, longitudes, zoom)
+    x, y = np.floor(x).astype(np.int64), np.floor(y).astype(np.int64)
+    if len(x) == 0:
+        return {}
+    # Order-independent digest of the samples in each tile: the wrapping sum of their row hashes
+    hashes = pd.util.hash_pandas_object(
+        pd.DataFrame({'latitude': latitudes, 'longitude': longitudes, 'value': values}), index=False).to_numpy()
+    order = np.lexsort((y, x))
+    x, y, hashes = x[order], y[order], hashes[order]
+    starts = np.flatnonzero(np.r_[True, (np.diff(x) != 0) | (np.diff(y) != 0)])
+    counts = np.diff(np.r_[starts, len(x)])
+    occupied = {(int(x[s]), int(y[s])): (int(total), int(count))
+                for s, total, count in zip(starts, np.add.reduceat(hashes, starts), counts)}
+
+    # Tiles are narrowest in the northernmost row
+    rings = int(np.ceil(radius_m / tile_width_m(zoom, y.min())))
+    offsets = [(dx, dy) for dx in range(-rings, rings + 1) for dy in range(-rings, rings + 1)]
+    tiles = {(tx + dx, ty + dy) for tx, ty in occupied for dx, dy in offsets}
+    return {
+        (tx, ty): hashlib.sha256(repr([(dx, dy, *occupied[tx + dx, ty + dy]) for dx, dy in offsets
+                                       if (tx + dx, ty + dy) in occupied]).encode()).hexdigest()
+        for tx, ty in tiles
+    }
+
+
+def upsample(surface, size):
+    """
+    Bilinear resampling of a square surface to `size` x `size` pixels. Cells without data do not bleed
+    into their neighbours: pixels take the average of the known cells around them and stay NaN where
+    most of those are unknown.
+    """
+    cells = surface.shape[0]
+    if cells == size:
+        return surface
+    source = np.clip((np.arange(size) + 0.5) * cells / size - 0.5, 0, cells - 1)
+    low = np.floor(source).astype(np.int64)
+    high = np.minimum(low + 1, cells - 1)
+    weight = source - low
+
+    def resample(grid):
+        rows = grid[low] * (1 - weight)[:, None] + grid[high] * weight[:, None]
+        return rows[:, low] * (1 - weight) + rows[:, high] * weight
+
+    known = ~np.isnan(surface)
+    coverage = resample(known.astype(float))
+    totals = resample(np.where(known, surface, 0.0))
+    pixels = np.full((size, size), np.nan)
+    visible = coverage >= 0.5
+    pixels[visible] = totals[visible] / coverage[visible]
+    return pixels
+
+
+def render_tile(index, values, zoom, x, y, rgb, radius_m=RADIUS_M, power=POWER):
+    """PNG of the interpolated surface over tile (zoom, x, y); transparent where no sample is in range"""
+    cells = int(min(TILE_SIZE, np.ceil(tile_width_m(zoom, y) / MIN_CELL_M)))
+    fractions = (np.arange(cells) + 0.5) / cells
+    cell_latitudes, cell_longitudes = np.meshgrid(tile_latitudes(y + fractions, zoom),
+                                                  tile_longitudes(x + fractions, zoom), indexing='ij')
+    surface = idw_values(index, values, cell_latitudes.ravel(), cell_longitudes.ravel(), radius_m, power)
+    pixels = upsample(surface.reshape(cells, cells), TILE_SIZE)
+    return write_png(surface_rgba(pixels, rgb=rgb))
+
+
+# Samples of every layer in a worker process, set once by the pool initializer
+worker_layers = {}
+
+
+def init_worker(layers):
+    for layer, (latitudes, longitudes, values) in layers.items():
+        worker_layers[layer] = (GridIndex(latitudes, longitudes, cell_size_m=RADIUS_M), values)
+
+
+def render_tiles(directory, tasks):
+    """Renders a batch of (layer, zoom, x, y) tiles into `directory`, returning how many were written"""
+    for layer, zoom, x, y in tasks:
+        index, values = worker_layers[layer]
+        path = tile_path(directory, layer, zoom, x, y)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # A browser or server reading the tile meanwhile never sees a partially written file
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(render_tile(index, values, zoom, x, y, TILE_LAYERS[layer]['rgb']))
+        os.replace(tmp_path, path)
+    return len(tasks)
+
+
+def update_tiles(frame, directory=TILES_DIR, zooms=DEFAULT_ZOOMS, workers=None, force=False, batch_size=32):
+    """
+    Renders the TILE_LAYERS of travel_info into `directory`/LAYER/Z/X/Y.png for every zoom of the range,
+    in a process pool. Only tiles whose samples changed since they were last rendered are drawn again,
+    tiles no sample reaches any more are deleted.
+    Returns (rendered, unchanged, removed) tile counts.
+    """
+    os.makedirs(directory, exist_ok=True)
+    store = FingerprintStore(os.path.join(directory, '.fingerprints.json'))
+    layers = {layer: spec['samples'](frame) for layer, spec in TILE_LAYERS.items()}
+
+    stale, current = [], set()
+    for layer, (latitudes, longitudes, values) in layers.items():
+        settings = {'palette': TILE_LAYERS[layer]['palette'], 'radius_m': RADIUS_M, 'power': POWER,
+                    'min_cell_m': MIN_CELL_M, 'tile_size': TILE_SIZE}
+        for zoom in range(zooms[0], zooms[1] + 1):
+            for (x, y), samples in tile_fingerprints(latitudes, longitudes, values, zoom).items():
+                key = f'{layer}/{zoom}/{x}/{y}'
+                fingerprint = combine({'samples': samples, **settings})
+                current.add(key)
+                if force or not store.is_fresh(key, tile_path(directory, layer, zoom, x, y), fingerprint):
+                    stale.append(((layer, zoom, x, y), key, fingerprint))
+
+    removed = [key for key in store.fingerprints if key not in current]
+    for key in removed:
+        layer, zoom, x, y = key.split('/')
+        path = tile_path(directory, layer, zoom, x, y)
+        if os.path.exists(path):
+            os.remove(path)
+        del store.fingerprints[key]
+
+    batches = [stale[i:i + batch_size] for i in range(0, len(stale), batch_size)]
+    workers = min(workers or os.cpu_count() or 1, len(batches)) or 1
+    try:
+        if workers <= 1:
+            init_worker(layers)
+            for batch in batches:
+                render_tiles(directory, [tile for tile, _, _ in batch])
+                for _, key, fingerprint in batch:
+                    store.update(key, fingerprint)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(layers,)) as executor:
+                futures = {executor.submit(render_tiles, directory, [tile for tile, _, _ in batch]): batch
+                           for batch in batches}
+                for future in as_completed(futures):
+                    future.result()
+                    for _, key, fingerprint in futures[future]:
+                        store.update(key, fingerprint)
+    finally:
+        # Keep what was rendered before an interruption, the rest stays stale for the next run
+        store.save()
+    return len(stale), len(current) - len(stale), len(removed)
+
+
+def parse_zooms(text):
+    """'10-15' or '12' as a (lowest, highest) zoom range"""
+    low, _, high = text.partition('-')
+    if not low.isdigit() or not (high or low).isdigit() or int(low) > int(high or low):
+        raise ValueError(f"Invalid zoom range {text!r}, expected e.g. 10-15")
+    return int(low), int(high or low)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render travel time surfaces into XYZ map tiles')
+    parser.add_argument('--db', default='travel_info.db', help='database or snapshot (*.snap) to read')
+    parser.add_argument('--slot', help='use the latest travel times sampled at this departure slot')
+    parser.add_argument('--zooms', default=f'{DEFAULT_ZOOMS[0]}-{DEFAULT_ZOOMS[1]}', help='zoom range, e.g. 10-15')
+    parser.add_argument('--output', default=TILES_DIR, help='tile directory')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='parallel rendering processes')
+    parser.add_argument('--force', action='store_true', help='render even the tiles whose samples did not change')
+    args = parser.parse_args()
+
+    if args.slot and is_snapshot(args.db):
+        parser.error('--slot needs the database, restore the snapshot first')
+    try:
+        zooms = parse_zooms(args.zooms)
+        frame = load_travel_info(args.db, args.slot)
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    rendered, unchanged, removed = update_tiles(frame, args.output, zooms, args.workers, args.force)
+    print(f"🧱 Rendered {rendered} tiles ({unchanged} unchanged, {removed} removed) "
+          f"in {time.perf_counter() - start:.1f} s into {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5962 +0,0 @@
-PRAGMA foreign_keys=OFF;
-BEGIN TRANSACTION;
-CREATE TABLE travel_info (
-            street TEXT PRIMARY KEY,
-            latitude REAL,
-            longitude REAL,
-            transit_duration REAL,
-            transfers INTEGER,
-            car_duration_avg REAL
-        );
-INSERT INTO travel_info VALUES('ulica Dynarska, 6',52.25864020000000209,20.91667929999999842,34.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Ziębicka, 1',52.24312139999999971,20.92041379999999861,27.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Karola Miarki, 8',52.26326290000000085,20.92100419999999871,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 4A',52.24764069999999805,20.91357460000000045,26.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Łęgi, 7',52.21442009999999812,20.88639300000000177,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 80A',52.22080979999999784,20.90518030000000139,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Posejdona, 3',52.24908729999999935,20.90989829999999827,27.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Forsycji, 17',52.34865020000000157,20.99672819999999974,43.0,2,33.0);
-INSERT INTO travel_info VALUES('ulica Dobka z Oleśnicy, 3',52.32446290000000033,21.03309559999999934,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Czołowa, 38Z',52.33578459999999666,20.99320439999999977,34.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Bukowska, 15',52.35279880000000218,20.92990019999999874,54.0,2,34.5);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 79',52.31799230000000022,21.0487384000000013,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Szynowa, 3',52.32928489999999755,20.9873744000000002,34.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Nowodworska, 14J',52.32235090000000354,20.94138739999999999,41.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Claudia Monteverdiego, 13',52.34210780000000085,21.05136269999999854,49.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Srebrnogórska, 23B',52.32823119999999762,20.98086269999999943,38.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 6',52.2325127000000009,20.92094589999999954,24.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Dostępna, 36',52.26156970000000256,20.9054347000000007,35.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Laserowa, 6',52.26027450000000129,20.90044449999999899,32.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Galileusza, 11',52.25707669999999894,20.88993659999999863,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 14G',52.21969740000000115,20.88944469999999853,45.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 4D',52.24768240000000218,20.9141964999999992,27.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 73',52.22473029999999739,20.90441059999999851,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 19I',52.35595730000000003,20.9769331000000001,37.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 26C',52.34027350000000211,20.97903240000000124,40.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 40N',52.33499650000000258,20.99143979999999842,32.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fleminga, 31',52.3196907999999965,20.97808339999999916,43.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 84A',52.3235303000000016,21.07641549999999953,50.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 47A',52.33319529999999987,21.02030789999999883,55.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Kartograficzna, 58C',52.31091610000000002,21.074420700000001,49.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Kartograficzna, 78A',52.31309439999999711,21.07691949999999892,50.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Obrębowa, 34',52.36552830000000113,20.95372030000000052,49.0,1,39.5);
-INSERT INTO travel_info VALUES('ulica Skrzatów, 14',52.31514469999999762,21.0366421999999993,38.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Ziołowa, 34',52.33690870000000217,20.99529400000000123,36.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Zakręcona, 21',52.32955359999999701,20.99695300000000132,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Anny Jagiellonki, 6',52.30711949999999888,20.9180275999999985,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Opalin, 3',52.28496770000000282,20.88764820000000099,39.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Zbyszka z Bogdańca, 15B',52.31020279999999901,21.03442559999999873,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 67E',52.29329750000000132,20.88428640000000058,50.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Jana Bytnara „Rudego”, 23',52.19227490000000102,21.00430980000000148,23.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 48A',52.29483479999999674,20.8843671999999998,48.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Batalionu AK „Bałtyk”, 5',52.20690009999999859,21.0646495999999992,28.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Jana Kasprowicza, 145',52.29050050000000027,20.9276826999999983,24.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Renesansowa, 7B',52.27557010000000303,20.93672219999999839,32.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Brunona Schulza, 9',52.28436870000000169,20.96945810000000065,25.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Artura Grottgera, 12',52.20546900000000078,21.02989260000000015,25.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Pyjasa, 1',52.1950018,21.05276329999999874,33.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Racławicka, 120',52.19688850000000002,20.99452840000000009,25.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Korzenna, 14',52.19472979999999752,21.09540289999999985,52.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Polska, 20B',52.2049473000000006,21.07430709999999862,15.0,1,5.5);
-INSERT INTO travel_info VALUES('ulica Orężna, 28',52.18404730000000313,21.06252449999999853,36.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Miłobędzka, 15',52.19481369999999743,20.9916836999999994,27.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Padewska, 13A',52.2022777999999974,21.03086190000000145,25.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Tawerny, 4',52.19559780000000159,20.98787439999999905,31.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Wróbla, 53',52.17688760000000058,21.03237730000000027,28.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Bitwy Warszawskiej 1920 r., 4',52.21180970000000343,20.97551839999999856,32.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica gen. Bronisława Bohaterewicza, 8',52.23042230000000074,21.08903159999999843,31.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Usypiskowa, 9',52.20232879999999654,20.96132300000000014,37.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Drawska, 17',52.20821260000000307,20.9570988999999983,33.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Lotnicza, 9',52.23406119999999931,21.12390080000000125,32.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Weterynaryjna, 3',52.24822309999999704,21.07211059999999847,24.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Wiarusów, 1',52.24340240000000079,21.11894320000000035,36.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Osiecka, 47A',52.23987050000000209,21.10556890000000152,33.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Naddnieprzańska, 11',52.23866679999999719,21.1277177000000016,37.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Strzelecka, 26',52.26194679999999693,21.04193349999999896,17.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Kadrowa, 65J',52.26965669999999876,21.15678910000000101,57.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Heloizy, 4',52.29175469999999848,21.06452990000000013,34.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Topograficzna, 1',52.26016469999999714,21.17258119999999977,40.0,2,26.5);
-INSERT INTO travel_info VALUES('ulica Penelopy, 30',52.291255900000003,21.0645187000000007,33.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Janinówka, 19',52.27331159999999955,21.05594909999999942,21.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Szeroka, 46',52.24801759999999718,21.12668640000000053,48.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Mroźna, 7A',52.28879390000000171,21.0749367999999997,30.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Safony, 3',52.29170069999999982,21.0579402999999985,30.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Prawnicza, 49A',52.18843520000000069,20.88169639999999916,51.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Regulska, 60B',52.18775939999999736,20.8728611000000015,40.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wincentego Kadłubka, 14',52.20524999999999949,20.86512189999999833,35.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 21',52.18087529999999675,20.94317410000000023,49.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Smocza, 16',52.24581330000000178,20.98587769999999964,18.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Kryształowa, 24B',52.23040859999999697,20.9094932,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Oświatowa, 19A',52.23161640000000005,20.91947449999999976,25.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Atutowa, 1',52.31605220000000144,20.96062450000000155,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Strawczyńska, 22',52.25171970000000243,20.87973489999999899,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Na Wyraju, 13',52.22280150000000276,20.88032580000000138,60.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 28',52.24234750000000104,20.9017830999999994,34.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Dionizosa, 5A',52.3376470999999981,20.95149250000000051,55.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Borecka, 18',52.32779010000000141,21.01476239999999862,55.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 50B',52.21851389999999782,20.90775100000000108,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 21Ł',52.3559821999999997,20.97508699999999848,35.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 231',52.30758929999999652,21.02920160000000038,34.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 50A',52.32394829999999786,21.07013780000000124,40.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 23',52.32350850000000264,20.94487349999999993,39.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 110',52.31969910000000112,21.06753730000000147,38.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Osiedle, 9',52.34736829999999941,20.94484329999999873,49.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Ketlinga, 32',52.33488700000000193,21.03983870000000067,48.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Krokwi, 27',52.33364900000000119,20.97381109999999894,40.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Nad Rzeczką, 20B',52.31132480000000128,21.04344740000000158,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 89W',52.31301390000000139,21.04885180000000134,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 51',52.31000960000000077,20.97030379999999994,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 23B',52.31670720000000329,21.05763479999999888,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Płużnicka, 6',52.31127359999999982,20.97312930000000008,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Akcent, 43A',52.29690870000000302,20.87708770000000058,43.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Zbożowa, 11',52.32059879999999908,21.03665760000000163,55.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Zawiślańska, 1B',52.3491073,20.97660970000000091,39.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Bogusławskiego, 6A',52.27664860000000146,20.9165914000000015,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Oriona, 12',52.28409049999999781,20.89451970000000002,39.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Josepha Conrada, 16',52.27384849999999972,20.92476080000000139,32.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 60',52.29454330000000084,20.8817510999999989,45.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Książąt Mazowieckich, 15',52.30248000000000274,20.93204499999999868,34.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Asfaltowa, 5',52.20550159999999807,21.00756390000000095,15.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Augustówka, 28',52.19099640000000306,21.08388199999999913,39.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Czerniakowska, 131',52.20983499999999822,21.04690310000000153,29.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Kostrzyńska, 25',52.18843449999999962,21.07809430000000006,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Cybernetyki, 6B',52.17633099999999758,20.99719669999999994,32.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Jarosława Dąbrowskiego, 20A',52.20229090000000127,21.01953109999999824,22.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Ojcowska, 3A',52.18069100000000304,21.07203499999999963,40.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 38',52.17794200000000159,21.02485390000000009,23.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Sękocińska, 7A',52.22035449999999913,20.97913469999999947,25.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Adolfa Pawińskiego, 8',52.2075806,20.97842179999999957,37.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Studencka, 60',52.17692799999999665,21.03153740000000126,27.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Sielecka, 10',52.20421710000000103,21.0394773000000015,28.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Byczyńska, 37',52.24878739999999767,21.10865910000000056,25.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Koreańska, 11',52.2265841999999978,21.06295920000000166,28.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Józefa Dwernickiego, 22',52.2508146999999994,21.08045140000000117,23.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Floriana Znanieckiego, 6',52.2247125999999966,21.10483380000000154,41.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Tadeusza Rechniewskiego, 10',52.22623070000000211,21.10457889999999992,39.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Osowska, 23',52.24402789999999897,21.1081858000000011,38.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 249',52.26904150000000015,21.11960429999999889,48.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 91A',52.27434960000000074,21.15969259999999963,51.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Działyńczyków, 34',52.25048110000000178,21.17154060000000015,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Magenta, 47',52.2744690000000034,21.16501489999999919,54.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Masztalerska, 23',52.26501559999999814,21.15158879999999897,39.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Jerzego, 10',52.26862919999999946,21.16914119999999854,58.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jerzego, 62',52.27280269999999974,21.16335360000000065,55.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Simóna Bolívara, 4',52.28967959999999949,21.04313709999999916,31.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 45A',52.26887870000000191,21.16503379999999979,45.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Określona, 23',52.28573430000000143,21.06887640000000061,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Sucha, 25',52.29209039999999931,21.0753762999999985,31.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Łabiszyńska, 17',52.29457200000000227,21.03199629999999943,27.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Tarnogórska, 37',52.27943429999999836,21.07919559999999847,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Walerego Sławka, 3/5',52.19453370000000091,20.89665979999999834,47.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Rynkowa, 8',52.19432210000000083,20.88610999999999862,32.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Suwalska, 6',52.29569939999999662,21.02620569999999844,28.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Robinii, 20',52.18693059999999662,20.88008430000000004,56.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Odnowiciela, 12A',52.20606500000000238,20.86136020000000002,37.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Leszka Białego, 17A',52.20662099999999839,20.86057089999999903,36.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Jerzego i Władysławy Włoczewskich, 3',52.1890862999999996,20.87026630000000082,35.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Drumli, 11',52.11542599999999937,21.01524029999999854,41.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 59G',52.11447580000000101,21.02220180000000127,40.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Baletowa, 20',52.12373840000000058,21.00960480000000175,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Jastrzębia, 23',52.14925399999999911,21.02894480000000144,33.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Elegijna, 27',52.16384080000000267,21.03406740000000142,28.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Głęboka, 51',52.12133990000000238,21.00828380000000095,48.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Meander, 2A',52.13991469999999851,21.05434509999999904,28.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Karczunkowska, 156',52.11138449999999978,20.98971239999999838,44.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 82H/1',52.14374329999999703,20.99844020000000099,48.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Celulozy, 107Z',52.1664241000000004,21.17105139999999964,67.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Celulozy, 109ZF',52.16630930000000176,21.16971360000000147,64.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Lokalna, 65A',52.17013440000000201,21.22328020000000138,58.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Gruszy, 46',52.19806559999999962,21.16833839999999967,44.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 35B',52.19496120000000161,21.12613049999999859,53.0,1,19.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 360H',52.22008459999999986,21.13754180000000104,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Koprowa, 47',52.19051439999999787,21.20947819999999951,59.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Koryncka, 17C',52.21614550000000321,21.14420720000000031,43.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Botaniczna, 70',52.2334069999999997,21.1550590000000014,51.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Pod Brzozami, 76',52.19984240000000141,21.12614070000000054,49.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Strzelińska, 20',52.17976949999999903,21.18582779999999843,49.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Słotna, 21',52.18658580000000313,21.18151669999999954,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 14CB',52.21021530000000154,21.1183164000000012,48.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Legionowa, 4',52.21956380000000308,20.90843890000000016,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kozłowicka, 13',52.25009579999999688,20.87713000000000107,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 33C',52.25848330000000174,20.89705119999999994,34.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Sochaczewska, 25',52.21938800000000213,20.88267259999999937,57.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 37A',52.222018300000002,20.91294810000000126,34.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Telefoniczna, 2A',52.26580129999999969,20.90195990000000137,46.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 15A',52.34508100000000041,20.94307329999999822,51.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Radiowa, 1',52.25278269999999737,20.91060059999999864,28.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Romana Popiołka, 52',52.26349820000000079,20.92304280000000105,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Guńki, 6',52.34368690000000157,20.99752489999999838,37.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Grzymalitów, 12F',52.33685340000000252,20.93903620000000032,49.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 62A',52.22509010000000273,20.9042785000000002,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 108A',52.25612420000000213,20.92008020000000101,27.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Jasiniec, 38',52.31295490000000114,21.07652900000000073,49.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kiersnowskiego, 17',52.34224650000000167,20.97750239999999878,44.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Kroczewska, 53A',52.33927880000000243,21.08136830000000117,60.0,2,36.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 154B',52.32234940000000023,21.05075520000000111,40.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Szczerbca, 11A',52.32698729999999899,20.96569810000000089,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 79',52.33698270000000007,20.96384499999999918,45.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Reniferowa, 40',52.30802419999999842,21.04755970000000075,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 41B',52.31287989999999866,21.04507470000000068,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 49',52.35046299999999775,21.05345159999999894,49.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 61',52.3217618999999985,21.05659770000000108,35.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Zakątna, 2A',52.3108505000000008,20.97848829999999864,35.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wilkowiecka, 44',52.34554109999999839,21.02656879999999973,51.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Maszewska, 22',52.27579140000000279,20.91455930000000051,38.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jana Kochanowskiego, 3',52.26593929999999944,20.95510949999999895,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Księżycowa, 66D',52.27495660000000299,20.9124212000000007,38.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Bernardyńska, 2',52.19397399999999721,21.06828970000000111,40.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Władysława Smoleńskiego, 7/9',52.2806732000000025,20.9649156000000012,27.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Jana Sebastiana Bacha, 10',52.17046770000000321,21.0324850000000012,25.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Podleśna, 39',52.28426319999999806,20.96891019999999984,25.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kalatówki, 18',52.18741610000000008,21.02575119999999841,21.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Rakowiecka, 30A',52.20803839999999952,21.00445279999999926,14.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Czyżewska, 6',52.18910429999999679,21.06428419999999946,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Powsińska, 42',52.18677809999999795,21.06446229999999887,33.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Uniwersytecka, 4',52.21725519999999677,20.98731220000000164,23.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Bukowskiego, 4',52.22992920000000083,21.0934197999999995,34.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Opaczewska, 33',52.21043389999999818,20.96422060000000087,34.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Koszykowa, 79B',52.2226189000000005,21.00154870000000073,17.0,1,7.5);
-INSERT INTO travel_info VALUES('ulica Kwitnącego Sadu, 29',52.20938780000000178,20.95569920000000153,33.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Majdańska, 13',52.24070880000000016,21.08457759999999937,31.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 127B',52.2754710999999972,21.16377359999999897,51.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Okuniewska, 20',52.24014939999999996,21.0972073999999985,35.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Eugeniusza Bocheńskiego „Dubańca”, 1',52.2549633,21.15909470000000069,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Julianowska, 29',52.28430939999999794,21.02805890000000133,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Gliwicka, 16',52.28390660000000167,21.06662839999999904,26.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Konwisarska, 71',52.25823859999999855,21.17879789999999929,37.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Ametystowa, 3',52.28023919999999692,21.07888670000000176,27.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Określona, 21',52.28570239999999814,21.06942259999999934,29.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 34',52.30003760000000312,21.05133419999999945,35.0,0,28.5);
-INSERT INTO travel_info VALUES('ulica Zesłańców Polskich, 100B',52.27168170000000202,21.14677500000000166,55.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 239',52.28567360000000263,21.07361930000000072,23.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kolejarska, 20',52.29037300000000243,21.07517999999999959,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica II Armii Wojska Polskiego, 58',52.18934229999999986,20.87926979999999944,40.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Mrozowska, 32',52.28011879999999679,21.05976479999999996,27.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Łukasiewicza, 17',52.29005570000000346,21.0690798000000008,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Henryka IV Probusa, 10',52.20447750000000297,20.86681460000000144,37.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Gierdziejewskiego, 19',52.20013860000000249,20.87684600000000045,38.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Wolbromska, 49',52.28278410000000064,21.07978689999999843,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Nowotyska, 8',52.19855840000000313,20.89515790000000095,51.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Robinii, 2',52.18740590000000167,20.8857323000000008,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Władysława Jagiełły, 31H',52.19836320000000284,20.87541440000000037,38.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 57E',52.1141087999999968,21.02246660000000134,41.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Henryka Melcera-Szczawińskiego, 3',52.18355569999999944,20.88713189999999998,58.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Arkadowa, 7',52.16880139999999955,21.04466150000000013,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Drzemlika, 1F',52.12128380000000049,21.02165679999999882,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Drzemlika, 1E',52.12135140000000177,21.02166039999999824,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Atłasowa, 3',52.13314940000000063,21.05121409999999927,38.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Jaworowa, 7',52.13251460000000037,21.04735080000000024,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Jana Miklaszewskiego, 11',52.14895620000000064,21.03636170000000049,35.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Kuropatwy, 24L',52.10722289999999646,21.02663869999999947,48.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Małej Łąki, 9',52.13649840000000068,21.05266759999999949,37.0,0,27.0);
-INSERT INTO travel_info VALUES('ulica Ludwinowska, 45',52.13445109999999972,21.00833409999999902,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Migdałowa, 2',52.14794630000000097,21.05994979999999827,35.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Rysy, 55',52.14550289999999678,21.01643590000000116,32.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Tramblanki, 37',52.14208070000000105,20.9987540000000017,47.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Sporna, 11',52.12361340000000353,21.01561530000000033,34.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Darniowa, 11',52.21639139999999913,21.13472240000000113,47.0,2,18.5);
-INSERT INTO travel_info VALUES('ulica Chorzowska, 14',52.2105081999999996,21.15881729999999906,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Perlicza, 9',52.10740289999999675,21.03122910000000089,52.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Chylicka, 6',52.18004619999999961,21.20477659999999887,50.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 50/17',52.19621790000000061,21.13088940000000093,53.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Odrodzenia, 6',52.22166930000000206,21.16648500000000155,46.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 79E',52.19218120000000027,21.16611299999999929,50.0,2,25.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 300E/25',52.21023329999999874,21.13631730000000176,52.0,1,20.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 354L',52.21928090000000111,21.13823250000000086,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Jaskrów, 9',52.2115378000000021,21.17423429999999839,51.0,1,23.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 183A',52.20014050000000338,21.13352229999999921,46.0,1,19.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 399',52.22739169999999831,21.13956479999999871,39.0,1,19.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 225A',52.20485260000000238,21.1332293,48.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kwitnącej Akacji, 31C',52.18612759999999895,21.21848669999999971,55.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Podkowy, 114A',52.16990870000000057,21.24365810000000109,61.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Storczykowa, 50',52.23255950000000069,21.1537052999999986,50.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Rolnicza, 9',52.22947949999999651,21.14955000000000141,46.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Rosiczki, 14G',52.16688820000000248,21.16683510000000012,57.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 18L',52.21112689999999646,21.12036790000000153,48.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Przewodowa, 147/151',52.17117230000000205,21.1994624000000016,44.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Peonii, 20/17',52.18742739999999714,21.13685780000000137,48.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Notecka, 22',52.21188910000000049,20.89645880000000134,47.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 51',52.20982579999999729,20.93194980000000172,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 44',52.26426829999999769,20.91508260000000164,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 15',52.22271119999999911,20.91674370000000139,28.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Dołowa, 7A',52.32726770000000016,20.9640999999999984,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 366',52.33710399999999652,21.0351953000000016,45.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 160F',52.32396109999999823,21.08896580000000042,54.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 19O',52.35570500000000038,20.97620480000000143,35.0,1,37.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 85R',52.33198409999999968,21.04980820000000107,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ketlinga, 8',52.33456910000000306,21.03508109999999932,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Podróżnicza, 28',52.33006540000000228,20.98010030000000014,39.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 21C',52.34485550000000131,21.05587500000000034,60.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Szawelska, 5',52.34980219999999918,20.93839290000000019,52.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Akcent, 26',52.29680270000000064,20.88221599999999967,45.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Żywiczna, 12A',52.32091119999999763,20.98304770000000019,46.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 51G',52.31463490000000149,21.04436109999999971,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Zamożna, 8',52.35995590000000277,21.04554339999999968,51.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Wojdyńska, 43',52.35128989999999761,21.0801084000000003,79.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Wiklinowa, 10A',52.32220480000000151,20.98607949999999889,53.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Heroldów, 5A',52.3043483000000009,20.93257420000000124,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Pabla Nerudy, 10',52.27727229999999992,20.9283374000000002,32.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Zgrupowania AK „Żmija”, 12',52.26974560000000025,20.93645289999999904,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Zofii Roesler, 2',52.30211789999999895,20.93326689999999957,32.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Tułowicka, 1',52.31044550000000015,20.91262190000000132,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Jeziorna, 21B',52.18971899999999665,21.07076860000000095,41.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Artura Grottgera, 16',52.20539050000000003,21.02939070000000043,24.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Cybernetyki, 3B',52.17500640000000089,20.99936539999999851,34.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pogodna, 4',52.2054822999999999,21.02852800000000145,54.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Adama Naruszewicza, 15',52.1910696999999999,21.02029579999999954,18.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Zielona, 11',52.18658690000000177,21.06999539999999982,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Śpiewu Ptaków, 5',52.18360719999999731,21.03824399999999884,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Sobolewska, 7',52.18971810000000033,21.06434240000000102,41.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Sobolewska, 12A',52.1903086000000016,21.06475310000000078,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Sardyńska, 8',52.17896280000000075,21.05279570000000077,32.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Zwierzyniecka, 18',52.21106939999999952,21.04978069999999946,28.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Białowieska, 4B',52.23694629999999962,21.08980869999999897,25.0,0,14.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 162A',52.20791210000000148,20.94373579999999891,34.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Grójecka, 71/73',52.21287780000000111,20.97893840000000054,26.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Nowogrodzka, 59E',52.22535580000000265,20.99797209999999836,19.0,0,7.0);
-INSERT INTO travel_info VALUES('ulica Walentego Skorochód-Majewskiego, 3A',52.207614999999997,20.97559259999999882,36.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Francuska, 9A',52.23243229999999926,21.05496420000000057,20.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Podskarbińska, 54',52.25791900000000111,21.08128070000000064,89.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Saska, 4',52.22675319999999744,21.06765659999999941,27.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Ostrobramska, 67',52.23226950000000101,21.11655569999999927,37.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Stalowa, 37',52.26064949999999954,21.04180949999999939,19.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Kowieńska, 19',52.26353550000000325,21.04122440000000082,18.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Łukowska, 18',52.23752970000000317,21.10335919999999988,32.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Roty, 38',52.26477570000000127,21.15838589999999897,41.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Licealna, 31',52.26846450000000032,21.1670121999999985,44.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Izdebnicka, 11',52.24472089999999725,21.13161679999999976,41.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Namysłowska, 4',52.26262539999999746,21.03533330000000135,23.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Jagiellońska, 67',52.27630959999999761,21.01269590000000064,26.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Gliwicka, 10',52.28277580000000313,21.06701860000000081,27.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Giermków, 17',52.25156960000000339,21.16528569999999831,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Gawędziarzy, 7',52.25799489999999992,21.16105629999999848,26.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 27A',52.1747653999999983,20.93021389999999826,57.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 37',52.20447719999999948,20.90583120000000151,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 3',52.22183600000000325,20.9133685999999983,33.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 4',52.25448509999999658,20.89343360000000161,40.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 16A',52.22670659999999999,20.89763639999999967,33.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Strzelców, 11',52.22101339999999681,20.90943349999999867,41.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Eugeniusza Szwankowskiego, 8',52.23391320000000348,20.89905720000000145,32.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Skłoby, 11',52.25187489999999713,20.87789450000000002,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 21F',52.35613479999999953,20.97580299999999909,35.0,1,37.5);
-INSERT INTO travel_info VALUES('ulica Pitagorasa, 24',52.25809929999999782,20.89098350000000081,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cudne Manowce, 6',52.34440910000000002,21.02549529999999934,54.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Lapońska, 40',52.31015380000000192,21.05456849999999846,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Liczydło, 24A',52.31551230000000174,20.97884309999999886,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 21',52.35652739999999739,20.97768449999999874,33.0,1,37.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 25',52.32771569999999884,21.0598320000000001,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 15R',52.3138892999999996,21.05898300000000134,37.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 113B',52.34270539999999983,21.02723399999999999,45.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 7A',52.30818870000000231,21.04611759999999876,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Światowida, 58',52.33055310000000304,20.94192950000000053,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 150A',52.2864481000000012,20.8856503999999994,39.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Bartycka, 25',52.21147460000000251,21.07094959999999873,36.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 307C',52.29841439999999864,20.88356539999999839,45.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Łomiańska, 14',52.28088280000000054,20.96945729999999841,31.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 9',52.27773410000000353,20.9365275000000004,28.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Pęcicka, 40',52.27931949999999973,20.96724359999999976,26.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Wrzeciono, 57A',52.29310869999999767,20.94502019999999831,27.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Orężna, 21',52.18322299999999814,21.06179799999999958,36.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Puławska, 2A',52.21160340000000132,21.01857359999999986,22.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Piaseczyńska, 36',52.19278719999999794,21.03141610000000127,33.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Oszczepników, 2',52.19668550000000095,20.99669910000000072,25.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Ludwika Narbutta, 41/43',52.20525539999999865,21.01280819999999849,19.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Zielona, 26',52.18616990000000299,21.06883350000000021,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Studencka, 32',52.17464110000000232,21.03052260000000117,23.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 58L',52.20277889999999843,20.95480020000000109,41.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Jesionowa, 5',52.21755009999999686,21.00233910000000037,22.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Sztabowa, 10',52.24232390000000236,21.11869360000000028,38.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Fundamentowa, 43',52.23849859999999979,21.08160020000000045,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Skaryszewska, 8',52.24883249999999891,21.0483879000000016,16.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Poligonowa, 1',52.23209270000000259,21.08241419999999878,28.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Walecznych, 40A',52.23496709999999866,21.0560362000000012,20.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Złoczowska, 20',52.22521340000000122,21.06371589999999827,30.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Buchalteryjna, 27',52.27426750000000055,21.16539159999999953,54.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Liryczna, 18',52.25981240000000127,21.18152990000000102,40.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 74',52.2629142999999985,21.16375160000000121,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kaletnicza, 15',52.26751029999999787,21.15081950000000077,41.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Krobińska, 37N',52.25613930000000095,21.11841450000000008,54.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Gorzykowska, 7',52.26952510000000273,21.05824630000000041,23.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Strażacka, 104',52.25912480000000215,21.15558190000000139,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Rajgrodzka, 20',52.27192600000000055,21.06445610000000101,21.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Klementowicka, 1A',52.26760279999999881,21.07641890000000017,31.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Józefowska, 2A',52.2633652999999967,21.06476380000000149,24.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Lidzka, 5',52.27362140000000323,21.03707610000000016,29.0,1,23.0);
-INSERT INTO travel_info VALUES('Aleja Bzów, 55',52.18984220000000107,20.88529420000000058,38.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Staniewicka, 6',52.27307540000000329,21.03051789999999955,25.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zastępowa, 4',52.29008060000000313,21.0719725000000011,26.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Spójni, 11',52.28235080000000323,21.06417300000000025,25.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Poczty Gdańskiej, 15',52.19837580000000087,20.9003501000000007,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Wojciechowskiego, 37',52.19474679999999723,20.87136629999999826,38.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Kajetańska, 2',52.19032649999999763,20.87542649999999967,41.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Gawota, 29E',52.13698500000000279,21.00709080000000028,50.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 7B',52.11087030000000197,21.03870879999999843,55.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 64',52.13302730000000195,21.01250239999999892,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Indiry Gandhi, 9',52.14859440000000034,21.04419409999999857,27.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Fortepianowa, 53',52.13706799999999931,21.00829039999999993,46.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Małej Łąki, 80',52.13792819999999751,21.05318880000000092,32.0,0,28.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Marii Lanciego, 9C',52.14295570000000168,21.05661620000000056,29.0,0,28.5);
-INSERT INTO travel_info VALUES('ulica Pelikanów, 9',52.12302050000000264,21.02320590000000066,36.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Zdzisława Mączeńskiego, 1',52.15008190000000354,21.01664510000000164,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Puławska, 562',52.10593550000000107,21.01787180000000177,37.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Pawła Edmunda Strzeleckiego, 2',52.15417920000000151,21.0464935000000004,33.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Błękitna, 5A',52.21748939999999806,21.15372590000000131,37.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Napoleona Bonaparte, 31',52.17138880000000256,21.22870359999999935,58.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Liliowa, 31Z/1',52.162460099999997,21.18468280000000092,66.0,1,27.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 177E/3',52.19927739999999972,21.13308930000000175,46.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Gruntowa, 68A',52.16695359999999937,21.21942340000000015,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Jasnoty, 8',52.1741217000000006,21.22733290000000039,61.0,2,30.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 253K',52.21040969999999959,21.13200210000000112,49.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Otwarta, 11',52.23691209999999785,21.14851050000000043,41.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Kożuchowska, 8C',52.20386040000000349,21.17206380000000009,36.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ogórkowa, 12A',52.15560980000000057,21.16686599999999885,59.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Karpacka, 6C',52.2333716999999993,21.14916120000000178,46.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Bronowska, 16',52.20042020000000349,21.12399969999999883,46.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Bluszczowa, 36',52.23986699999999673,21.13982379999999849,39.0,0,19.0);
-INSERT INTO travel_info VALUES('Aleja Dzieci Polskich, 69C',52.21094539999999995,21.2045533000000006,49.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Polany, 58',52.16608420000000023,21.24936429999999988,69.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Podkowy, 122R',52.16997640000000302,21.25155450000000101,71.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 22',52.17373659999999803,20.9306927000000016,56.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Hucisko, 15',52.25119560000000262,20.87750079999999997,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Batalionów Chłopskich, 77B',52.23077320000000156,20.89344210000000147,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 4',52.26152979999999815,20.91611920000000068,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 71',52.26438370000000332,20.91677759999999964,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 18C',52.22263360000000176,20.89525799999999833,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Narwik, 16',52.24207160000000271,20.89634949999999947,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Andrzeja Sołtana, 1A',52.25554809999999862,20.92479960000000005,27.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Andrzeja Sołtana, 6',52.25450370000000077,20.92507930000000015,27.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Sternicza, 64',52.2215843000000035,20.90750459999999933,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 25D',52.22258750000000304,20.89432289999999882,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 160B',52.32487150000000042,21.08858090000000018,53.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Książkowa, 7E',52.33069669999999718,20.93704490000000006,47.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Internetowa, 33',52.32036399999999788,21.07390859999999933,42.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Odkryta, 29F',52.33082269999999881,20.93457850000000064,51.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 79C',52.33697690000000335,20.96415229999999851,45.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 63',52.32130539999999997,21.02329599999999842,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Sarenki, 9',52.34535410000000155,21.01567700000000016,64.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 167B',52.35613930000000237,21.02760340000000027,49.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Poetów, 10F',52.33821890000000109,20.9496891000000005,49.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Złotokwiatu, 1',52.36098890000000238,21.04673030000000011,60.0,1,37.5);
-INSERT INTO travel_info VALUES('ulica Współczesna, 9',52.30923070000000052,21.05369280000000031,34.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 77',52.32301230000000202,21.03851429999999923,48.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Samuela Bogumiła Lindego, 10',52.28937849999999799,20.94801580000000029,30.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Złotych Dębów, 17',52.33079339999999747,21.00800219999999996,61.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Truskawkowa, 8',52.31588789999999989,21.03941109999999882,15.0,1,6.0);
-INSERT INTO travel_info VALUES('ulica Farysa, 46',52.30703739999999869,20.9367775000000016,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Groteski, 5',52.29775109999999927,20.87936429999999888,44.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Grodeckiego, 7',52.28352120000000269,20.94313059999999994,26.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Tczewska, 3',52.28779850000000095,20.9757384999999985,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 297B',52.2969251999999969,20.88671439999999891,49.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Cisowa, 16',52.18690360000000083,21.03140910000000118,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Morszyńska, 27',52.18318790000000007,21.07016390000000072,41.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Etiudy Rewolucyjnej, 18',52.19009340000000207,20.98962829999999969,40.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Dolna, 33',52.19961150000000316,21.02741239999999934,22.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 35',52.17786319999999734,21.02449849999999998,23.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Zawojska, 41',52.18163109999999705,21.05692859999999911,34.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Ateńska, 10',52.22432669999999888,21.06691789999999998,28.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Augustyna Kordeckiego, 8',52.24244670000000212,21.10704450000000065,32.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Raszyńska, 54',52.21762879999999996,20.98850789999999832,21.0,1,10.0);
-INSERT INTO travel_info VALUES('ulica Ateńska, 19',52.22334320000000218,21.06543680000000051,27.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Mariana Langiewicza, 24',52.21839940000000268,21.00078050000000118,19.0,1,8.0);
-INSERT INTO travel_info VALUES('ulica Hetmańska, 19',52.24273310000000236,21.10934430000000006,33.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Marokańska, 21A',52.22303670000000153,21.07198939999999965,26.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Kiprów, 9/11',52.24597669999999994,21.1021718000000007,34.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Grochowska, 60',52.24018130000000326,21.11393199999999836,31.0,1,20.5);
-INSERT INTO travel_info VALUES('Aleja Stanów Zjednoczonych, 59',52.24058500000000293,21.08159399999999906,27.0,1,12.5);
-INSERT INTO travel_info VALUES('Aleja Stanów Zjednoczonych, 69',52.24302670000000148,21.08344920000000044,28.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 219',52.26664099999999991,21.12050410000000156,45.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Obrońców, 9',52.23285369999999972,21.05073690000000041,24.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Rożnowska, 2',52.23996369999999701,21.12533760000000172,40.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Wileńska, 23',52.25736249999999928,21.03810599999999909,18.0,0,15.0);
-INSERT INTO travel_info VALUES('Aleja gen. Antoniego Chruściela „Montera”, 74',52.26206799999999931,21.16633240000000172,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 51A',52.27214490000000068,21.1538934999999988,40.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Mokry Ług, 3',52.2808144999999982,21.16841780000000028,27.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Gawędziarzy, 79',52.26301389999999714,21.16817410000000166,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Gilarska, 34',52.27825169999999844,21.05837340000000068,24.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Księcia Witolda, 50B',52.24769129999999962,21.17250200000000149,50.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 33',52.26132160000000226,21.15831650000000153,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cmentarna, 23',52.2738315,21.03893010000000175,27.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Ilskiego, 45',52.25520099999999957,21.16523970000000076,31.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Szeroka, 67',52.25688319999999721,21.12050019999999861,54.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Świetlicka, 16',52.24932830000000194,21.12865419999999972,47.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Stelmachów, 17E',52.25618800000000163,21.12467709999999955,48.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Rusiecka, 13',52.29211790000000092,21.07833550000000145,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Palestyńska, 3',52.28308690000000069,21.02180969999999859,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Księcia Ziemowita, 18',52.26354299999999853,21.06330579999999841,22.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Obwodowa, 11J',52.2741552000000027,21.04024349999999899,26.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Samarytanka, 21',52.28056229999999971,21.059863,28.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Bodycha, 12',52.18263739999999729,20.89761670000000037,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Siedzibna, 34A',52.28274900000000258,21.02991469999999908,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Orłów Piastowskich, 40A',52.20267690000000015,20.86844689999999857,41.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Królowej Bony, 49D1',52.19822460000000319,20.85795859999999991,50.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Robinii, 18',52.18700270000000074,20.88125670000000156,55.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Kaczorowska, 9',52.19062840000000136,20.87807929999999957,39.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Władysława Jagiełły, 18',52.19762329999999651,20.87936249999999916,35.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Bekasów, 102',52.15009729999999877,21.02445459999999854,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Dzierzby, 22',52.13450550000000305,21.02044649999999847,32.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Ekologiczna, 24',52.12994640000000146,21.05729009999999946,38.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Kądziołeczki, 52P',52.1447603000000015,21.00206680000000148,50.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Baletowa, 158',52.1313906999999972,20.9837491000000007,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Marii Lanciego, 7A',52.1432235999999989,21.05749580000000166,29.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Akwarelowa, 38',52.23136290000000059,21.14961209999999881,50.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Kulczyńskiego, 16',52.14894999999999925,21.05231979999999937,29.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Transportowców, 21A',52.13477910000000292,21.01594790000000045,34.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica ppłk. Zbigniewa Stanisława Kiedacza, 12A',52.1580524999999966,21.05621580000000037,30.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Żołny, 26A',52.13802499999999896,21.02845350000000124,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wyczółki, 13A',52.15508700000000175,21.01269470000000083,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Sarabandy, 92F',52.12021130000000113,21.00865479999999863,52.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Lipkowska, 24',52.19425400000000081,21.18596940000000117,48.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Homera, 35',52.22356119999999891,21.1643940999999991,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Paczkowska, 42',52.21054800000000284,21.15278640000000009,40.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Klimatyczna, 22',52.18826700000000329,21.18036199999999881,42.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Michała Kajki, 106',52.22432680000000004,21.16230859999999936,42.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 31',52.17238009999999804,21.15545330000000135,46.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Pod Brzozami, 23',52.19957809999999654,21.12375790000000108,46.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Skowronkowa, 7',52.21197250000000167,21.18046010000000123,59.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Snopowa, 2',52.21112339999999819,21.14646210000000081,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stradomska, 72',52.22560740000000123,21.1577263000000002,35.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Galaktyki, 15',52.21154250000000018,20.91125960000000105,34.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Jamińska, 14',52.18480399999999975,20.95044659999999937,45.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 21A',52.19871239999999802,20.91871259999999922,41.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 28',52.19700530000000071,20.92309459999999888,38.0,0,18.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 4/6',52.16366719999999902,20.93115029999999877,47.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Józefa Ignacego Kraszewskiego, 54',52.21160830000000174,20.89826629999999952,44.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5BB',52.22689129999999836,20.97522389999999959,19.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Naukowa, 12A',52.20414610000000266,20.93234700000000003,37.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Bolkowska, 1',52.24068659999999654,20.91689799999999977,22.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Józefa Brandta, 2',52.25211780000000061,20.87426639999999978,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 156',52.24199159999999865,20.92054320000000089,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Grotowska, 15',52.26540620000000103,20.89892090000000024,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 117A',52.24617330000000237,20.90863200000000077,27.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 139',52.24641030000000085,20.90484139999999868,32.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Fortuny, 21',52.21644770000000335,20.90562329999999846,37.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 27',52.22815520000000333,20.90931979999999867,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 6',52.24966990000000066,20.8751944000000016,54.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 8E',52.22003990000000328,20.91097140000000109,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 12D',52.23815059999999733,20.89446519999999908,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 119A',52.24609530000000034,20.90855330000000122,27.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 8A',52.23636849999999754,20.89401390000000091,31.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 27',52.22522330000000323,20.90863200000000077,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 18',52.26435889999999774,20.90646609999999939,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Apoloniusza Kędzierskiego, 6',52.25215130000000129,20.91699170000000052,15.0,1,5.5);
-INSERT INTO travel_info VALUES('ulica Kryształowa, 40',52.23232819999999777,20.90854270000000171,32.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Kruszyńska, 22',52.23182769999999664,20.91818800000000067,27.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 83',52.2641455999999991,20.91851979999999855,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Hery, 66',52.2521131999999966,20.91115560000000073,28.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kiermaszowa, 8A',52.23288990000000353,20.91710219999999864,29.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 24',52.26305169999999834,20.9143220999999997,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 15A',52.22132719999999751,20.90992449999999892,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 253D',52.2390400000000028,20.89586299999999852,27.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 69',52.23542549999999807,20.91376629999999893,24.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Tkaczy, 20',52.22189420000000126,20.90776650000000103,36.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Atutowa, 13A',52.31702030000000291,20.95416960000000017,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 23',52.22258519999999749,20.9155957999999984,29.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Legendy, 6C',52.23152000000000327,20.91263839999999874,25.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 52',52.23285599999999818,20.9153039000000014,25.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Karola Miarki, 7A',52.26276990000000211,20.91985040000000141,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Karola Miarki, 7',52.26279739999999663,20.92066110000000023,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Zeusa, 33',52.2485558999999995,20.91009030000000024,26.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Karola Miarki, 5A',52.26263730000000151,20.91970510000000161,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 67',52.32461700000000348,21.07096449999999877,41.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Oświatowa, 13',52.23093000000000074,20.91931340000000005,30.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 25BD',52.22215390000000212,20.89435399999999988,42.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Wyki, 9',52.22950019999999683,20.90336669999999942,33.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Annopol, 6A',52.30444599999999867,21.01971350000000172,33.0,1,28.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 44',52.23790019999999857,20.91918150000000053,23.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Michała Sobczaka, 10',52.26486909999999853,20.90411220000000014,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Michała Sobczaka, 31',52.26249169999999822,20.90092260000000123,35.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica 15 Sierpnia, 25',52.32755310000000292,20.98392750000000006,38.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 33D',52.34852599999999967,20.94123480000000014,48.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 13',52.26221710000000086,20.91507580000000032,38.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dębowa, 14',52.36249149999999731,20.95146180000000057,59.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 34R',52.34208960000000132,20.97941279999999864,45.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 34N',52.34197549999999666,20.9794823000000008,45.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Edmunda Jana Osmańczyka, 16',52.25878910000000132,20.93207489999999993,30.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Guńki, 4',52.34368460000000311,20.99699850000000012,36.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 116A',52.21695660000000316,20.88329410000000052,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Długorzeczna, 14',52.35932700000000039,21.0311667,52.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Siemienowicza, 15A',52.2553818000000021,20.89181440000000122,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32E',52.33263620000000315,20.98958220000000096,32.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32X',52.335681000000001,20.99365930000000091,35.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Grzymalitów, 14D',52.33709129999999732,20.93977720000000176,48.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 17A',52.22112229999999756,20.92172409999999871,25.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Obrońców Tobruku, 32',52.2589133999999973,20.93356759999999995,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Obrońców Tobruku, 7G',52.26070860000000095,20.94343819999999923,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 23C',52.35679869999999881,20.97748430000000041,33.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Gryfitów, 48',52.30500059999999963,21.03885040000000117,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Gryfitów, 50',52.30504880000000156,21.03907159999999977,40.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 7F',52.33115360000000038,21.03612070000000145,50.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 73C',52.31723850000000197,21.03629649999999885,36.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Danusi, 2J',52.31463360000000051,21.02699720000000027,37.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 47',52.34474459999999852,20.97658900000000059,46.0,2,31.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 145',52.23456050000000061,20.91550810000000026,26.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Dębowa, 14A',52.36239379999999955,20.95086299999999823,58.0,2,34.5);
-INSERT INTO travel_info VALUES('ulica Danusi, 33A',52.31513060000000336,21.03079299999999919,36.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 28A',52.22969230000000351,20.91585249999999974,25.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 164B',52.30661589999999706,21.03083720000000056,32.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 15N',52.35478820000000155,20.97603720000000038,37.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Gladioli, 23B',52.3487353000000013,20.93184630000000012,59.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 28',52.33075259999999674,21.04373190000000093,44.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Bohaterów, 19A',52.33673339999999997,20.98902149999999978,33.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 68A',52.33750369999999919,21.06834930000000127,57.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 23W',52.35657539999999699,20.97558439999999891,34.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Boczańska, 8B',52.34476049999999959,20.97216380000000057,57.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Lapońska, 7',52.31037599999999799,21.05301419999999979,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Internetowa, 43B',52.31856009999999913,21.07428170000000022,48.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Maćka z Bogdańca, 6',52.30763290000000154,21.04731840000000176,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Mazurska, 5',52.3400340999999969,20.99938919999999954,38.0,2,33.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Kamińskiego, 22',52.32257959999999742,20.95524699999999996,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Majolikowa, 25',52.32817039999999765,20.95592179999999871,50.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Maćka z Bogdańca, 14A',52.3075156000000021,21.04871269999999939,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Maćka z Bogdańca, 14',52.30771589999999805,21.04846750000000099,38.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 12G',52.34842040000000196,20.92871669999999896,59.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Marcina z Wrocimowic, 3M',52.34186950000000138,20.93800930000000093,50.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 297A',52.31916489999999698,21.03182380000000152,38.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Chlubna, 9C',52.35878670000000312,20.95196770000000086,62.0,2,35.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 18',52.35855670000000117,20.97689039999999849,31.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Klinkierowa, 1',52.19842080000000095,20.95182439999999958,44.0,1,20.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 173',52.18378030000000222,20.95144910000000138,43.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Józefa Ignacego Kraszewskiego, 19',52.20799840000000102,20.89631029999999968,41.0,1,22.0);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 184',52.20061069999999859,20.93263560000000111,27.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Nike, 11',52.21101620000000309,20.91464369999999918,34.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Nike, 16',52.21102379999999954,20.91580640000000101,35.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Płomyka, 32',52.20081520000000097,20.92016840000000145,44.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 49',52.20364610000000027,20.92629850000000147,31.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Płomyka, 9',52.19969300000000345,20.91925760000000168,42.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 62',52.20281829999999701,20.92860419999999877,33.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Józefa Brandta, 13',52.25189180000000277,20.87433220000000134,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 35',52.22496120000000274,20.90659420000000068,35.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Borzęcińska, 13',52.24873529999999989,20.87892989999999927,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Elektry, 13',52.2501523999999975,20.90899089999999916,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 171D',52.24637450000000171,20.90040700000000129,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 165C',52.24625759999999986,20.90119130000000069,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 8',52.24905509999999965,20.87483810000000162,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Iskry, 36',52.25082450000000022,20.87027769999999905,39.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Dębicka, 22',52.24385939999999807,20.91879730000000138,28.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 23',52.2220979000000014,20.910666599999999,15.0,1,5.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 83A',52.22571049999999815,20.90580830000000034,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 2',52.26613929999999897,20.90100980000000063,46.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 7T',52.23883980000000093,20.89300529999999866,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Witolda Doroszewskiego, 9',52.23735700000000292,20.89961020000000147,27.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Laserowa, 1',52.25968240000000264,20.90105970000000112,31.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Kryształowa, 29',52.23094300000000345,20.90831409999999834,30.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Miejska, 25A',52.22451019999999744,20.90746259999999879,35.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Miejska, 28',52.224881400000001,20.90771200000000007,36.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Jamesa Joyce''a, 12',52.23039750000000225,20.92031139999999923,30.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Kocjana, 11',52.25174109999999673,20.88064260000000161,36.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Kocjana, 39',52.25247579999999914,20.87542690000000078,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 2A',52.25209759999999904,20.89854319999999888,33.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 255C',52.23880700000000132,20.89538070000000047,27.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Gimnazjalna, 6',52.22994140000000129,20.91691660000000041,27.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 6',52.21840209999999872,20.89953729999999865,40.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Oławska, 1A',52.26019339999999858,20.92628230000000044,35.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 17F',52.32457430000000186,21.05754340000000013,41.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Strzelców, 2C',52.22102199999999784,20.91266919999999985,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 25',52.25744660000000152,20.91862509999999987,28.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Tkaczy, 23A',52.22200459999999823,20.90673040000000071,36.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Tkaczy, 36',52.22346759999999933,20.90690340000000091,37.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 19',52.22253270000000213,20.91618539999999982,29.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Pawła Stellera, 4',52.26459359999999777,20.91328950000000119,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Pawła Stellera, 9',52.26503720000000186,20.91360639999999905,41.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 75M',52.32646859999999834,21.07170269999999946,43.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Marynin, 45',52.24667219999999901,20.9203702999999983,27.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Spychowska, 2B',52.25086830000000048,20.87578690000000137,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Tkaczy, 11A',52.22058419999999757,20.90813670000000001,40.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Dymitra Mendelejewa, 14',52.2573968000000022,20.8920931000000003,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Zeusa, 5',52.24717400000000111,20.91038319999999828,25.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Narwik, 22D',52.24238509999999991,20.89498800000000145,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Wielbarska, 7',52.25151470000000131,20.87399800000000027,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fleminga, 47B',52.32059370000000342,20.97671400000000119,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Dzikiej Kaczki, 18',52.34437009999999902,20.94523990000000068,53.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Uniejowska, 2',52.2486670999999987,20.91467880000000079,28.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Waldorffa, 33',52.2569913000000028,20.94412639999999825,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 34B',52.34809510000000187,20.94440619999999953,47.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Annopol, 10',52.30863920000000177,21.01618649999999989,33.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Sternicza, 105',52.22120309999999677,20.90741680000000002,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 2',52.26203780000000165,20.91592070000000092,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Anecińska, 1A',52.32785429999999849,20.9617709000000012,43.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Anilinowa, 1A',52.34788120000000333,20.94581039999999917,49.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Strąkowa, 43A',52.23190240000000272,20.91676199999999852,26.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 12A',52.21945809999999711,20.90153400000000162,41.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Otrębuska, 21',52.24922939999999727,20.87675679999999901,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Osowiecka, 3',52.24889619999999724,20.87672879999999864,37.0,1,25.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 173',52.23569330000000121,20.91825860000000148,27.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Posejdona, 7',52.2491909000000021,20.90955419999999876,27.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32F',52.33270370000000326,20.98973279999999875,32.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 11',52.21920300000000025,20.90181889999999853,41.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Podmiejska, 2',52.26385230000000348,20.91290160000000143,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32T',52.33524419999999822,20.99336999999999876,35.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Flisaków, 3',52.36141369999999995,21.04017680000000112,52.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 34L',52.33358770000000248,20.99066459999999879,30.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Dionizosa, 7',52.33835359999999782,20.95145949999999857,51.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 50',52.22393399999999986,20.90368870000000001,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 58',52.22481750000000033,20.90415640000000153,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Christa Botewa, 4F',52.31852690000000194,20.95637139999999831,41.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 102A',52.33405760000000128,21.05493410000000054,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 109',52.32435830000000009,21.07724139999999835,50.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Czeremchowa, 24',52.34212440000000299,20.96085000000000064,52.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Czeremchowa, 15',52.3417703000000003,20.96094090000000065,53.0,1,31.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 116',52.2357648999999995,20.9162037000000005,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fleminga, 21',52.31849090000000046,20.97880620000000106,42.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 17E',52.35583830000000205,20.97795380000000165,36.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 361',52.32481279999999658,21.03149230000000002,42.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 41A',52.33131840000000067,21.04524260000000169,42.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 29E',52.35707599999999929,20.97616139999999874,35.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 36',52.33213570000000203,20.98795829999999896,30.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Dynamiczna, 10',52.33941719999999976,20.9975828,40.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Dynamiczna, 3',52.33987400000000178,20.99640829999999881,38.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Bohaterów, 17A',52.33655089999999888,20.98922269999999913,34.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 12B',52.35733909999999725,20.97790609999999844,32.0,1,37.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 8',52.35661840000000211,20.97899699999999968,33.0,1,37.0);
-INSERT INTO travel_info VALUES('ulica Chęcińska, 6B',52.33332769999999812,20.95785280000000129,45.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 19C',52.32515769999999833,21.05822810000000089,40.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Erazma z Zakroczymia, 9',52.32072970000000111,20.95052210000000059,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 55F',52.36249930000000318,21.04816759999999932,52.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 6U/1',52.34561190000000152,20.93046710000000133,64.0,2,37.0);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kolumba, 57',52.17779440000000334,20.93075629999999876,59.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Płomyka, 46',52.20154000000000138,20.92053980000000024,37.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Notecka, 17',52.2118358000000029,20.90269100000000079,52.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 11',52.20576489999999837,20.91012350000000097,32.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 7',52.22252699999999948,20.91289039999999843,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 5',52.22199080000000037,20.91321010000000057,34.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Rosy Bailly, 36',52.24844709999999993,20.92554850000000144,28.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 13',52.2638060999999965,20.90770519999999877,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 21A',52.25392269999999684,20.89118510000000129,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Iskry, 34',52.25082369999999799,20.87036919999999896,39.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 51',52.26015040000000055,20.90227970000000112,32.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 21',52.22183449999999994,20.91057410000000161,15.0,1,5.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 11',52.26457260000000104,20.90724120000000142,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 3F',52.23688880000000267,20.91098450000000142,24.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 173A',52.2461855999999969,20.90014160000000132,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 12B',52.23546050000000207,20.90908749999999827,27.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Artemidy, 9',52.24830260000000237,20.90906640000000038,27.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Afrodyty, 7',52.24913430000000147,20.90780039999999929,28.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Akantu, 42',52.261651999999998,20.90244369999999919,35.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Anieli Krzywoń, 6',52.22787689999999828,20.91680350000000032,28.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Lencewicza, 2A',52.25302260000000131,20.91619689999999921,29.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Isaaca Newtona, 16',52.25684989999999886,20.89131869999999936,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 5',52.26127019999999846,20.91607580000000155,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kruszyńska, 6',52.23014049999999742,20.91829269999999851,29.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Kawy, 10',52.26122509999999722,20.91959930000000157,34.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Kawy, 7',52.26181580000000082,20.92269519999999972,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Kocjana, 70',52.25394649999999786,20.87317399999999879,44.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Księżycowa, 5',52.27277529999999928,20.91027950000000147,37.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 14A',52.22101239999999934,20.88921549999999883,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jana Olbrachta, 118A',52.23453440000000114,20.92024370000000033,29.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 16E',52.21873449999999651,20.89052530000000018,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 35',52.25905829999999952,20.89716710000000077,30.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 21',52.25399850000000157,20.89724950000000092,36.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 27A',52.22283230000000031,20.89330449999999928,39.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 30B',52.22827449999999772,20.88920129999999987,40.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 24A',52.22896730000000076,20.91584890000000029,25.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 17',52.26248950000000093,20.91503519999999838,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 121C',52.32469340000000102,21.07937139999999943,44.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 38',52.25693909999999676,20.92107370000000088,26.0,1,24.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 5',52.23732439999999855,20.91676289999999838,22.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Lustrzana, 14',52.21941679999999764,20.90391380000000155,42.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Zeusa, 73',52.25129539999999651,20.91099960000000024,28.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Narwik, 7',52.2417535000000015,20.89791719999999841,30.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Ambaras, 40A',52.34313399999999917,20.99748419999999883,41.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 16C',52.22683490000000006,20.89764600000000173,33.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 22A',52.24251139999999794,20.90616770000000101,31.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 54A',52.2222301999999985,20.9095240000000011,34.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 28',52.22651199999999961,20.89066640000000063,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Szobera, 3B',52.23613480000000208,20.8993347000000007,29.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 27A',52.32534460000000109,21.06235570000000123,36.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Waldorffa, 31A',52.25790620000000075,20.94589720000000099,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Strąkowa, 25',52.23190879999999936,20.92173130000000114,24.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Otrębuska, 11',52.24912189999999868,20.87931250000000105,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 49',52.34532459999999788,20.97623640000000122,45.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Długi Kąt, 9',52.35984450000000123,21.06550749999999895,58.0,1,39.0);
-INSERT INTO travel_info VALUES('ulica Grzymalitów, 9D',52.33703469999999669,20.93624499999999955,51.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Flisaków, 16',52.36209620000000342,21.04221899999999935,55.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Pirenejska, 1',52.25452460000000343,20.91399850000000172,30.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 44',52.21872909999999735,20.90927059999999927,29.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Geodezyjna, 73',52.31090040000000129,21.07824090000000083,47.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Geodezyjna, 84D',52.30964060000000159,21.08236919999999869,43.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 5',52.35338000000000135,20.98053949999999901,38.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Danusi, 2H',52.31459749999999787,21.02634450000000043,38.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 150A',52.3050555000000017,21.03068469999999834,34.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Dębowa, 9',52.36321829999999978,20.951459100000001,59.0,2,35.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 14',52.30825049999999977,21.04085489999999937,38.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fleminga, 55',52.32195420000000041,20.97624709999999836,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 20C',52.30919659999999994,21.04122549999999948,37.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 15',52.21953789999999885,20.90202310000000096,41.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Fajna, 17',52.34726630000000113,21.04826329999999856,53.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 25K',52.35621220000000164,20.97487819999999914,35.0,1,38.0);
-INSERT INTO travel_info VALUES('ulica Fajna, 11',52.34729289999999935,21.04637010000000074,55.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Bohaterów, 66',52.34342730000000187,20.99474250000000097,36.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 82G',52.33949179999999757,21.06960570000000032,58.0,2,36.5);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 27',52.33041519999999736,21.02631729999999877,46.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Czarnocińska, 10C',52.32691820000000149,20.97078240000000093,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 19D',52.32511840000000091,21.05761959999999889,40.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 19K',52.32534230000000263,21.05735440000000124,41.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 18B',52.33187130000000308,20.97408940000000043,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 174',52.30880489999999839,21.03045350000000013,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 166C',52.30676389999999998,21.03031629999999908,33.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Calineczki, 23',52.353194000000002,21.0594569000000007,64.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 269L',52.31542189999999693,21.02744179999999829,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Dynamiczna, 14',52.33914149999999666,20.99893580000000171,40.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Bogoriów, 11',52.3031105000000025,21.04332399999999836,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Celtów, 4A',52.32920440000000183,20.99222130000000063,36.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 67E',52.33780980000000226,21.06498069999999956,59.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 164C',52.30652700000000265,21.03167489999999873,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Bohaterów, 19E',52.33680059999999657,20.98856899999999825,33.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 82P',52.33965369999999951,21.07171329999999899,60.0,2,34.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 82C',52.33938109999999711,21.06841049999999882,57.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 10F',52.32419949999999887,21.0518755000000013,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 101BG',52.33290499999999668,21.0496383999999992,48.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 103J',52.3336471000000003,21.05028190000000166,56.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Księcia Jaremy, 14',52.30965960000000336,21.03309360000000083,39.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Borecka, 23',52.32858939999999848,21.00806310000000109,58.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Chlubna, 56',52.35858000000000345,20.96623599999999854,32.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 23C',52.35353479999999849,20.92382429999999971,59.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 5',52.34643690000000049,20.92611600000000038,59.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Fraszki, 14',52.20536129999999986,20.90041829999999833,41.0,0,22.0);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 198N',52.19851179999999858,20.92788110000000045,41.0,0,19.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 236',52.18853260000000204,20.95709540000000004,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Jamińska, 12',52.18461539999999844,20.95070959999999972,45.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Jamińska, 6A',52.18440809999999886,20.9514282999999999,44.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 29A',52.18095670000000296,20.94139180000000167,50.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 41B',52.19782380000000188,20.9235559000000002,38.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Geologiczna, 10',52.18996599999999831,20.95559970000000049,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 8',52.18053559999999891,20.94601390000000051,45.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 30',52.1817502000000033,20.94091729999999885,51.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 24',52.19824739999999963,20.91922509999999846,40.0,1,18.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 2A',52.16325609999999813,20.93121939999999981,47.0,2,21.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 75',52.17221080000000199,20.93874810000000153,53.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Janka Muzykanta, 1B',52.16242720000000332,20.93265729999999892,49.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Jantar, 17',52.19661010000000089,20.93506160000000093,41.0,0,17.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 208',52.18489470000000096,20.95424219999999949,43.0,1,21.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 17',52.16542749999999984,20.93186479999999961,48.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 9',52.17233629999999778,20.92956380000000038,55.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Kolneńska, 6B',52.1917174000000017,20.94494219999999985,41.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 24',52.20618739999999747,20.92925209999999936,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Nike, 35',52.21132759999999707,20.91804989999999976,15.0,1,5.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 58',52.20301649999999683,20.92778029999999844,32.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 46',52.20335029999999677,20.92505639999999901,31.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Milanowska, 7',52.20439360000000306,20.91727129999999946,36.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Notecka, 14A',52.2122567999999987,20.89995890000000145,46.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Wolska, 68/72',52.23315250000000276,20.96247620000000111,14.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Wolska, 44',52.23451839999999891,20.96950340000000068,14.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5BN',52.22683959999999815,20.97532029999999992,19.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5BD',52.22689600000000353,20.97531130000000133,19.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Wolska, 89',52.23204290000000327,20.96013629999999849,15.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 39',52.23940019999999862,20.95906709999999861,15.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 5E',52.2341941000000034,20.95932679999999948,18.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 10A',52.20447879999999686,20.92828940000000059,34.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 10',52.20439189999999741,20.92825309999999917,34.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Pograniczna, 2/4',52.16852519999999772,20.93407789999999835,48.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 20',52.20590140000000189,20.92909679999999995,36.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Nieduża, 10',52.17703730000000206,20.93532580000000109,55.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 23',52.22401529999999781,20.91189040000000076,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 32',52.2046992000000003,20.90553909999999859,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 4',52.20611339999999956,20.91040920000000014,32.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 18',52.20528319999999667,20.90779279999999929,35.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jana Bułhaka, 23',52.25273990000000168,20.87359939999999981,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Arki Bożka, 1',52.24319260000000042,20.91730079999999959,26.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 253',52.23934080000000079,20.89588660000000075,25.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 29',52.22518800000000283,20.90832019999999857,35.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 15',52.23757489999999848,20.90599729999999923,28.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 171A',52.24587079999999873,20.90028470000000027,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Elektry, 15',52.25019149999999968,20.90891089999999863,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Elektry, 9',52.25004729999999853,20.90923490000000129,29.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Fortuny, 16',52.21670879999999926,20.90570960000000156,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 115A',52.24615279999999729,20.90899560000000079,27.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 141A',52.24644159999999716,20.90400860000000093,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 39A',52.2611731000000006,20.90380210000000005,34.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Hucisko, 11',52.25111859999999809,20.87802530000000089,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 34',52.26212269999999905,20.90469720000000108,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 36',52.24961710000000181,20.86884080000000096,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Fortuny, 13',52.21663699999999864,20.90681449999999942,41.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Fortuny, 9',52.21654490000000237,20.90736349999999888,41.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 9',52.25416539999999799,20.8926620000000014,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 4',52.24958370000000229,20.87568410000000085,54.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 98',52.22841230000000223,20.89899169999999984,33.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 246A',52.24034220000000061,20.89398579999999939,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wacława Gąsiorowskiego, 26',52.25819829999999656,20.8957872999999985,32.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Gabriela, 2',52.21922179999999969,20.91052739999999944,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Witolda Doroszewskiego, 3',52.23744889999999686,20.90245260000000016,26.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 12',52.25510359999999821,20.89242429999999828,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 16',52.25500629999999803,20.89196520000000135,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 154A',52.24201829999999803,20.9208336000000017,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Dostępna, 54',52.25929179999999974,20.90202130000000124,30.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 41',52.2252447999999987,20.90533020000000164,35.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 101',52.22749389999999892,20.90627290000000115,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 9',52.26463139999999897,20.90733260000000015,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 43',52.22196399999999983,20.90411269999999889,39.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 2',52.2651773999999989,20.90771739999999924,42.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Akantu, 17A',52.2636546000000024,20.90587830000000124,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 71',52.22457479999999919,20.90535510000000131,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 129B',52.24574950000000228,20.90600530000000034,30.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 14',52.26527449999999675,20.89971800000000001,45.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 157A',52.24573540000000093,20.90164550000000076,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 125',52.24635099999999711,20.90743750000000034,28.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Andyjska, 20',52.25540519999999845,20.9116073,33.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 157',52.24632119999999703,20.9018417999999997,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Artemidy, 6A',52.24843429999999956,20.90951319999999925,28.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 57',52.22325289999999854,20.90469789999999861,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 25',52.22028629999999794,20.90325209999999956,40.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 40',52.25020560000000102,20.869765000000001,56.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 7N',52.23744419999999878,20.89243039999999851,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 4',52.23641520000000326,20.9123121999999988,23.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 82',52.22905169999999942,20.90923090000000073,33.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jamińska, 2A',52.18422979999999712,20.95168430000000014,44.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 13',52.18056920000000076,20.94462139999999906,47.0,1,21.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 149',52.18102710000000143,20.94790820000000053,48.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 17',52.18071820000000116,20.94391200000000097,48.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Jantar, 13',52.19655600000000106,20.93539159999999911,41.0,0,17.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 123',52.17805270000000206,20.94533360000000144,45.0,1,22.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 131',52.17907559999999734,20.94636249999999933,43.0,1,22.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 215',52.1880656000000016,20.95589490000000054,39.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 20',52.1736112000000034,20.93076830000000043,56.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Janka Muzykanta, 19',52.16408030000000195,20.93490029999999891,50.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Janka Muzykanta, 60',52.17570309999999978,20.94534510000000082,50.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Kolneńska, 6C',52.19142240000000043,20.944760500000001,44.0,1,22.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 121',52.17800979999999811,20.94518139999999918,45.0,1,22.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 110/114',52.17778080000000073,20.94618090000000166,42.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 28',52.17462330000000036,20.93108840000000014,57.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Jantar, 22',52.19676539999999676,20.93509069999999995,41.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kolumba, 17',52.17269519999999972,20.92810800000000171,56.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Józefa Ignacego Kraszewskiego, 31',52.20976650000000063,20.89698110000000142,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 11A',52.20518169999999714,20.92832489999999979,35.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 22',52.20609350000000148,20.92919859999999944,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Płomyka, 33',52.20168790000000313,20.92012360000000015,37.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Płomyka, 35',52.20199819999999847,20.92029989999999984,36.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Notecka, 11',52.21195699999999818,20.90380520000000075,52.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Notecka, 31A',52.21176539999999733,20.90039219999999887,47.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Wolska, 46/48',52.23442779999999886,20.96851129999999941,13.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 57',52.20315620000000222,20.92878029999999968,33.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 36',52.20387519999999882,20.92326309999999979,34.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 82',52.19998830000000111,20.9409458000000015,34.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 14',52.23658340000000066,20.95978089999999838,14.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5AT',52.22705909999999819,20.97511400000000137,19.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5AG',52.22713190000000338,20.97543549999999968,19.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5AE',52.22712669999999946,20.97532800000000108,19.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Władysława Przanowskiego, 47',52.23829109999999787,20.93334679999999893,21.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 7B',52.23444680000000062,20.95997600000000105,17.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 24/26',52.23882480000000327,20.95944749999999957,14.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 47A',52.20446650000000232,20.904468099999999,38.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 70',52.20162210000000158,20.93050290000000046,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 53',52.2098901999999967,20.9322809999999997,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Nieduża, 11',52.17695559999999944,20.9343855000000012,55.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 29A',52.22474290000000252,20.91139679999999856,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 13',52.20549019999999985,20.90996260000000006,33.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 41',52.20424090000000205,20.90542749999999827,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Rosy Bailly, 42',52.2485332999999983,20.92611360000000075,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Bolimowska, 1A',52.24868800000000135,20.87963219999999965,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Bolimowska, 1C',52.2487144999999984,20.87944099999999992,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Bolkowska, 2D',52.24046969999999846,20.91424400000000005,22.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 31',52.24991610000000008,20.87107789999999952,55.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Józefa Brandta, 11',52.25187830000000133,20.87441829999999853,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wacława Borowego, 6',52.2305283999999972,20.9120436000000005,27.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica gen. Mikołaja Bołtucia, 8',52.25154409999999672,20.92284910000000053,32.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 162',52.24192200000000241,20.91967269999999957,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 160',52.24193650000000133,20.91983919999999841,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 154',52.24202879999999994,20.92094150000000142,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Dostępna, 30',52.26207980000000219,20.90618489999999952,36.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Dostępna, 62B',52.25851699999999767,20.90090760000000003,28.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 25A',52.22519189999999867,20.90886589999999856,34.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 1F',52.23679270000000229,20.91262280000000117,23.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Grotowska, 13',52.26570989999999739,20.89937099999999858,46.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 155',52.24636089999999911,20.90214800000000039,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 9B',52.22953400000000101,20.92010319999999979,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 42A',52.22945709999999764,20.91704049999999882,26.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 78',52.22900450000000205,20.90979959999999949,33.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 171E',52.24615000000000009,20.9003735000000006,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Fortuny, 1A',52.21688079999999844,20.91014649999999975,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 169A',52.2455803000000003,20.90067720000000051,32.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Ebro, 6',52.2642515000000003,20.90765820000000019,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Iskry, 25',52.2503967999999972,20.87278399999999934,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 24A',52.25415790000000271,20.89083919999999849,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Dźwigowa, 61',52.21782220000000052,20.91498299999999944,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Dźwigowa, 55',52.21817999999999671,20.91507899999999864,29.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 12',52.24915510000000296,20.87425879999999979,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Iskry, 32',52.25082199999999944,20.87070479999999861,38.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 20A',52.26330349999999925,20.90644530000000146,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ebro, 57',52.2592655999999991,20.90096760000000132,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Fabiańska, 14',52.25213540000000023,20.87529590000000112,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Bolesława Dobrowolskiego, 19',52.25848950000000314,20.89130460000000156,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Fabiańska, 2',52.25116119999999854,20.87497189999999847,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 4',52.21941240000000306,20.91033709999999957,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Hery, 18',52.24990669999999682,20.90829090000000078,31.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 20A',52.25003850000000227,20.87281030000000114,57.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 45',52.25001439999999775,20.86913970000000163,57.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 13A',52.22108450000000345,20.91026709999999866,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 14',52.25499870000000157,20.89211380000000062,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wacława Gąsiorowskiego, 14',52.25854890000000096,20.89396289999999822,34.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 259',52.23959030000000325,20.89387969999999939,27.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Witolda Doroszewskiego, 5',52.23771899999999846,20.90217330000000117,26.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Witolda Doroszewskiego, 1',52.23771909999999963,20.90322169999999958,25.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 8',52.2551318000000009,20.89288249999999892,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 29',52.26264040000000221,20.90440500000000056,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 83',52.22565639999999832,20.90578430000000054,34.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Akantu, 5',52.26482969999999995,20.90762600000000048,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 5',52.26584239999999682,20.9010227999999998,46.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 9G',52.23836560000000162,20.8940355999999987,28.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 165M',52.24555560000000298,20.90111669999999933,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 165D',52.24618009999999658,20.90117910000000023,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 21',52.26417789999999997,20.89854880000000036,45.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 3',52.2368208999999979,20.91196139999999915,22.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Apollina, 10',52.25229660000000109,20.91205820000000059,28.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 46',52.23423910000000347,20.92146160000000065,29.0,0,22.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 198P',52.19877809999999841,20.92803200000000175,41.0,0,19.0);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 198M',52.19824249999999922,20.92772480000000001,40.0,0,19.0);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 198K',52.19770520000000146,20.92741709999999956,40.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 9',52.18037890000000089,20.94542609999999883,46.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Globusowa, 17',52.20833789999999653,20.91409600000000068,32.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Fraszki, 16',52.20536870000000106,20.9000723000000015,41.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Fraszki, 21',52.20483080000000342,20.90075810000000089,42.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Fraszki, 20',52.20561759999999652,20.89881970000000066,41.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Globusowa, 19',52.20851629999999944,20.91389579999999882,32.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Globusowa, 40',52.21039129999999773,20.91259519999999838,34.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Globusowa, 27',52.20963220000000148,20.91270989999999941,33.0,0,20.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 129',52.17878460000000018,20.94599499999999992,44.0,1,22.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 127',52.17862029999999863,20.94586879999999951,44.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 11',52.1804969000000014,20.94495110000000082,46.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 19A',52.18082179999999682,20.94343059999999924,49.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 29',52.18121080000000233,20.94163430000000047,50.0,1,20.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 187',52.18532309999999797,20.95311470000000042,42.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 1A',52.19980910000000307,20.91478839999999906,35.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Galaktyki, 7',52.21124360000000308,20.91170860000000075,34.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Galaktyki, 25',52.21178239999999704,20.91082349999999935,34.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 31',52.18129540000000332,20.94123919999999827,51.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 33',52.18136770000000268,20.9409004000000003,51.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 26',52.19816000000000144,20.91947749999999929,39.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 3A',52.19969249999999761,20.91518280000000018,35.0,0,18.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 14',52.16490490000000335,20.93261060000000028,48.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Janka Muzykanta, 5',52.16276630000000125,20.93336040000000154,50.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Jantar, 19',52.19673470000000037,20.93437780000000003,40.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 40A',52.1758006000000023,20.93160049999999827,57.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Klinowa, 3',52.16800109999999791,20.93290229999999851,49.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Kolneńska, 21',52.18935669999999761,20.94273779999999974,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 38',52.17551389999999856,20.93145260000000007,59.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Jantar, 2',52.19637629999999718,20.93753440000000054,37.0,0,17.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 172',52.20385350000000101,20.9386839000000009,34.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Kolneńska, 14',52.19061239999999913,20.9437767000000008,45.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kolneńska, 18',52.18969479999999806,20.94280279999999906,47.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 8',52.20415349999999677,20.9281417999999988,33.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 41',52.20405920000000321,20.9243048000000016,32.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 64',52.20268889999999829,20.92901669999999825,34.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 29',52.20461110000000104,20.9217613,32.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Notecka, 12',52.21199560000000161,20.90072680000000104,47.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Notecka, 5',52.21197039999999845,20.90512460000000061,42.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Milanowska, 13',52.20377380000000044,20.917466000000001,37.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Nike, 27A',52.2115052999999989,20.91694880000000011,36.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Notecka, 31',52.21176189999999906,20.90030000000000144,46.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 34',52.20396680000000344,20.92284409999999895,33.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Władysława Przanowskiego, 37',52.23801199999999767,20.9334479999999985,21.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Smocza, 26',52.24877850000000023,20.9835718,23.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Wolska, 50',52.2343461999999974,20.96771550000000061,12.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Wolska, 115A',52.22905759999999731,20.95265029999999839,19.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 25C',52.23811179999999866,20.95897580000000104,13.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 45',52.20932299999999771,20.93115829999999989,44.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5AC',52.22712119999999914,20.97523759999999982,19.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Nike, 23',52.21131150000000076,20.91623909999999852,35.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 35',52.20447159999999798,20.92315980000000052,34.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 19',52.22363320000000186,20.91215220000000131,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 19',52.22536900000000059,20.9098177000000014,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Arki Bożka, 4',52.24333560000000176,20.91631479999999854,27.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Jana Bułhaka, 5A',52.25195649999999859,20.87329799999999835,42.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jana Bułhaka, 7',52.25212359999999734,20.8733475999999989,42.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Dostępna, 26',52.26245060000000108,20.90674089999999908,36.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Cokołowa, 43',52.22525610000000284,20.90495320000000135,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 33',52.22788649999999678,20.90467010000000058,33.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Grotowska, 17',52.26487269999999797,20.8981268,45.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 149C',52.24578079999999858,20.90212100000000106,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Fortuny, 33',52.21612180000000336,20.90355650000000053,40.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Fortuny, 31A',52.21613609999999995,20.90405489999999844,41.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 90',52.24170430000000209,20.90036369999999977,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Hucisko, 9',52.25108800000000286,20.87822110000000108,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 20',52.26344629999999825,20.90666249999999949,38.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Iskry, 15',52.25013220000000302,20.87457080000000075,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 23',52.2539225000000016,20.89097399999999994,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Fabiańska, 12',52.25202759999999814,20.87525820000000109,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Bolesława Dobrowolskiego, 27',52.2584567999999976,20.89057070000000139,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Fortuny, 3A',52.21691090000000201,20.90903409999999952,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Bolesława Dobrowolskiego, 9',52.25826930000000203,20.89240530000000006,35.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 60',52.22908670000000341,20.91323369999999926,27.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 13',52.25408310000000255,20.89222090000000165,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 45',52.26065779999999706,20.90303090000000096,33.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 41',52.26100509999999844,20.90354470000000119,33.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Himalajska, 14',52.25795579999999774,20.91386220000000051,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 22',52.25481359999999854,20.89097860000000039,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 7',52.25486970000000042,20.89291300000000006,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 10',52.2647781000000009,20.90709190000000106,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Jana Blatona, 2',52.25716709999999666,20.92266980000000132,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Andyjska, 22',52.2554548999999966,20.91167139999999947,33.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 2',52.23647540000000333,20.91295279999999935,23.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Artemidy, 18',52.24970150000000046,20.90933730000000068,29.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Artemidy, 21',52.24914050000000287,20.90867539999999992,28.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Babimojska, 13',52.24476630000000199,20.92313190000000134,30.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 32',52.23360559999999709,20.92127290000000173,25.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 42',52.23404339999999735,20.92140309999999915,29.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Rosy Bailly, 40',52.24850270000000307,20.92592120000000122,28.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 20A',52.23618100000000197,20.90552179999999894,29.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Arciszewskiego, 13',52.25589430000000135,20.8903812000000002,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dynarska, 2',52.25801179999999846,20.91616949999999875,33.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Arciszewskiego, 4',52.25598850000000084,20.89231140000000053,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Batalionów Chłopskich, 84',52.2320198999999974,20.89109189999999928,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 9',52.229662900000001,20.92119080000000154,30.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Arkadyjska, 11',52.25108879999999801,20.8800574999999995,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Arkadyjska, 1',52.2510438999999991,20.88048739999999981,34.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Batalionów Chłopskich, 87',52.23175789999999808,20.88933510000000026,31.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 40',52.24156589999999767,20.90222599999999887,33.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 85A',52.22593189999999908,20.9059355999999994,34.0,1,22.0);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 178A',52.20280269999999945,20.93719210000000074,32.0,0,17.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 217',52.19001620000000229,20.92042130000000099,48.0,0,18.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 216',52.19028500000000292,20.91869450000000085,51.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Fraszki, 19',52.20506199999999808,20.90096009999999894,42.0,0,22.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 62',52.1713124999999991,20.93904480000000135,45.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Globusowa, 7',52.20762969999999826,20.91487959999999902,30.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Galaktyki, 17',52.21158729999999793,20.91114029999999957,34.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 17D',52.19957029999999776,20.91865250000000031,40.0,0,17.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 106',52.17389810000000238,20.94917949999999963,61.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 38B',52.20875300000000152,20.93106720000000109,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 30',52.20486360000000303,20.90585910000000069,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 17',52.22351700000000107,20.91223210000000065,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Józefa Brandta, 17',52.25193939999999771,20.87413289999999933,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 20',52.24996610000000174,20.87292499999999861,57.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 13',52.24954420000000254,20.87435149999999951,56.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Dostępna, 20',52.26297089999999912,20.90751339999999914,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Drogomilska, 25',52.23247599999999836,20.91322260000000099,30.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 86',52.2417463999999967,20.9007411999999988,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 24',52.2629969999999986,20.90597550000000026,37.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 88',52.22871870000000171,20.90690040000000139,31.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 26A',52.22994669999999929,20.92124240000000057,30.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 25',52.25387190000000003,20.89062080000000065,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Himalajska, 12',52.25735029999999882,20.91301019999999866,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 223',52.23846559999999784,20.90857899999999959,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 12',52.21932979999999703,20.9028905000000016,41.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Andyjska, 16',52.25507129999999734,20.91150599999999927,31.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 22',52.2500762000000023,20.87246760000000023,60.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 12A',52.23637519999999768,20.90899960000000136,25.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Legionowa, 8',52.21927339999999874,20.90777849999999916,39.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Kruszyńska, 30A',52.2328546999999972,20.91832510000000056,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Gottfrieda Leibniza, 17',52.25560159999999855,20.88984920000000045,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Isaaca Newtona, 14',52.25685620000000142,20.89143860000000074,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 63',52.26454309999999737,20.91563030000000011,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Gołuchowska, 1',52.24932290000000278,20.91817749999999876,26.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kazubów, 10',52.24526879999999807,20.91365499999999855,28.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 32',52.26356380000000001,20.91437459999999859,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 210',52.2392593000000005,20.90927969999999903,23.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Gimnazjalna, 5',52.23002180000000294,20.91655769999999847,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 8',52.22430260000000146,20.91753190000000017,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Ołtarzewska, 27',52.24960180000000065,20.87866719999999888,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Oświatowa, 18A',52.23266749999999803,20.92008690000000115,25.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 50',52.22269589999999795,20.91501360000000176,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pawła Stellera, 17',52.26492799999999761,20.91431830000000148,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 5A',52.2484103000000033,20.91893380000000136,25.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Ambaras, 42',52.34297159999999849,20.99700659999999886,41.0,2,33.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 76',52.23622389999999883,20.92141009999999924,27.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Dymitra Mendelejewa, 13',52.2571325999999985,20.8921537000000015,36.0,1,25.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 70',52.2366535999999968,20.92215270000000161,28.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Narwik, 8B',52.24338989999999683,20.89821720000000127,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 25C',52.34721059999999682,20.94151159999999833,48.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Lustrzana, 49',52.22334330000000335,20.90559030000000007,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Spychowska, 13',52.25028700000000014,20.87769529999999918,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Spychowska, 43',52.25095449999999886,20.87329980000000163,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Józefa Wybickiego, 12',52.21997749999999883,20.90551689999999851,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Rodła, 14',52.26361539999999906,20.91758989999999941,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Aroniowa, 14',52.35279700000000246,21.04357800000000011,60.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 89B',52.24333779999999905,20.91009389999999968,27.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 11',52.24132579999999849,20.90559839999999881,29.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 68',52.22137589999999819,20.90696640000000173,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica ppłk. Wacława Szadkowskiego, 3A',52.25218180000000245,20.92203470000000109,27.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 15',52.26232859999999648,20.91506569999999954,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Szlifierska, 4',52.24264320000000338,20.92119639999999948,27.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Sternicza, 50A',52.22250439999999828,20.9103627000000003,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica gen. Ludomiła Rayskiego, 3',52.23046810000000306,20.8912191000000007,31.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Sternicza, 117',52.22045409999999777,20.90525789999999873,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Strąkowa, 38',52.23218810000000189,20.91883139999999841,25.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 36',52.26347700000000173,20.91633549999999886,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Owczarska, 2',52.22292439999999659,20.91090609999999827,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 18',52.22015559999999824,20.90183670000000049,40.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Posejdona, 2',52.24933949999999783,20.90954669999999994,28.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Edmunda Jana Osmańczyka, 24',52.26040030000000058,20.93323699999999831,29.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Grzymalitów, 1A',52.3356100999999967,20.93265399999999943,55.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 345B',52.32298089999999747,21.03074189999999888,40.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 174F',52.30913559999999763,21.03287639999999926,38.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 186D',52.3110465999999974,21.03044020000000102,34.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Borecka, 35',52.32791139999999786,21.01234469999999988,57.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 8A',52.30688760000000314,21.04136709999999865,40.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 20E',52.30923589999999735,21.0418276000000013,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Fortel, 13',52.32811840000000103,20.97827420000000132,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 58',52.33432140000000032,21.02105690000000138,54.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 93A',52.34086099999999675,21.06549280000000123,57.0,2,36.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 14B',52.33131629999999746,20.97277169999999913,49.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 170D',52.3076125999999988,21.03150799999999876,35.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 20A',52.33243399999999924,20.97446869999999919,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Erazma z Zakroczymia, 7',52.32109710000000291,20.95097249999999889,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ceglana, 4',52.33450419999999781,20.96029509999999974,42.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 82M',52.33963920000000058,21.07118219999999909,59.0,2,36.5);
-INSERT INTO travel_info VALUES('ulica Dylewska, 22',52.34436050000000051,21.00827370000000016,47.0,2,33.0);
-INSERT INTO travel_info VALUES('ulica Lapońska, 50',52.31019810000000092,21.05552649999999915,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Marywilska, 52A',52.31832789999999989,21.00041219999999953,33.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Marcina z Wrocimowic, 5F',52.3420878000000016,20.93745020000000067,50.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 111M',52.3347957000000008,21.05054679999999934,57.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Liczydło, 2',52.31344810000000222,20.98129409999999951,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Henryka Jędrzejowskiego, 12',52.35140570000000082,20.94341280000000082,50.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 63E',52.33718869999999868,21.06528750000000016,60.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 44J',52.31687980000000237,21.04370159999999856,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Leśny Potok, 29',52.35710530000000062,21.04969889999999922,58.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 4D',52.32358190000000064,21.05100189999999927,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Książkowa, 49B',52.32907840000000021,20.95039279999999949,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Lemiesz, 21D',52.32898970000000105,20.99256360000000043,39.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Leśnej Polanki, 9D',52.33092630000000156,20.95417929999999985,50.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 58K',52.36075989999999792,21.0482882999999994,52.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 18A',52.35523959999999733,21.03288470000000032,53.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Marmurowa, 12',52.36414570000000168,20.94599350000000015,58.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Fraszki, 21A',52.20512169999999941,20.90058469999999958,42.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 18A',52.20463039999999922,20.91972000000000165,33.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Przesmyk, 3',52.20664419999999951,20.9266615999999992,39.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Nieduża, 6',52.17678719999999971,20.93547999999999831,55.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 37',52.22746209999999679,20.89976409999999874,33.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 22',52.24948770000000308,20.87258509999999844,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu 303, 173C',52.24536299999999756,20.9000824999999999,32.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wacława Gąsiorowskiego, 20',52.2585004999999967,20.89518509999999907,33.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 91',52.22644600000000281,20.90614920000000155,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 3',52.26497179999999788,20.90783880000000038,42.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 12',52.23747240000000147,20.89415650000000113,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 5A',52.23687790000000319,20.91022209999999859,24.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Artemidy, 22',52.24980450000000331,20.90949579999999841,29.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jana Blatona, 1',52.25674440000000231,20.92289119999999869,30.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Fraszki, 5',52.20467810000000241,20.90333060000000031,39.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Globusowa, 12',52.20805690000000254,20.91545029999999983,31.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 17',52.17358080000000342,20.93002859999999999,55.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Jantar, 5',52.19638559999999928,20.93660249999999934,42.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 11',52.20503070000000178,20.92824960000000089,35.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Płomyka, 11A',52.19983150000000193,20.91871610000000103,42.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Władysława Przanowskiego, 29',52.23761679999999786,20.93359179999999852,22.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Szańcowa, 11A',52.23775599999999742,20.9327235000000016,21.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Rosy Bailly, 28',52.2483622999999966,20.92479289999999992,27.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Wacława Borowego, 15',52.22975319999999755,20.90790219999999878,33.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Grotowska, 11',52.26587789999999956,20.89962609999999899,46.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Fortuny, 12',52.2171469999999971,20.90730710000000058,40.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 168',52.24182900000000273,20.91899679999999861,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 9',52.21891000000000104,20.90222290000000172,40.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 26',52.26379010000000135,20.89696460000000044,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 7',52.24939489999999865,20.87519280000000065,54.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 4',52.23242359999999707,20.9209196999999989,24.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 16',52.23293559999999758,20.92112380000000015,24.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 22C',52.2495455999999976,20.87120489999999861,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 14A',52.24926459999999651,20.8737364999999997,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Akantu, 20',52.26429929999999758,20.90637699999999911,40.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 20',52.24151140000000026,20.90295899999999918,34.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Kryształowa, 45',52.233280299999997,20.90797129999999982,32.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Gustawa Morcinka, 16',52.25929789999999998,20.92043119999999945,31.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 168',52.24327739999999665,20.8974240999999985,30.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kruszyńska, 6A',52.23020040000000108,20.91829389999999833,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Kocjana, 1',52.24965009999999666,20.89347970000000032,33.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Kunickiego, 51',52.2599291000000008,20.89868939999999852,31.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Kunickiego, 49',52.26015910000000275,20.89866870000000177,31.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 28',52.26324960000000174,20.91432909999999979,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Iskry, 24',52.25066549999999666,20.87261429999999862,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 2E',52.25018109999999894,20.89949280000000086,33.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Gimnazjalna, 7A',52.23027820000000076,20.91656839999999918,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 19',52.25508500000000111,20.92263090000000148,28.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 8',52.26255419999999675,20.91591700000000031,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Łęgi, 1A',52.21223859999999917,20.88506299999999883,46.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 16F',52.22703140000000132,20.89766410000000007,32.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Lustrzana, 26',52.22099510000000321,20.90473920000000164,39.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Puszczy Solskiej, 4',52.22752140000000053,20.90956309999999974,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Dymitra Mendelejewa, 29',52.25719840000000004,20.89045679999999905,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mory, 8',52.2131048999999976,20.87563420000000036,41.0,2,25.0);
-INSERT INTO travel_info VALUES('ulica Moździerzy, 16A',52.21920810000000301,20.89565179999999956,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 121G',52.32531319999999653,21.07910169999999895,54.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 48',52.21863350000000281,20.90869280000000074,37.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Aroniowa, 27',52.35337849999999805,21.04695059999999885,61.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Aroniowa, 29A',52.3536918,21.04774159999999838,62.0,2,35.0);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 25BF',52.22210290000000298,20.89422689999999961,42.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 20',52.24322360000000031,20.90715640000000164,31.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Józefa Wybickiego, 8',52.21957359999999682,20.90578289999999839,37.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Annopol, 5',52.30441110000000293,21.01841939999999909,32.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Radiowa, 23A',52.25897150000000124,20.89527239999999964,35.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 19L',52.32541049999999672,21.05809040000000109,40.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 50',52.22255539999999741,20.91051209999999827,34.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Babinicza, 19',52.33641010000000193,21.04278210000000015,48.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica gen. Ludomiła Rayskiego, 6',52.23009660000000309,20.89012160000000051,32.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Waldorffa, 11',52.25973290000000304,20.94939989999999952,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Skłoby, 5',52.25143800000000027,20.87771940000000014,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Romana Popiołka, 30',52.26354140000000114,20.92158339999999939,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 34M',52.33381239999999935,20.99097910000000055,30.0,1,29.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 118',52.23586120000000221,20.91646749999999955,24.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Skłoby, 15',52.25198569999999876,20.87793860000000023,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Drogowa, 12',52.32806529999999868,20.97161559999999981,45.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Drogowa, 18A',52.32823309999999851,20.97249049999999926,46.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 10B',52.30760409999999894,21.04170159999999968,40.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 69',52.21742189999999795,20.90636500000000097,40.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Grzymalitów, 11A',52.33751800000000287,20.93919460000000043,48.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Obrońców Tobruku, 28',52.25878540000000072,20.93475259999999949,26.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Obrońców Tobruku, 18D',52.26073610000000257,20.93292220000000014,32.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Fortel, 4A',52.32668439999999777,20.97664860000000075,45.0,1,28.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 139',52.23530600000000134,20.91525550000000066,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Dorodna, 20',52.30345189999999889,20.9847709999999985,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ekspresowa, 8',52.31286070000000165,20.98044259999999995,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 91A',52.21613680000000101,20.90129479999999874,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Fortel, 15',52.32815169999999938,20.97833430000000021,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 17D',52.35573610000000144,20.97801109999999981,36.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 174G',52.30911270000000001,21.03214459999999875,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 13C',52.35505179999999826,20.97889199999999831,35.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Gladioli, 11B',52.34825229999999863,20.92944400000000015,61.0,2,37.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 40Ł',52.33472359999999668,20.99105700000000141,31.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Gladioli, 23A',52.34865899999999784,20.93187719999999886,60.0,2,37.0);
-INSERT INTO travel_info VALUES('ulica Gladioli, 11',52.34809940000000239,20.92871279999999957,60.0,2,37.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 40C',52.33300570000000107,20.98855789999999999,30.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Gościnna, 2',52.31492310000000145,21.06654890000000079,36.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 73K',52.32616600000000062,21.07140490000000099,43.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Bohaterów, 18A',52.33634500000000144,20.98965129999999845,32.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Dwusieczna, 24',52.35385899999999993,20.98004380000000068,37.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Czołowa, 36P',52.33322569999999985,20.98950809999999833,31.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 18A',52.33214250000000333,20.97387859999999904,48.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 25F',52.3562708999999984,20.97528180000000119,35.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Gitarowa, 22',52.33183120000000343,20.99788179999999826,58.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Marywilska, 54',52.3182151000000033,20.99923060000000063,33.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Księcia Jaremy, 16',52.3096464999999995,21.03284299999999974,39.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 16A',52.32668799999999721,21.06270969999999921,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Henryka Jędrzejowskiego, 6',52.35097809999999897,20.94211980000000039,50.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Księcia Jaremy, 17',52.30944819999999851,21.03280559999999966,39.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Księcia Jaremy, 7',52.3095049000000003,21.03389539999999868,38.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Chlubna, 98',52.35934429999999651,20.9803961000000001,35.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Borecka, 4B',52.32711590000000256,21.00667530000000127,59.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Borecka, 12',52.32758270000000067,21.01220920000000091,57.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Borecka, 10',52.32746250000000287,21.01016429999999958,59.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 73G',52.32577009999999973,21.0715046000000008,44.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Marywilska, 65',52.31769020000000125,20.99738879999999953,33.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Kuszników, 15A',52.30133819999999645,21.03089879999999923,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Kupiecka, 32',52.32102799999999832,21.01642770000000126,53.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 57',52.33037620000000345,21.05709510000000151,46.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Mańkowska, 49',52.3503222000000008,21.05617709999999932,51.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Kumaka, 6',52.33665320000000065,21.05797910000000072,51.0,1,37.5);
-INSERT INTO travel_info VALUES('ulica Lewandów, 16',52.32248280000000306,21.07010079999999875,40.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 123J',52.33577799999999769,21.04997729999999833,58.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Henrykowska, 9',52.35565309999999784,20.98057530000000171,37.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Głębocka, 80A',52.31483399999999762,21.06726340000000164,36.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Odkryta, 27U',52.33008490000000278,20.9350486999999994,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 166B',52.32469290000000228,21.04946109999999848,43.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ketlinga, 30',52.33484519999999663,21.03942160000000072,48.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 150B',52.3218352999999965,21.05071080000000094,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Karnicka, 3',52.3405703000000031,20.97765229999999904,40.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Konwaliowa, 36',52.29972680000000195,20.98241069999999909,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jasiniec, 59',52.31425190000000213,21.0755745999999995,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Odłogi, 8',52.33517700000000161,21.02305919999999873,54.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Olesin, 9B',52.34335649999999874,21.06976769999999988,61.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 144CA',52.32103070000000144,21.05123220000000117,42.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 100',52.34254669999999976,20.97262810000000144,53.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Ojca Aniceta, 12B',52.30396249999999725,21.04200889999999902,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 84',52.30967179999999673,20.98180819999999969,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 344',52.35356060000000155,20.94392069999999962,55.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 82L',52.31256359999999717,21.05461520000000064,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kiersnowskiego, 3',52.34158459999999736,20.97436060000000068,46.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 98A',52.31453280000000205,21.05185279999999893,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 60K',52.30863349999999912,21.05321789999999993,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Natalii Gąsiorowskiej, 26B',52.35468329999999782,20.9407740000000011,53.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Natalii Gąsiorowskiej, 26A',52.35465520000000338,20.94068800000000153,53.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Międzyrzecze, 24',52.36149240000000304,21.04315929999999924,55.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 54C',52.35071370000000001,21.04173249999999839,60.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Nagodziców, 12',52.31484050000000252,20.96676130000000172,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 17',52.2998744000000002,20.99177650000000028,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 88B',52.35460270000000093,21.03889720000000096,53.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Mirabelki, 11',52.32205540000000354,21.04552599999999885,42.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Mirabelki, 5',52.32217289999999821,21.04773510000000058,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Obrazkowa, 24',52.31446400000000096,20.97271969999999897,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 328J',52.34882780000000224,20.95059720000000069,54.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 122',52.34810730000000233,20.9767569000000016,41.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Reniferowa, 29',52.30829399999999652,21.04701199999999873,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 109C',52.34005710000000277,21.02760059999999954,44.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Piwoniowa, 40',52.35851720000000142,20.9733628000000003,29.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Szklarniowa, 6B',52.32732699999999682,21.01749399999999924,53.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 15H',52.34193499999999944,21.0567302000000005,52.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Międzyrzecze, 7',52.36154810000000026,21.04210989999999982,54.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Poli Negri, 14',52.33129730000000279,20.99255859999999885,38.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Michałówek, 13',52.34617819999999711,21.01107610000000036,52.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Starej Gruszy, 1',52.30923150000000276,21.05646970000000095,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 126',52.32006200000000006,21.05842429999999865,37.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Pułaskiego, 18',52.32336839999999967,20.98282289999999861,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 113D',52.34232449999999659,21.02606630000000009,47.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Szlachecka, 52B',52.3156285999999966,21.0237380000000016,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Powałów, 17',52.31807779999999753,20.97805380000000142,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Gioacchino Rossiniego, 7',52.34345530000000223,21.0530229999999996,47.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 18',52.28399910000000261,20.90918669999999935,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 49C',52.31365490000000306,21.04465270000000032,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Przyrzecze, 7',52.35535039999999896,20.93826460000000011,52.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Poetów, 4E',52.3384986000000012,20.94685619999999915,47.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Poetów, 4B',52.33835899999999697,20.94666439999999952,48.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Przydrożna, 17D',52.31967800000000323,21.02756529999999913,42.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Przydrożna, 26',52.31933610000000101,21.03000600000000019,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Abecadło, 8',52.30835280000000153,20.93228309999999937,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Piknikowa, 105',52.33146179999999959,21.01593739999999854,65.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Szawelska, 18',52.35246740000000187,20.93659699999999902,60.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 22',52.33782510000000343,20.98639939999999982,30.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Vincenta van Gogha, 1',52.31376329999999797,20.95319590000000076,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 98A',52.33714760000000154,21.03167829999999939,46.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 134L',52.28569209999999857,20.88939149999999855,39.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Łazanowicka, 2',52.35896050000000201,20.98994420000000005,64.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 36',52.28150839999999989,20.95232950000000116,21.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 200',52.28752070000000173,20.8779837999999991,39.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 34/28',52.28533379999999653,20.90236880000000142,39.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 180',52.28702899999999687,20.88029990000000069,40.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 157/16',52.28477120000000155,20.88552470000000127,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Zakręcona, 5',52.32979259999999755,20.99452910000000116,43.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Złotej Rybki, 9',52.35445049999999867,21.02982150000000061,51.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 73',52.28376620000000229,20.89920160000000138,38.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Wojdyńska, 21',52.35259669999999944,21.07253980000000126,69.0,1,36.5);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 70',52.34466770000000224,20.99747830000000092,37.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Waligóry, 31B',52.33088060000000041,20.99860819999999962,58.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Tymotki, 14',52.35559020000000174,21.05709170000000085,53.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Zyndrama z Maszkowic, 2D',52.32814100000000223,20.99428950000000071,44.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 77',52.34195429999999761,21.06605049999999935,60.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 47',52.34273559999999748,20.99082620000000076,39.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Wyszkowska, 59',52.33560429999999997,21.07753220000000027,59.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Apollina, 4A',52.25180970000000257,20.91155129999999929,28.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 18D',52.22692260000000175,20.91677500000000122,27.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 34E',52.34222179999999725,20.97888770000000136,44.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 8',52.22224140000000147,20.92239349999999831,24.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 7',52.33138490000000331,20.97045149999999936,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Marywilska, 75',52.32013080000000115,20.99545439999999986,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 36C',52.31783420000000006,21.04076699999999889,40.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Lapońska, 20',52.31008460000000326,21.05331689999999866,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Głębocka, 54G',52.31026330000000257,21.07068579999999969,40.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 356',52.36178559999999749,20.94010139999999965,73.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 86',52.34177019999999914,21.06776320000000169,54.0,2,33.0);
-INSERT INTO travel_info VALUES('ulica Wielkiego Dębu, 15B',52.3081277,21.03342639999999975,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Heroldów, 9',52.30398019999999804,20.93204689999999957,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Jowisza, 10',52.28230219999999662,20.90005830000000132,39.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Sokratesa, 2',52.28193770000000029,20.92582619999999949,30.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Przy Agorze, 18',52.2920513999999983,20.9372600999999996,28.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Chochołowska, 15',52.18321850000000239,21.06027909999999892,38.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Korzenna, 8A',52.19498759999999749,21.09638479999999917,53.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Rolna, 175A',52.17629769999999923,21.02653270000000063,23.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Okrężna, 87',52.18163040000000307,21.06153750000000002,39.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 33',52.20119280000000117,20.96243750000000005,34.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Wiktorska, 95/97',52.1976481000000021,21.00535770000000113,19.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Zdrojowa, 66',52.18256070000000335,21.06000639999999891,37.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 81A',52.20184530000000222,20.94973990000000085,40.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Na Bateryjce, 12',52.21440890000000223,20.95753510000000119,29.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Filipinki, 5A',52.20842309999999742,20.95371330000000043,32.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Kawcza, 64',52.2411724000000035,21.10529259999999851,33.0,0,18.0);
-INSERT INTO travel_info VALUES('Aleja Stanów Zjednoczonych, 25',52.22871020000000186,21.06216309999999937,19.0,0,9.5);
-INSERT INTO travel_info VALUES('ulica Rozłucka, 7A',52.23818579999999657,21.0776274999999984,30.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Saska, 9K',52.2263187000000002,21.06470339999999908,28.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica ks. Ignacego Kłopotowskiego, 7',52.24959410000000303,21.02947710000000114,17.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Fizylierów, 9',52.24830490000000082,21.17199109999999962,50.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Targowa, 80',52.25624340000000245,21.03389310000000023,15.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 29/31',52.26174569999999875,21.15847369999999827,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Łukowska, 17C',52.23696269999999942,21.10351670000000012,31.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Republikańska, 24',52.2607639000000006,21.16953120000000155,36.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Gilarska, 41',52.27798520000000337,21.05850969999999833,23.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Szeroka, 26',52.2453997000000001,21.12998580000000004,44.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Agatowa, 25B',52.28133540000000323,21.07689560000000028,28.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bukowiecka, 67',52.26986889999999875,21.08016160000000027,29.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Szafarzy, 47F',52.26786330000000191,21.15485800000000082,41.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Strycharska, 55',52.26397409999999866,21.1638692000000006,43.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Mokra, 31',52.27313929999999687,21.05746429999999947,23.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Tarnogórska, 8',52.27976960000000161,21.07188659999999914,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Władysława Jagiełły, 31F',52.1982288999999966,20.87540200000000112,39.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Plutonu AK „Torpedy”, 25',52.19503550000000302,20.88926530000000171,33.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Indycza, 18',52.11172789999999822,21.03155119999999912,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Albatrosów, 15',52.14966720000000321,21.01892159999999877,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Hawajska, 15',52.15161549999999835,21.03901970000000076,30.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Zagłoby, 29',52.19235989999999959,20.86456820000000078,36.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Kokosowa, 39',52.15359649999999903,21.06088199999999944,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Rybałtów, 23',52.12947489999999818,21.0555260000000004,36.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Samsonowska, 6',52.149630700000003,21.01584400000000131,30.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cedrowa, 18',52.22873009999999994,21.15174689999999913,44.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Puzonistów, 11',52.11627459999999701,21.01477840000000085,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Marecka, 8',52.20350109999999689,21.1738907999999988,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Nagłowicka, 20A',52.17499819999999744,21.18341059999999842,52.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Naddnieprzańska, 33C',52.23629820000000023,21.13305809999999952,38.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Morąska, 5A',52.17819339999999784,21.18557380000000023,62.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 30F',52.19442010000000209,21.12770330000000029,52.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Stradomska, 57',52.22221170000000256,21.15846549999999837,36.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Patriotów, 51',52.16033629999999733,21.21189589999999824,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica II Poprzeczna, 9',52.2235293000000027,21.15312249999999849,33.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Widoczna, 5',52.21451919999999803,21.15769480000000158,30.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Zwoleńska, 94H/1',52.19993370000000254,21.15664950000000033,48.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Wierchów, 8',52.21970160000000049,21.14817460000000082,35.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Łabędzia, 51',52.19251270000000175,21.19500139999999889,50.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 466J',52.20339870000000104,21.11934229999999957,47.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Zasadowa, 15E',52.18031950000000307,21.17304100000000134,54.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Zabielska, 22',52.20639520000000288,21.11698330000000112,47.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Wolna, 24',52.1675017999999966,21.21633950000000012,49.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Źródlana, 32',52.20233189999999724,21.15698989999999924,44.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Europejska, 16B',52.15726310000000154,21.09574710000000052,50.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dostatnia, 4B',52.16839219999999955,21.11219180000000151,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Spokojna, 9',52.24950630000000018,21.22485040000000111,24.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Brylantowa, 47',52.21803760000000238,21.22608370000000022,60.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 13B',52.22075000000000244,21.235634000000001,56.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Armii Krajowej, 47B',52.25038529999999782,21.22830190000000173,34.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Husarii, 35A',52.17316160000000024,21.08298870000000136,48.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Hoserów, 17',52.14618240000000071,21.1295712999999985,63.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Senatorska, 34',52.24365099999999984,21.00379510000000139,12.0,0,7.0);
-INSERT INTO travel_info VALUES('ulica Bytomska, 2',52.27297980000000166,20.9846105999999999,21.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Vogla, 37',52.16371840000000048,21.10638000000000148,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Syta, 6',52.1526809,21.12987830000000145,55.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Koszycka, 5A',52.24247019999999964,20.94332169999999848,21.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Zaściankowa, 7G',52.16874090000000308,21.11715119999999856,57.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Krochmalna, 58',52.23546249999999703,20.98556590000000099,18.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Wiertnicza, 68A',52.17269799999999691,21.08146560000000136,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Nadziei, 5',52.19534720000000049,20.95652460000000162,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Głubczycka, 32',52.20940459999999917,20.9002789,39.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Husarska, 28C',52.19952270000000282,20.92056380000000004,39.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Cyprysowa, 41/43',52.1805031000000028,20.94187919999999892,49.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Strubiczów, 4',52.19321839999999924,20.96319989999999934,34.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Romańska, 7',52.24323780000000283,20.93709439999999944,24.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Dymna, 25',52.20550699999999722,20.89500310000000027,39.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Belwederska, 36/38B',52.20865770000000338,21.02969410000000038,24.0,1,15.0);
-INSERT INTO travel_info VALUES('Aleja Prymasa Tysiąclecia, 81A/11',52.22355840000000171,20.9551791999999999,24.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Krasińskiego, 67',52.25912019999999814,20.96391059999999839,28.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Batalionów Chłopskich, 82A',52.23232399999999843,20.89222690000000071,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Oblęgorska, 11',52.25118690000000043,20.87589210000000151,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Juliusza Kaden-Bandrowskiego, 5',52.24947110000000094,20.92399259999999827,27.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Pirenejska, 6',52.25384019999999908,20.91427529999999991,28.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 57C',52.36206849999999947,21.04860800000000154,51.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Laurowa, 23A',52.30393399999999816,20.98197550000000077,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Jarzębinowa, 9',52.34683470000000227,21.0582029999999989,50.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Lemiesz, 58',52.33506229999999704,20.99503849999999972,39.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 74S',52.31149179999999888,21.05600180000000065,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Odłogi, 20',52.33681680000000113,21.02243509999999916,56.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 162F',52.35316770000000019,20.99323499999999853,62.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Szamocin, 14',52.35159469999999971,21.01731129999999937,58.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 19C',52.31531100000000122,21.05569789999999841,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 21',52.34056590000000142,21.04006610000000065,49.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Piknikowa, 64',52.33120670000000274,21.0195046000000012,59.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 94A',52.3367918000000003,21.03083889999999912,47.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Łąkowa, 39',52.34646299999999997,20.967591800000001,61.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Pasterska, 14',52.31037880000000228,20.91639729999999986,41.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wiśniowy Sad, 28',52.31337059999999895,21.0271681000000008,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 51',52.31904910000000086,21.0388963000000011,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Literacka, 18',52.26659080000000301,20.95006270000000014,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Jana Kasprowicza, 60',52.28406760000000019,20.94605160000000054,23.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica płk. Mieczysława Niedzielskiego „Żywiciela”, 2D',52.2675926000000004,20.94137440000000083,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Marymoncka, 42',52.29945769999999783,20.94315819999999917,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Bocheńska, 8',52.18089299999999753,21.03040100000000123,24.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Sokratesa, 7',52.28307670000000229,20.92620979999999876,31.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Leopolda Staffa, 63',52.27467889999999784,20.952459300000001,27.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Klarysewska, 36',52.1801031999999978,21.068439699999999,42.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Gierymskiego, 14',52.19996789999999721,21.03559070000000019,24.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Juliusa Fučíka, 29',52.17883259999999979,21.05975769999999869,37.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Nadrzeczna, 6D',52.21215569999999673,21.07742179999999977,36.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Pory, 57',52.1837964999999997,21.04414870000000092,30.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Nadrzeczna, 2B',52.20927060000000352,21.080816200000001,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Okrężna, 135',52.18424430000000313,21.06459350000000085,40.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Miłobędzka, 3',52.19426969999999955,20.99139770000000027,28.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Wiśniowa, 38',52.20690199999999948,21.01520269999999969,22.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Bora-Komorowskiego, 5J',52.22405009999999948,21.09637259999999869,31.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Zadumana, 3/5',52.20461110000000104,20.94895400000000051,36.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Berneńska, 9A',52.22366800000000353,21.06333389999999995,30.0,0,12.0);
-INSERT INTO travel_info VALUES('Plac Sokratesa Starynkiewicza, 1/3',52.22429660000000239,20.99524650000000036,19.0,0,7.0);
-INSERT INTO travel_info VALUES('ulica Hetmańska, 2A',52.24148670000000294,21.10919360000000111,31.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Kozia Górka, 4',52.25638159999999744,21.10045789999999854,70.0,1,25.5);
-INSERT INTO travel_info VALUES('Aleja Jerzego Waszyngtona, 6',52.23843279999999823,21.05434359999999928,22.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Kawcza, 42',52.23859370000000268,21.10364840000000086,33.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Szaserów, 109',52.24767289999999776,21.09880689999999959,31.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Kompasowa, 16',52.23193440000000009,21.08368949999999841,28.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Rozłucka, 9',52.23859910000000184,21.07710450000000079,31.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Rzymska, 18',52.22320369999999912,21.06321300000000107,29.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Olszynki Grochowskiej, 66',52.24317250000000001,21.12054690000000078,36.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Rusznikarska, 25',52.25009940000000341,21.10303869999999904,26.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Pabianicka, 49',52.23932599999999838,21.12225809999999982,36.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Ząbkowska, 39',52.25511660000000091,21.04745529999999932,19.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Buławy, 8A',52.25783700000000209,21.17327829999999978,36.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Buławy, 16',52.25898480000000034,21.17342259999999853,37.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Kapitańska, 24',52.27464770000000271,21.16811330000000169,53.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 6',52.24198959999999659,21.10784519999999987,31.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Księcia Witolda, 41',52.24920620000000326,21.16884930000000154,43.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Doroty Kłuszyńskiej, 5',52.25391270000000076,21.16959939999999918,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 17',52.26688450000000329,21.16820690000000126,41.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Guliwera, 7',52.28696260000000251,21.0587611999999993,26.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Borzymowska, 26',52.27661919999999896,21.04752179999999839,26.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 210',52.28251269999999807,21.07229780000000118,29.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Przecławska, 2',52.26979270000000354,21.07265579999999972,30.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Penelopy, 2',52.29134210000000138,21.05780250000000108,30.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Koszalińska, 11A',52.28104019999999963,21.07622040000000041,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kolonijna, 3',52.27730530000000186,21.04610419999999848,24.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Samarytanka, 40',52.28048569999999984,21.06199330000000102,28.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Stojanowska, 13',52.27304250000000251,21.05343990000000076,21.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Spójni, 6',52.28199860000000143,21.06489440000000001,26.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica gen. Kazimierza Sosnkowskiego, 29',52.1929920999999979,20.88594720000000037,33.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Mariana Krawczyka, 14A',52.1899368999999993,20.86958609999999937,33.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Makolągwy, 2',52.14529050000000154,21.02183769999999897,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 160',52.15554579999999874,21.05540189999999968,32.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Migdałowa, 33',52.14674399999999821,21.06102020000000153,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 51',52.14189040000000119,21.00342470000000005,42.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Pelikanów, 11',52.12300259999999952,21.02275140000000064,35.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Puchalska, 19A',52.14215260000000284,20.99693780000000132,48.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Puchaczy, 12',52.13334270000000003,21.02252899999999868,33.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Tramblanki, 47',52.14347730000000069,20.99899329999999864,47.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wawrzyńca Surowieckiego, 12',52.1580611999999988,21.02080829999999879,31.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Puchaczy, 19',52.13310080000000112,21.02212589999999893,32.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 111',52.22762110000000035,21.14132379999999855,40.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Orłowskiego, 73',52.18722629999999896,21.20260959999999884,48.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Młoda, 15',52.16019670000000019,21.21084139999999963,44.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Mrągowska, 25K',52.17046179999999823,21.16314810000000079,64.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Ogrody, 11',52.21474560000000053,21.11011129999999981,45.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Dzielnicowa, 37',52.22187170000000122,21.14452109999999862,33.0,1,20.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 14',52.17357959999999651,21.15444700000000111,47.0,1,20.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 354G',52.21929289999999924,21.1375567999999987,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kościuszkowców, 89',52.23875199999999808,21.15615160000000116,42.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Narcyzowa, 14B',52.16082850000000092,21.22361240000000037,53.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Goździków, 10',52.23831969999999814,21.13651750000000006,38.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Szoferska, 28',52.22031559999999928,21.16929820000000006,51.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 137B',52.22320700000000215,21.10945200000000099,41.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Palmowa, 15G',52.2169158999999965,21.13913660000000049,47.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 76E',52.2161836000000008,21.11593560000000024,46.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Mrągowska, 7',52.16839149999999848,21.16693820000000059,67.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Zasobna, 5',52.18364290000000238,21.17257239999999996,49.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 6K',52.20837120000000197,21.11370090000000133,45.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Łosicka, 3',52.19055449999999752,21.17383350000000064,56.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Wiślanych Pól, 6A',52.15225680000000352,21.19043479999999846,58.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Związkowa, 28A',52.23432470000000193,21.14148600000000044,43.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Tawułkowa, 7ZK',52.16903700000000299,21.18025980000000175,56.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 45A',52.21147140000000064,21.10885650000000169,44.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica ks. Sylwestra Szulczyka, 77B',52.18073329999999999,21.2380923000000017,67.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Walcownicza, 40',52.16354749999999996,21.21902680000000175,48.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica ks. Sylwestra Szulczyka, 30A',52.17422520000000218,21.23538440000000093,64.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Wielostronna, 20',52.18746279999999871,21.17939489999999835,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Diamentowa, 16',52.21916370000000284,21.2275659999999995,58.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Glebowa, 22',52.17972950000000054,21.1007421000000015,46.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Skoczna, 1',52.22154720000000338,21.24860260000000168,58.0,1,25.5);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 6',52.22364389999999901,21.21827689999999933,51.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica św. Antoniego, 4',52.21972439999999694,21.22232999999999948,54.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Biedronki, 103',52.17659270000000049,21.07941549999999964,45.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 95E',52.1665752999999981,21.11531739999999857,60.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 119G',52.17084129999999931,21.11084200000000167,50.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Urszuli, 7',52.20692069999999774,20.90210779999999958,39.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Zakroczymska, 3C',52.25410550000000142,21.00542079999999956,18.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Olęderska, 12B',52.15528079999999989,21.13316379999999838,58.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Jakuba Kubickiego, 21',52.17031219999999792,21.06997390000000081,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Rosy, 17B',52.14047390000000348,21.13342700000000107,69.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Przyczółkowa, 122D',52.13160049999999757,21.10423850000000101,51.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Okopowa, 33',52.24151109999999676,20.97731170000000134,21.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Wyprawa, 20',52.15923469999999896,21.09059099999999987,45.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Seweryna Krzyżanowskiego, 34',52.22687479999999738,20.96786290000000008,19.0,0,12.0);
-INSERT INTO travel_info VALUES('Aleja Jana Pawła II, 27',52.23794720000000069,20.99571380000000075,15.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Wilanowska, 35',52.24374530000000049,21.18814109999999929,20.0,0,8.0);
-INSERT INTO travel_info VALUES('ulica Rumiana, 15A',52.17104880000000122,21.07909790000000072,40.0,1,20.5);
-INSERT INTO travel_info VALUES('Rynek Starego Miasta, 30',52.25023780000000073,21.01190760000000068,19.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Trojańska, 13A',52.18180060000000253,20.94582839999999991,49.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Sklepowa, 14G',52.20303489999999869,20.91294329999999845,44.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Wiedeńska, 91C',52.14606169999999708,21.08571870000000103,52.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Chrobrego, 44',52.200265899999998,20.91421589999999852,34.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Komitetu Obrony Robotników, 39N',52.17860019999999822,20.9745430000000006,43.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Jutrzenki, 97',52.18984950000000111,20.92673059999999908,36.0,1,18.5);
-INSERT INTO travel_info VALUES('Aleja Prymasa Tysiąclecia, 91',52.22985010000000016,20.95619659999999839,16.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Dziupli, 17',52.20638979999999663,20.92702750000000122,36.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Buńczuk, 8',52.17833989999999745,20.94082709999999992,50.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 16',52.24995400000000245,20.87355039999999918,56.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 17A',52.22914629999999648,20.91730850000000074,27.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Oblęgorska, 2',52.2523582000000033,20.87597900000000095,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Mieczysława Wolfkego, 15',52.25861359999999678,20.92408809999999875,31.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Ligonia, 44',52.26313309999999746,20.91345649999999879,40.0,1,25.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 82',52.23668370000000038,20.92013359999999978,25.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Waldorffa, 29',52.25793409999999995,20.94498859999999851,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Strąkowa, 41A',52.23186609999999775,20.91741040000000141,26.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 26D',52.34037059999999997,20.97864999999999824,40.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Daniszewska, 32',52.31230120000000027,21.02875219999999957,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Danusi, 31B',52.31528000000000133,21.03036349999999999,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 15B',52.35529720000000253,20.97829229999999968,35.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 105M',52.3339915999999974,21.05094259999999907,60.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Szamocin, 25P',52.35125790000000023,21.02655869999999894,51.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 99',52.33772909999999712,21.02707889999999936,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Łąkowa, 12H',52.34568920000000247,20.97032989999999942,59.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Widna, 5B',52.35740450000000123,20.98770830000000132,46.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Klaudyny, 21',52.28272470000000282,20.97192480000000003,23.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Bukszpanowa, 2',52.1852062000000032,21.03523549999999887,31.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Stefana Żeromskiego, 17',52.27612260000000077,20.95308430000000043,26.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Adriatycka, 35',52.17314209999999975,21.05519770000000079,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Sobocka, 19',52.28160079999999966,20.96793119999999889,30.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Podleśna, 7',52.28541940000000209,20.97167680000000089,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kielecka, 29',52.20382399999999735,21.00555840000000174,19.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 104',52.1957755999999975,21.02384590000000131,23.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 16',52.20840019999999982,21.0213764999999988,21.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Pory, 60',52.18418439999999948,21.04441459999999964,31.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Słoneczna, 4',52.20747289999999908,21.02568780000000003,22.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Boremlowska, 31',52.24798059999999822,21.10392879999999848,35.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Tyniecka, 30B',52.19365289999999647,21.02295099999999906,24.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Oczki, 1A',52.22425150000000115,21.00097350000000062,19.0,1,8.0);
-INSERT INTO travel_info VALUES('ulica Grójecka, 95',52.20949949999999973,20.97583679999999973,35.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Stefana Kazimierza Hankiewicza, 1',52.20871879999999977,20.97865799999999937,38.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 194/196',52.2455028999999982,21.08791980000000166,32.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Koprzywiańska, 17A',52.24093859999999979,21.11904120000000163,36.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Dąbrowiecka, 23A',52.23372479999999741,21.0489278000000013,23.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Grenadierów, 67/69',52.24413160000000289,21.07638700000000042,28.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Sulejkowska, 15',52.23855720000000246,21.1047955000000016,35.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Jana Styki, 1',52.23219029999999919,21.05798580000000086,19.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Paryska, 39',52.23043909999999813,21.05638060000000066,20.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Rogalskiego, 1E',52.22736110000000309,21.08287310000000047,28.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Podskarbińska, 51',52.25629750000000228,21.07367059999999981,32.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Tarchomińska, 5',52.25588319999999954,21.04744949999999904,21.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Karola Szymanowskiego, 5A',52.26277809999999847,21.03159300000000087,27.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Józefa Szanajcy, 14',52.26246969999999692,21.02836579999999956,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 75C',52.26377550000000127,21.16546539999999865,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Franciszka Ilskiego, 49A',52.25517359999999912,21.16588799999999893,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Rusiecka, 17',52.29203760000000045,21.07870540000000048,34.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 36H',52.30103189999999814,21.05296209999999845,39.0,0,29.5);
-INSERT INTO travel_info VALUES('ulica Dzieci Warszawy, 26',52.19181789999999666,20.90996799999999923,43.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Litawora, 15',52.28609600000000057,21.06096889999999889,22.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Kolista, 8',52.28791410000000183,21.0624323000000011,26.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Lidzka, 12',52.27409829999999858,21.03784990000000121,28.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Łodygowa, 60B',52.28528219999999749,21.09548619999999986,26.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Regulska, 59',52.18687919999999992,20.87330379999999863,42.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kajetańska, 27A',52.19215839999999674,20.87499409999999855,38.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Jaskółcza, 10',52.1101370000000017,21.02212370000000164,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Czapli, 21',52.14924469999999702,21.03091029999999861,31.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kobzy, 3',52.11782130000000279,21.01576920000000114,35.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Moczydłowska, 67F',52.13426989999999961,21.04690700000000092,42.0,0,29.5);
-INSERT INTO travel_info VALUES('ulica Kanarkowa, 17',52.13565289999999664,21.02682019999999952,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Trombity, 29',52.11503929999999941,21.00095620000000096,54.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica ppłk. Zbigniewa Stanisława Kiedacza, 20',52.15889169999999809,21.05691279999999921,32.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Derkaczy, 76',52.16586649999999992,21.20427199999999957,58.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Drwali, 12',52.1808704999999975,21.19997460000000089,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Pląsy, 15',52.14602670000000017,21.01427109999999842,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Liliowa, 17M',52.16161699999999968,21.18763720000000105,54.0,2,26.5);
-INSERT INTO travel_info VALUES('ulica Heliotropów, 20',52.18112949999999728,21.1382159999999999,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Krupnicza, 16A',52.2040350999999987,21.1746136000000007,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Benedykta Hertza, 6A',52.22354130000000083,21.15274870000000007,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Lipcowa, 17',52.18315270000000083,21.1580976000000014,56.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Korkowa, 95',52.23783060000000233,21.14477760000000117,38.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Kąkolowa, 20',52.17518129999999843,21.20126649999999913,42.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Ezopa, 6',52.19342230000000171,21.1816424000000012,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Klimontowska, 74/76',52.21757509999999769,21.15035389999999894,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Północna, 23/1',52.20576859999999897,21.15910050000000097,44.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Zwoleńska, 40/11',52.19777229999999691,21.144533899999999,50.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Henryka Łasaka, 17A',52.21497140000000314,21.11006479999999997,45.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Walcownicza, 39D',52.16431550000000072,21.21973159999999937,48.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 608B',52.21422650000000231,21.1039431999999998,34.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Przyjaźni, 67',52.23292390000000295,21.15678880000000106,52.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Zabielska, 9E',52.2051300999999981,21.11566720000000074,46.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Zwoleńska, 131A',52.20480539999999792,21.16424380000000127,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Władysława IV, 1',52.21426720000000187,21.15589320000000129,33.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Kolendrowa, 14',52.21609060000000113,21.24731799999999993,58.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Zielony Las, 24',52.21900620000000259,21.11366080000000168,47.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Wodyńska, 12',52.2076537000000016,21.18534650000000142,50.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Zwoleńska, 100A',52.20253610000000321,21.15776260000000165,43.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Wysokomazowiecka, 3B',52.17737160000000073,21.18617749999999945,59.0,0,27.0);
-INSERT INTO travel_info VALUES('ulica Zegrzyńska, 4',52.18481129999999979,21.17405769999999877,49.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Trawiasta, 36G',52.22172179999999742,21.15745310000000146,35.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Władysława Syrokomli, 3',52.25090310000000215,21.23514610000000147,31.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Nowa, 8',52.2441486000000026,21.1887749999999997,53.0,1,25.0);
-INSERT INTO travel_info VALUES('Aleja marsz. Józefa Piłsudskiego, 33B',52.22947140000000132,21.24680820000000025,64.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 32J',52.21825350000000298,21.23362399999999895,58.0,1,25.5);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 99',52.22386829999999947,21.24545309999999887,56.0,1,27.0);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 222A',52.22278659999999917,21.00507490000000032,13.0,1,6.0);
-INSERT INTO travel_info VALUES('ulica Szczęsna, 7B',52.20942149999999771,20.92807529999999972,43.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Nowy Świat, 53',52.23572670000000073,21.01812320000000157,8.0,0,4.5);
-INSERT INTO travel_info VALUES('Aleja Rzeczypospolitej, 33C',52.16841459999999842,21.06567190000000168,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Syta, 9D',52.15175030000000333,21.12608360000000118,57.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Rzodkiewki, 48',52.16466090000000122,21.05514679999999928,44.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Marcina Kasprzaka, 44/52',52.22887639999999721,20.96564700000000058,17.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Zakroczymska, 9',52.25470779999999849,21.00595889999999955,19.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Królowej Marysieńki, 74',52.17508829999999876,21.07109030000000161,44.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Wilcza, 44',52.22442269999999809,21.01307369999999964,10.0,0,5.5);
-INSERT INTO travel_info VALUES('ulica Zakamarek, 36',52.13398639999999773,21.11411879999999997,54.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Czereśniowa, 43B',52.20157110000000244,20.92745120000000014,37.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Długopolska, 18',52.17588099999999685,20.9392479999999992,51.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Redaktorska, 22',52.21179169999999914,20.91519579999999934,34.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Wiertnicza, 89',52.17333510000000273,21.07921789999999974,45.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Wiedeńska, 94DD',52.14683300000000087,21.08983070000000026,53.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Patrolowa, 16',52.21128300000000166,20.93400689999999998,52.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Pawła Lipowczana, 6',52.18454160000000285,20.94605609999999985,52.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Prudnicka, 10',52.18202130000000238,20.94378130000000126,51.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Czesława Kłosia, 7A',52.20656530000000117,20.91932660000000155,30.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Krańcowa, 47',52.19789440000000269,20.92483079999999874,37.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Gęślarska, 4',52.20510620000000301,20.89785020000000059,40.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Rękodzielnicza, 11',52.17894929999999932,20.94236920000000169,49.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Towarowa, 33',52.23426700000000266,20.98113409999999845,15.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Działkowa, 62',52.18743469999999718,20.93435170000000056,55.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Wolska, 60',52.23354140000000001,20.96489970000000013,15.0,0,15.0);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 192A',52.19874380000000257,20.93016839999999946,46.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Jantar, 28A',52.1971053999999981,20.93388069999999957,40.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 8',52.17201130000000119,20.92978120000000075,56.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Jantar, 6',52.19643789999999939,20.93720739999999835,36.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5AL',52.22707230000000322,20.9753778000000004,19.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 26',52.2048729999999992,20.90660069999999848,36.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Wacława Borowego, 13',52.22926220000000085,20.90873159999999942,33.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 110',52.24180189999999869,20.89999209999999862,32.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Iskry, 5',52.24998240000000038,20.87555629999999951,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Fabiańska, 15',52.25209149999999881,20.87479689999999977,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Alberta Einsteina, 8',52.25443849999999913,20.89294200000000146,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 26',52.25479250000000064,20.89050840000000165,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 29A',52.26361760000000344,20.89702150000000102,46.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 14B',52.23608049999999992,20.90781309999999848,26.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Rosy Bailly, 14',52.24822580000000016,20.92344680000000067,26.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 32',52.26299910000000181,20.90444300000000055,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 36A',52.26266969999999646,20.90395660000000077,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jana Blatona, 6',52.25732560000000148,20.92181749999999952,29.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kruszyńska, 2A',52.22978739999999931,20.9183287,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 23',52.26286759999999987,20.91404599999999903,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 185',52.24762669999999787,20.89746099999999985,31.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Karabeli, 2D',52.22879629999999907,20.90216549999999885,33.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kircholmska, 1',52.25128250000000207,20.8786290000000001,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Kocjana, 17',52.25194510000000036,20.87943029999999923,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Kawy, 10A',52.26211200000000189,20.91902609999999996,34.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jana Olbrachta, 118B',52.23485989999999646,20.92013589999999823,31.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Karabeli, 2B',52.22873529999999676,20.90186870000000142,33.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Strońska, 3',52.24478049999999741,20.92166329999999875,29.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Telefoniczna, 32',52.26315369999999661,20.89687220000000067,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Radiowa, 16B',52.24989759999999706,20.91927869999999957,25.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Marynin, 29',52.24641220000000174,20.92296530000000133,25.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Ligonia, 40',52.26291230000000354,20.91349740000000068,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Karola Miarki, 11B',52.26326050000000122,20.92029600000000044,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Zeusa, 3',52.24711020000000161,20.91041549999999916,25.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wieśniacza, 7',52.2458594000000005,20.91863880000000008,33.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 75J',52.32610520000000065,21.07179229999999847,44.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Nowej Huty, 6',52.21648079999999937,20.90287590000000151,39.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Spychowska, 45',52.250971100000001,20.873189,41.0,1,26.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 91',52.23654739999999919,20.91610580000000041,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Wyki, 2G',52.23016140000000007,20.90187810000000112,35.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Wieśniacza, 5',52.2457447999999971,20.91887900000000044,33.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 4',52.3426082000000008,20.94286590000000103,48.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Obrońców Tobruku, 20C',52.26016419999999841,20.93435720000000088,34.0,1,22.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 83',52.23714919999999751,20.9199762999999983,24.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 8A',52.34358060000000278,20.94363699999999895,50.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Waldorffa, 31',52.25751549999999668,20.94618390000000118,35.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 17',52.32430339999999803,21.05719930000000061,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Telewizyjna, 17',52.26424999999999699,20.9051954000000002,48.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Ołtarzewska, 8',52.24966909999999843,20.87905579999999973,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Strzelców, 1A',52.22051439999999901,20.91225370000000083,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Synów Pułku, 9',52.2242371000000034,20.9184196,27.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Czeremchowa, 5A',52.33855129999999889,20.96410949999999929,48.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Rozalińska, 7',52.24879709999999733,20.87720679999999974,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 52',52.34514990000000267,20.97678219999999883,46.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 56C',52.34602900000000147,20.97666459999999944,45.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Drożdżowa, 4H',52.32943879999999837,20.9746333000000007,50.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Romana Popiołka, 8',52.26377250000000174,20.92277879999999968,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Romana Popiołka, 46',52.26343959999999811,20.92242369999999952,36.0,1,24.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 48',52.23842220000000224,20.92019420000000096,23.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Grzymalitów, 21',52.3381563000000014,20.94119849999999871,46.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32U',52.33538579999999741,20.99357020000000062,35.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Dołowa, 5',52.32669169999999781,20.9642608000000017,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Duninów, 3',52.31871540000000209,20.97571680000000071,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Ciupagi, 13A',52.3351343,21.00451169999999834,40.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Siemiatycka, 3',52.22434979999999883,20.9025755999999987,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Chęcińska, 15',52.33394570000000101,20.95592449999999828,47.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Geodezyjna, 84',52.31111990000000133,21.08177909999999855,45.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Borecka, 6',52.32738539999999717,21.00896099999999934,60.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 5',52.22321740000000289,20.91660530000000051,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 67',52.31638850000000218,21.03710930000000089,39.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Prometeusza, 19',52.24868829999999776,20.90838079999999977,28.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Geodezyjna, 66B',52.30898200000000031,21.07379669999999905,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Geodezyjna, 71E',52.31188619999999645,21.0774101000000016,48.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fleminga, 40J',52.31979619999999898,20.97931990000000013,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 85',52.21695739999999831,20.90377360000000095,39.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 83',52.22565399999999869,20.9048665999999983,35.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 15R',52.35471480000000354,20.9757239999999996,37.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 269ZD',52.31581299999999857,21.02727959999999996,43.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 29D',52.3571347999999972,20.9763061999999998,35.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Bruszewska, 12',52.32485570000000052,21.02151299999999879,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Ceramiczna, 37B',52.32230760000000202,20.95911849999999888,48.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Eskimoska, 8',52.3105382999999975,21.05522519999999887,41.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cytadeli, 4',52.3415832000000023,20.99526459999999873,40.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 79B',52.33936630000000178,21.06550119999999993,57.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Czołowa, 38J',52.33476670000000297,20.9917447000000017,32.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 11K',52.33114100000000235,21.03858479999999887,47.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 5',52.33074200000000075,21.03489090000000061,50.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 1C',52.32618730000000084,21.07426399999999945,50.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 57G',52.36243929999999836,21.0485004999999994,52.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Majolikowa, 27K',52.32707779999999787,20.95320459999999941,52.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Marywilska, 19',52.30035879999999793,21.01079379999999829,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Małej Żabki, 27',52.3523235999999983,21.04364049999999863,60.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 372A',52.33812160000000091,21.03560549999999907,48.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Chlubna, 62',52.3586699999999965,20.96748450000000119,31.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 24B',52.32677979999999707,21.07805139999999966,52.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brzozowy Zagajnik, 9',52.34886900000000053,20.98133359999999926,40.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Brzozowy Zagajnik, 30',52.34936679999999854,20.98331080000000171,42.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 54',52.33389509999999945,21.02384980000000069,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Bukowska, 2',52.35159209999999775,20.92674050000000107,55.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Głębocka, 54H',52.31050739999999877,21.07186610000000115,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Książkowa, 44',52.32854180000000354,20.94757919999999985,47.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 14',52.34870240000000052,20.92559119999999951,57.0,2,34.5);
-INSERT INTO travel_info VALUES('ulica Książkowa, 48C',52.32833660000000008,20.94832269999999851,48.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Leśnej Polanki, 29',52.33381200000000177,20.95146689999999979,51.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Maluchów, 6',52.32882359999999978,20.95951189999999898,47.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Lewandów, 62',52.32224420000000009,21.07783110000000093,41.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Jasiniec, 30',52.31246409999999969,21.07672720000000055,48.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Odkryta, 46C',52.33394400000000246,20.93982189999999832,44.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 39',52.31799680000000307,21.04147959999999884,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jarzębinowa, 32',52.34709900000000004,21.06454760000000092,58.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Pasłęcka, 12',52.3329860999999994,20.94775329999999868,46.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Jasiniec, 68',52.31509350000000324,21.0756534000000002,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Marywilska, 34E',52.30768750000000011,21.01039679999999877,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Osiedle, 14',52.34853880000000003,20.94508569999999992,47.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Odłogi, 23B',52.33687720000000354,21.02084440000000143,58.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Młyńska, 17',52.33081440000000128,21.01734289999999917,61.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 164T',52.35427649999999745,20.99239160000000126,61.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Ornecka, 152N',52.34965160000000139,21.01461360000000055,64.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Osuchowska, 10',52.33264390000000076,20.95671150000000082,47.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 60I',52.3086196000000001,21.05298450000000087,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wiktorii Kaweckiej, 10',52.33091660000000189,20.99127319999999841,36.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Orchowiecka, 11E',52.34389709999999952,20.97561809999999837,56.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Kasztanowa, 27',52.30771899999999875,20.97815290000000133,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Perkusyjna, 13A',52.33363599999999849,20.99669349999999924,54.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Perkusyjna, 22',52.33288369999999646,20.99807440000000013,46.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Odkryta, 65B',52.33821379999999835,20.93627030000000033,50.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Kasztanowa, 2',52.30866129999999715,20.98128589999999961,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Osuchowska, 12F',52.3328501000000017,20.95635169999999903,47.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Jana Husa, 7',52.34771750000000167,20.9532859000000009,50.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Kartograficzna, 78D',52.31238510000000019,21.0772118000000006,49.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 141A',52.35347699999999805,20.98504600000000053,40.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Ogrody Przyjaciół, 68',52.3318343999999982,21.01852420000000166,58.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 162',52.3534415000000024,20.99231190000000069,61.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 42F',52.306664099999999,20.97628849999999901,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 159',52.31707229999999953,20.97405060000000177,35.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Ogrody Przyjaciół, 59',52.33221790000000339,21.01781769999999838,59.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Feliksa Pancera, 5',52.31975210000000231,20.94643680000000074,45.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 56S',52.30787070000000227,21.05525060000000081,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 202',52.32844089999999682,20.96838179999999952,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 19',52.30130319999999955,20.97838820000000126,39.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Międzyrzecze, 34',52.36173790000000138,21.0439393999999993,56.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Nowodworska, 18F',52.3223271999999966,20.94088800000000105,41.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Szynowa, 10',52.33103779999999717,20.9864865000000016,31.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Obrębowa, 52',52.36463640000000197,20.95488980000000012,47.0,1,39.0);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 110D',52.35725769999999813,21.03793389999999875,58.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 104A',52.3213811999999976,20.954192299999999,42.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 333A',52.34507119999999958,20.94949760000000082,46.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Claudia Monteverdiego, 5',52.3423000000000016,21.05354970000000137,47.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Reniferowa, 41B',52.30842830000000276,21.04842689999999906,40.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Szałasa, 15D',52.32141659999999917,20.97557760000000115,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Staropolska, 16',52.31174089999999666,21.04782559999999947,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Sprawna, 14J',52.34040650000000027,20.9408606000000006,48.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Sprawna, 16C',52.34112729999999659,20.94101369999999918,47.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 14C',52.29808969999999846,21.00302699999999945,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Myśliwska, 7',52.35180129999999821,20.98066499999999834,40.0,2,34.5);
-INSERT INTO travel_info VALUES('ulica Sieczna, 69A',52.3176696000000021,21.07662649999999971,51.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Podróżnicza, 5D',52.32594230000000123,20.97138749999999874,42.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Porajów, 3A',52.31478119999999877,20.96117269999999877,38.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Podróżnicza, 26',52.32982630000000057,20.97971920000000168,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Szałwiowa, 25',52.32373179999999735,20.98613930000000139,46.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 126D',52.31975599999999816,21.06005419999999973,38.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Skrzatów, 17',52.31491390000000052,21.03631910000000004,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 40B',52.31250310000000069,21.04753279999999905,41.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 57',52.35159939999999779,21.05309250000000177,51.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Szlachecka, 2',52.30938499999999892,21.0240298999999986,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 102E',52.36062009999999845,21.05471029999999999,52.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Rozewska, 19A',52.32066499999999821,20.97987930000000034,42.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Światowida, 14',52.3200708999999975,20.96840579999999932,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 96A',52.28508680000000197,20.89448670000000164,38.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Zręby, 3',52.33141239999999784,20.96349409999999835,41.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 70',52.2843593999999996,20.89819209999999928,37.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 150',52.28615959999999774,20.88560909999999993,38.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Płużnicka, 6D',52.3113864000000035,20.9706071999999999,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 34/34',52.28556220000000109,20.90297490000000024,40.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 165K',52.28470889999999827,20.8844928000000003,41.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Przydrożna, 43',52.32298289999999952,21.0293403000000012,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 29B',52.33156900000000177,20.94354510000000147,42.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 6C',52.32610739999999794,20.94538239999999974,44.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Podłużna, 34A',52.31910880000000219,21.07605420000000152,56.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Przeździecka, 9',52.33878059999999977,20.99085829999999931,34.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 152B',52.35201829999999746,21.03061759999999936,50.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Piknikowa, 125',52.33148889999999654,21.01660640000000057,60.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Piknikowa, 4',52.33103890000000291,21.01463850000000022,63.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 167E',52.35624810000000195,21.02494910000000061,51.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica gen. Milana Štefánika, 14C',52.3259572999999989,20.94439309999999921,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica gen. Milana Štefánika, 14B',52.32625230000000016,20.9444341999999999,44.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Arrasowa, 19',52.31146319999999861,20.92117000000000004,43.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 89',52.28423659999999984,20.89681149999999831,35.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Mieczysławy Ćwiklińskiej, 6D',52.33428200000000174,20.95431370000000015,53.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 18C',52.33980319999999864,21.03841369999999956,51.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Łanowa, 9',52.35543859999999939,20.93544509999999904,56.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Łuczywo, 8',52.3543416999999991,20.97705170000000052,33.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Łączna, 12A',52.35134469999999852,20.94094090000000107,51.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 135/7',52.28423039999999844,20.89057559999999824,42.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Piknikowa, 14',52.33106120000000061,21.01553820000000173,62.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Łazy, 14A',52.33554490000000214,21.02661039999999915,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Łączna, 1',52.34959190000000006,20.94179610000000124,48.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 27',52.31099489999999719,21.04594369999999869,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Pomorska, 19A',52.33012939999999702,20.96249680000000026,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Żywiczna, 24',52.32213010000000252,20.98116230000000115,43.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Reniferowa, 86',52.30826379999999887,21.05158760000000129,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 180A',52.28740969999999777,20.88047149999999875,40.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 96D',52.28616269999999844,20.89471560000000139,39.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Złotokwiatu, 21A',52.35789659999999657,21.04832329999999985,55.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 83Z/22',52.34439580000000091,21.06432279999999935,61.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Toruńska, 107A',52.30848739999999709,21.08178559999999991,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Żeglugi Wiślanej, 1',52.36082400000000092,21.03821849999999927,52.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Jana Żiżki, 14A',52.33758989999999756,20.96167739999999924,47.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Wielkiego Dębu, 4',52.30697579999999647,21.03155100000000032,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Włodzimierza Tetmajera, 11',52.3388288000000017,20.9972797,41.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Kolektorska, 30',52.27625009999999862,20.96838869999999843,24.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Widna, 5',52.35763089999999665,20.98752809999999868,46.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Wyganowska, 10A',52.35534169999999677,20.98665769999999852,45.0,2,35.5);
-INSERT INTO travel_info VALUES('ulica Pelplińska, 16',52.28185359999999804,20.97048540000000116,25.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Marymoncka, 75',52.28286049999999819,20.95631429999999896,27.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Wilkowiecka, 16B',52.34508749999999822,21.01950330000000022,57.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Warzelnicza, 28A',52.32828460000000347,21.04680039999999863,43.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Zbyszka z Bogdańca, 24',52.31123579999999862,21.0355205000000005,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Odysei, 12',52.30900969999999717,20.93439180000000021,38.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Chlewińska, 8',52.27692030000000045,20.96540780000000125,24.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Chlewińska, 6',52.27679570000000097,20.96555559999999829,24.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Królowej Jadwigi, 5D',52.30720459999999861,20.92438070000000038,39.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Klaudyny, 42',52.28460619999999893,20.97172510000000045,23.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Farysa, 37A',52.30571969999999738,20.93729749999999968,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Kleczewska, 90',52.28156769999999654,20.94598179999999842,22.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Farysa, 22D',52.30561190000000237,20.94059389999999965,41.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Magiera, 1',52.27066549999999979,20.95452039999999983,29.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Farysa, 42A',52.30750290000000291,20.93880610000000075,38.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Lektykarska, 36',52.28177970000000129,20.96708419999999861,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Pelplińska, 1B',52.28036900000000031,20.97037189999999996,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Nokturnu, 10',52.29608269999999948,20.91005859999999928,53.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Perseusza, 69',52.28131079999999998,20.90398310000000138,40.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Fontany, 34',52.27973870000000289,20.95152990000000059,22.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Ananasowa, 30',52.20687070000000318,21.06965459999999979,35.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Estrady, 116A',52.30111339999999843,20.88225669999999923,44.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Bluszczańska, 1',52.2091009000000028,21.07312819999999932,29.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Kasjopei, 47',52.28192680000000081,20.90550149999999974,39.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Kasjopei, 45',52.28192330000000254,20.90539649999999838,39.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Broniwoja, 5',52.1878998999999979,21.01918380000000041,18.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Farysa, 34',52.30629009999999824,20.93848099999999946,38.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Hieroglif, 9',52.30861819999999796,20.93305859999999897,39.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Hieroglif, 6A',52.30890730000000132,20.93284680000000008,39.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Jamki, 3',52.30925640000000242,20.91626079999999988,40.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Estrady, 33F',52.29989030000000127,20.87809560000000176,42.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Marymoncka, 12',52.27684010000000114,20.96292180000000016,22.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 85',52.29408339999999811,20.87860200000000077,42.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Heroldów, 23',52.30289979999999873,20.92914910000000006,36.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Blacharska, 1',52.17561729999999898,21.01626500000000064,24.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Zgrupowania AK „Żmija”, 2',52.26915569999999889,20.94028199999999985,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Akermańska, 7',52.18037340000000057,21.04978880000000175,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Gdańska, 14',52.27662349999999947,20.97087429999999841,25.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Stefana Żeromskiego, 4',52.27612609999999905,20.9579248999999983,20.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Witolda Gombrowicza, 17',52.28463490000000035,20.97023109999999946,25.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica św. Bonifacego, 146',52.19060329999999937,21.06662469999999842,38.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Zgrupowania AK „Żmija”, 3',52.26883670000000137,20.93990820000000142,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Edwarda Józefa Abramowskiego, 9',52.18418249999999859,21.01531519999999987,25.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica św. Bonifacego, 111B',52.18924719999999696,21.06480829999999927,40.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Tadeusza Gajcego, 7',52.29146279999999792,20.93383760000000037,32.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Bartycka, 77',52.20983209999999986,21.06430489999999978,34.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 28',52.27827090000000254,20.90480240000000122,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Konstruktorska, 3A',52.18538540000000125,21.0000764999999987,25.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Konstruktorska, 10D',52.18628520000000037,20.99093069999999984,28.0,1,18.0);
-INSERT INTO travel_info VALUES('Aleja Władysława Reymonta, 10C',52.2730530999999985,20.93569880000000082,32.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Płatnicza, 25',52.27658379999999739,20.94437810000000156,29.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Płatnicza, 38',52.27786700000000053,20.94508610000000103,27.0,0,24.0);
-INSERT INTO travel_info VALUES('Aleja Władysława Reymonta, 2',52.26937259999999697,20.9339063000000003,33.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Inspektowa, 3F',52.18619199999999836,21.03616949999999975,30.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Widokowa, 6B',52.30510819999999939,20.88166479999999937,49.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Władysława Smoleńskiego, 4A',52.28160580000000123,20.96577840000000137,28.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Przybyszewskiego, 64/68',52.28145260000000149,20.94413720000000012,25.0,0,25.0);
-INSERT INTO travel_info VALUES('Aleja Władysława Reymonta, 40',52.28252890000000263,20.94091299999999833,27.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Bernardyńska, 1',52.1933870000000013,21.07043940000000149,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Baboszewska, 6',52.19371619999999723,21.00359100000000012,22.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Starej Baśni, 3',52.27295840000000026,20.94372849999999886,34.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 14',52.27887779999999652,20.93414489999999973,27.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Gwintowa, 9',52.20848680000000285,21.08112399999999909,36.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 303R',52.29733759999999876,20.88540619999999847,48.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Konduktorska, 16',52.20170879999999869,21.02913350000000036,22.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Cypryjska, 43',52.17227630000000004,21.06021000000000143,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Króżańska, 2C',52.20203240000000022,21.01177099999999954,17.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Wazów, 28A',52.30834089999999748,20.91269259999999975,44.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Pułkowa, 46',52.30597740000000328,20.93362940000000094,29.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 170B',52.28459469999999954,20.91552659999999975,33.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Szepietowska, 9',52.27576729999999828,20.94489150000000066,29.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Radecka, 23',52.30612719999999883,20.92511539999999926,39.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Przy Agorze, 16B',52.29259520000000094,20.93783709999999943,29.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Rokokowa, 136C',52.28565909999999662,20.91264280000000042,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Wrzeciono, 63A',52.29150510000000195,20.94695400000000163,33.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Chełmska, 46',52.2021099000000035,21.03763329999999954,26.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Krasickiego, 12A',52.19189469999999887,21.02130209999999977,20.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Kierbedzia, 4',52.19849980000000044,21.0452836000000012,32.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Iwicka, 3',52.20361139999999978,21.04259760000000056,27.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Dywizjonu AK „Jeleń”, 12',52.2063459000000023,21.06485109999999849,29.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Gierymskiego, 17',52.20018670000000327,21.03469379999999945,23.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Ikara, 2',52.18596099999999894,21.02819410000000033,22.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Jazgarzewska, 10A',52.19980840000000199,21.03983159999999942,33.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Czerniowiecka, 4',52.18522719999999993,21.02761840000000149,24.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Pilicka, 54',52.19460949999999855,21.01831990000000161,23.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Racławicka, 30',52.19845959999999963,21.01442619999999906,15.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Postępu, 5',52.17456980000000044,20.99407700000000076,40.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Postępu, 11',52.17789810000000016,20.99606280000000069,31.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Cybernetyki, 19',52.17710340000000002,20.98943549999999903,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Polkowska, 11',52.20201730000000139,21.04743709999999979,29.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Olimpijska, 22',52.19336839999999711,20.99791929999999951,26.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Racławicka, 136',52.19800599999999947,20.98783819999999878,33.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Gimnastyczna, 8',52.19703179999999776,20.99936830000000043,23.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Jarosława Dąbrowskiego, 84A',52.20038569999999823,21.00718219999999903,20.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Kostrzyńska, 24',52.1882208000000034,21.07832319999999982,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Jarosława Dąbrowskiego, 82G',52.2007076000000012,21.00992480000000028,17.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Rodzynkowa, 3B',52.21413419999999662,21.07020479999999907,37.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 242',52.17357520000000192,21.01952029999999994,20.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Płyćwiańska, 14',52.1865772000000021,21.03025269999999835,24.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Polska, 14',52.20593350000000043,21.07421090000000063,40.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Olimpijska, 13',52.19312339999999751,20.99715499999999935,27.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Rolna, 169',52.17563379999999996,21.02620209999999901,22.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Goraszewska, 7E',52.18851329999999678,21.06856889999999894,42.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Olkuska, 9',52.1989175000000003,21.02211379999999963,23.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Powsińska, 72A',52.19168690000000054,21.05971050000000134,32.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 84',52.19886699999999991,21.02357380000000119,24.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Jana Karola Chodkiewicza, 1B',52.20256179999999802,20.99131510000000134,27.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Odolańska, 28',52.2008306000000033,21.01631199999999922,18.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Miączyńska, 21',52.19233700000000197,20.99774670000000043,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Rodziny Hiszpańskich, 8',52.18134520000000264,21.00628770000000146,30.0,1,17.5);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 132/136',52.20451909999999885,21.00992739999999869,17.0,0,11.0);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 20',52.18491600000000119,21.02002119999999862,21.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Orężna, 4',52.18523909999999689,21.06436040000000177,37.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Cisowa, 6',52.18562920000000104,21.03148579999999867,31.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Etiudy Rewolucyjnej, 24',52.19035850000000209,20.9897652999999984,41.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Puławska, 99A',52.19842289999999708,21.02433990000000108,20.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Modzelewskiego, 15',52.1727441999999968,21.01125100000000146,27.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Nadrzeczna, 15B',52.21175180000000182,21.07667610000000024,36.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Zelwerowicza, 57A',52.1797224999999969,21.05984360000000066,35.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Niedźwiedzia, 8D',52.17594799999999822,21.03333830000000048,29.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Miłobędzka, 14',52.19538550000000043,20.99239299999999986,26.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Miłobędzka, 5',52.19439789999999846,20.99146479999999926,27.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Nałęczowska, 11A',52.17804530000000085,21.06975999999999871,42.0,1,19.5);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 27',52.18458280000000115,21.01916990000000141,21.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Walerego Wróblewskiego, 25',52.18788380000000159,21.07927670000000119,44.0,1,19.0);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 47',52.18781479999999818,21.01728340000000017,18.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Ludowa, 10',52.20176200000000221,21.02722239999999943,24.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Obrzeżna, 4',52.17034040000000061,20.99841280000000054,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Bitwy Warszawskiej 1920 r., 3',52.21181359999999927,20.97353400000000078,29.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Jana Pawła Woronicza, 50',52.18932050000000089,21.00272830000000112,24.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Zawojska, 39',52.18157930000000277,21.05698280000000011,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Truskawiecka, 12',52.18111220000000116,21.0602526999999995,36.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Włoska, 1',52.20198750000000131,21.03146569999999826,25.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Sonaty, 6A',52.1704215999999974,21.02892040000000051,22.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 37',52.1780538000000007,21.02454439999999992,23.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Truskawiecka, 13A',52.18033020000000021,21.06012949999999861,35.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Altowa, 13',52.19991900000000129,20.96210900000000166,33.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Dorotowska, 9A',52.21331550000000021,20.97651559999999904,28.0,1,14.0);
-INSERT INTO travel_info VALUES('Aleja Wincentego Witosa, 31',52.19722039999999908,21.04995509999999825,35.0,0,15.5);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 97I',52.17301599999999696,21.04927500000000152,31.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Bajońska, 6A',52.22608410000000134,21.05845740000000177,23.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Byczyńska, 3',52.24661100000000146,21.10662969999999917,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 55E',52.20161559999999668,20.95640009999999976,41.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Jana Pawła Woronicza, 29',52.1884289999999993,20.99721399999999961,24.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Białobrzeska, 14',52.2110648000000026,20.97225119999999877,29.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Zakręt, 3',52.18979190000000301,21.06969150000000112,44.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Zalew, 3',52.18439620000000189,21.06258899999999912,36.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Sandomierska, 8',52.20674120000000328,21.01980310000000073,22.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Jana III Sobieskiego, 37',52.18561069999999802,21.05121330000000057,32.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Sękocińska, 16',52.22067599999999743,20.97755910000000056,25.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Szczęśliwicka, 33A',52.21443200000000217,20.97047999999999845,28.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica 21 Pułku Piechoty Dzieci Warszawy, 5A',52.2226715999999982,21.08316870000000165,32.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Sueska, 11',52.17271480000000138,21.05702520000000178,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 14A',52.17560009999999693,21.0239452,23.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 14',52.17554830000000265,21.02392950000000126,23.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Barwnicza, 15B',52.25013100000000321,21.1021995000000011,36.0,1,18.5);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 67A',52.17174370000000038,21.05363469999999993,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Jana Sibeliusa, 25',52.1902571999999978,20.99056320000000042,28.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Algierska, 23A',52.22233589999999737,21.07257849999999877,28.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Mińska, 25A',52.24909040000000004,21.05944639999999879,21.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Kurhan, 18A',52.21125390000000265,20.95558439999999934,29.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Żwirki i Wigury, 34',52.21217690000000288,20.98903359999999907,26.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Afrykańska, 14A',52.22695350000000047,21.071063800000001,29.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Afrykańska, 5A',52.22361990000000275,21.07028100000000138,26.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Biskupia, 14',52.23789089999999647,21.12210089999999952,36.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pandy, 7',52.2087456000000003,20.95696769999999987,32.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Lutniowa, 25',52.19927429999999902,20.96408660000000169,31.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Maszynowa, 8',52.20096230000000048,20.95161939999999844,42.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Motorowa, 10',52.23515530000000239,21.08135989999999894,24.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Andrzeja Krzyckiego, 3',52.21737989999999741,20.98988399999999999,22.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Lipska, 6',52.23640360000000271,21.04980529999999917,22.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Pruszkowska, 4',52.20156639999999726,20.98375340000000122,29.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Kwitnącego Sadu, 25',52.20925629999999984,20.95574089999999856,33.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Nowogrodzka, 59D',52.22516920000000339,20.99851579999999985,19.0,0,7.0);
-INSERT INTO travel_info VALUES('ulica Harfowa, 11',52.20117369999999824,20.96399960000000106,35.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Libijska, 11A',52.22392529999999767,21.0737300999999988,27.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Tadeusza Joteyki, 24',52.21990749999999793,20.97642390000000034,27.0,0,11.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 181B',52.21022020000000196,20.95212420000000008,28.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 335A',52.24582980000000276,21.06154069999999833,21.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Mikołajczyka, 8',52.23004929999999746,21.09845059999999962,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Drwęcka, 8',52.25511720000000082,21.08013790000000042,25.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Garwolińska, 3',52.24548310000000128,21.09081880000000097,26.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Lotaryńska, 48A',52.22614349999999917,21.06417390000000011,29.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Lotaryńska, 48',52.2264076000000017,21.06391580000000018,29.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Gorzelnicza, 7',52.24015109999999851,21.12534429999999829,40.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Gocławska, 10',52.24807599999999753,21.06376330000000153,21.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Murmańska, 21',52.2374245999999971,21.12872570000000038,36.0,0,17.0);
-INSERT INTO travel_info VALUES('Plac Tadeusza Kotarbińskiego, 1',52.22078719999999664,21.09942149999999827,34.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Kobielska, 32A',52.24733129999999904,21.08567980000000119,32.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Lubiniecka, 3',52.24396889999999872,21.10136729999999972,31.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Londyńska, 26',52.23803600000000102,21.06259760000000014,27.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Lubomira, 4A',52.24486650000000054,21.07708159999999964,28.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Janusza Meissnera, 8B',52.22363179999999972,21.08812169999999852,33.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Libijska, 14',52.22454650000000242,21.07405419999999908,28.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica gen. Augusta Emila Fieldorfa „Nila”, 41',52.2323627999999971,21.09463510000000142,28.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Walecznych, 9A',52.23496329999999688,21.04872680000000073,23.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Grochowska, 342',52.24733890000000258,21.05538500000000112,19.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Józefa Dwernickiego, 20',52.2507678999999996,21.08156269999999922,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Sztabowa, 16A',52.24234719999999755,21.11779140000000155,37.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Szaserów, 87',52.2465693999999985,21.10292319999999933,32.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Szaserów, 105',52.24720479999999868,21.10048610000000124,32.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Francuska, 11',52.23261289999999946,21.05472789999999961,20.0,1,10.0);
-INSERT INTO travel_info VALUES('ulica Genewska, 12B',52.22544280000000327,21.05753989999999831,21.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Grenadierów, 2',52.23717969999999867,21.08784089999999978,24.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 107',52.24138990000000148,21.10583259999999939,31.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Lotnicza, 11',52.23437789999999837,21.12388190000000065,33.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Krypska, 24',52.2419433999999967,21.08723750000000052,33.0,0,16.0);
-INSERT INTO travel_info VALUES('Plac Piotra Szembeka, 2',52.24285210000000034,21.10265100000000161,33.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Suchodolska, 6',52.24209259999999944,21.07574950000000058,28.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Tarnobrzeska, 5',52.23940650000000118,21.12798210000000054,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Tarnowiecka, 11',52.23666750000000291,21.10425839999999909,31.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Jugosłowiańska, 5',52.22217599999999749,21.10113929999999983,31.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Augusta, 3',52.2446538000000018,21.0735285999999995,24.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 147',52.24243090000000222,21.09892849999999954,31.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Filomatów, 57',52.23928360000000026,21.09472579999999909,32.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Tomasza Zana, 4',52.24377369999999843,21.10500850000000028,33.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Stoczkowska, 5',52.2432276999999985,21.10562799999999939,37.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Wspólna Droga, 1',52.24422779999999734,21.09518050000000145,27.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica ks. Jana Sztuki, 5',52.24430370000000323,21.10240010000000054,31.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Pustelnicka, 48A',52.2419077999999999,21.1006064000000002,33.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Obrońców, 6',52.23245639999999668,21.05027700000000123,24.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Osada Ojców, 3',52.23917360000000087,21.1245283999999991,41.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Olszynki Grochowskiej, 30',52.24101790000000278,21.12064180000000136,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Zamieniecka, 63',52.23966229999999911,21.10024689999999836,34.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Wiatraczna, 14',52.24687540000000041,21.08424069999999873,26.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Władysława Umińskiego, 3A',52.22515369999999991,21.10087880000000026,33.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Skaryszewska, 7',52.24899659999999813,21.04804910000000006,16.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Zbrojarska, 12',52.25451340000000044,21.11226729999999919,64.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Osada Ojców, 17',52.23800969999999922,21.12493600000000172,41.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Osada Ojców, 40',52.23622360000000242,21.1252804999999988,37.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Szkoły Orląt, 1',52.22721659999999844,21.1086443000000017,36.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Złoczowska, 4D',52.22503019999999907,21.06600740000000016,29.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Rusznikarska, 16',52.24978740000000243,21.10343749999999829,27.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Fiszera, 19',52.25831399999999861,21.16450049999999906,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Jana Nowaka-Jeziorańskiego, 10',52.23053290000000004,21.10988289999999879,34.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Okuniewska, 5',52.23894370000000009,21.09620049999999835,34.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 199',52.26420209999999856,21.12193209999999865,47.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 92',52.27331509999999782,21.15889669999999967,41.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Rzymska, 24',52.22334310000000101,21.06262650000000036,29.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Osowska, 85',52.24668830000000241,21.09304249999999926,33.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Prochowa, 30',52.24809659999999667,21.08490929999999964,29.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Obrońców, 7',52.23284060000000295,21.0506290000000007,24.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Płowiecka, 1',52.23545270000000328,21.12518719999999917,36.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Rumuńska, 28',52.22681519999999722,21.06250779999999879,28.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Józefa Chłopickiego, 80C',52.25771530000000097,21.12272360000000048,52.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Dąbrowszczaków, 8',52.26062309999999656,21.03217469999999878,23.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Białostocka, 9A',52.25753499999999719,21.04525250000000013,23.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Dwóch Mieczy, 3A',52.25297429999999821,21.16318589999999844,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Łukowska, 25',52.23777520000000151,21.10071290000000133,30.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Ząbkowska, 43',52.25542769999999849,21.04872359999999887,20.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica 11 Listopada, 4',52.25691390000000069,21.03370070000000069,16.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Ząbkowska, 40',52.25428889999999882,21.04645689999999903,18.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 98D',52.2524663000000018,21.1298825999999984,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jagiellońska, 17',52.25223729999999734,21.03414009999999834,17.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Stalowa, 34',52.2608587,21.04294249999999878,19.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 100',52.25246020000000157,21.12888729999999882,43.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Łochowska, 31',52.25946150000000045,21.05513889999999933,22.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Wybrzeże Szczecińskie, 6',52.24707440000000246,21.03200389999999942,26.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Dziewiarska, 29',52.2699690999999973,21.15029559999999976,40.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Targowa, 83A',52.25625639999999806,21.03243060000000142,16.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Złotej Wilgi, 10',52.22678259999999995,21.09546629999999822,35.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica mjr. Franciszka Michała Amałowicza „Tatara”, 19',52.25569509999999696,21.16037139999999895,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Podhalańska, 4',52.24870349999999775,21.12644420000000168,50.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Targowa, 85',52.25744470000000063,21.03176910000000178,18.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Mirska, 3',52.24536739999999924,21.13075309999999974,42.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Mieczysława Niedziałkowskiego, 8',52.25557729999999879,21.16878829999999923,34.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Środkowa, 20',52.26091939999999881,21.0400349999999996,20.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 52',52.24843500000000062,21.13230890000000173,44.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Józefa Chłopickiego, 98',52.25811259999999692,21.12649629999999946,49.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Witkiewicza, 10',52.27908790000000038,21.0146860999999987,29.0,1,19.0);
-INSERT INTO travel_info VALUES('Aleja gen. Antoniego Chruściela „Montera”, 42',52.25996370000000013,21.1630332999999986,28.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Pancerna, 2',52.26866859999999804,21.16290800000000161,46.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 3',52.2911629999999974,21.00142340000000018,30.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Płatnerska, 87',52.24697290000000293,21.17226319999999973,51.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Madziarów, 24A',52.26449889999999954,21.1551518999999999,38.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Tarchomińska, 11',52.25648520000000019,21.04708289999999949,22.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Płatnerska, 1B',52.24862809999999769,21.1663901999999986,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Michała Okurzałego, 8',52.26101609999999909,21.18049770000000009,38.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Republikańska, 15',52.25943420000000116,21.16889039999999866,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Roty, 21',52.26404079999999653,21.1555636999999983,40.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Licealna, 9',52.26722610000000202,21.16898760000000123,41.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Licealna, 41',52.26911059999999765,21.16567600000000126,45.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Listonoszy, 24',52.27113099999999691,21.16740640000000084,63.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Licealna, 70',52.27173959999999653,21.16279550000000143,54.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Szwedzka, 1',52.2602171999999996,21.0466520000000017,19.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Pontonierów, 5',52.26536560000000264,21.17592459999999832,43.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Jedwabnicka, 6A',52.24876609999999744,21.13368600000000085,44.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Gniazdowska, 24',52.28915599999999842,21.07013930000000101,31.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Kadrowa, 1B',52.26464620000000138,21.1692247999999985,52.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Franciszka Ilskiego, 62',52.25484449999999726,21.16808920000000071,34.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Jagodna, 1',52.2678243000000009,21.16044649999999905,61.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 143',52.27187719999999871,21.14884320000000173,55.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Instruktorska, 3',52.24691150000000305,21.17322190000000149,49.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 144F',52.27321520000000276,21.15229049999999945,61.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Magenta, 137',52.26999339999999706,21.15429160000000052,56.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Namysłowska, 6',52.26350130000000149,21.03530040000000056,28.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Masztalerska, 48',52.26789550000000161,21.14962609999999899,57.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Przedświt, 4A',52.25113319999999817,21.16332039999999993,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Masztalerska, 27',52.26543259999999691,21.15100909999999957,40.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kanonierska, 13',52.26753479999999997,21.157415799999999,58.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kordiana, 31',52.26125470000000206,21.15803590000000157,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Gliwicka, 5',52.28234710000000262,21.0665766000000012,28.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Konwisarska, 102',52.25786500000000245,21.18077620000000038,39.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Dyngus, 12',52.28386739999999833,21.06820129999999835,28.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Kuglarska, 4D',52.25612859999999671,21.15500390000000052,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Jerzego, 64A',52.27279490000000095,21.16270979999999823,54.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Konwisarska, 80',52.25796330000000011,21.17900769999999966,38.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Gontarska, 11B',52.255219799999999,21.12432730000000091,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Gontarska, 11A',52.25520149999999831,21.12419420000000159,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Gontarska, 14B',52.25503429999999839,21.1248894000000007,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Codzienna, 56',52.29106310000000235,21.06854570000000138,31.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Codzienna, 20A',52.28793309999999651,21.06529099999999843,26.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Hodowlana, 5',52.26887680000000102,21.05809319999999829,23.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Gilarska, 123',52.2817075000000031,21.05353369999999913,29.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 83',52.2711279000000033,21.16117970000000171,53.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Bajeczna, 14',52.28133079999999922,21.07248759999999877,28.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Zawiszaków, 17',52.25921840000000173,21.15433309999999878,28.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Smolarzy, 14B',52.28533060000000176,21.16575269999999876,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Borzymowska, 40',52.27624649999999918,21.04391400000000089,24.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Strażacka, 129',52.25986759999999976,21.15492989999999907,28.0,1,20.0);
-INSERT INTO travel_info VALUES('Aleja Sztandarów, 73',52.27464069999999908,21.17062779999999833,51.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Zawiszaków, 37B',52.26067580000000134,21.15840610000000054,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Protazego, 33',52.28616679999999662,21.06023000000000067,23.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Gilarska, 8',52.27707370000000253,21.06226300000000152,25.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Ułańska, 13',52.25892460000000028,21.17145860000000112,37.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Oliwska, 11CC',52.28203580000000272,21.0215886999999988,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Beczkowa, 12',52.26139990000000068,21.07975499999999868,30.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Szeroka, 47',52.25492229999999694,21.12073660000000074,51.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Bolesławicka, 5',52.28287069999999659,21.03132210000000057,31.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Szewska, 8A',52.27107960000000019,21.16372150000000118,55.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Szkutników, 33',52.25424269999999894,21.12693469999999963,45.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Piotra Bardowskiego, 2',52.27075880000000296,21.09466799999999864,39.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Szeroka, 136A',52.25597710000000262,21.12147879999999844,51.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Pszczyńska, 16',52.28595659999999868,21.07701679999999911,29.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 38CB',52.30166969999999794,21.05227179999999976,42.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 249',52.28757120000000213,21.07548919999999982,23.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Zesłańców Polskich, 98F',52.27168249999999717,21.14749249999999847,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Praska, 4',52.26812579999999997,21.04005749999999964,27.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Pohulanka, 9',52.27837290000000081,21.08771750000000011,29.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 238',52.28489239999999683,21.07415650000000084,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Remiszewska, 8',52.27026159999999778,21.05923200000000151,25.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 94A',52.266561099999997,21.05932920000000052,21.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Perłowa, 17',52.2823605000000029,21.08123660000000043,30.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Świetlicka, 31',52.25050259999999725,21.12663919999999962,48.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 175',52.27788910000000299,21.06733369999999895,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 141',52.27419830000000189,21.06414789999999825,21.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Strycharska, 35',52.26428289999999777,21.16561499999999896,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Rembrandta, 4A',52.28045459999999878,21.05069170000000157,27.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Czerwona Droga, 12',52.20240499999999884,20.86745780000000038,40.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Nauczycielska, 1A',52.28380400000000349,21.07408069999999967,32.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Nauczycielska, 23',52.28544329999999718,21.07542779999999994,33.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 85A',52.27116560000000333,21.1608117,53.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 156',52.27346099999999752,21.06491309999999828,20.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta III, 16',52.25050840000000107,21.16927109999999957,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Promienna, 38A',52.27386330000000214,21.07151100000000099,34.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Pszczyńska, 21A',52.2863149000000007,21.0767433000000004,29.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Pszczyńska, 30A',52.28819219999999746,21.07824829999999849,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Porannej Bryzy, 34',52.29045020000000221,21.05490460000000041,28.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Mroźna, 29',52.29068060000000173,21.07157369999999829,28.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Kanałowa, 42',52.29085859999999997,21.06560689999999881,32.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Lewinowska, 26',52.28397129999999749,21.07719140000000024,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Mleczna, 27',52.28815989999999659,21.06427790000000044,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Karminowa, 29',52.28286760000000299,21.0535433999999988,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Krakusa, 3',52.28963559999999689,21.01740990000000053,28.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Krakusa, 1',52.2921783999999974,21.02498699999999943,28.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Krzywińska, 5',52.28244959999999964,21.0304241999999988,29.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Motycka, 22',52.27574890000000351,21.04640829999999952,27.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Korzystna, 11/13',52.28847720000000265,21.06719440000000177,28.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Wyszogrodzka, 2',52.28828310000000101,21.03213470000000029,34.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Śmiałego, 21',52.20201000000000135,20.86339260000000095,42.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Samotna, 2',52.28952060000000301,21.07000120000000009,31.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Skrzypcowa, 3',52.28623410000000149,21.06720860000000072,28.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Tristana, 5',52.28538189999999731,21.05891490000000133,24.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Trocka, 4',52.27465730000000121,21.05949770000000143,24.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Trocka, 10A',52.27565839999999753,21.05504769999999937,18.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Leśniewska, 9',52.27809090000000225,21.06530989999999904,26.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica św. Jacka Odrowąża, 3C',52.27342050000000028,21.03081010000000006,25.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Leśniewska, 13',52.27820189999999912,21.0649476,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Safony, 4',52.29178410000000098,21.05848990000000143,30.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Staniewicka, 20',52.27700109999999967,21.02637149999999978,26.0,1,21.0);
-INSERT INTO travel_info VALUES('Plac Czerwca 1976 Roku, 3',52.2020786000000001,20.89208779999999877,45.0,1,21.5);
-INSERT INTO travel_info VALUES('Plac Czerwca 1976 Roku, 5',52.20175330000000002,20.89133059999999987,46.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Czerwona Droga, 20',52.20267969999999736,20.86726940000000142,41.0,0,26.5);
-INSERT INTO travel_info VALUES('Aleja Bzów, 35',52.18715890000000001,20.88628149999999906,52.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 75',52.19128169999999756,20.88004490000000147,37.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Róży Wiatrów, 5',52.28931889999999783,21.08190739999999863,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Henryka Sternhela, 9',52.28339059999999706,21.05771460000000061,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Józefa Czechowicza, 2A',52.19766200000000111,20.87689920000000043,38.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Aktorska, 5',52.19487999999999773,20.87688710000000114,37.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Dzieci Warszawy, 21H',52.19095020000000317,20.90814419999999885,44.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Zarębska, 8A',52.28642099999999716,21.06644119999999987,27.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Tużycka, 3',52.28278410000000064,21.07383210000000062,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zastępowa, 11',52.2908204000000012,21.07305649999999986,28.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica św. Wincentego, 82',52.27738300000000037,21.04368240000000157,24.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Siedzibna, 39',52.28303249999999736,21.02994079999999854,29.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Suchy Las, 20',52.1863028,20.88012940000000129,57.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Rakietników, 52',52.19249690000000185,20.8881541999999989,36.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Słupska, 32',52.18445530000000331,20.87988340000000064,49.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Skoroszewska, 7',52.18746829999999904,20.89733220000000102,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jana Vermeera, 1',52.27984010000000125,21.05105520000000041,28.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Regulska, 88',52.18377730000000269,20.86975779999999858,42.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Regulska, 4',52.19503339999999981,20.88199649999999963,31.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Wszeborska, 6',52.26553590000000326,21.07063420000000064,26.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Seledynowa, 20',52.28086499999999859,21.05526000000000053,28.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Henryka Rodakowskiego, 2',52.19613259999999855,20.88649170000000054,30.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Uznamska, 15',52.28978219999999766,21.08098980000000111,33.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Rydzyńska, 32',52.19747980000000353,20.89652369999999948,49.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Andrzeja Szomańskiego, 24A',52.18588900000000307,20.87740970000000118,47.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Wierna, 5',52.27268800000000226,21.08569089999999946,28.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica gen. Kazimierza Sosnkowskiego, 26',52.19301120000000082,20.88679169999999985,34.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Seledynowa, 44',52.28167580000000214,21.05512429999999924,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Kuźnicy Kołłątajowskiej, 23',52.18492570000000085,20.87785750000000106,48.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica II Armii Wojska Polskiego, 17A',52.18499789999999905,20.87902929999999913,59.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Imbirowa, 13',52.15224150000000236,21.06003409999999932,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Przemysława II, 30A',52.19865810000000294,20.86345969999999995,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Tomcia Palucha, 12',52.18792700000000195,20.8931672000000006,49.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Przemysława II, 24',52.19994359999999745,20.86393610000000009,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Przemysława II, 2',52.20324269999999701,20.86535419999999875,39.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Rakietników, 18',52.19597439999999722,20.89123239999999982,36.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Karola Taylora, 2A',52.19960100000000124,20.88171820000000168,35.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Wiosny Ludów, 71',52.19655829999999952,20.88660210000000105,30.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Władysława Syrokomli, 29A',52.28536609999999741,21.02800780000000102,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 14',52.18392639999999716,20.88123059999999853,60.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Piastowska, 3P',52.18826760000000319,20.87256209999999968,38.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Plutonu AK „Torpedy”, 21',52.1952641999999969,20.88945560000000157,34.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 54',52.13281479999999846,21.01201280000000082,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Ogniowa, 7',52.19907820000000242,20.88425219999999883,35.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 51F',52.11385949999999668,21.02423220000000014,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Królowej Bony, 49C3',52.19801460000000048,20.85825780000000051,50.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Akustyczna, 15',52.12829219999999709,21.01466050000000152,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Bekasów, 60',52.14966749999999963,21.02382360000000005,37.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Stefana Dembego, 8A',52.1297815,21.07568789999999836,40.0,0,30.5);
-INSERT INTO travel_info VALUES('ulica Stefana Dembego, 23',52.13447889999999774,21.07138529999999932,38.0,0,29.0);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 40',52.12663299999999822,21.01306230000000142,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Gżegżółki, 4',52.15006230000000186,21.02820970000000145,31.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Ibisa, 14',52.14167960000000334,21.01956759999999846,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 9BA',52.1200236999999973,21.01313190000000119,37.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 59',52.11532270000000011,21.02244770000000073,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Fosa, 37B',52.16968299999999915,21.04266900000000006,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Dezyderego Adama Chłapowskiego, 16',52.16456929999999659,21.03824390000000121,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Leszczyńskiego, 15',52.20461209999999853,20.8598649000000016,40.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Bokserska, 23',52.16759270000000014,21.00556359999999855,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bokserska, 71A',52.17087120000000055,20.99044680000000084,39.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Geologiczna, 12',52.18998330000000152,20.95553699999999964,39.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 72',52.20209539999999749,20.93134189999999962,35.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Smocza, 18',52.24680699999999689,20.98509079999999826,20.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Popas, 10A',52.16110549999999791,20.9391077999999986,52.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Batalionu „Miotła”, 8',52.23261980000000193,20.92097719999999939,24.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Budy, 7',52.24093129999999974,20.91977539999999892,24.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 16A',52.22477740000000068,20.91187439999999853,29.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jana Bułhaka, 4',52.25136049999999699,20.87342010000000058,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Wacława Borowego, 8',52.23024699999999854,20.911570600000001,28.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 22A',52.24953639999999667,20.87180449999999965,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 23A',52.24983960000000138,20.87249350000000092,58.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Himalajska, 18',52.25886770000000325,20.91487910000000027,32.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 4',52.25515229999999889,20.89335339999999875,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 89',52.22624119999999693,20.90603769999999884,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 58',52.2240013999999988,20.9055421999999993,37.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 8B',52.23668510000000253,20.8944864999999993,31.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 16A',52.23592229999999859,20.90708090000000041,28.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 5',52.24137720000000228,20.90244149999999834,33.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 61',52.2236175999999972,20.90485980000000054,38.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Kryształowa, 42',52.23266780000000153,20.9084146000000004,32.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Apoloniusza Kędzierskiego, 8',52.25232960000000304,20.91751010000000121,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 66A',52.22201539999999654,20.91230759999999833,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Księcia Bolesława, 5A',52.25395509999999888,20.93553359999999942,29.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Szczotkarska, 58',52.22250540000000285,20.91373180000000076,33.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 2E',52.2214254000000011,20.8950603000000008,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Romualda Millera, 12',52.25868590000000324,20.92011460000000156,29.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Gustawa Morcinka, 22',52.26002580000000108,20.92081999999999909,31.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Kazubów, 2C',52.24281959999999714,20.91350500000000067,24.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Kocjana, 70B',52.25234209999999991,20.88179900000000088,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Kontuszowa, 10',52.22012660000000039,20.90714690000000075,41.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Iskry, 47',52.25057230000000174,20.86954980000000149,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Legendy, 6B',52.23152710000000098,20.91271229999999904,25.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 2C',52.22132200000000068,20.89497229999999917,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Sochaczewska, 51',52.22000959999999737,20.87930190000000153,54.0,2,26.5);
-INSERT INTO travel_info VALUES('ulica Strawczyńska, 23',52.25163570000000134,20.87932299999999942,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Anecińska, 14',52.32897510000000096,20.96388170000000173,41.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Radiowa, 18',52.25008160000000145,20.91877639999999871,27.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Ambaras, 43',52.34242100000000164,20.99716499999999897,42.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Lustrzana, 18',52.21982690000000104,20.90412450000000178,41.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Marynin, 23A',52.24510889999999819,20.92475350000000134,25.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Na Wyraju, 7A',52.22188649999999655,20.88024079999999927,57.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Rostworowskiego, 28',52.26253570000000081,20.92416030000000048,33.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 14A',52.24283539999999704,20.90863759999999871,29.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 121',52.22045539999999875,20.90449660000000165,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 5',52.24175619999999754,20.90812060000000016,28.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Anilinowa, 6',52.34741079999999869,20.94633930000000178,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 16',52.26241199999999765,20.91684640000000072,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Synów Pułku, 5',52.22356289999999746,20.91971600000000108,26.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Skłoby, 19',52.2520877999999982,20.87798069999999839,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Skłoby, 6',52.25086389999999881,20.87785249999999949,38.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 34G',52.34205440000000209,20.97900569999999831,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Czeremchowa, 23',52.34403890000000103,20.95750059999999948,50.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Rzędzińska, 16A',52.23239730000000236,20.92186600000000141,24.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Głębocka, 56E',52.31060049999999962,21.06847540000000051,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 56A',52.3456760999999986,20.97638239999999854,45.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 63J',52.31567270000000036,21.03515450000000086,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 4',52.21862010000000253,20.90113489999999886,39.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Drożdżowa, 11',52.32951330000000211,20.97402470000000107,50.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Danusi, 25',52.31506060000000246,21.02852880000000013,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Orlich Gniazd, 4',52.25017359999999656,20.92056829999999934,30.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Oryszewska, 8',52.24958060000000159,20.87665799999999905,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Siemiatycka, 22',52.22592170000000066,20.90434000000000125,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 27C',52.35679040000000128,20.97553470000000075,34.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Calineczki, 38',52.35321880000000049,21.06366939999999843,62.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Danusi, 35B',52.31526379999999677,21.03164879999999926,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Podkowińska, 5',52.25121990000000238,20.87645889999999938,39.0,1,26.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 166',52.23559509999999762,20.91751830000000111,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Dębowa, 26',52.3631516000000019,20.95616770000000174,46.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Daniszewska, 30',52.31227760000000159,21.02817080000000161,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Danusi, 31E',52.31559239999999989,21.03030640000000062,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 64',52.32432860000000118,21.07225599999999944,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Czarnocińska, 34',52.33008120000000218,20.96854220000000169,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 17',52.32595160000000333,21.07675060000000044,51.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 15A',52.35531360000000233,20.9784164000000004,35.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Gladioli, 11A',52.34805920000000156,20.92935969999999913,61.0,2,34.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 5',52.33168049999999739,20.96933539999999851,43.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 261A',52.31418279999999755,21.02956939999999975,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Erazma z Zakroczymia, 1',52.31980420000000009,20.95287890000000175,39.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 380',52.34049050000000136,21.03398440000000136,51.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 7P',52.33149670000000241,21.0365947999999996,50.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 248',52.31956459999999965,21.03284289999999856,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Geometryczna, 5A',52.311321999999997,21.07171849999999936,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Gitarowa, 9',52.33210710000000176,20.99762339999999838,59.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Chudoby, 82B',52.33936709999999693,21.06828940000000116,56.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 101BD',52.33307450000000216,21.05153549999999996,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Konik Polny, 34',52.31901589999999658,21.0781205000000007,55.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Internetowa, 43G',52.3179394000000002,21.07453680000000062,49.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Marywilska, 11',52.29824860000000086,21.01238229999999874,26.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kabrioletu, 4',52.33389689999999917,20.96364499999999965,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Brzozowy Zagajnik, 18',52.34865760000000278,20.98153969999999902,40.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Chlubna, 27',52.35887819999999949,20.9601387999999993,39.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 159C',52.3258470000000031,21.08841569999999877,53.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Bieszczadzka, 16',52.34485569999999655,20.9753936000000003,57.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Marcina z Wrocimowic, 22',52.3436610999999985,20.93740030000000018,53.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 158C',52.30614589999999709,21.03184909999999875,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 38V',52.33551510000000206,20.9928132000000005,33.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 43',52.3313143000000025,21.04559340000000134,42.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Lewandów, 23A',52.32305190000000294,21.07159139999999909,40.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 61',52.3306703000000013,21.05678530000000138,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 10',52.35556890000000151,21.03126370000000022,50.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Jabłoni, 15',52.35210670000000021,20.97716570000000047,36.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 105A',52.33421820000000224,21.05373050000000034,51.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Insurekcji, 14',52.34381160000000221,20.9900285999999987,38.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Insurekcji, 1E',52.34289640000000076,20.98877200000000087,39.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Insurekcji, 4',52.34266310000000288,20.98922579999999983,38.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Mańkowska, 15C',52.347466500000003,21.04810150000000136,58.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Marmurowa, 8N',52.36433339999999959,20.94888459999999953,57.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Konwaliowa, 10A',52.30187279999999817,20.98672790000000177,32.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 30E',52.35795519999999926,21.03873749999999987,50.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Laurowa, 20B',52.30435210000000267,20.98223889999999869,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 123L',52.33571270000000197,21.04921129999999963,59.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Małego Rycerza, 12J',52.33267620000000164,21.03643440000000097,51.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 238',52.34171299999999861,21.04756640000000089,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 145B',52.32063349999999958,21.04735120000000137,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Oleńki, 11',52.33603480000000018,21.03729350000000053,46.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Hałabały, 4',52.31469369999999942,21.03756339999999981,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 229W',52.34028179999999964,21.04374909999999944,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Olesin, 148A',52.36399380000000292,21.06485500000000144,59.0,1,35.5);
-INSERT INTO travel_info VALUES('ulica Jasiniec, 37',52.31284099999999882,21.07614500000000035,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 72D',52.3109704000000022,21.05338659999999962,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Leszczynowa, 1',52.30468340000000182,20.98061410000000037,59.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Odkryta, 56A',52.33465609999999658,20.93753999999999848,48.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Odkryta, 44K',52.33298820000000262,20.9381358000000013,44.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 76A',52.31177310000000346,21.05288679999999957,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 144C',52.32112910000000027,21.05121719999999997,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Paavo Nurmiego, 55',52.30897120000000199,21.04920010000000019,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Na Przełaj, 16B',52.3591655999999972,20.98861360000000075,46.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Kroczewska, 45G',52.33744570000000351,21.07678359999999885,62.0,2,36.5);
-INSERT INTO travel_info VALUES('ulica Kołacińska, 10B',52.32151249999999721,20.97471099999999922,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Główna, 2A',52.35174179999999922,20.93819690000000122,55.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Główna, 12B',52.35222040000000021,20.94055690000000069,53.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Ogrody Przyjaciół, 67',52.33232399999999985,21.01812010000000086,59.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 95',52.31913060000000115,20.95724149999999852,40.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Ogrody Przyjaciół, 25',52.3329548000000031,21.01818219999999826,59.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Ogrody Przyjaciół, 15',52.33322419999999653,21.0186522999999994,58.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Obrazkowa, 14',52.31378850000000113,20.96995689999999968,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 247',52.33164709999999787,20.96487499999999927,39.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 179A',52.31881450000000199,20.97222839999999878,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 85C',52.31758109999999818,20.9577871999999985,38.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 76',52.35481049999999926,21.05400159999999943,51.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 118',52.31787190000000009,21.05900390000000044,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 120',52.31819010000000247,21.05872949999999832,35.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Pochyła, 8',52.34374199999999889,20.94736490000000017,49.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Sortowa, 8A',52.34955010000000186,20.94062389999999851,51.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Stasinek, 20',52.35869069999999681,20.93424320000000093,63.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Piwoniowa, 20A',52.35458189999999946,20.97492869999999954,31.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Nowodworska, 14E',52.32201419999999815,20.94090950000000006,41.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 166K',52.35431849999999799,20.99093969999999842,59.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 226',52.33344739999999718,20.96405830000000137,42.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 25',52.30314589999999698,20.98912460000000024,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 181A',52.35890400000000255,21.02710739999999844,53.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Porajów, 4',52.31352319999999879,20.95944559999999867,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Pomorska, 7A',52.32882130000000131,20.96074510000000046,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Starego Dębu, 4',52.34849299999999773,20.97968189999999922,37.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Sieczna, 5',52.31493139999999898,21.06817540000000121,49.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Sprawna, 14G',52.34041859999999958,20.94016560000000026,48.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Słonecznego Poranka, 59',52.33880529999999709,21.07951519999999946,67.0,2,33.0);
-INSERT INTO travel_info VALUES('ulica Szamocin, 26W',52.34780330000000247,21.02197119999999942,56.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Szamocin, 26P',52.34797100000000114,21.02139229999999869,57.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Srebrnogórska, 37',52.3300188999999989,20.98388980000000003,34.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 80',52.28462780000000265,20.8966864000000001,36.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 157/6',52.28528969999999987,20.88558060000000082,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Ziołowa, 43',52.33731039999999979,20.99308539999999823,34.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Przydrożna, 26A',52.31934640000000058,21.03018610000000166,43.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Polnych Kwiatów, 56',52.34910930000000206,20.97888490000000061,40.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Skuterowa, 1',52.32904860000000013,20.97675819999999903,45.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Śpiewaków, 13',52.33314990000000221,20.99133760000000138,34.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Przy Kanale, 5',52.33969729999999743,21.03020559999999861,44.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Podłużna, 30A',52.3193708000000015,21.07465759999999832,56.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 146A',52.34993359999999996,21.03031980000000089,47.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 58A',52.35142890000000193,21.05382919999999914,51.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Poetów, 29',52.34300509999999918,20.95059030000000178,43.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Bajana, 8',52.27463399999999894,20.9359611000000001,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Przyjazna, 9',52.31950820000000135,21.03442539999999994,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Bajana, 31B',52.27475110000000313,20.9317896999999995,34.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 13B',52.33764049999999913,20.98565239999999932,29.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Piknikowa, 91',52.33126610000000056,21.01547599999999961,62.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Łuczywo, 4',52.35408429999999669,20.97583799999999954,32.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Poetów, 10K',52.3373868999999985,20.94823799999999992,49.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 108A',52.34046539999999937,21.02988819999999847,45.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 72',52.31710730000000353,21.04501610000000156,43.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Uczniowska, 22A',52.32990759999999853,20.97246799999999923,47.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 165B',52.28578890000000001,20.88461570000000122,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Wielkiego Dębu, 5',52.30733260000000228,21.03152839999999913,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Weteranów, 14G',52.32180689999999857,20.98467259999999968,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wojdyńska, 49',52.35073700000000229,21.08205209999999851,68.0,2,36.0);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 58B',52.34335060000000083,20.99398379999999876,36.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 17',52.33827399999999841,20.98556980000000038,30.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Waligóry, 1D',52.3269231000000019,20.99951139999999939,57.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Żeglugi Wiślanej, 11A',52.36070349999999963,21.03444530000000157,56.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Zyndrama z Maszkowic, 6B',52.32843780000000322,20.99484939999999967,44.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 69H',52.32146660000000082,21.03515499999999961,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Jana Żiżki, 14B',52.33766229999999809,20.96176469999999981,47.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Mariana Wyrzykowskiego, 1',52.33565279999999831,20.95144230000000007,52.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Wojdyńska, 48A',52.34946779999999933,21.08150979999999919,71.0,2,36.5);
-INSERT INTO travel_info VALUES('ulica Zaułek, 22',52.32640680000000088,21.06646260000000125,42.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Zawiślańska, 25',52.35401060000000228,20.9739557000000012,32.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Muzealna, 15',52.30635399999999891,20.93410950000000171,30.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Muzealna, 10',52.30673159999999911,20.9341544000000006,34.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Lektykarska, 7',52.27949230000000113,20.96761319999999885,28.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica płk. Mieczysława Niedzielskiego „Żywiciela”, 2E',52.26726779999999906,20.94140489999999843,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Giuseppe Verdiego, 13',52.3443146999999982,21.054337799999999,47.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Lisowska, 28',52.27736070000000268,20.95097200000000015,26.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Wyganowska, 1',52.35523020000000116,20.98346099999999836,42.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Marii Pawlikowskiej-Jasnorzewskiej, 6',52.27723420000000231,20.95717519999999822,21.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Warzelnicza, 29A',52.32891169999999903,21.04673090000000001,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Wiśniowy Sad, 17',52.31364680000000078,21.02683389999999975,38.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Zbytki, 10B',52.34322889999999973,20.94010769999999865,53.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Zarzecze, 10',52.29943500000000256,20.98799670000000006,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Chabrowa, 4',52.28407070000000089,20.9040619999999997,36.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Farysa, 32',52.30634469999999681,20.93905349999999999,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Cząstkowska, 28',52.28103289999999959,20.96796080000000017,30.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Jana Kochanowskiego, 45',52.27015500000000258,20.93856590000000039,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Osikowa, 7',52.27313910000000163,20.91884149999999921,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jana Kochanowskiego, 11',52.26627529999999667,20.95225689999999829,35.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kleczewska, 103',52.28205200000000019,20.94616470000000063,22.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Pasymska, 7M',52.30512329999999821,20.92672179999999927,37.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Lisowska, 47',52.27953420000000051,20.95216389999999861,23.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Dankowicka, 22C',52.3094352000000029,20.91294119999999879,41.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Buska, 6',52.17722460000000239,21.06864630000000104,43.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Bluszczańska, 3D',52.20897570000000342,21.07264340000000046,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 1A',52.27516169999999818,20.90693200000000118,39.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Cegłowska, 32',52.28243520000000188,20.95592879999999881,26.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Groteski, 3',52.29775370000000123,20.87982219999999956,43.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Bartycka, 173',52.21250040000000325,21.05176180000000131,28.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Jamki, 30',52.31197879999999856,20.91210859999999983,42.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Jamki, 32',52.31202489999999728,20.91202589999999973,42.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Kwitnąca, 5',52.27478229999999826,20.9174433999999998,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica św. Bonifacego, 150',52.19079719999999867,21.06674639999999954,38.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 7',52.27497790000000321,20.90586770000000172,39.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ananasowa, 48',52.20764510000000058,21.06800679999999915,35.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Hajoty, 48',52.27796889999999764,20.95245450000000176,26.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Bohdziewicza, 27',52.28121629999999698,20.96842300000000137,31.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica św. Bonifacego, 10',52.17748710000000045,21.04898310000000094,32.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Efraima Schroegera, 83',52.28027289999999994,20.94400860000000008,25.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Irysowa, 18',52.17570189999999997,21.01828310000000144,23.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Biały Kamień, 8',52.20650919999999929,20.99685970000000169,20.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Sokratesa, 4',52.28201969999999932,20.92638859999999923,34.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Prozy, 19A',52.30607229999999675,20.9415419000000007,40.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Korczyńska, 10',52.19047859999999873,21.05142220000000108,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Przytyk, 3',52.28915839999999804,20.93858870000000038,26.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Bogumiła Zuga, 32B',52.28389169999999809,20.95083530000000139,25.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Widokowa, 7',52.30588910000000169,20.88180189999999926,48.0,1,33.5);
-INSERT INTO travel_info VALUES('Aleja Słowiańska, 10C',52.27679690000000078,20.96704049999999953,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Władysława Smoleńskiego, 1D',52.28046410000000321,20.96693169999999995,27.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Bełdan, 2',52.17165049999999838,21.01060530000000171,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Czerniakowska, 26',52.2021127000000007,21.05071530000000024,29.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 303H',52.29797889999999683,20.88531790000000043,46.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Rodziny Połanieckich, 48',52.27805250000000114,20.91151320000000169,43.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Swarzewska, 70',52.27839939999999786,20.95398979999999866,23.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Włodzimierza Perzyńskiego, 10',52.27305679999999911,20.95368729999999857,29.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Perseusza, 29',52.2822650999999965,20.9036350000000013,38.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Pęcicka, 16',52.27987639999999914,20.97008280000000013,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Przybyszewskiego, 16',52.27660410000000013,20.9419512999999995,26.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Gimnastyczna, 9',52.19677639999999741,20.99884120000000109,24.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Artura Grottgera, 25',52.20503140000000286,21.0282291999999984,24.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Artura Grottgera, 17',52.20521010000000217,21.02947019999999866,24.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Iwonicka, 27',52.17794090000000295,21.06365620000000049,40.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Kątna, 9E',52.20752749999999765,21.07293080000000174,40.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Klarysewska, 15A',52.17917880000000252,21.06930679999999967,43.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Gimnastyczna, 80C',52.19784450000000219,20.9941791000000002,26.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Artura Grottgera, 9',52.20538030000000162,21.03067349999999891,26.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Koronowska, 13',52.19082800000000332,21.06783920000000166,38.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Kątna, 19',52.20779509999999846,21.07250600000000062,40.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Fryderyka Joliot-Curie, 9',52.19130429999999877,21.01016759999999906,22.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Koronowska, 15',52.19092090000000183,21.06741810000000114,38.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Kielecka, 18',52.20336840000000222,21.00624110000000044,20.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Opoczyńska, 12',52.2066188000000011,21.00598049999999973,14.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Racławicka, 4',52.20022620000000301,21.02243040000000107,24.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Humańska, 9',52.20824580000000025,21.02488260000000154,21.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Dominikańska, 13C',52.17466050000000166,21.03535929999999965,26.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Dominikańska, 19A',52.17591759999999824,21.03484860000000011,30.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Cypryjska, 8',52.17302600000000012,21.05942459999999983,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Racjonalizacji, 10',52.18770419999999888,20.99453049999999977,27.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Rodzynkowa, 26',52.2140369999999976,21.07199560000000104,38.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Rodzynkowa, 7',52.21455079999999783,21.07019409999999837,39.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Egejska, 17A',52.17981549999999658,21.05584299999999943,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Goraszewska, 11',52.18820869999999701,21.06791769999999886,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Polska, 17B',52.20672919999999806,21.0755820000000007,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Cieszyńska, 4',52.18302280000000337,21.02806950000000085,22.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Goraszewska, 22',52.18778110000000225,21.06657470000000031,40.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Daktylowa, 13',52.2110264000000015,21.0689801999999986,35.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 25A',52.20916170000000278,21.02177199999999857,18.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Rakowiecka, 33',52.20828379999999669,21.01300309999999883,22.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Olimpijska, 40',52.19332610000000016,20.99689719999999938,27.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Adama Naruszewicza, 12A',52.19170640000000105,21.02175709999999853,20.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 128',52.19302179999999681,21.02401820000000043,24.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 24A',52.20664899999999876,21.02203310000000159,23.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Macedońska, 5',52.17469770000000295,21.04819450000000102,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Noskowskiego, 20',52.17277080000000211,21.03711350000000024,24.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Niegocińska, 3',52.17445459999999713,21.00846050000000176,29.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pułku AK „Baszta”, 2C',52.1915547999999987,21.00680290000000027,26.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Adama Naruszewicza, 14A',52.19164440000000126,21.02141250000000027,20.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Okrężna, 26',52.18282549999999987,21.07073009999999868,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Rymanowska, 26',52.18204740000000185,21.07130799999999837,41.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Podbipięty, 51',52.17686020000000013,21.02839579999999841,24.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Limanowskiego, 28',52.19016500000000036,21.05449550000000159,40.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Odolańska, 48',52.20035130000000123,21.01361539999999906,15.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Okrężna, 109',52.18357970000000278,21.06320459999999884,38.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Niedźwiedzia, 47',52.1769488999999993,21.02065320000000171,21.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Józefa Madalińskiego, 15',52.20479699999999923,21.01955369999999946,21.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Modra, 92B',52.17851579999999956,21.01784380000000141,25.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Malczewskiego, 40W',52.19377049999999941,21.01601229999999987,20.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Mariana Zdziechowskiego, 6',52.18482029999999839,21.01153700000000057,26.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Mariana Zdziechowskiego, 9',52.18453329999999824,21.01010480000000057,28.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Malczewskiego, 31',52.1935075000000026,21.01794320000000126,21.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Modzelewskiego, 73',52.19146800000000041,21.01313130000000129,25.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Macedońska, 1',52.17464569999999924,21.04843059999999966,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Narbutta, 45',52.20519139999999681,21.01243099999999942,18.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Jana Pawła Woronicza, 34A',52.18923399999999902,21.01346530000000001,18.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Sobieszyńska, 31',52.19874519999999763,21.03996499999999869,31.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Jana Pawła Woronicza, 46',52.18933690000000069,21.00455679999999959,24.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Wołoska, 68A',52.19609719999999698,21.00247110000000105,18.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Sandomierska, 5/7',52.20645549999999702,21.01961109999999878,22.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Altowa, 26A',52.19907280000000326,20.96267680000000055,31.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Śpiewu Ptaków, 6',52.1838503999999972,21.03824200000000033,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Zapachu Bzu, 16',52.18323010000000294,21.03746969999999906,34.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Wołodyjowskiego, 48',52.17571180000000197,21.02268139999999975,25.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Jana III Sobieskiego, 43',52.18799690000000168,21.0487012,30.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Żwirki i Wigury, 45A',52.20042730000000119,20.98329820000000012,29.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Różana, 44',52.201788999999998,21.0118589,17.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 32',52.17740009999999984,21.02463579999999865,23.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Bora-Komorowskiego, 39',52.22562839999999796,21.08100809999999825,27.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Alzacka, 8',52.22575510000000065,21.06548869999999952,29.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Jana Sibeliusa, 39',52.19063469999999683,20.99055170000000103,31.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Spartańska, 1B',52.19200370000000077,20.9950417999999992,25.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Słoneczna, 18',52.20787760000000332,21.02571089999999999,21.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Wiktorska, 91',52.19778850000000147,21.00620190000000064,19.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Wołoska, 27',52.19118850000000264,21.0012162999999994,23.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Taśmowa, 5',52.17941330000000021,20.98915579999999892,37.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zakręt, 10',52.18946960000000245,21.06843860000000034,43.0,1,17.5);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 43B',52.17152089999999732,21.05868050000000124,33.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Bora-Komorowskiego, 6A',52.22416270000000082,21.10074339999999893,33.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Berezyńska, 15',52.23603849999999938,21.05145740000000031,24.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Ukryta, 16',52.19459160000000252,20.99091960000000157,32.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Berezyńska, 12',52.23580979999999841,21.04980439999999931,23.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Barwnicza, 8',52.24951829999999831,21.1021402000000009,35.0,1,18.0);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 213',52.21384129999999857,21.00457289999999944,20.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Koprzywiańska, 18',52.2402288999999982,21.11962829999999868,38.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Nieborowska, 15',52.21599319999999978,20.97665059999999926,27.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Gorlicka, 1',52.19521509999999865,20.97978769999999927,31.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Adolfa Pawińskiego, 22',52.2041825000000017,20.9754271999999986,39.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Augustyna Kordeckiego, 79',52.24532810000000182,21.09223679999999845,28.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Siewierska, 18',52.21379780000000181,20.97476049999999858,32.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Ateńska, 57',52.22541919999999749,21.0671640999999994,26.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Bułgarska, 20A',52.22600510000000184,21.06196819999999903,25.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Bułgarska, 17',52.22580179999999928,21.06209039999999888,28.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Władysława Korotyńskiego, 26',52.20125740000000291,20.97439830000000071,39.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Afrykańska, 2A',52.22238480000000038,21.07156820000000153,27.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Algierska, 5',52.2229165999999978,21.07792690000000136,33.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Marokańska, 1W',52.22306859999999773,21.07851580000000169,34.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Opaczewska, 58',52.2122288999999995,20.96333119999999895,32.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Lipska, 4',52.23638340000000113,21.04930009999999996,23.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Kwitnącego Sadu, 27',52.2093478000000033,20.95571139999999843,33.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Filipinki, 7',52.20863090000000283,20.95384140000000173,32.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Rokosowska, 12R',52.21534780000000353,20.9710238000000011,29.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Kresowa, 3A',52.23911879999999997,21.12985989999999959,35.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Mińska, 71A',52.25204860000000195,21.07158250000000166,24.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Marsa, 13A',52.23621109999999846,21.12889510000000115,36.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Kutnowska, 12',52.23920799999999787,21.08922529999999896,29.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Indyjska, 19',52.22705189999999931,21.06293940000000119,28.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Kinowa, 25',52.24387029999999755,21.07055790000000072,27.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Komorska, 55',52.24153650000000226,21.10327440000000009,32.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Katowicka, 9',52.23225109999999916,21.05204960000000014,19.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Wąchocka, 1I',52.22764209999999708,21.05657809999999941,23.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Zwycięzców, 21',52.23150530000000202,21.05503080000000082,17.0,1,9.5);
-INSERT INTO travel_info VALUES('Aleja Jerzego Waszyngtona, 100',52.24256689999999992,21.07494600000000062,27.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Jordanowska, 12',52.23799700000000001,21.12839969999999923,37.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Jarocińska, 22',52.23972679999999969,21.10515769999999947,38.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Władysława Umińskiego, 16C',52.22692210000000301,21.09805860000000167,34.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Styrska, 27',52.23985989999999902,21.1174868999999994,36.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Filomatów, 37',52.23813100000000275,21.09418529999999948,30.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Wspólna Droga, 13',52.24708840000000265,21.09644339999999829,32.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Murmańska, 31',52.23862650000000229,21.13007659999999888,34.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Osada Ojców, 7',52.23894200000000154,21.12460889999999835,41.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Osiecka, 53',52.24086559999999935,21.10615400000000008,32.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Podskarbińska, 8B',52.24907679999999744,21.07531609999999844,26.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Ostrobramska, 86',52.23502049999999742,21.09921110000000156,26.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Nubijska, 1',52.22420470000000136,21.06982879999999981,27.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 142',52.24313529999999873,21.1000097999999987,29.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Zbaraska, 3',52.2438465999999977,21.07258009999999971,26.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Władysława Umińskiego, 6',52.22562599999999833,21.10204960000000085,34.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Zagójska, 9',52.24020769999999914,21.09333439999999982,31.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Walecznych, 50',52.23530259999999715,21.0582564000000012,23.0,1,10.0);
-INSERT INTO travel_info VALUES('ulica Zamieniecka, 17',52.23521749999999742,21.09741809999999874,27.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Szaserów, 61C',52.24548020000000292,21.10738320000000101,33.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Fiszera, 23',52.25814820000000082,21.16540379999999999,29.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Olszynki Grochowskiej, 58',52.24270039999999682,21.12052600000000169,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Prochowa, 25',52.24785080000000192,21.08654209999999907,31.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Serocka, 50',52.24855230000000005,21.10354359999999829,36.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Serocka, 41',52.24771350000000325,21.10186390000000146,34.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Serocka, 55A',52.24946930000000122,21.10374300000000148,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Pułtuska, 13',52.2454722000000018,21.09819189999999978,32.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Serocka, 27',52.2459130000000016,21.10046940000000149,36.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Rożnowska, 7',52.24025919999999701,21.12369299999999939,42.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Pabianicka, 51',52.23934520000000247,21.12212020000000123,36.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Józefa Chłopickiego, 74D',52.25716340000000315,21.1187913000000016,56.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 111C',52.25332079999999735,21.12712360000000089,44.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Bombardierów, 16',52.26374400000000264,21.16235749999999883,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Agrarna, 16',52.25116659999999769,21.12713219999999836,46.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Białostocka, 20',52.25469900000000222,21.03968349999999888,16.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Dwóch Mieczy, 50',52.25029289999999805,21.17054189999999992,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Łukowska, 50',52.23965249999999827,21.09611650000000082,34.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Zaokopowa, 3',52.25776319999999942,21.03789310000000157,19.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Białostocka, 36',52.2569275000000033,21.0464373000000009,22.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Kijowska, 2',52.24988869999999964,21.04429409999999833,16.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Łochowska, 12',52.25721500000000219,21.05338839999999934,22.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Łomżyńska, 6',52.25932579999999917,21.0530854000000005,22.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Łomżyńska, 35',52.26209800000000171,21.05830290000000104,29.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Panieńska, 1A',52.24949629999999701,21.02825340000000053,17.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica 11 Listopada, 15',52.26342710000000124,21.03786750000000083,20.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 146C',52.2569203999999985,21.12868950000000012,47.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kawęczyńska, 9',52.25611049999999836,21.05154609999999949,21.0,1,14.0);
-INSERT INTO travel_info VALUES('Aleja „Solidarności”, 15',52.2575938000000022,21.04223329999999948,21.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Żupnicza, 28',52.25273709999999739,21.06952420000000003,23.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Łukowska, 2A',52.2369168999999971,21.11209690000000094,37.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Agrarna, 11A',52.25132260000000172,21.12599780000000038,47.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Floriańska, 14',52.25231620000000276,21.03067619999999848,17.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 147/149A',52.27206960000000179,21.14837689999999882,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 11B',52.24355109999999769,21.10832489999999951,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Płatnerska, 2',52.25423469999999782,21.15611499999999979,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Płatnerska, 2A',52.25375900000000228,21.15671680000000166,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 114',52.27028200000000168,21.15086499999999959,39.0,2,19.5);
-INSERT INTO travel_info VALUES('ulica Liryczna, 24A',52.25967320000000171,21.18240420000000057,41.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Pielgrzymów, 16',52.26166889999999655,21.16308859999999825,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Niepołomicka, 31A',52.24718299999999971,21.13576570000000032,43.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Niepołomicka, 33',52.24724100000000248,21.13603189999999899,43.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Niepołomicka, 18',52.24626920000000041,21.13247339999999852,41.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Szwedzka, 43',52.26573789999999776,21.04069140000000004,21.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Mokry Ług, 85',52.28635789999999873,21.17210109999999901,55.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 60A',52.24752050000000025,21.11081220000000159,26.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 161',52.27349319999999722,21.14749850000000108,58.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Józefa Szanajcy, 16A',52.26311830000000213,21.03023609999999977,28.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Władysława Szernera, 5',52.28108579999999961,21.01335740000000029,36.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 52',52.24682949999999693,21.11079660000000046,34.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 8A',52.2593609999999984,21.15346419999999838,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kapitańska, 9A',52.27323619999999949,21.16909800000000175,51.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Kacpury, 75',52.25581650000000166,21.17170189999999863,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Księcia Witolda, 30',52.2490614000000022,21.16876939999999862,43.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Pociskowa, 5',52.25595040000000324,21.15786879999999926,23.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Magenta, 102A',52.26731749999999722,21.14789539999999946,55.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Giermków, 38',52.24972230000000195,21.16948849999999994,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Namysłowska, 9',52.26330560000000247,21.03368019999999917,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Nieporęcka, 14',52.2565427999999983,21.04645730000000014,21.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Objazdowa, 1',52.25738179999999745,21.06169960000000074,33.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Gliwicka, 27',52.28573719999999981,21.06503079999999884,24.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Gliwicka, 19',52.28438489999999917,21.06592859999999945,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 7/11',52.25973969999999725,21.15337840000000113,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 79A',52.26412659999999733,21.16653769999999924,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Drewnowskiego, 4',52.28388429999999687,21.0534953999999992,29.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Licealna, 61B',52.27061859999999883,21.16348550000000017,63.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Haubicy, 9',52.26102499999999651,21.1674824000000008,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Księcia Witolda, 59',52.24842600000000203,21.17149489999999901,51.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Gawędziarzy, 27D',52.25970449999999801,21.16348659999999882,29.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Figara, 6',52.28436599999999857,21.06152640000000176,19.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Codzienna, 38',52.28990799999999695,21.06725739999999903,29.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Rękawicznicza, 6',52.27540290000000311,21.17003839999999926,52.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Bratka, 4B',52.2862095999999994,21.0622985000000007,24.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Licealna, 74',52.27172180000000167,21.16218280000000007,54.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Codzienna, 50',52.29076289999999716,21.06871359999999883,32.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Giermków, 22',52.25065560000000175,21.16665280000000138,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Penelopy, 28',52.29123849999999863,21.06433120000000159,34.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Regatowa, 3A',52.28819200000000222,21.07194799999999902,33.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Strażacka, 106',52.25868779999999703,21.15627660000000177,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Stelmachów, 23',52.25591299999999962,21.12554629999999989,47.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Strażacka, 53',52.25911330000000276,21.12948079999999962,52.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Strażacka, 149',52.25899720000000314,21.15978580000000165,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Bolesławicka, 25',52.28535490000000152,21.02958720000000171,30.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Szewska, 19',52.27264879999999892,21.16555749999999846,53.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Barkocińska, 15',52.26851649999999694,21.0565289,21.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Gilarska, 143',52.28254629999999992,21.05308989999999981,28.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Gołębia, 16',52.2889484999999965,21.06236020000000053,28.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Horodelska, 12A',52.27257519999999858,21.03891000000000134,24.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Oszmiańska, 5',52.26697829999999812,21.04457599999999929,24.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta III, 1',52.24891339999999929,21.16689829999999973,41.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Płońska, 41',52.28401149999999831,21.08039039999999887,30.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Zesłańców Polskich, 100C',52.27173739999999925,21.14695019999999915,55.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Remiszewska, 16',52.2713401000000033,21.05667659999999942,23.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 129D',52.27119739999999837,21.06188069999999968,20.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Przewoźników, 16',52.28618329999999759,21.07826139999999882,28.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Benedykta, 3',52.28519070000000112,21.05989479999999858,23.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 65',52.27005189999999857,21.16304669999999888,63.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 59',52.26981680000000096,21.16350299999999862,62.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 11B',52.29822709999999831,21.05063309999999888,32.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Koniczynowa, 18',52.28031599999999913,21.06654340000000047,30.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Lisia, 22',52.2786102000000028,21.07317069999999858,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 38Y',52.30213580000000206,21.0522701000000012,39.0,0,29.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Jórskiego, 61',52.27963460000000139,21.05765990000000087,27.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Montwiłłowska, 7',52.27665160000000099,21.08449560000000033,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Młodzieńcza, 35',52.29012050000000044,21.0703460999999983,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kolejarska, 20A',52.29028000000000275,21.07521489999999887,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Nauczycielska, 4',52.28421170000000017,21.07470860000000101,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Knyszyńska, 14',52.29143040000000297,21.07505400000000151,31.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 46',52.2689694999999972,21.16533469999999895,45.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Rembielińska, 19',52.29197200000000123,21.02699030000000136,28.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Palestyńska, 2A',52.28145570000000219,21.02296750000000002,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Olgierda, 38',52.2725233999999972,21.04563840000000142,24.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Obwodowa, 11C',52.27443619999999669,21.03925890000000009,27.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Lusińska, 29',52.27565580000000267,21.04910489999999968,25.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Lwa, 12',52.28846419999999995,21.05874160000000117,27.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Nad Potokiem, 1',52.29016349999999847,21.05581069999999854,29.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Łąkocińska, 15',52.28352929999999788,21.02851749999999953,30.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Naczelnikowska, 6',52.26377130000000192,21.05684169999999967,22.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Korzystna, 6A',52.28779610000000133,21.06676909999999836,27.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Korzystna, 6',52.2878479000000027,21.06644610000000028,27.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Łabiszyńska, 21D',52.29571219999999699,21.03184010000000014,29.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Wyszogrodzka, 4A',52.28853289999999988,21.03338679999999883,33.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Śmiałego, 19',52.20235830000000021,20.86352000000000117,42.0,0,27.0);
-INSERT INTO travel_info VALUES('ulica 1 Maja, 8',52.19475210000000231,20.89213140000000024,37.0,0,21.5);
-INSERT INTO travel_info VALUES('Plac 1905 Roku, 1',52.19153380000000197,20.88981130000000164,50.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Żyzna, 7',52.28069820000000333,21.06396589999999947,30.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Zaciszańska, 1',52.29017600000000243,21.05706089999999975,31.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Lwa, 19',52.28867480000000256,21.05815829999999878,28.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Lwa, 1',52.28806420000000088,21.05856610000000017,27.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Krośniewicka, 6',52.28083290000000005,21.0635255999999984,28.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica św. Wincentego, 75',52.27569170000000298,21.0426928999999987,26.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Wolbromska, 39',52.28247499999999804,21.07807169999999886,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Wolbromska, 13',52.2810241999999974,21.07508659999999879,27.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Samarytanka, 48',52.2802088999999981,21.06288370000000043,29.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Badylarska, 28',52.18629229999999808,20.91453470000000081,46.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Seledynowa, 66',52.28249089999999911,21.05503230000000058,29.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Sucha, 12',52.29143320000000016,21.0738114000000003,30.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Dzieci Warszawy, 11',52.1907168999999982,20.91230889999999932,46.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Wysoczyńska, 14A',52.19291040000000236,20.87659520000000057,39.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Wincentego Kadłubka, 26A',52.20385910000000251,20.86591160000000044,37.0,0,26.5);
-INSERT INTO travel_info VALUES('ulica Michała Spisaka, 9A',52.18385140000000177,20.88498579999999905,38.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Siedzibna, 29A',52.28262560000000291,21.02841709999999864,27.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Warsa, 6',52.28748339999999928,21.05776820000000172,27.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Słupska, 9',52.18473610000000206,20.88584279999999894,56.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Słupska, 44D',52.18439109999999915,20.87648250000000161,47.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Wschodnia, 14',52.2861395999999985,21.07980420000000166,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Skoroszewska, 5',52.1901280000000014,20.90009360000000172,48.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Wolności, 18',52.20262139999999818,20.87025459999999911,46.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Traktorzystów, 30',52.1966618000000011,20.88470309999999941,30.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Poczty Gdańskiej, 22A',52.19831510000000207,20.89835910000000041,47.0,2,19.5);
-INSERT INTO travel_info VALUES('ulica Poczty Gdańskiej, 9',52.19923490000000043,20.89964900000000014,55.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Ustronna, 4A',52.28958680000000214,21.07976749999999911,32.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Tomcia Palucha, 2',52.1897847999999982,20.89490299999999934,51.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Szmaragdowa, 15',52.28067469999999873,21.07791380000000103,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Wieniecka, 10',52.28636029999999835,21.07263329999999968,24.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Wiosny Ludów, 41',52.19760130000000231,20.88968099999999951,33.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Koronacyjna, 30',52.20127010000000211,20.86088570000000075,45.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Ryżowa, 41F',52.19005949999999672,20.90799570000000073,45.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Michała Spisaka, 42',52.18766389999999689,20.88460129999999993,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Michała Spisaka, 74',52.19071180000000254,20.88375669999999929,36.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Słupska, 18',52.18473540000000099,20.88357710000000011,57.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica gen. Kazimierza Sosnkowskiego, 38',52.19377000000000066,20.88488540000000171,32.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Wiosny Ludów, 45',52.19741270000000099,20.88904949999999871,33.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Jana Marcina Szancera, 6',52.19414400000000142,20.89777529999999928,46.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Wieczorowa, 1',52.28181759999999656,21.06567619999999863,28.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 5',52.11151960000000116,21.03932740000000123,54.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kompanii AK „Kordian”, 14',52.18961310000000253,20.88494860000000131,48.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 18',52.18416899999999715,20.88122179999999873,59.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 90',52.19141179999999736,20.88042060000000077,37.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Piastowska, 3L',52.18811929999999677,20.8725796999999993,38.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Kościuszki, 8',52.19658090000000072,20.88895460000000171,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Piastowska, 11B',52.18778739999999772,20.86993730000000013,35.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Kompanii AK „Kordian”, 9',52.18926600000000348,20.88475770000000154,48.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Obrońców Helu, 4',52.19231719999999797,20.89227959999999839,38.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Ochocka, 12',52.18846249999999998,20.87575029999999999,42.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Ogniowa, 2',52.19765389999999883,20.88577850000000069,33.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 29A',52.1126786000000024,21.03284520000000057,50.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Jesienna, 37',52.19788880000000119,20.86204970000000002,46.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Henryka Melcera-Szczawińskiego, 9',52.18358159999999657,20.88610410000000072,58.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 51M',52.11336599999999919,21.02395489999999967,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kuźnicy Kołłątajowskiej, 24B',52.18486930000000256,20.87851709999999983,48.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 51U',52.11389090000000123,21.02376269999999892,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Bajaderki, 32',52.15616059999999977,21.05905089999999902,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Dźwiękowa, 14',52.13510449999999708,21.01458330000000175,35.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 49D',52.11428850000000068,21.02530409999999961,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Dezyderego Adama Chłapowskiego, 55',52.1639444999999995,21.03757489999999919,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cymbalistów, 7',52.10819020000000278,21.01513620000000059,46.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Bokserska, 5',52.16733090000000316,21.00668149999999912,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 63A/24',52.11486579999999691,21.0196587000000008,37.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Baletowa, 115B',52.12608840000000043,20.99087079999999972,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Elegijna, 25',52.16396629999999846,21.03411090000000173,28.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Bekasów, 43C',52.14851449999999745,21.02147959999999927,30.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Buszycka, 21A',52.11197429999999998,20.9945214,53.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Białozora, 37',52.13700779999999924,21.02132710000000059,34.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Władysława Jagiełły, 14',52.19710080000000118,20.88109899999999897,32.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Ekologiczna, 15',52.12959370000000092,21.0579073000000001,37.0,0,28.5);
-INSERT INTO travel_info VALUES('ulica Roalda Amundsena, 3',52.14881549999999777,21.03570589999999996,33.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Zaczarowanej Dorożki, 23',52.19753889999999786,20.86027310000000056,47.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Chóralna, 6/8',52.11314689999999672,21.01670520000000053,41.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Chóralna, 8',52.11285120000000148,21.01654329999999859,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Jarząbków, 6',52.13640670000000199,21.02425099999999958,40.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Arachidowa, 1',52.15296349999999848,21.0592107999999989,35.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Grzywaczy, 4',52.14618819999999744,21.01907089999999912,31.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bociania, 9H',52.14594999999999914,21.01873930000000001,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Augusta, 3',52.20478380000000129,20.86429180000000016,37.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Kolibrów, 9A',52.13656019999999814,21.02508239999999873,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Bogatki, 11',52.13222729999999672,21.02272029999999959,33.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Bogatki, 9',52.13222840000000246,21.02283639999999921,33.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 101E',52.14144269999999893,21.06876589999999894,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Małej Łąki, 36',52.13569249999999756,21.05521110000000106,35.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Muzyczna, 46',52.13110780000000232,21.01431900000000041,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Lelka, 26',52.14417569999999814,21.01953490000000002,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Nowoczesna, 1',52.12980189999999681,21.05477550000000165,37.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Małej Łąki, 17',52.13745229999999964,21.05255280000000084,34.0,0,27.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 61F',52.1147701000000012,21.02168169999999847,41.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Czapli, 31A',52.14957069999999817,21.03097049999999867,30.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kuropatwy, 8J',52.10723610000000149,21.03321160000000135,51.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Akwarelowa, 54',52.23199530000000123,21.15304989999999919,50.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Eugeniusza Lokajskiego, 22',52.14068160000000062,21.06555940000000149,36.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Karmazynowa, 34G',52.11370200000000352,21.02004579999999833,43.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kolibrów, 9',52.1365249999999989,21.02555870000000126,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Moczydłowska, 63J',52.13370539999999665,21.04743189999999942,42.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 11C',52.14385870000000267,21.01276689999999903,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Modelowa, 11',52.15426010000000189,21.05878939999999843,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Boglarczyków, 5',52.13378540000000072,21.06030159999999896,34.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Nad Wąwozem, 18',52.13329379999999703,21.07891509999999969,38.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Bogatki, 22',52.1325365000000005,21.01987379999999917,31.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 50B',52.14219349999999765,21.00428159999999878,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Moczydłowska, 37A',52.13196239999999904,21.04626479999999944,45.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Ornak, 14',52.14466989999999669,21.01601870000000005,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Ferdynanda Magellana, 11',52.15472880000000088,21.04381169999999913,34.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica ppłk. Zbigniewa Stanisława Kiedacza, 54A',52.1599981000000028,21.05596299999999843,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 30D',52.14445899999999768,21.00951639999999899,41.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Wędrowców, 16',52.1369406999999967,21.01409220000000033,41.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Welurowa, 3',52.13357969999999853,21.05068610000000006,41.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Kujawiaka, 7',52.13076319999999698,21.0039851000000013,50.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Rysy, 17',52.1441919000000027,21.01676929999999999,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Sporna, 23',52.12394530000000258,21.01413670000000167,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Łukaszczyka, 29',52.1484759000000011,21.02831289999999954,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Bronisława Pietraszewicza „Lota”, 9',52.14555719999999895,21.06465569999999943,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Villardczyków, 23',52.13402349999999786,21.05750439999999913,37.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Kraski, 53A',52.15135570000000342,21.02030230000000088,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kraski, 55',52.15148500000000097,21.01959689999999981,32.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Puchalska, 5',52.13988390000000094,20.99651580000000095,53.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Rybitwy, 6A',52.15083030000000263,21.01982609999999952,30.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Rumby, 27',52.14274489999999674,21.01226409999999945,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Oskara Sosnowskiego, 4',52.1547015000000016,21.02810050000000074,29.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Słonki, 3C',52.12074090000000126,21.02177370000000067,43.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Słonki, 5D',52.12101729999999833,21.02221570000000028,42.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Walczyka, 23',52.14551929999999658,21.01309519999999864,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica 27 Grudnia, 15',52.22335499999999798,21.14416639999999959,34.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Taneczna, 59L',52.14755079999999766,21.01462880000000055,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cedrowa, 3',52.22753689999999694,21.15194530000000129,42.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Chodzieska, 42K',52.18918889999999778,21.13620590000000021,55.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Pod Strzechą, 8',52.13064289999999801,21.05909129999999862,36.0,0,29.0);
-INSERT INTO travel_info VALUES('ulica Sarabandy, 77',52.11949729999999903,21.00610730000000003,50.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Pustułeczki, 12',52.14380729999999887,21.02930170000000132,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Drwali, 8',52.18014939999999769,21.19760790000000127,49.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Celulozy, 111Z',52.16720339999999823,21.17208790000000107,65.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Cylichowska, 25B',52.19541860000000355,21.14669370000000014,54.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Chodzieska, 42C',52.19007739999999985,21.13635070000000126,54.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Cylichowska, 87A',52.19898890000000335,21.16632849999999877,44.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Pląsy, 14B',52.14646749999999998,21.01157560000000046,34.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Celulozy, 107ZB',52.1663027000000028,21.17061989999999838,67.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Wilhelma Konrada Roentgena, 43R',52.1429540999999972,21.02908169999999899,34.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 28A',52.21973460000000244,21.15170030000000168,33.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 434',52.12534190000000222,21.01744619999999841,34.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Perlicza, 3A',52.1066010999999989,21.03113469999999908,51.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Bronisława Czecha, 25',52.22661829999999839,21.15129990000000149,41.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 79A',52.2249099000000001,21.14399500000000031,33.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Cedrowa, 42',52.2312018000000009,21.15060340000000139,50.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Czarnoleska, 2B',52.23408750000000111,21.14835040000000177,45.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Cylichowska, 69D',52.19850110000000142,21.15961839999999939,49.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Celofanowa, 3A',52.21188200000000279,21.17824020000000118,56.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Dulczyńska, 1A',52.16007379999999927,21.23036730000000105,59.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Chylicka, 14',52.18003989999999704,21.20779939999999897,50.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Derkaczy, 31A',52.15680059999999685,21.21195000000000164,49.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Bielszowicka, 5A',52.20559469999999891,21.18605020000000038,51.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Bysławska, 14C',52.15485960000000176,21.18119659999999982,54.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Karpacka, 25',52.23444580000000314,21.15310669999999859,48.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Karpacka, 5',52.23368560000000115,21.14891839999999946,47.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Bardiniego, 23',52.17865239999999716,21.22856290000000001,58.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Bielszowicka, 6',52.20514800000000121,21.18683359999999994,52.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Borówkowa, 16',52.17348280000000215,21.23054859999999878,62.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Borowiecka, 55J',52.18351489999999871,21.1551909000000009,55.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Bambusowa, 1F',52.16284540000000191,21.21168270000000077,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Botaniczna, 71',52.23373540000000048,21.15423189999999921,50.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Bajkowa, 6',52.18629849999999948,21.17725580000000107,44.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Bambusowa, 12',52.1630502000000007,21.2120804000000014,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Juhasów, 34A',52.19452689999999962,21.16755870000000072,49.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Małowiejska, 59',52.16378639999999934,21.20625370000000132,46.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 121',52.17659379999999914,21.18434789999999879,62.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 27A/1',52.21144389999999902,21.11513439999999875,46.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Morawska, 3',52.19169159999999863,21.1369883999999999,55.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 157',52.18100139999999954,21.17934380000000161,49.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 27J',52.21164830000000023,21.11481960000000057,46.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Mydlarska, 17',52.20856210000000174,21.14954189999999912,45.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Prasowa, 38A',52.16605359999999792,21.20247110000000034,58.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Orłowskiego, 23',52.187554200000001,21.19128339999999966,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Minerska, 35',52.23089370000000286,21.13702530000000123,44.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Niecodzienna, 28',52.18435089999999832,21.23425609999999964,66.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Nagłowicka, 22',52.17467690000000146,21.18352900000000005,52.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 141',52.20053440000000222,21.16758940000000066,40.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 21',52.162860000000002,21.20274810000000087,47.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Minerska, 8A',52.2291335000000032,21.14160329999999988,38.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Malwowa, 11A',52.18112920000000087,21.17472910000000041,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Olecka, 26',52.15427389999999975,21.21035679999999957,52.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Popiołów, 1E',52.17245350000000314,21.2084855999999995,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 119A',52.17642349999999852,21.18416600000000116,62.0,0,26.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 177E/2',52.19933160000000071,21.13322060000000136,46.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Gąsienicowa, 27',52.23397349999999762,21.14048999999999979,43.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Hortensji, 7A',52.17719679999999727,21.17787699999999874,68.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Fuksji, 4C',52.20337560000000109,21.17747209999999925,53.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Dzięcioła, 7B',52.16733250000000055,21.16092199999999935,65.0,2,23.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 206A',52.19826369999999827,21.13523809999999869,45.0,1,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 26E',52.17487679999999984,21.15591849999999851,50.0,1,21.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 132A',52.1883695000000003,21.14220630000000157,56.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Dusznicka, 55',52.16802220000000289,21.21521699999999911,50.0,1,27.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 140/14',52.18832199999999944,21.14732180000000028,59.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Homera, 41',52.22439969999999932,21.16398650000000003,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Liliowa, 31K',52.16273730000000341,21.18691959999999952,64.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Liliowa, 27J',52.16232310000000182,21.18723170000000167,56.0,2,26.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 352A',52.21933529999999735,21.13581669999999946,46.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Lucerny, 77',52.21432169999999929,21.14709399999999917,41.0,1,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 239Z',52.20632729999999811,21.12814159999999931,54.0,2,19.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 395B',52.22675350000000094,21.14009550000000103,40.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Lucerny, 89',52.21432360000000016,21.15009330000000177,37.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Benedykta Hertza, 2',52.2221902,21.15329729999999841,30.0,1,19.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 274A',52.20630890000000334,21.13674370000000024,49.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Filmowa, 40',52.15945640000000338,21.219612699999999,50.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Liścienia, 13',52.18804879999999713,21.20656800000000075,54.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Liścienia, 30',52.19063630000000131,21.20745409999999965,56.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Benedykta Hertza, 12C',52.22536050000000074,21.15241689999999863,31.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Obiegowa, 7',52.20830279999999846,21.18740160000000116,52.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kłodzka, 36D',52.16472689999999802,21.21831780000000122,49.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Lawendowa, 10',52.18600289999999831,21.17259500000000116,48.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kościuszkowców, 101',52.2413626000000022,21.15503670000000013,42.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Lebiodowa, 6A',52.20635010000000164,21.13502469999999889,48.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Ligustrowa, 23F',52.20164059999999751,21.12393870000000006,47.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Kuligowska, 21B',52.18472400000000277,21.13569659999999928,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kwitnącej Akacji, 61B',52.19261999999999802,21.21938039999999858,64.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Napoleona Bonaparte, 71A',52.16479859999999747,21.23960209999999905,70.0,2,33.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 271G',52.21298740000000293,21.1300182999999997,46.0,2,18.5);
-INSERT INTO travel_info VALUES('ulica Lebiodowa, 27L',52.2095125999999965,21.13914660000000012,56.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Narcyzowa, 20',52.16336259999999925,21.22029949999999943,50.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Ligustrowa, 21G',52.20150220000000018,21.12324509999999833,47.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Paczkowska, 36',52.21033740000000022,21.15231220000000078,40.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Paczkowska, 37',52.21114219999999762,21.15291690000000102,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Ochocza, 57',52.16030800000000056,21.22533179999999931,54.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Kudowska, 42C',52.16216560000000157,21.22833659999999866,60.0,2,30.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 275M',52.21327550000000172,21.13084999999999881,46.0,2,18.0);
-INSERT INTO travel_info VALUES('ulica Kosmatki, 66D',52.22283130000000284,21.10767309999999953,40.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Otwarta, 2A',52.2377188999999973,21.1478332999999985,39.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Kąkolowa, 7',52.17287619999999749,21.2029437999999999,43.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Mydlarska, 37',52.21060810000000174,21.14853510000000014,44.0,1,20.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 303F',52.21662560000000041,21.13087200000000009,48.0,2,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 395',52.22684009999999689,21.13972989999999897,40.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Heliotropów, 78B',52.18481700000000245,21.13383100000000069,42.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 59E',52.19737109999999803,21.12654129999999953,51.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Dzięcioła, 9C',52.1677533000000011,21.16143080000000154,56.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Klimatyczna, 10A',52.18838370000000281,21.1746969000000007,47.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Bystrzycka, 25B',52.15836099999999931,21.21742330000000009,48.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Bielszowicka, 53A',52.21343499999999694,21.18522880000000085,62.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Goździków, 37',52.23931420000000258,21.14071609999999879,38.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Goździków, 3',52.2385313999999994,21.13473600000000018,37.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Gardenii, 19',52.21623309999999663,21.15353269999999953,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Juhasów, 4C/1',52.19280710000000311,21.15922420000000059,53.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Gardenii, 16',52.21666150000000072,21.15336729999999932,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kalinowa, 15',52.17221190000000063,21.23067849999999979,59.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Bychowska, 15A',52.23641930000000144,21.14687190000000072,43.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Michała Kajki, 66',52.2188262000000023,21.1647488000000017,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 41E',52.19532660000000134,21.1257830999999996,48.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 12P',52.19326110000000085,21.12877639999999957,51.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Juhasów, 16',52.19378900000000243,21.16187959999999891,49.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 50/9',52.19599480000000113,21.13009740000000036,52.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Izbicka, 139',52.18217500000000086,21.22922880000000135,53.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Dąbrowa, 10',52.16578330000000107,21.1656480000000009,56.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Hafciarska, 46C',52.21329860000000167,21.18326970000000031,61.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kisielicka, 11',52.16026500000000254,21.22464060000000074,54.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Juhasów, 38B',52.19484920000000016,21.16849240000000166,49.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Patriotów, 222',52.20133870000000086,21.17247619999999841,37.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Rogatkowa, 28',52.20225450000000222,21.16403389999999974,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Podmokła, 15',52.18891740000000112,21.22504809999999864,58.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Szoferska, 35',52.21953620000000029,21.17020550000000157,51.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Podkowy, 100A',52.16723770000000115,21.24054579999999959,65.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Retmańska, 10',52.15241790000000321,21.18424339999999973,61.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Rzeźbiarska, 30B',52.21386499999999842,21.16450100000000135,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Patriotów, 203A',52.18268189999999863,21.18850060000000112,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Romana Pazińskiego, 1M',52.21437960000000089,21.17298170000000112,53.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Szafirowa, 51B',52.17011980000000193,21.19793200000000156,48.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Szalejowa, 1A',52.21732620000000224,21.15242479999999858,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 26',52.172328499999999,21.15651490000000123,48.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Planetowa, 33',52.18877479999999736,21.19282550000000143,44.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica ks. Sylwestra Szulczyka, 40',52.1758164000000022,21.23598859999999889,66.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Rzeźbiarska, 19A',52.21154529999999739,21.16440559999999848,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 141C',52.22392330000000271,21.1096882999999984,42.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Przewodowa, 116',52.17118169999999822,21.19264989999999927,46.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Piołunowa, 46',52.21871110000000015,21.20203509999999981,59.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Peonii, 20/10',52.18752380000000101,21.13540040000000176,46.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Storczykowa, 8',52.22766539999999936,21.15594970000000074,42.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Przewodowa, 16',52.17104069999999894,21.16085400000000049,53.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Pomiechowska, 49',52.21341329999999914,21.15159140000000093,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Papierowa, 14H',52.20850709999999851,21.11645499999999842,45.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 52F',52.17312470000000246,21.16115449999999853,52.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 46',52.21285799999999711,21.11561070000000129,47.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Patriotów, 112',52.1741443000000018,21.19964680000000001,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Parterowa, 27',52.16018629999999945,21.22631240000000119,55.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 33',52.21262959999999965,21.11505830000000116,48.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Podkowy, 108',52.16877019999999732,21.24193460000000044,61.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 23',52.16305630000000093,21.20270620000000151,47.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Wiązana, 50C',52.20539829999999882,21.14213769999999926,56.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Tęczowa, 1',52.2284278999999998,21.14553700000000091,48.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Ukośna, 17',52.22301949999999949,21.15726889999999826,35.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Trawiasta, 5B',52.21695869999999929,21.15843440000000086,34.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Tytoniowa, 16',52.235449899999999,21.13042349999999914,37.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Tytoniowa, 13',52.23606379999999661,21.13069499999999934,37.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Zorzy, 8',52.2160814000000002,21.16733479999999901,47.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Wiślanych Pól, 6',52.15224390000000198,21.19030409999999876,58.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 16C',52.20876439999999974,21.11170800000000014,44.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 77B',52.21422309999999812,21.10587170000000157,44.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Żwanowiecka, 121',52.1826578000000012,21.19599330000000137,47.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 212',52.1716405000000023,21.1555332000000007,45.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 564',52.2104140000000001,21.1073637000000005,36.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Rusałki, 1',52.17592439999999954,21.18584029999999885,50.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Wierchów, 19',52.21993280000000225,21.14939809999999909,34.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Wisełki, 73A',52.18654750000000319,21.2030144000000007,48.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Wisełki, 27A',52.18699569999999711,21.19222519999999932,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Wiązana, 30Ł',52.20352609999999772,21.1463454000000013,58.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Reszelska, 30',52.23904389999999865,21.15515800000000012,42.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 552D',52.20975030000000316,21.10898710000000022,45.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 45B',52.21138839999999704,21.10856019999999945,44.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 38U/6',52.15340900000000345,21.19235169999999969,60.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Rzeźbiarska, 83',52.22287279999999754,21.16024559999999966,38.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Sobierajska, 15',52.19130429999999877,21.19055090000000164,46.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Przyleśna, 5A',52.1944683999999981,21.19761820000000085,64.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 38A',52.15293690000000026,21.18739090000000047,55.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 22L',52.20243260000000162,21.1460353000000012,56.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Sielankowa, 13B',52.17939750000000032,21.1768123000000017,57.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 14/16',52.20132739999999672,21.14293680000000108,50.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 494C',52.20483939999999735,21.11490679999999998,44.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 576A',52.2113055000000017,21.10676889999999873,35.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Bronisława Wesołowskiego, 10A',52.20976280000000002,21.15277239999999992,42.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 28L',52.20335779999999915,21.14734839999999849,60.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Storczykowa, 63',52.23350729999999942,21.15284309999999834,49.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Sezam, 5E',52.23793979999999948,21.15208579999999827,45.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 37N',52.20236090000000217,21.1376078000000014,48.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Trzykrotki, 31',52.21608160000000253,21.19829449999999938,56.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 426A',52.19902170000000296,21.12010390000000015,44.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Wilgi, 11A',52.18635669999999749,21.19066390000000055,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wilgi, 51',52.18562339999999722,21.20377669999999882,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Spadowa, 3',52.22487730000000283,21.13784890000000161,45.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 24A',52.15154880000000048,21.18886350000000007,57.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Włókiennicza, 45',52.16067340000000029,21.20609509999999887,45.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jodłowa, 11',52.21812820000000243,21.22553449999999841,44.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Fabryczna, 7',52.2207835999999972,21.2308526999999998,19.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Zasadowa, 12A',52.18251949999999795,21.17044920000000018,51.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Diamentowa, 74',52.21526070000000174,21.22716600000000042,53.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Wacława Wojtyszki, 24',52.18460919999999704,21.14875990000000173,66.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 52',52.18178679999999759,21.23662600000000111,64.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Granitowa, 16',52.21756289999999723,21.22846889999999931,59.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jaspisowa, 18',52.22070680000000209,21.22536990000000045,54.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Włókiennicza, 30/32',52.15633820000000042,21.21090020000000109,49.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Władysława IV, 3',52.21436620000000061,21.15580320000000114,32.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Irysów, 3',52.21329730000000068,21.23988010000000059,59.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Wiązowska, 39A',52.17870930000000129,21.24773240000000029,78.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica Zambrowska, 6A',52.21502269999999868,21.17209649999999854,53.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Gościniec, 54',52.22218269999999763,21.22665459999999982,52.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Żelechowska, 8B',52.19035470000000032,21.17793440000000161,45.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wacława Wojtyszki, 77C',52.1841468000000006,21.15930510000000097,55.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Wrzosowa, 3',52.16390270000000128,21.21322879999999956,39.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Wydawnicza, 38',52.21979269999999929,21.15442649999999958,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Zabrzańska, 11',52.17807280000000247,21.21127680000000026,51.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Kalinowa, 12',52.21573320000000251,21.23332729999999913,60.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Fabryczna, 14',52.2175629999999984,21.22996120000000176,18.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Wydawnicza, 22',52.21687870000000231,21.15747700000000008,33.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 3',52.17229400000000083,21.22718449999999991,58.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Żonkilowa, 3',52.19855400000000145,21.16199130000000039,47.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wyszatycka, 34',52.15969719999999655,21.22833010000000086,56.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Zasadowa, 6A',52.18349220000000343,21.17158500000000032,48.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Dąbrowy, 25',52.20995849999999905,21.23978149999999943,65.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Fabryczna, 3',52.22000740000000007,21.23242360000000061,17.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Zgodna, 12',52.21828560000000152,21.11347710000000077,48.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Świecka, 9',52.2336102000000011,21.13202019999999948,38.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Zalipie, 18',52.22132979999999947,21.1675904000000017,47.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zasadowa, 48C',52.1763773999999998,21.1745398999999992,66.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Zasobna, 21',52.18350579999999895,21.17557910000000021,48.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wylotowa, 23',52.21738630000000114,21.14806430000000149,41.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 63H',52.18294250000000289,21.2345089999999992,62.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Zakładowa, 20',52.21956149999999753,21.14380699999999891,40.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Ulanowska, 34',52.18552129999999778,21.18655379999999865,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wójcicka, 8',52.20359930000000048,21.15829889999999835,42.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Włókiennicza, 67',52.16310560000000151,21.2037741000000004,48.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Wacława Wojtyszki, 45D',52.18531070000000227,21.15268049999999889,56.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Związkowa, 38',52.23340859999999708,21.14193660000000107,44.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Zastowska, 2',52.22521460000000104,21.13764799999999866,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Zielony Las, 36',52.21924299999999875,21.11478029999999962,48.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Wolęcińska, 76',52.19366449999999702,21.19945639999999898,58.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Juliana Ursyna Niemcewicza, 38',52.2463829000000004,21.21696659999999924,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Mazowiecka, 99A/3',52.224852300000002,21.24838009999999854,63.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Miła, 1',52.25328460000000063,21.22491189999999861,23.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica gen. Władysława Sikorskiego, 76A',52.2516064,21.24376469999999984,53.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Kościuszki, 21',52.24362330000000298,21.21919300000000063,41.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Mazowiecka, 80',52.22434510000000074,21.24206219999999946,54.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Konwaliowa, 44',52.21406149999999969,21.24231160000000073,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Moniuszki, 28',52.2506731000000002,21.21708890000000025,34.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 102D',52.17195759999999894,21.11572950000000048,55.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Piękna, 3',52.24989320000000248,21.18676770000000075,51.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Świerkowa, 1B',52.25215620000000171,21.25225169999999863,47.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Hoserów, 5',52.14864630000000289,21.13244239999999862,56.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Piękna, 14',52.24843740000000025,21.18709580000000159,49.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Modrzewiowa, 17',52.25117920000000282,21.23692780000000013,41.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Jara, 4G',52.17569379999999768,21.11377799999999994,52.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Turkusowa, 42',52.22109439999999836,21.22412920000000013,53.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Gratyny, 7B',52.14804420000000106,21.138236899999999,55.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Husarii, 30',52.17285650000000174,21.08374279999999957,48.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Cicha Dolina, 22',52.17265179999999703,21.11427379999999943,54.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica św. Antoniego, 58',52.21998020000000195,21.22072710000000129,57.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Brata Alberta, 34A',52.24117900000000247,21.19037549999999825,59.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Urocza, 66',52.24165610000000015,21.19308489999999879,59.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Bohaterów z Kopalni „Wujek”, 49A',52.24306419999999918,21.18955539999999971,58.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Brzozowa, 23',52.22689780000000325,21.23365659999999978,20.0,1,11.0);
-INSERT INTO travel_info VALUES('Aleja marsz. Józefa Piłsudskiego, 65/1',52.23491049999999803,21.25373319999999922,73.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Urocza, 63/65',52.24173110000000264,21.19775359999999864,63.0,1,26.5);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 87B',52.22350449999999711,21.2402255999999987,50.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Spokojna, 7',52.24962409999999836,21.22468710000000058,24.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Sportowa, 15',52.24864980000000258,21.1898124999999986,51.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Marii Skłodowskiej-Curie, 1',52.24609980000000319,21.21768090000000129,43.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Marii Konopnickiej, 12',52.25063690000000349,21.23117260000000072,35.0,1,28.0);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 58',52.22295820000000077,21.23243090000000066,50.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Tymiankowa, 14',52.21643960000000106,21.24648609999999848,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Czereśniowa, 6',52.21536569999999955,21.23238299999999867,37.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Cienista, 38',52.21265600000000262,21.23776700000000162,61.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Cyklamenowa, 24',52.21278559999999658,21.24271260000000083,63.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Bartosza Głowackiego, 20A',52.25400319999999966,21.21519220000000061,35.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Fiołków, 9',52.21794719999999757,21.24665530000000046,50.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Dąbrowskiego, 40',52.21880469999999975,21.25241730000000117,64.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Szlachecka, 26',52.21849890000000016,21.2466280999999988,42.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Szlachecka, 25',52.21851809999999717,21.24699030000000021,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jana Pawła II, 154',52.21610890000000182,21.23369950000000017,55.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Forsycji, 32',52.21197409999999906,21.24475770000000096,66.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Hebanowa, 13',52.21564300000000002,21.22806479999999851,53.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Szlachecka, 10',52.2195820000000026,21.2467289000000008,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Flory, 10',52.21793639999999926,21.22137590000000174,21.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Jagodowa, 14',52.24915690000000267,21.19627880000000176,54.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jana Pawła II, 90',52.21655650000000292,21.22657660000000135,19.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica gen. Władysława Sikorskiego, 36',52.25207730000000339,21.23379680000000035,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Brata Alberta, 61C',52.23888500000000334,21.19281610000000172,60.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Urocza, 49',52.24189510000000069,21.19376300000000057,60.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Syta, 144B',52.17510850000000033,21.10787750000000073,50.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dobrodzieja, 20B',52.13466400000000078,21.10868079999999835,61.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Chorągwi Pancernej, 3',52.17010789999999787,21.08461249999999864,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Sągi, 3B',52.13782299999999737,21.14548770000000033,62.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Europejska, 30D',52.15588040000000091,21.09405369999999991,47.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Prymasa Augusta Hlonda, 1',52.15955170000000151,21.07092820000000088,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Zaułek, 5',52.23905049999999762,21.19285029999999992,38.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Śnieżna, 8',52.218473699999997,21.23233310000000174,60.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Łukasza Drewny, 68A',52.12911679999999848,21.09948950000000067,45.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Środkowa, 5',52.24949060000000145,21.18583280000000002,21.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Piwna, 9/11',52.24829019999999958,21.01268389999999898,16.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Książęca, 4',52.23001630000000261,21.02354929999999911,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Józefa Lewartowskiego, 17A',52.24880999999999887,20.98906759999999849,15.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Urszuli, 29',52.20967780000000146,20.9032802999999987,49.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Podwale, 17A',52.2488383999999968,21.00944140000000004,20.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Mokotowska, 27',52.22119719999999888,21.01866739999999822,13.0,0,6.0);
-INSERT INTO travel_info VALUES('ulica Stefana Czarnieckiego, 44',52.26687079999999952,20.99141739999999957,23.0,0,15.0);
-INSERT INTO travel_info VALUES('Plac Powstańców Warszawy, 1',52.23450940000000031,21.01322659999999943,7.0,0,3.5);
-INSERT INTO travel_info VALUES('ulica Karmelicka, 26',52.25076620000000104,20.98988819999999933,22.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Lekarska, 15',52.21816499999999906,21.0062268000000003,19.0,0,8.5);
-INSERT INTO travel_info VALUES('Plac Powstańców Warszawy, 2A',52.2345661000000021,21.01422930000000022,8.0,0,3.5);
-INSERT INTO travel_info VALUES('ulica Poznańska, 2/4',52.22328329999999852,21.013027000000001,13.0,0,6.0);
-INSERT INTO travel_info VALUES('ulica Sycowska, 17',52.17955340000000319,20.94275049999999894,50.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Wspólna, 27',52.22755459999999772,21.0165140000000008,50.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Litewska, 16',52.21700359999999819,21.02024709999999886,14.0,0,7.0);
-INSERT INTO travel_info VALUES('ulica Karmelicka, 17',52.24844730000000225,20.99110179999999915,15.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Szyszkowa, 44',52.17394300000000129,20.92599350000000058,67.0,1,20.0);
-INSERT INTO travel_info VALUES('Aleja Róż, 6',52.22190479999999724,21.02278899999999951,15.0,0,8.0);
-INSERT INTO travel_info VALUES('ulica Wybrzeże Kościuszkowskie, 43B',52.24051459999999736,21.0289672000000003,10.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Nowogrodzka, 21',52.22933259999999934,21.01530280000000061,10.0,0,4.0);
-INSERT INTO travel_info VALUES('ulica Urszuli, 8',52.20876229999999652,20.90326909999999927,39.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Karmelicka, 3AA',52.2451677000000032,20.99404099999999929,19.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Brodzińskiego, 28',52.26520969999999978,20.98167970000000082,23.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Pańska, 7',52.23285820000000256,21.00023159999999934,9.0,0,7.5);
-INSERT INTO travel_info VALUES('Plac Zbawiciela, 5',52.2200228000000024,21.01715340000000154,13.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Obornicka, 12',52.17102700000000226,21.08726749999999939,45.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 1B',52.25220740000000319,21.2446349000000012,34.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Biedronki, 60A',52.17235939999999772,21.08885169999999932,48.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Olęderska, 10C',52.15520370000000127,21.13255930000000049,58.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 96C',52.17068499999999887,21.11630690000000144,58.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Przyczółkowa, 340',52.15864160000000282,21.0887911999999993,41.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kremowa, 21E',52.12575569999999914,21.096848099999999,49.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Rumiana, 105',52.1773937000000032,21.07229069999999994,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Rumiana, 64A',52.17387769999999847,21.07735569999999825,47.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Uprawna, 46A',52.15809790000000134,21.09527140000000145,50.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Królowej Marysieńki, 4',52.16834519999999742,21.07925889999999925,40.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Syta, 62F',52.16083900000000284,21.12023860000000041,52.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Rosy, 39A',52.14685670000000072,21.12634140000000115,61.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Królowej Marysieńki, 3I',52.16798059999999993,21.07797010000000171,40.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Rumiana, 28',52.17115989999999926,21.07953189999999922,40.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Krochmalna, 32A',52.23701779999999673,20.99347360000000152,16.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Bolecha, 72',52.24790850000000119,20.94586740000000091,23.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 17A',52.2366529999999969,20.9664223000000014,16.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Niska, 18',52.24992619999999733,20.98370380000000068,20.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Ogrodowa, 7',52.23958720000000255,20.99198099999999912,14.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Młynarska, 29',52.23861459999999824,20.97116940000000084,20.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Dobrogniewa, 1F',52.24855490000000202,20.94825979999999888,24.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kajetana Garbińskiego, 12',52.23528950000000037,20.94479370000000174,21.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Nowolipki, 20A',52.24392249999999649,20.98861949999999865,16.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Jana Olbrachta, 3',52.23821089999999856,20.9435633999999986,15.0,0,18.0);
-INSERT INTO travel_info VALUES('Plac Stanisława Małachowskiego, 1',52.2387445000000028,21.01080290000000162,9.0,0,4.0);
-INSERT INTO travel_info VALUES('ulica Nowy Zjazd, 1',52.24729789999999952,21.01908230000000088,22.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Seweryna Krzyżanowskiego, 40C',52.22750330000000218,20.96789850000000043,18.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Ogrodowa, 4G',52.24059720000000339,20.99292330000000106,13.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Seweryna Krzyżanowskiego, 48',52.22828059999999795,20.96765179999999873,13.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Gniewkowska, 57',52.21550150000000201,20.92705349999999954,38.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Rotmistrzowska, 16',52.17260439999999733,21.08708280000000101,51.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cypriana Kamila Norwida, 2',52.23167250000000194,20.93773900000000054,25.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Jana Olbrachta, 94',52.23447019999999697,20.92871789999999877,22.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Ogrodowa, 5',52.23952129999999983,20.99313700000000082,14.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Melonowa, 17A',52.16709999999999781,21.05674189999999867,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Gliniana, 6D',52.24653169999999847,20.98248669999999905,22.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 142H',52.17795859999999664,21.11233530000000159,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Za Dębami, 6',52.24974910000000249,21.19809499999999857,53.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Biedronki, 57',52.17464079999999882,21.08636290000000101,51.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Siedliskowa, 3A',52.17765239999999949,21.10575329999999994,47.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Rosochata, 20CC',52.13248990000000304,21.12503999999999848,58.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 62A',52.16445900000000079,21.120581099999999,55.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Zaciszna, 5',52.24339499999999959,21.2053268000000017,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 116D',52.17398790000000019,21.1127395,56.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Rosochata, 72/74',52.13024310000000127,21.10889590000000026,53.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Sklepowa, 5',52.20183070000000213,20.91354559999999907,37.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Wilcza, 22',52.22549099999999811,21.01820389999999961,11.0,0,5.5);
-INSERT INTO travel_info VALUES('ulica Saperów, 5',52.18190500000000042,20.94179120000000082,51.0,1,20.0);
-INSERT INTO travel_info VALUES('Aleje Ujazdowskie, 7',52.21726950000000044,21.02526909999999916,16.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Sycowska, 32',52.17984270000000179,20.94237490000000079,50.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Szuberta, 27',52.20662959999999942,20.90014860000000141,48.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Sklepowa, 23A',52.20246449999999783,20.91055409999999882,44.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Trzcinowa, 28',52.21220160000000021,20.91634330000000119,35.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Długopolska, 12',52.17790680000000236,20.94138579999999906,47.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 37A',52.12743400000000093,21.09156790000000114,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Erika Dahlbergha, 22',52.24852889999999662,20.9475289999999994,29.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Wiedeńska, 94BL',52.14655139999999989,21.09076819999999942,53.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Wiertnicza, 93',52.17354040000000026,21.07875599999999849,44.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bolecha, 18',52.24818909999999761,20.95134699999999838,28.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 56',52.12864499999999879,21.09141440000000146,47.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 238',52.13013020000000352,21.09457079999999963,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Zakamarek, 21C',52.1319718000000023,21.11509649999999994,50.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Dzwonkowa, 41A',52.17338039999999922,20.92623860000000136,68.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Agawy, 2',52.24151150000000143,20.9614565000000006,58.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Cietrzewia, 17A',52.20368570000000119,20.92227310000000174,34.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Szkolna, 2/4',52.23610680000000172,21.00961780000000089,2.0,0,3.0);
-INSERT INTO travel_info VALUES('ulica Chłodna, 35/37',52.23654100000000255,20.9870176000000015,23.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 12C',52.12844280000000196,21.0958736999999985,46.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Cienista, 10A',52.20748100000000135,20.91410649999999905,38.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Batalionu AK „Pięść”, 5',52.24033819999999651,20.94785620000000037,18.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Burakowska, 16A',52.25637909999999665,20.9789734999999986,24.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Wiertnicza, 133',52.17641400000000118,21.07562869999999933,43.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Człuchowska, 12',52.23036090000000086,20.92533879999999868,25.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Żelazna, 59',52.23359310000000022,20.99115910000000084,14.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Jana Brożka, 16',52.24289890000000013,20.94114829999999827,20.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Wiedeńska, 94DH',52.14662309999999935,21.0899915,53.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Popularna, 4/6',52.20516109999999799,20.91669729999999917,34.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Municypalna, 69',52.18323949999999912,20.9138194999999989,52.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Latarnika, 48',52.20994149999999934,20.89914410000000088,44.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Perlonowa, 22',52.18332190000000281,20.92973680000000058,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Maciejki, 20',52.17558209999999975,20.94714199999999949,45.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Lechicka, 14',52.19243939999999782,20.96399290000000092,36.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Przerwana, 11A',52.19233179999999806,20.92002499999999899,45.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Parowcowa, 32',52.21283360000000328,20.90739149999999925,38.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Jutrzenki, 7',52.17769669999999849,20.9188130000000001,45.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Parowcowa, 29A',52.21269219999999934,20.91627139999999941,35.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Płużańska, 22',52.20741100000000045,20.92544679999999957,38.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Mineralna, 50',52.17727080000000228,20.92950659999999985,58.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Komitetu Obrony Robotników, 36/38',52.18129569999999973,20.97616379999999836,41.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Husarska, 28D',52.19939229999999953,20.92024680000000103,39.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Przasnyska, 6B',52.26040090000000049,20.97076059999999841,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Krakowiaków, 32',52.1877283000000034,20.9466025000000009,45.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Franciszka Hynka, 2D',52.18637849999999645,20.97048050000000074,43.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pana Tadeusza, 1G',52.19908800000000326,20.92072220000000015,42.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Lechicka, 4',52.19137769999999677,20.96879489999999891,37.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Plastyczna, 39',52.21074169999999981,20.92105499999999907,37.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Jakobinów, 25',52.18689140000000037,20.94357889999999855,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Potrzebna, 3',52.2072851,20.91676809999999876,30.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Hipotezy, 10',52.16443999999999904,20.9340679999999999,50.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Latarnika, 39',52.20984700000000344,20.89872670000000098,43.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Jutrzenki, 154',52.19830410000000142,20.9343079000000003,35.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Adolfa Dygasińskiego, 29',52.27229140000000029,20.98730259999999959,22.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Krótka, 3',52.17061850000000333,20.92923130000000143,58.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Włościańska, 16',52.27035089999999685,20.96593280000000092,22.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Wszemirowska, 34',52.20630380000000059,20.89548500000000075,37.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Bielańska, 3',52.24415520000000157,21.00623200000000068,12.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Strubiczów, 4A',52.19318410000000341,20.9637993999999992,34.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Dubois, 12',52.25299960000000254,20.99227589999999922,16.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Bednarska, 20A',52.24508980000000235,21.0170710000000014,16.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Wronia, 33',52.23272089999999679,20.98569889999999916,15.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Konstantego Ildefonsa Gałczyńskiego, 10',52.23481730000000311,21.01979040000000155,11.0,0,9.5);
-INSERT INTO travel_info VALUES('ulica Dymna, 7A',52.20484189999999814,20.89584119999999957,40.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Chmielna, 11',52.23275730000000294,21.01706330000000022,12.0,0,5.5);
-INSERT INTO travel_info VALUES('ulica Płocka, 7A',52.23074549999999761,20.96665210000000101,12.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Płocka, 7',52.23057119999999998,20.96671089999999893,13.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Szańcowa, 10',52.23677940000000319,20.93340710000000015,23.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Danuty Siedzikówny „Inki”, 7',52.24053620000000108,20.94310829999999867,17.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Pańska, 67',52.23146030000000195,20.99358120000000127,7.0,0,8.5);
-INSERT INTO travel_info VALUES('ulica Kajetana Sołtyka, 7',52.24484749999999878,20.96875130000000098,18.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Łopuszańska, 9',52.19048690000000334,20.95581759999999961,38.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Icchoka Lejba Pereca, 1A',52.2336201000000031,20.99650069999999857,9.0,0,8.5);
-INSERT INTO travel_info VALUES('ulica Centralna, 27',52.17893159999999853,20.93984070000000131,51.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Żwirki i Wigury, 8',52.18491879999999839,20.97980649999999869,36.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Władysława Przanowskiego, 16',52.23833400000000182,20.933704800000001,21.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Pańska, 77/79',52.23104109999999878,20.99157459999999987,9.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Hoża, 66/68',52.22532640000000014,21.00956190000000135,10.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Aksamitna, 5A',52.17927929999999748,20.93045310000000114,48.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Czardasza, 21',52.19194250000000323,20.9631930000000004,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Szańcowa, 23',52.23941789999999941,20.93212469999999926,18.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Przyokopowa, 31',52.23074789999999724,20.98041059999999903,11.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Działkowa, 109',52.18557200000000051,20.9325429000000014,38.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Przyokopowa, 5A',52.22555690000000083,20.97788070000000004,18.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Przyokopowa, 1/3',52.22518060000000161,20.97767800000000093,19.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Emila Zegadłowicza, 1',52.22792419999999681,20.97173349999999914,20.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Stawki, 21',52.2503707999999989,20.98329220000000105,19.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Potrzebna, 54G',52.21241729999999848,20.93080289999999977,39.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Buńczuk, 7A',52.17812789999999979,20.94105130000000159,50.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Adolfa Dygasińskiego, 10',52.27197300000000268,20.99168560000000027,24.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Izabelli, 11',52.26636919999999976,20.95937220000000067,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Bracka, 3',52.22988360000000085,21.02005510000000043,15.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Bracka, 20B',52.23214959999999963,21.01718569999999887,12.0,0,5.5);
-INSERT INTO travel_info VALUES('ulica Długa, 19',52.24814130000000034,21.00578459999999836,14.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica ks. Zygmunta Trószyńskiego, 5',52.2739801999999969,20.9724162000000014,21.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Śląska, 14',52.20579459999999728,20.91907810000000011,36.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Górnośląska, 1',52.22570979999999708,21.04186160000000072,19.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Tucholska, 28',52.27161459999999949,20.98570150000000111,19.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Kaniowska, 118',52.2697878999999972,20.99583480000000079,26.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Śląska, 27',52.20478380000000129,20.92499979999999837,34.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Mierosławskiego, 3A',52.26546960000000296,20.99374040000000007,25.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Kaniowska, 1',52.26656839999999705,20.99430020000000142,26.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Zodiakalna, 12',52.2122130999999996,20.91214730000000088,33.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Izabelli, 6',52.26424870000000311,20.95875119999999824,31.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kolumba, 28',52.17471239999999711,20.92968700000000126,57.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Śmiała, 79',52.26905270000000314,20.99334029999999985,25.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Potocka, 58',52.27314810000000022,20.97723969999999837,20.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Wespazjana Kochowskiego, 13',52.26649660000000352,20.98059359999999885,20.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Fraszki, 12A',52.20534140000000178,20.90054190000000033,41.0,0,20.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 257',52.19229190000000073,20.95940320000000056,40.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Geologiczna, 13',52.18996949999999658,20.95429910000000006,40.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Pograniczna, 3',52.1685844000000003,20.9328025999999987,49.0,2,18.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 12',52.20570390000000315,20.90914730000000076,33.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Brygadzistów, 25',52.22417560000000236,20.91178469999999833,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Jana Bułhaka, 1',52.25130000000000052,20.87304460000000005,41.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Hery, 16',52.24958050000000042,20.90790720000000035,30.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Dostępna, 52',52.25983540000000004,20.90281399999999934,31.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 3B',52.23685780000000278,20.91154410000000041,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica gen. Meriana C. Coopera, 7S',52.23847539999999868,20.89327570000000022,37.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dorohuska, 11',52.25192930000000046,20.87219479999999905,41.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Deyny, 12',52.24181169999999952,20.90315849999999998,34.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Oblęgorska, 8',52.25203590000000275,20.87585049999999853,43.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kluczborska, 2',52.24241659999999854,20.9230072999999983,24.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 6C',52.22201030000000088,20.89097969999999905,41.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 6A',52.2221991999999986,20.89144329999999883,40.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 228D',52.24036159999999996,20.8987406,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 29B',52.25663190000000213,20.89469830000000173,36.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 228C',52.24041119999999694,20.89805289999999971,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 75D',52.32543019999999956,21.07194589999999935,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Oławska, 5',52.25918620000000203,20.92423279999999863,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Aroniowa, 13A',52.35324860000000057,21.04269890000000132,60.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Zachodzącego Słońca, 54',52.25765630000000072,20.91434209999999894,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Atutowa, 3',52.31595550000000116,20.96001599999999954,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Telefoniczna, 18',52.2645374000000018,20.90008770000000026,43.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 27',52.25782339999999949,20.91819509999999837,30.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Lustrzana, 33A',52.22173910000000063,20.90469540000000138,38.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Puszczy Solskiej, 3',52.22668749999999705,20.90962379999999853,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Moździerzy, 6A',52.21809820000000001,20.89535929999999909,39.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Miejska, 2A',52.22246410000000338,20.90948390000000146,35.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Narwik, 20B',52.24222040000000077,20.89529209999999893,30.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Mieczysława Wolfkego, 12B',52.25795190000000189,20.9273838000000012,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Pełczyńskiego, 139',52.24223349999999755,20.89876190000000022,31.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Aroniowa, 10',52.3526410999999996,21.0418731000000001,59.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 61',52.21761060000000043,20.90720579999999985,39.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 20A',52.22305240000000026,20.89439050000000008,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Anilinowa, 1C',52.34826209999999947,20.94561919999999944,50.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Radiowa, 20E',52.25815930000000264,20.90302799999999906,31.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Skłoby, 7',52.25153699999999902,20.87776029999999849,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Michała Sobczaka, 56',52.25953779999999683,20.89999909999999871,30.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 119',52.21595429999999994,20.88177840000000174,39.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 63A',52.22404840000000092,20.9040247999999984,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Guńki, 8A',52.34368109999999775,20.99835630000000108,38.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 107',52.31724919999999913,21.06686720000000079,36.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Czarodzieja, 17',52.33387520000000137,20.96484690000000129,44.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Rozalińska, 16',52.24959710000000256,20.8779016999999989,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 95',52.21616430000000264,20.89834310000000173,38.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 158N',52.32381970000000137,21.08839689999999934,54.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Epopei, 4',52.3328817000000015,20.98793230000000065,28.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 99',52.33361850000000004,21.05427919999999987,50.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Borecka, 27',52.32777920000000193,21.00988500000000058,59.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 6K',52.34611590000000092,20.92940009999999874,64.0,2,34.0);
-INSERT INTO travel_info VALUES('ulica Bukowska, 23',52.35287399999999991,20.93086050000000143,53.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Dębowa, 10K',52.36110260000000238,20.9464970000000008,56.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 39',52.3125947999999994,21.03855659999999972,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 39G',52.31270669999999968,21.03620799999999846,41.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 41',52.34320610000000328,20.97688450000000059,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 44',52.22315619999999826,20.9033161000000014,39.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Ekspresowa, 5',52.31305340000000114,20.97925770000000157,36.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 25',52.310291399999997,21.03945639999999884,34.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Gryfitów, 4A',52.30319099999999822,21.03091230000000066,32.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 23Y',52.35640209999999684,20.97560160000000095,35.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 37ZC',52.33254370000000221,21.02354240000000018,57.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 16A',52.3318158000000011,20.97304929999999957,48.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 91',52.32479469999999822,21.07423620000000142,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Calineczki, 43',52.35371630000000209,21.06458969999999909,63.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 5A',52.33150899999999695,20.96981909999999871,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 236A',52.31836650000000332,21.03317380000000014,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cudne Manowce, 8',52.34403569999999917,21.02548549999999849,54.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Leszczynowa, 3',52.30494060000000189,20.98115909999999929,59.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 101D',52.33366410000000001,21.0524558000000006,52.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Marcina Kątskiego, 13',52.3193733000000023,20.98311440000000161,46.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Krzyżówki, 28',52.30689389999999861,20.99401350000000121,39.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Marywilska, 7',52.29691890000000142,21.01266680000000165,24.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Marywilska, 73',52.31968930000000028,20.99563350000000028,36.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Lapońska, 13',52.3103960999999984,21.05336739999999907,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Marcina z Wrocimowic, 16A',52.34305379999999986,20.93724479999999843,52.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 315B',52.32062870000000032,21.03147549999999911,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 289A',52.31826350000000047,21.03217240000000032,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 27D',52.33031890000000174,21.0252561,47.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Lewandów, 46',52.32217899999999844,21.07545629999999904,40.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Jarzębinowa, 34',52.3471133999999978,21.0651565000000005,59.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 71',52.33135000000000047,21.05588080000000061,49.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kniei, 12',52.34103540000000265,21.0769434000000011,74.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Książkowa, 9B',52.33036390000000181,20.94038219999999839,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Jagmina, 8',52.32183710000000331,20.96636270000000124,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 4',52.35556890000000151,21.02936989999999895,47.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Jabłoni, 2',52.35331180000000017,20.98005279999999929,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Mańkowska, 2',52.34660629999999771,21.05018550000000133,52.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 58G',52.35986489999999805,21.04865789999999847,54.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Małego Rycerza, 16',52.33368080000000333,21.03825910000000121,48.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Laurowa, 33',52.30255600000000271,20.98032440000000065,41.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Lapońska, 17',52.31040889999999877,21.05360170000000153,39.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Kukuczki, 28',52.35430660000000102,21.02333030000000136,59.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Marcina z Wrocimowic, 12G',52.34417799999999943,20.93841120000000088,54.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 129',52.31929840000000098,21.04938230000000133,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Kopijników, 67B',52.30466040000000305,21.04657440000000079,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 217',52.33774760000000014,21.04689069999999874,43.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 89H/1',52.31308400000000347,21.04920050000000132,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 61A',52.33363169999999798,20.95970549999999832,43.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Milenijna, 27',52.32221489999999875,20.96600959999999958,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 245B/12',52.3414295999999979,21.03875299999999982,51.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Osuchowska, 7A',52.33249959999999846,20.95612799999999965,47.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Olesin, 112',52.35972799999999694,21.06386660000000077,57.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Odkryta, 50B',52.3349437999999978,20.93977830000000039,45.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Główna, 7',52.35269670000000274,20.94020139999999941,53.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Natalii Gąsiorowskiej, 32A',52.35497929999999656,20.94014220000000037,51.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Jesiennych Liści, 15D',52.31006380000000177,21.05860039999999956,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kiersnowskiego, 19',52.34249280000000226,20.97852590000000105,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 89T',52.3129665000000017,21.04801570000000054,41.0,1,25.5);
-INSERT INTO travel_info VALUES('Trakt Nadwiślański, 14',52.31903979999999877,20.96274299999999969,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 56K',52.30777020000000021,21.05384109999999965,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Międzyrzecze, 22',52.36142389999999836,21.04293990000000036,55.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Obrazkowa, 36',52.31509810000000015,20.97491580000000156,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 136F',52.35027600000000091,20.97977149999999824,40.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Paavo Nurmiego, 53',52.3089656000000005,21.04908659999999899,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 328P',52.34881810000000257,20.94976159999999865,54.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 104',52.35625939999999901,21.03710570000000147,58.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 307',52.34004149999999811,20.95511450000000053,44.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 167',52.35620759999999763,21.02816879999999955,47.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Szałasa, 13A',52.3211367999999979,20.97536240000000163,42.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 51B',52.32029719999999884,21.05612849999999981,38.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Rzędziana, 7',52.3342452999999992,21.03574010000000172,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 189A',52.36081599999999981,21.02710670000000092,50.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Miętowa, 8',52.31604029999999739,20.9993192999999998,30.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 96T',52.35645600000000143,21.04405919999999953,58.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 16',52.32797759999999699,20.94599279999999908,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 35A',52.33277549999999679,20.94454779999999871,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 371A',52.35489009999999866,20.94096760000000045,53.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 100',52.32051919999999968,20.9568052999999992,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 102',52.32115420000000227,20.95462110000000066,41.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 286',52.34166110000000315,20.95456079999999944,50.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Mikołaja z Długolasu, 8',52.31844799999999652,21.02455030000000136,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Galaktyki, 11',52.21134899999999846,20.91157640000000129,34.0,2,18.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 2',52.17132380000000324,20.92933100000000123,57.0,2,20.5);
-INSERT INTO travel_info VALUES('Aleje Jerozolimskie, 200',52.19454269999999952,20.92542070000000009,37.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Nike, 13',52.21112080000000332,20.91507440000000174,34.0,2,18.5);
-INSERT INTO travel_info VALUES('ulica Płomyka, 20',52.20035279999999745,20.91992510000000038,43.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Milanowska, 17',52.20279469999999833,20.91671669999999849,32.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Popularna, 56A',52.20297579999999727,20.92699590000000143,31.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Bolimowska, 1B',52.24870109999999813,20.87953780000000137,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Bolkowska, 2A',52.24062330000000287,20.91608220000000174,22.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Ebro, 30',52.26248439999999818,20.90528709999999891,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Iskry, 11',52.25006290000000319,20.87501680000000092,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Elektry, 7',52.25000880000000336,20.90931339999999849,29.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Hery, 10',52.24939859999999925,20.90764850000000052,29.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Gabriela, 7',52.22041779999999989,20.91003969999999867,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Dostępna, 24',52.26273030000000119,20.90680479999999975,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 69A',52.22441189999999978,20.9051985000000009,36.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Rosy Bailly, 1',52.24879210000000284,20.92509409999999904,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Henryka Dobrzańskiego „Hubala”, 2',52.24893300000000095,20.87550870000000102,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Batalionów Chłopskich, 78A',52.23232089999999773,20.89512949999999947,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Ligonia, 59',52.26414059999999751,20.91346589999999849,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 1',52.26128940000000255,20.91681279999999888,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Kunickiego, 31',52.26262520000000222,20.89964700000000164,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Apoloniusza Kędzierskiego, 1',52.25183419999999757,20.91612160000000031,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 131',52.23830449999999815,20.89613190000000031,27.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Hery, 54',52.25173420000000135,20.91067950000000053,28.0,1,22.0);
-INSERT INTO travel_info VALUES('Plac Kasztelański, 6',52.23204109999999645,20.91543830000000171,25.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kazubów, 12',52.24561789999999917,20.91464390000000151,29.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Kazubów, 8',52.24436800000000147,20.91324080000000051,27.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 16B',52.21894629999999893,20.88985309999999985,44.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Kunickiego, 20',52.26414499999999919,20.90157430000000005,38.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 51',52.26428940000000267,20.91468539999999976,39.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 17',52.25214379999999892,20.89745939999999891,40.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 228',52.23966349999999892,20.8999334999999995,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 2',52.25316180000000088,20.89956610000000125,34.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 26A',52.22595710000000224,20.89142580000000037,39.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Sochaczewska, 30',52.2204701,20.88056990000000112,55.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 6A',52.21869459999999919,20.89986890000000131,41.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 20A',52.25176890000000184,20.92537980000000176,28.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Łagowska, 3',52.24156909999999954,20.91611800000000087,24.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Lazurowa, 11A',52.22394630000000148,20.89529380000000102,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Narwik, 17A',52.24149380000000064,20.89471610000000012,30.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 53A',52.32480069999999728,21.06934989999999886,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 13',52.32471120000000297,21.05596750000000129,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Spychowska, 51',52.25109109999999646,20.87239639999999952,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 26B',52.22640429999999868,20.89130460000000156,39.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Reżyserska, 17',52.22654399999999698,20.9073323000000002,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 25CD',52.22231440000000191,20.89416780000000174,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Obrońców Tobruku, 48',52.25433559999999745,20.93129869999999926,25.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 32D',52.2289671999999996,20.88752519999999891,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wrocławska, 5',52.24853780000000114,20.91879709999999904,26.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Sternicza, 46',52.22278790000000014,20.91121289999999889,33.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 101',52.22152210000000138,20.90844209999999847,36.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Babinicza, 14',52.33688089999999705,21.04384020000000178,46.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 47',52.26382910000000237,20.91657770000000127,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Radziejowicka, 5',52.24959779999999654,20.87977370000000121,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 18',52.26224590000000347,20.91685500000000176,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Dołowa, 17',52.32794830000000274,20.96366910000000061,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Drożdżowa, 5',52.3283573000000004,20.9750672999999992,48.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 114A',52.21728300000000189,20.88416099999999887,42.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 27',52.22063829999999741,20.90252949999999999,39.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 28A',52.22128779999999893,20.90241740000000092,39.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Pirenejska, 3A',52.25550239999999747,20.91452770000000072,36.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Edmunda Jana Osmańczyka, 14B',52.25950310000000342,20.93235059999999948,30.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 11A',52.35448240000000197,20.97954680000000139,37.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Gryfitów, 16',52.30369369999999663,21.0328513000000008,34.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Geometryczna, 5',52.31141430000000269,21.0722334999999994,42.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Geometryczna, 7A',52.31192209999999677,21.07146099999999934,42.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 8Y',52.3076426000000012,21.04387609999999853,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Dobka z Oleśnicy, 22C',52.32532080000000007,21.04006539999999959,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 56B',52.31082649999999746,21.06654520000000019,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fleminga, 42K',52.32016500000000291,20.97910189999999986,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 287',52.31835629999999782,21.03170640000000091,37.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 17H',52.35553819999999803,20.9771371000000002,36.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 21L',52.355998900000003,20.97519099999999881,35.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Brzeziny, 34A',52.33066230000000018,21.04581479999999871,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Chlebowa, 18',52.35406619999999834,20.96869029999999867,34.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Chlebowa, 1',52.35281260000000003,20.96986580000000088,36.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ciechanowska, 1',52.35446910000000286,20.93296349999999962,60.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Czeremchowa, 21C',52.34340749999999787,20.95816230000000147,49.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Dwusieczna, 7A',52.3535870999999986,20.97699000000000069,35.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Dwusieczna, 7',52.35342030000000335,20.97705170000000052,35.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Arcangela Corellego, 5D',52.34399789999999797,21.05030620000000142,51.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 57L',52.36307670000000058,21.04830899999999972,53.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Internetowa, 43A',52.31873999999999825,21.07421039999999834,56.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Marcina Kątskiego, 19',52.32005070000000301,20.98469180000000022,48.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Leśny Potok, 17',52.3590547000000015,21.05172130000000052,56.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Księcia Jaremy, 6',52.30971720000000146,21.03419620000000023,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Borecka, 39',52.32795689999999667,21.01279070000000004,56.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 159J',52.3265098999999978,21.0881419000000001,54.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 19D',52.35622779999999921,20.97736989999999935,37.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 159A',52.32562450000000353,21.08850509999999901,52.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 8C',52.32441229999999877,21.05321019999999877,41.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 147',52.32394500000000192,21.06676290000000051,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Marchołta, 25A',52.32995280000000093,20.96986869999999926,45.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Książkowa, 44D',52.32828119999999928,20.94770219999999838,48.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kniei, 8',52.34116079999999727,21.07848770000000016,65.0,2,35.0);
-INSERT INTO travel_info VALUES('ulica Kuszników, 32E',52.30406949999999711,21.03945889999999964,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica św. Marii Magdaleny, 6',52.29782339999999863,21.01781629999999979,40.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 6K/1',52.34617250000000154,20.92959039999999859,64.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Kamykowa, 28',52.31099150000000008,21.04523049999999885,44.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Lubawska, 9',52.34574769999999689,21.00887690000000063,50.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Kumaka, 8',52.33665140000000093,21.05817190000000139,51.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Mańkowska, 66',52.35098920000000077,21.06757059999999982,61.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Ku Rzece, 5A',52.2989377000000033,20.978145099999999,41.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Mańkowska, 12C',52.34778620000000159,21.05224899999999977,58.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Kukuczki, 7A',52.35260379999999714,21.02673240000000021,50.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Małego Księcia, 3',52.35216030000000131,21.05921449999999951,58.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Oleńki, 3A',52.33615730000000354,21.03574300000000008,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Operowa, 21B',52.33179069999999911,21.00277649999999952,55.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Pasłęcka, 5',52.33111679999999666,20.94886029999999977,47.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 229L',52.34037899999999866,21.04556330000000131,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 131',52.32215010000000177,21.0664517999999994,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Odkryta, 18A',52.32827199999999835,20.93735189999999947,44.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kroczewska, 75E',52.34234649999999789,21.07815379999999906,64.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Olesin, 110A',52.35938759999999804,21.06396020000000035,57.0,1,36.0);
-INSERT INTO travel_info VALUES('ulica Kwietniowa, 20',52.35230549999999994,20.97196369999999988,36.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Kłosowa, 11',52.35800729999999704,20.97570190000000067,30.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Osiedle, 1A',52.346298400000002,20.94466369999999956,50.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Krzyżówki, 13A',52.30985760000000084,20.99245660000000057,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jarzębinowa, 7',52.34680159999999916,21.05784710000000004,49.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 152',52.32200770000000034,21.04972229999999911,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 164X',52.35407029999999651,20.99222890000000063,61.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 164R',52.3542221000000012,20.99292270000000115,44.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 207D',52.33473949999999775,21.04514819999999987,44.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Milenijna, 41A',52.32281129999999792,20.96112600000000014,45.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Owoców Leśnych, 6',52.31470290000000034,21.04106069999999918,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wiktorii Kaweckiej, 12',52.33122190000000273,20.99169039999999953,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Jesiennych Liści, 19C',52.31012139999999989,21.05928349999999938,34.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Główna, 15',52.35348869999999977,20.94277179999999917,53.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 82K',52.31255759999999811,21.05445699999999932,40.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 8E',52.31592020000000076,21.03491680000000131,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Olesin, 27C',52.34690319999999986,21.06815620000000066,67.0,2,33.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 336',52.3506146000000001,20.94703240000000121,50.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Sprawna, 30C',52.3413979999999981,20.94549269999999908,44.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 125A',52.31361950000000149,20.97502689999999959,39.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 58C',52.30830499999999717,21.05331119999999956,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Ornecka, 102',52.33953050000000217,21.01384549999999862,54.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 93A',52.31868070000000159,20.95754009999999923,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 65',52.30899490000000184,20.98098600000000147,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 6C',52.29226129999999984,21.00468770000000163,31.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Ołówkowa, 49',52.34499559999999719,20.98260030000000143,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 328O',52.3488945000000001,20.95000080000000154,54.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Claudia Monteverdiego, 4',52.34254570000000228,21.05367030000000028,47.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Gioacchino Rossiniego, 17',52.34313800000000327,21.05055660000000017,49.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Szałasa, 12',52.32055669999999737,20.97558039999999834,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Piwoniowa, 34',52.35703840000000042,20.97347399999999951,27.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Staropolska, 6',52.31177660000000173,21.04962689999999981,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 10',52.34229739999999965,21.05983519999999842,50.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Piskląt, 5',52.34402670000000057,20.98273149999999987,37.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Szklarniowa, 2B',52.32734760000000306,21.01601030000000137,54.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 49A',52.32013830000000353,21.05727879999999886,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 2A',52.34671970000000129,21.046729899999999,58.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Szamocin, 25L',52.35134180000000014,21.02619400000000027,51.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Sprawna, 22A',52.3415225000000035,20.94362690000000172,48.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 45A',52.33333249999999737,20.94287980000000004,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 321',52.34161499999999734,20.95168470000000127,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Paavo Nurmiego, 75',52.30904379999999776,21.05051449999999846,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 117',52.34807080000000212,20.97618160000000031,41.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 75',52.33620799999999918,20.9630396999999995,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Nowodworska, 27A',52.32168769999999825,20.9381282000000013,47.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Mielnicka, 4',52.35083149999999819,20.93984329999999972,52.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 346B',52.35406700000000057,20.94360700000000008,53.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 342',52.35131100000000259,20.94559659999999823,51.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Starego Dębu, 16',52.34894239999999855,20.98049290000000156,39.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Rozewska, 15D',52.3200207000000006,20.98010310000000089,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 17F',52.34281179999999978,21.05696520000000049,59.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 17C',52.34281339999999716,21.05769349999999918,52.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Szklarniowa, 30',52.32812830000000303,21.02738210000000051,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 97B',52.337539900000003,21.02808260000000117,46.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 80H',52.35629579999999806,21.05564999999999998,52.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Pośrednia, 19',52.31021880000000123,21.03859609999999947,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 43',52.28350139999999869,20.90371830000000131,36.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Raciborska, 5C',52.35336519999999894,20.9836235000000002,39.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 145',52.28540209999999889,20.8889560000000003,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Płytowa, 14',52.31984039999999681,21.01255889999999837,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 51F',52.31451380000000028,21.04440849999999941,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Przy Kanale, 8A',52.33905020000000263,21.03180899999999909,46.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Porajów, 3B',52.31473549999999762,20.96100879999999833,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Szawelska, 19',52.35157499999999687,20.93713500000000139,55.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 187C',52.36035100000000142,21.02513390000000015,57.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Żywiczna, 43',52.32330189999999704,20.97916560000000175,44.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Łączna, 15',52.35262170000000025,20.93922810000000112,53.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Poetów, 6W',52.33804829999999698,20.94742330000000052,48.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Pabla Picassa, 5',52.3128110000000035,20.9563322999999997,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 52J',52.31432499999999664,21.04617700000000013,42.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Żubowiecka, 4',52.30734770000000111,20.98578709999999959,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 32',52.28395189999999815,20.90450260000000071,36.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wilkowiecka, 9F',52.34614270000000146,21.01987529999999893,60.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Zbyszka z Bogdańca, 17B',52.31049529999999948,21.03416939999999969,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Waligóry, 1C',52.32690819999999832,20.99965819999999895,57.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Zawiślańska, 3A',52.34970059999999848,20.97591320000000081,39.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Tymotki, 23A',52.35629490000000174,21.06081590000000148,57.0,1,34.5);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 23C',52.34071110000000004,21.04125090000000143,51.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Mariana Wyrzykowskiego, 5A',52.33695399999999865,20.95161369999999935,55.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Wiklinowa, 7C',52.32171979999999679,20.98606459999999885,53.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 89D',52.28371729999999929,20.89671119999999859,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Twórcza, 79O',52.32281629999999951,21.03582199999999958,53.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 71H',52.32188690000000264,21.03566269999999961,51.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 46C',52.29502140000000309,20.88757779999999898,56.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Heroldów, 7',52.30454759999999937,20.93144789999999844,30.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Zofii Nałkowskiej, 13',52.27542429999999741,20.95238289999999993,26.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Marii Pawlikowskiej-Jasnorzewskiej, 28',52.27749949999999757,20.95596340000000169,21.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Jana Kochanowskiego, 16',52.26801319999999862,20.94849939999999933,29.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Wacława Berenta, 22',52.28114589999999851,20.96980819999999924,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Krotoszyńska, 2',52.28085810000000321,20.95650189999999924,25.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Estrady, 72E',52.29596329999999683,20.8808290999999997,43.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Palisadowa, 39',52.29599670000000344,20.90269899999999836,46.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Literacka, 17B',52.2660094000000015,20.94873850000000103,34.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 42',52.28254439999999903,20.95010690000000154,22.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Osikowa, 2',52.27349130000000343,20.92089400000000054,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kleczewska, 53',52.27988260000000053,20.94402150000000163,25.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Gustawa Daniłowskiego, 8',52.27465800000000228,20.9460248,30.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Kiwerska, 27',52.2833734000000021,20.96889009999999943,26.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Grębałowska, 15',52.28342090000000297,20.95212569999999986,24.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Fontany, 38',52.27989269999999778,20.95168689999999855,22.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Buska, 4',52.17710420000000226,21.06886739999999846,41.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Żółwia, 11A',52.271539599999997,20.92129969999999873,37.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Antoniewska, 40',52.20037589999999739,21.07812880000000178,41.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Dankowicka, 39A',52.30884999999999963,20.91188909999999979,39.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Burleska, 9',52.29300940000000252,20.89992930000000015,49.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Parnas, 4',52.29466159999999775,20.8804268999999998,44.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Bluszczańska, 69A',52.20897740000000197,21.06282009999999972,31.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Klaudyny, 36',52.28552020000000055,20.97336579999999984,27.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Estrady, 94C',52.29858800000000229,20.8821785999999996,43.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Estrady, 94A',52.29864100000000348,20.88123339999999928,41.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Królowej Jadwigi, 8N',52.30821710000000024,20.92510869999999912,41.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Adriatycka, 19',52.1732992999999965,21.05605650000000039,33.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Belwederska, 9',52.20306699999999723,21.03343059999999909,25.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Władysława Broniewskiego, 85A',52.27109730000000098,20.94473190000000073,24.0,1,20.5);
-INSERT INTO travel_info VALUES('Aleja Zjednoczenia, 38',52.28183920000000028,20.95185370000000091,21.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Burgaska, 2',52.1850219000000024,21.05069500000000104,33.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Stefana Żeromskiego, 23',52.27640569999999798,20.95074079999999838,25.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Belgijska, 6',52.20290769999999725,21.02561610000000058,22.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Bobrowiecka, 5',52.19902950000000174,21.04624839999999964,26.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Bobrowiecka, 10',52.19957709999999907,21.04651660000000035,26.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 12',52.27674449999999951,20.90416250000000176,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Bartosza Głowackiego, 6',52.27273160000000018,20.91615799999999937,37.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Bluszczańska, 34',52.20966899999999811,21.06797960000000102,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Zgrupowania AK „Żmija”, 2A',52.26887889999999715,20.94125689999999907,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Żółwia, 14',52.27226960000000133,20.9191779000000011,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Fortowa, 13',52.2750838999999985,20.93620209999999915,34.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Gdańska, 22',52.2773157000000026,20.96961239999999905,27.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Adriatycka, 37',52.17316720000000174,21.05506889999999842,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 8',52.27639640000000298,20.90417980000000143,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Belgijska, 4',52.20303520000000219,21.02632390000000129,22.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Prozy, 36',52.30711070000000262,20.94062669999999927,42.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Kwiatowa, 23',52.20432329999999866,21.01180180000000063,19.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Kwiatowa, 7A',52.2026293999999993,21.0122289000000002,19.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Białego Dębu, 17',52.18154289999999663,21.038138,33.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Efraima Schroegera, 29',52.2782453000000018,20.95164199999999966,25.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Pęcicka, 9',52.27997659999999769,20.97170810000000074,27.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Wolumen, 4',52.28348559999999879,20.9375846999999986,25.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 307A',52.29872379999999766,20.88334250000000125,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Rokokowa, 130F',52.28516450000000048,20.91351399999999928,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Brązownicza, 13',52.27348529999999727,20.92247250000000137,33.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Podleśna, 57',52.28349380000000223,20.96661149999999907,27.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 303P',52.29732400000000325,20.88548409999999934,48.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Kobylańska, 28',52.1902633999999992,21.09689230000000037,49.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Swarzewska, 39',52.27691959999999938,20.952663900000001,25.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Podczaszyńskiego, 1/3',52.27682589999999863,20.95371919999999832,24.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Renesansowa, 27',52.2762835999999993,20.93336790000000036,30.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Chochołowska, 7A',52.18272869999999842,21.06109119999999991,37.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Szaflarska, 9A',52.28339150000000046,20.94970989999999844,24.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Ksawerego Pruszyńskiego, 5',52.27941270000000173,20.95817999999999869,22.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Kaspijska, 6',52.17969089999999711,21.0493920999999986,34.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Iwonicka, 37',52.17763939999999679,21.06290909999999883,42.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Krasickiego, 18',52.19289280000000275,21.02092700000000036,21.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Janiszowska, 4A',52.18035400000000123,20.94687640000000072,44.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 6C',52.19876930000000214,20.9145639999999986,37.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Gidzińskiego, 43',52.17710629999999839,20.93180770000000023,57.0,1,20.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 15',52.16504450000000048,20.93110319999999903,49.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Nike, 16A',52.21103529999999893,20.91590030000000055,35.0,2,18.5);
-INSERT INTO travel_info VALUES('ulica Notecka, 21',52.21181740000000104,20.90171240000000096,52.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Józefa Brandta, 15',52.25190529999999712,20.87424640000000053,43.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 66',52.22472890000000234,20.90579410000000138,36.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Akantu, 30',52.26314150000000324,20.90464010000000173,38.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Bolimowska, 1D',52.24901549999999873,20.87985049999999987,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Andyjska, 14',52.25511339999999905,20.91145300000000163,31.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica gen. Waleriana Czumy, 16B',52.23542059999999765,20.90733450000000104,27.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Batalionów Chłopskich, 77C',52.23002819999999958,20.89311370000000067,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Drzeworytników, 85',52.22580849999999942,20.90583249999999894,34.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kiermaszowa, 10',52.23310519999999713,20.91670930000000083,29.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Kontuszowa, 3',52.21952100000000029,20.90721320000000105,40.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 49',52.26238659999999925,20.89736750000000143,35.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Korfantego, 73',52.26429910000000234,20.91740310000000136,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 200',52.23955000000000126,20.91143339999999995,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Galileusza, 3',52.25621060000000284,20.8900345999999999,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Górczewska, 150',52.2420669999999987,20.92140870000000063,25.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Ambaras, 16',52.34058759999999922,21.0017870000000002,39.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Strawczyńska, 15',52.25121370000000098,20.87915410000000093,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Tkaczy, 30',52.22284280000000222,20.90722050000000109,36.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 122',52.21747830000000334,20.87785420000000159,42.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Spychowska, 67',52.25121759999999683,20.87023579999999968,40.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Spychowska, 49',52.25103670000000022,20.8727462000000017,41.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Zeusa, 23',52.24810490000000129,20.910161200000001,25.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Karola Miarki, 1',52.26228139999999911,20.92063389999999856,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Słomiana, 19',52.22409230000000235,20.90858180000000032,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Wyki, 2C',52.23003700000000293,20.90217140000000028,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 159T',52.32754849999999891,21.08771279999999848,55.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Spychowska, 11',52.25013820000000208,20.87866770000000116,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 49',52.23079419999999829,20.9144445999999995,26.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Telewizyjna, 44',52.26075550000000191,20.90084739999999997,33.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Radziejowicka, 7',52.24961069999999808,20.87968950000000135,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica kpt. Władysława Raginisa, 8',52.23105110000000195,20.90702020000000161,60.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Telewizyjna, 29',52.26311849999999737,20.90356480000000162,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Waldorffa, 35',52.25645360000000039,20.94426320000000175,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica 15 Sierpnia, 49',52.32996190000000069,20.98039740000000108,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 32',52.26350260000000247,20.91573590000000138,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 19A',52.21997840000000223,20.90216110000000071,39.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Flisaków, 24',52.36229610000000178,21.04286869999999965,55.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 150B',52.30515979999999843,21.03098830000000063,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Christa Botewa, 1',52.3184309999999968,20.95387300000000153,39.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 38A',52.3339314999999985,20.99055389999999832,34.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Fletniowa, 22',52.339304300000002,20.97846910000000165,43.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 19K',52.35576950000000095,20.9766294000000002,35.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Danusi, 2G',52.31459970000000225,21.02569190000000177,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 87',52.32465179999999805,21.07378250000000008,44.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 34B',52.22216949999999969,20.90282709999999967,40.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Danusi, 5',52.31480810000000047,21.0241807999999999,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Daniszewska, 33',52.31228540000000037,21.02502670000000152,44.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Czarnocińska, 16A',52.3281253000000035,20.96973390000000137,44.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Rzędzińska, 49A',52.2340798000000035,20.92197949999999907,30.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Oświatowa, 41',52.23404359999999969,20.92013890000000132,30.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Fajna, 5',52.34717700000000206,21.04463270000000107,56.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 138',52.3031263000000024,21.03024860000000018,32.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Gladioli, 15',52.34830370000000243,20.92994050000000072,61.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Dziatwy, 12',52.33153680000000207,20.97143780000000035,45.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 27',52.3571282999999994,20.97701700000000002,32.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Czajki, 2',52.34748489999999777,20.96622019999999864,62.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Dzikiego Wina, 8',52.31526550000000241,21.03897230000000106,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 261B',52.31410699999999992,21.02914979999999901,35.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Arcangela Corellego, 5A',52.3441402999999994,21.05188280000000134,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 186B',52.31117470000000224,21.03133370000000113,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 23X',52.35654499999999701,20.975487600000001,34.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Leona Berensona, 37F',52.32563970000000352,21.06682879999999969,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Gitarowa, 30',52.3317588000000029,20.99881660000000139,58.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Maćka z Bogdańca, 24A',52.3078359000000006,21.05034320000000036,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 101C',52.33367369999999852,21.05260270000000134,52.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Internetowa, 40',52.31914210000000053,21.07403559999999842,44.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Chlubna, 5',52.35550409999999744,20.94781139999999909,60.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Internetowa, 45',52.31848719999999986,21.07375970000000009,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Lapońska, 23',52.31042980000000142,21.05396479999999926,40.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Lapońska, 54',52.31026810000000182,21.05633070000000017,42.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Leśny Potok, 4',52.36046530000000132,21.05033050000000116,54.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 328',52.3295560999999978,21.03304149999999951,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Czołowa, 38X',52.33566809999999947,20.99304689999999952,33.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kniei, 14',52.34091750000000331,21.07599779999999968,76.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 115A',52.33540419999999927,21.05324680000000014,59.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Głębocka, 100',52.31817190000000294,21.06805729999999955,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Marchołta, 1A',52.3263221999999999,20.97182799999999858,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Majorki, 39A',52.33740209999999849,20.99657380000000017,39.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kępa Tarchomińska, 14K',52.34856889999999652,20.92790159999999843,58.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Lidzbarska, 38',52.35638929999999647,20.98682369999999863,45.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Lidzbarska, 23C',52.35228359999999981,20.98784549999999883,59.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Lubawska, 4',52.34486820000000051,21.00924720000000078,50.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Małego Rycerza, 41',52.33435440000000227,21.04451590000000038,44.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 96A',52.3174747999999994,21.0686101999999984,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Głębocka, 115',52.31902819999999821,21.06664579999999987,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Odkryta, 27',52.33010209999999774,20.93557089999999831,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 60P',52.30869009999999975,21.05426900000000146,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Okrągła, 23',52.31776740000000103,21.0625473999999997,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 207A',52.33479179999999787,21.04644710000000174,43.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Hajduczka, 11',52.31949529999999982,21.05229599999999834,41.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Głębocka, 59',52.31226499999999647,21.06477350000000114,33.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 44B',52.31682080000000212,21.04444850000000145,44.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Okienko, 4',52.33088639999999714,20.96326189999999912,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Okienko, 14',52.33141030000000171,20.9622989000000004,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 172',52.32575560000000081,21.04889439999999822,42.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Konwaliowa, 24',52.30077030000000348,20.98441760000000044,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Oknicka, 3',52.32308179999999709,21.07936189999999854,41.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 164S',52.35435110000000236,20.99245249999999885,61.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 264A',52.33973329999999891,20.95718610000000126,50.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Hanki Ordonówny, 19',52.33221689999999882,20.95012380000000007,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 58Ł',52.3081676999999985,21.05481109999999844,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 89M',52.31278079999999875,21.04857910000000132,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Olesin, 65',52.35341199999999873,21.06562359999999856,65.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Klasyków, 10B',52.33257849999999678,20.97011690000000072,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Olesin, 102',52.35798779999999653,21.06429699999999983,59.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 60L',52.30864050000000275,21.0533354000000017,37.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 108',52.31660339999999821,21.05080969999999851,37.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Krzysztofa Kiersnowskiego, 40',52.34241699999999753,20.98008300000000048,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 214',52.33239300000000326,20.96519359999999921,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 73',52.35356269999999768,21.03814039999999964,58.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 59',52.3522792999999993,21.03843970000000141,56.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Szynowa, 1',52.32921429999999675,20.9874173000000006,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 65B',52.30891849999999721,20.98027989999999932,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 10',52.30069799999999703,20.98021620000000098,39.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Sieczna, 43',52.31572680000000019,21.07245539999999906,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 107H',52.34634109999999652,20.97446869999999919,44.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Mirocińska, 4',52.3058847,20.98208610000000007,40.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 328I',52.34874219999999668,20.95040260000000031,54.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 51A',52.32054639999999779,21.05638090000000062,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Słodka, 2',52.34772149999999869,21.05529209999999907,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 24',52.34541959999999961,21.05682360000000131,49.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Różopole, 4',52.35866080000000266,20.99235780000000062,64.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Stasinek, 20A',52.35893010000000202,20.93468530000000172,63.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Nowodworska, 10',52.3211974999999967,20.94030920000000152,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Mochtyńska, 88E',52.35468370000000248,21.03995249999999828,54.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Paavo Nurmiego, 67',52.30901959999999918,21.05004609999999943,38.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Międzyrzecze, 46',52.36202540000000027,21.04486149999999967,57.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Stągiewna, 3',52.3327358000000018,20.96724869999999897,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 53',52.31134620000000268,20.96681350000000065,39.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Morwowa, 29D',52.33151629999999699,21.00306610000000163,60.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 248C',52.33920229999999663,20.96002740000000131,55.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Morwowa, 29B',52.33155649999999782,21.00382580000000133,60.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 113C',52.31299289999999758,20.97661390000000025,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 65A',52.32251949999999852,21.05626709999999946,35.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Pułaskiego, 15',52.32326679999999897,20.98170650000000137,44.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 14B',52.32791550000000313,20.94639189999999828,44.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Starego Dębu, 10',52.34870089999999721,20.98020659999999893,39.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Skrzatów, 26',52.31508089999999811,21.03565970000000007,38.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 107M',52.33912490000000161,21.02364700000000041,48.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Słonecznego Poranka, 7',52.337885,21.06940379999999991,58.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Szamocin, 25C',52.35121999999999787,21.02542860000000147,51.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Szamocin, 34B',52.34936530000000232,21.02708309999999869,47.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Stogi, 5',52.3374005000000011,21.0484694999999995,46.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 116C',52.31723869999999721,21.06008130000000022,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 116B',52.3172114999999991,21.05987909999999986,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Domenica Scarlattiego, 6',52.34444849999999861,21.04741339999999994,51.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Domenica Scarlattiego, 4',52.34418670000000162,21.04794760000000053,52.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 39A',52.33270129999999654,20.94364189999999937,42.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Strzybnicka, 1C',52.34859879999999777,20.97578719999999919,42.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Sarenki, 4',52.34493859999999899,21.01538820000000029,64.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Sarenki, 1',52.34453280000000319,21.01434019999999948,62.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Gioacchino Rossiniego, 21',52.34314340000000242,21.04954150000000012,50.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Przydrożna, 27B',52.32084100000000148,21.02846429999999956,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 111',52.34107730000000202,21.02782910000000172,45.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Zegarynki, 18',52.33823490000000333,20.99764019999999932,40.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Piasta Kołodzieja, 44',52.31295759999999718,21.04614189999999851,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Żyrardowska, 27',52.34135359999999793,20.99948080000000061,38.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Akcent, 37B',52.29746080000000318,20.87810539999999904,46.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Bajana, 20',52.27480919999999998,20.9339125000000017,37.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Przeździecka, 3',52.3385395000000031,20.99157549999999973,34.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 164',52.28637270000000114,20.88392160000000075,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Przemian, 15A',52.32984079999999949,20.9598595000000003,46.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 162',52.35421360000000134,21.02885540000000119,46.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Zegarynki, 18A',52.33809759999999756,20.99814010000000052,39.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Akcent, 28C',52.29671799999999849,20.88134189999999891,44.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Ścieżka, 11',52.32779519999999707,20.96524159999999882,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Vincenta van Gogha, 3',52.31490780000000029,20.95411340000000066,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 157/23',52.28439319999999669,20.88573729999999884,40.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Ławnicza, 4',52.35617750000000114,20.97071490000000082,30.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Przyrzecze, 14',52.35522250000000354,20.94004160000000069,50.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Pomorska, 32',52.33037240000000167,20.96349139999999878,41.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Światowida, 53C',52.32389419999999803,20.94105319999999893,40.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Światowida, 51B',52.32202900000000056,20.94190150000000016,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Łączna, 13',52.35170759999999746,20.93994389999999939,52.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Poetów, 6B',52.33817489999999851,20.94703150000000136,48.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Toporczyków, 15',52.30504109999999685,21.03471139999999906,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 58E',52.34311360000000235,20.99413219999999925,36.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Tłuchowska, 16',52.34086899999999787,20.94312490000000082,44.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Tłuchowska, 12C',52.34083199999999892,20.94422510000000059,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 67E',52.321337800000002,21.03608750000000071,50.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jana Żiżki, 5B',52.33736230000000233,20.96130020000000016,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Widna, 7',52.35748799999999648,20.9871692000000003,46.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Opłotek, 4',52.29802120000000087,20.9082049000000012,46.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 46L',52.29553599999999847,20.88829739999999902,57.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Lektykarska, 11',52.27965749999999901,20.96749589999999941,28.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Estrady, 132',52.30258119999999878,20.88289479999999899,43.0,1,34.0);
-INSERT INTO travel_info VALUES('ulica Jana Kasprowicza, 61',52.28197620000000256,20.94822359999999861,20.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Wiśniowy Sad, 30',52.31340629999999692,21.02749070000000132,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Tajemna, 12',52.31600029999999891,21.06583669999999841,38.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wartka, 17',52.30976119999999697,20.98516469999999856,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 71B',52.32196900000000283,21.03705709999999839,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Zdziarska, 16',52.33974469999999713,21.03652220000000028,58.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Estrady, 102',52.29937439999999783,20.88162820000000153,41.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Magiera, 23A',52.27201039999999921,20.9471689000000012,30.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Cząstkowska, 32',52.2811834000000033,20.96787279999999853,30.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Klaudyny, 18B',52.28207840000000317,20.97690760000000054,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jana Kasprowicza, 93',52.28333380000000119,20.94525499999999952,22.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Księżycowa, 70/5',52.27375519999999654,20.91088769999999997,36.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Oriona, 29',52.28395129999999825,20.89399810000000101,40.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Lesznowolska, 6A',52.28447969999999856,20.95270680000000141,26.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 33',52.28075100000000219,20.95344199999999902,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Lisowska, 41',52.27927300000000343,20.95190769999999958,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 69',52.29441320000000104,20.88401610000000019,47.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Zabłocińska, 6',52.27879850000000061,20.96289700000000167,22.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Farysa, 70',52.30757690000000081,20.9311556000000003,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Kasjopei, 2',52.28271800000000268,20.90409089999999992,37.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Hieroglif, 8',52.30872790000000094,20.93275170000000073,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Bogumiła Zuga, 6',52.2807042000000024,20.95555269999999836,24.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Bluszczańska, 19F',52.20864879999999886,21.06872669999999915,37.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 7',52.27985590000000115,20.95538709999999938,23.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 18',52.28072800000000341,20.95402109999999851,23.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Estrady, 44',52.29004030000000113,20.87693189999999888,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Heroldów, 1B',52.30422149999999704,20.93393839999999884,34.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Jana Parandowskiego, 35',52.2825609,20.96462680000000134,30.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Heroldów, 19A',52.30334620000000001,20.92964290000000104,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Bergamotki, 6',52.17842360000000212,21.04070219999999835,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Wóycickiego, 19',52.29753490000000226,20.90181210000000078,43.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Asfaltowa, 7A',52.20581690000000207,21.00741430000000065,14.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Batalionu AK „Karpaty”, 1',52.20819120000000168,21.0630412999999983,30.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Bukowińska, 21/25',52.17993510000000156,21.02664779999999923,20.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Władysława Broniewskiego, 37',52.26772439999999876,20.95755199999999974,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Dziewierza, 20',52.29789209999999855,20.88244179999999873,44.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Bzowa, 14',52.18676690000000206,21.03388449999999921,29.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Zgrupowania AK „Żmija”, 15C',52.26811690000000254,20.93871359999999982,34.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica św. Bonifacego, 143',52.19095149999999706,21.06632019999999983,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Cegłowska, 27',52.28443939999999657,20.95366200000000135,26.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 36',52.27871309999999739,20.90554089999999831,41.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Balladyny, 7',52.20076009999999656,21.00172159999999977,20.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Łomiańska, 5A',52.28009930000000338,20.96956369999999836,30.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Bogumiła Zuga, 28',52.28361110000000167,20.95125489999999857,24.0,0,22.0);
-INSERT INTO travel_info VALUES('Aleja Słowiańska, 20',52.27625119999999726,20.9657075000000006,23.0,0,20.5);
-INSERT INTO travel_info VALUES('Aleja Słowiańska, 15',52.27619599999999878,20.96739529999999974,24.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Renesansowa, 4',52.27568670000000139,20.93722700000000003,31.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Sobocka, 14',52.28222060000000226,20.96944969999999841,25.0,1,19.5);
-INSERT INTO travel_info VALUES('Plac Bernardyński, 1',52.19501710000000116,21.05531440000000031,30.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Kazimierzowska, 49',52.20354799999999785,21.01492299999999958,22.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Skalbmierska, 16',52.28255159999999791,20.94356910000000127,25.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Idzikowskiego, 8',52.19285049999999871,21.05101780000000033,35.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Konduktorska, 1A',52.1994376000000031,21.03153179999999978,23.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Kalatówki, 4',52.18662179999999751,21.02580070000000135,19.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Przybyszewskiego, 63/67',52.28165090000000247,20.94374549999999857,25.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Ptasi Raj, 13',52.31023030000000062,20.90823579999999993,42.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Zbigniewa Romaszewskiego, 14',52.2732922000000002,20.95837799999999974,23.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Łomiańska, 39',52.28262809999999661,20.9681065999999987,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pułkowa, 32',52.30520280000000354,20.93562280000000086,33.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Gościniec, 33',52.20975580000000348,21.07591820000000026,35.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Cytrynowa, 4',52.20977950000000333,21.06998259999999946,37.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Kaukaska, 8',52.18139959999999889,21.04998820000000138,34.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Chełmska, 10A',52.20279010000000141,21.04743720000000095,34.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Klarysewska, 25A',52.17966820000000183,21.06842809999999843,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Krasickiego, 14A',52.19216769999999884,21.02112950000000068,20.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Górska, 9D',52.20372720000000299,21.03649049999999932,26.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Kolady, 3',52.17324299999999937,21.00143849999999902,32.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Dyżewskiego, 15',52.21489369999999753,21.06396399999999857,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Oskara Kolberga, 10',52.18980739999999941,21.00918790000000058,23.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Konduktorska, 5',52.20021400000000255,21.02954539999999995,21.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Fryderyka Joliot-Curie, 10',52.19032479999999908,21.00916339999999848,24.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Cypryjska, 45',52.17222000000000292,21.06017780000000173,39.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Imielińska, 11',52.18760360000000275,21.03454920000000072,25.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Domaniewska, 48',52.18344849999999724,20.99698349999999892,31.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Jarosława Dąbrowskiego, 47',52.2009647000000001,21.01424480000000016,17.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Czerniowiecka, 4A',52.18522719999999993,21.02751130000000046,24.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Gimnastyczna, 44',52.19733289999999926,20.99715150000000107,25.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Jadźwingów, 17',52.17199579999999771,21.00164029999999826,31.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Jadźwingów, 15',52.17168420000000139,21.00229119999999838,30.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Dzikich Jabłoni, 6',52.18295169999999672,21.04170530000000027,32.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Klarysewska, 41',52.18248410000000347,21.06353479999999934,38.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Kobylańska, 48D',52.19201660000000231,21.09826490000000021,50.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 53A',52.20463749999999692,21.0241125999999987,22.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Okrężna, 83',52.17991690000000204,21.06295379999999895,38.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Rolna, 185A',52.17728939999999938,21.0268581999999995,24.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Cisowa, 12A',52.18656670000000019,21.03139930000000035,26.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Olimpijska, 32',52.19334479999999843,20.99736509999999968,27.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Daktylowa, 16',52.21089020000000147,21.06932859999999863,35.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Ciechocińska, 11',52.1785203000000024,21.06752820000000171,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Jarosława Dąbrowskiego, 3',52.20255449999999798,21.02228600000000113,23.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Powsińska, 70',52.19135270000000303,21.05932579999999988,32.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Powsińska, 8A',52.1800108999999992,21.07160909999999988,40.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Czerska, 17',52.20614040000000244,21.04517939999999853,29.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Cyganeczki, 4',52.17857419999999991,21.06281450000000178,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Figowa, 9',52.21065480000000036,21.0686758999999988,35.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Domaniewska, 50B',52.18371870000000001,20.99328429999999913,31.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Płatowcowa, 52',52.19607959999999736,20.99403810000000092,24.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Władysława Orkana, 12',52.1863195000000033,21.02339440000000081,19.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Ludwika Narbutta, 56',52.2056325000000001,21.01006399999999986,16.0,0,10.0);
-INSERT INTO travel_info VALUES('Aleja Lotników, 30',52.17534289999999686,21.00971480000000113,28.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Józefa Madalińskiego, 67C',52.20227320000000048,21.0084540000000004,19.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 26A',52.20597310000000135,21.02229709999999941,22.0,1,12.5);
-INSERT INTO travel_info VALUES('Aleja Lotników, 4',52.17370489999999706,21.01910409999999985,20.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Mesyńska, 12',52.17432349999999986,21.05987169999999863,36.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Ludwika Narbutta, 86',52.20376350000000087,21.00061820000000168,22.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Narbutta, 10',52.2071398000000002,21.01977330000000065,21.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Ponikowskiego, 6A',52.21424209999999988,21.06462270000000103,36.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Ponikowskiego, 2C',52.21434430000000048,21.06549589999999838,36.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 36',52.20445019999999659,21.02266489999999877,22.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Malczewskiego, 18',52.19453080000000255,21.0212848000000001,24.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Niedźwiedzia, 20',52.17589420000000188,21.02920659999999841,24.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Melomanów, 2',52.20550740000000189,21.05316850000000173,33.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Wysowska, 13',52.17864809999999665,21.06184040000000123,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Puławska, 117A',52.18700450000000046,21.0251595999999985,20.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Olesińska, 5',52.2046323000000001,21.02185379999999882,22.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Żwirki i Wigury, 24',52.2049116999999967,20.98820789999999903,28.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Limanowskiego, 6',52.19165890000000018,21.06251939999999934,35.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Jana Dantyszka, 8',52.21820830000000057,20.99080179999999985,22.0,1,9.5);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 124',52.20315620000000222,21.01056300000000121,19.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Jana Maklakiewicza, 2B',52.18913479999999794,20.99278629999999879,25.0,1,16.0);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 77/85',52.19230819999999938,21.01512059999999949,18.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Miączyńska, 37',52.19228309999999738,20.99635280000000037,26.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Macedońska, 3',52.17467270000000212,21.04831060000000064,31.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Narocz, 12',52.17162299999999676,21.01237349999999893,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Macedońska, 62',52.17617070000000012,21.04547549999999844,30.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Wynalazek, 3B',52.17896970000000322,20.99317560000000071,32.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Częstochowska, 19',52.21550760000000224,20.97578310000000101,27.0,1,13.5);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 177',52.21011649999999805,21.00642859999999957,15.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Miączyńska, 32',52.19250100000000003,20.99610739999999965,26.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Malczewskiego, 38',52.19379049999999865,21.01708560000000148,21.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Modra, 3',52.17901669999999826,21.01729560000000063,24.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Narbutta, 9',52.20689730000000139,21.02003119999999825,21.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Malczewskiego, 46A',52.19323200000000184,21.01313280000000105,21.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Orężna, 7A',52.18437980000000209,21.0635860000000008,37.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Padewska, 14',52.20244799999999686,21.03079819999999956,25.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Niedźwiedzia, 39A',52.1761562000000012,21.02338359999999895,21.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Różana, 14',52.20321059999999847,21.02012789999999853,25.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Zelwerowicza, 49',52.17861889999999648,21.06101909999999933,41.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Zawrat, 12',52.18732140000000185,21.02758499999999841,22.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Rabindranatha Tagore, 1A',52.19349330000000009,21.00695779999999857,26.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Altowa, 24A',52.19926240000000206,20.96261519999999833,32.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Karola Bohdanowicza, 17',52.1990854000000013,20.97543010000000052,38.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Wiśniowa, 6/10',52.20157290000000216,21.01885899999999908,21.0,0,12.5);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 335A',52.17893049999999989,21.02320620000000062,20.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Zwierzyniecka, 16',52.21093669999999776,21.05001779999999912,28.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Bora-Komorowskiego, 56A',52.22764149999999717,21.07769010000000165,30.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 5',52.1747948000000008,21.02324210000000093,22.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Tyniecka, 10',52.19111879999999815,21.02324009999999888,22.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 53',52.20179710000000028,20.95733020000000124,40.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 65A',52.20230519999999786,20.95296689999999984,41.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Wiktorska, 83/87',52.19812009999999703,21.00812090000000155,17.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Zawrotna, 3',52.18892499999999757,21.09694349999999829,48.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Tenisowa, 10F',52.19872660000000053,21.0198147000000013,20.0,0,14.0);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 182',52.17581210000000169,21.04242860000000092,24.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Algierska, 19T',52.22218110000000024,21.07933249999999959,34.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Studencka, 50',52.17646299999999827,21.03130619999999951,26.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Algierska, 12',52.22234180000000236,21.0757437000000003,34.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Berezyńska, 17',52.23605450000000161,21.05175150000000173,23.0,0,8.5);
-INSERT INTO travel_info VALUES('ulica Tyrreńska, 11',52.17349829999999856,21.0603371000000017,37.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Wał Zawadowski, 227',52.21067819999999671,21.08879519999999986,43.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 15',52.2016684999999967,20.96555839999999904,37.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Boremlowska, 1',52.24661830000000151,21.10921880000000072,36.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Boremlowska, 51B',52.24882560000000353,21.10069010000000134,33.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Wałbrzyska, 19',52.17288849999999912,21.02247159999999937,21.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Koszykowa, 82A',52.22341920000000214,20.99936310000000005,18.0,1,6.5);
-INSERT INTO travel_info VALUES('ulica Drawska, 19',52.20821620000000251,20.95737769999999855,34.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Modrzewiowa, 7',52.24523190000000028,21.08100029999999947,24.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Geodetów, 4',52.20391639999999712,20.9685549999999985,37.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Brazylijska, 12H',52.23062399999999883,21.06375630000000144,22.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Filtrowa, 66A',52.21988970000000307,20.98646180000000072,21.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Ludwika Pasteura, 8',52.21443909999999989,20.98180980000000062,23.0,1,10.0);
-INSERT INTO travel_info VALUES('ulica Brazylijska, 6',52.23072489999999846,21.06329219999999936,23.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 43C',52.20045999999999964,20.96028379999999914,44.0,1,17.0);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 85C',52.17188170000000013,21.05134449999999902,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Ursynowska, 64',52.19714170000000308,21.01538269999999998,17.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Alzacka, 27',52.22605349999999902,21.0636447000000011,28.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Ursynowska, 60',52.19727060000000307,21.01590410000000019,18.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Józefa Siemieńskiego, 7',52.20639649999999677,20.97646100000000046,35.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Pandy, 8',52.20847559999999988,20.95648399999999967,32.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Filtrowa, 38',52.21902060000000034,21.00089669999999841,18.0,1,7.5);
-INSERT INTO travel_info VALUES('ulica Grójecka, 42B',52.21762780000000248,20.98184990000000027,23.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Przemyska, 11',52.21241189999999933,20.97503860000000131,31.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Mariana Langiewicza, 5',52.21806089999999756,21.00358389999999887,19.0,1,9.0);
-INSERT INTO travel_info VALUES('ulica Tadeusza Joteyki, 4',52.21984119999999763,20.98010959999999869,25.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Jankowska, 2',52.19605580000000344,20.98057890000000114,34.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Kwitnącego Sadu, 13',52.20885270000000133,20.95585189999999898,32.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Kurhan, 10H',52.21039830000000137,20.95719409999999883,30.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Kwitnącego Sadu, 10',52.20893699999999882,20.95619370000000003,32.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Drewnicka, 4',52.2480327000000031,21.06503500000000174,24.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Dąbrowiecka, 34',52.23423580000000043,21.04959739999999969,23.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Karczewska, 12',52.24071049999999872,21.09437769999999901,32.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Międzyborska, 115',52.24504389999999888,21.0743797000000015,23.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica ks. Jana Sztuki, 17',52.24592990000000014,21.10356200000000015,32.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica gen. Augusta Emila Fieldorfa „Nila”, 8',52.222456600000001,21.09172420000000159,32.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 278',52.24649099999999891,21.06800520000000177,21.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Zakopiańska, 12',52.22879280000000079,21.05442760000000035,25.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Międzyborska, 92',52.24257339999999772,21.07663050000000026,29.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Królowej Aldony, 21',52.23408469999999682,21.05552009999999897,21.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Garwolińska, 38A',52.25281160000000113,21.09474559999999955,34.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Dudziarska, 11',52.2585199999999972,21.10080040000000067,82.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Komorska, 50',52.24029339999999877,21.10294090000000011,34.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Makowska, 33A',52.24270070000000032,21.1228371000000017,34.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Dudziarska, 7A',52.25817810000000207,21.10209139999999906,82.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jubilerska, 10',52.23595180000000226,21.11454399999999864,37.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Tarnobrzeska, 3A',52.23918650000000241,21.1277626000000005,37.0,0,18.5);
-INSERT INTO travel_info VALUES('Aleja Jerzego Waszyngtona, 53A',52.24398250000000132,21.07766790000000157,27.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Szaserów, 105A',52.24701890000000048,21.10006620000000054,32.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Witolińska, 12',52.23983059999999768,21.10945579999999922,33.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 73',52.2403493999999995,21.11069450000000102,33.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Francuska, 3',52.23189579999999666,21.05533060000000134,19.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Władysława Umińskiego, 16D',52.22682369999999708,21.09855320000000134,34.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Grochowska, 332',52.24714440000000337,21.05817770000000167,18.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Tomasza Zana, 24',52.24505330000000213,21.10600919999999903,34.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica gen. Augusta Emila Fieldorfa „Nila”, 12',52.22572949999999992,21.09374120000000019,31.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Peszteńska, 3',52.23581240000000036,21.06197369999999936,26.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Pustelnicka, 29',52.24077410000000298,21.10342010000000101,35.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Dziewosłęby, 19',52.25965800000000172,21.1663105999999992,32.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Roztocka, 5',52.23900809999999951,21.11869749999999968,37.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Styrska, 51',52.24028890000000302,21.11643919999999852,38.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Fiszera, 15',52.25810129999999987,21.16402769999999833,28.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Rogalskiego, 1C',52.22736059999999725,21.08304760000000044,28.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Niekłańska, 42',52.23779340000000104,21.05997019999999864,25.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Osada Ojców, 19',52.23775549999999868,21.12502539999999839,40.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 102',52.2737128999999996,21.16032709999999995,51.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Rusznikarska, 5A',52.2489808999999994,21.10231449999999853,35.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Jana Nowaka-Jeziorańskiego, 46',52.22986399999999919,21.07658770000000103,25.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Alfreda Nobla, 9',52.23292490000000043,21.05896290000000092,19.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Osowska, 82A',52.24725670000000121,21.0954777,33.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Babie Lato, 19',52.24933980000000133,21.13339570000000122,46.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Omulewska, 27',52.2420090999999971,21.09577020000000047,32.0,1,17.0);
-INSERT INTO travel_info VALUES('Aleja gen. Antoniego Chruściela „Montera”, 71',52.26346600000000108,21.16725690000000171,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wileńska, 18',52.25968000000000301,21.04532460000000071,21.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Admiralska, 12',52.26159750000000059,21.18331320000000062,38.0,2,26.5);
-INSERT INTO travel_info VALUES('ulica Kępna, 6',52.25055410000000222,21.03838980000000091,18.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Fizylierów, 29',52.25008520000000089,21.17263459999999852,47.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 131',52.27558009999999911,21.16449469999999878,52.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Targowa, 86',52.25744629999999802,21.03258579999999967,17.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica 11 Listopada, 42',52.26198699999999775,21.03790349999999876,22.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Niekłańska, 27',52.23543819999999727,21.06076320000000023,25.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Czerwonych Beretów, 9',52.262347400000003,21.17855730000000137,39.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Fizylierów, 10',52.24842060000000287,21.17260789999999915,50.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Mirska, 16',52.24550719999999871,21.13265709999999942,41.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Stefana Okrzei, 2',52.24857339999999795,21.02997279999999947,17.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Ratuszowa, 2',52.25367080000000186,21.02313900000000046,21.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Środkowa, 6A',52.25979840000000109,21.04190140000000042,21.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Łukowska, 22',52.23816049999999934,21.10092930000000066,31.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Buchalteryjna, 22',52.27305170000000344,21.16784249999999901,50.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Dokerów, 18',52.25232280000000173,21.16678479999999851,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Tarchomińska, 7',52.25611399999999663,21.04731010000000068,21.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Oraczy, 10',52.25149069999999796,21.1257893999999986,46.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Płatnerska, 37',52.24975100000000338,21.16530020000000078,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Powroźnicza, 12',52.25528189999999996,21.13138890000000102,47.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Powroźnicza, 18',52.25528409999999724,21.13278940000000005,48.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Płatnerska, 47',52.24929829999999953,21.16658830000000079,40.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 161B',52.2732785999999976,21.14659299999999931,59.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Mackiewicza, 11',52.25008150000000028,21.0453828999999999,17.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Pielgrzymów, 29',52.26296729999999969,21.16530630000000101,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Szwedzka, 9',52.26169360000000096,21.04530219999999829,16.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 80A',52.26686039999999878,21.15442080000000046,40.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Licealna, 63A',52.27076960000000127,21.16323679999999996,64.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Mokry Ług, 29B',52.28109390000000189,21.17029459999999829,55.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Licealna, 54',52.27038120000000276,21.16439980000000177,63.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Gontarska, 7A',52.25500449999999831,21.1228586000000007,49.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Gawędziarzy, 73',52.26252989999999699,21.16785580000000167,36.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Gilarska, 1',52.27638089999999949,21.06344719999999882,27.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 81',52.264210300000002,21.166798,38.0,1,24.5);
-INSERT INTO travel_info VALUES('Aleja Komandosów, 17',52.2538326999999967,21.16534689999999941,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Giermków, 10',52.25146629999999704,21.16412980000000133,35.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Pancerna, 13',52.26817299999999734,21.16236629999999863,62.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Pastuszków, 33',52.28978539999999953,21.16548039999999987,48.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Giermków, 2',52.25205009999999817,21.16233490000000116,34.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Młodnicka, 37',52.24485849999999943,21.1360835999999992,40.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Roty, 82',52.26643239999999935,21.16332110000000099,45.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Kordiana, 65',52.26306850000000281,21.1634178999999989,35.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kadrowa, 83K',52.27099189999999851,21.15405970000000124,58.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kanonierska, 32',52.26884210000000052,21.16203529999999944,62.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kanonierska, 10',52.26743650000000229,21.15782009999999857,58.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Jerzego, 22A',52.26954169999999778,21.16770370000000056,60.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Księcia Witolda, 22',52.24960910000000069,21.16707059999999885,40.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kadrowa, 83R',52.2706068999999971,21.15295550000000091,57.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Doroty Kłuszyńskiej, 4A',52.2537124999999989,21.16956779999999939,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Grzybowa, 3',52.251823899999998,21.17055709999999991,39.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kordiana, 55',52.26261259999999709,21.16192589999999996,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Kacpury, 2',52.25599799999999818,21.16011629999999854,25.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Władysława Szeflera „Włada”, 50',52.26690130000000067,21.16254909999999967,63.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Marii Bohuszewiczówny, 24C',52.29185780000000249,21.06159050000000121,32.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Marii Bohuszewiczówny, 10',52.28871050000000053,21.06175059999999988,27.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Smolarzy, 16',52.28562809999999673,21.16613669999999914,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Sobiborska, 2',52.25809639999999945,21.18138989999999922,40.0,2,25.0);
-INSERT INTO travel_info VALUES('ulica Szeroka, 138H',52.25666789999999651,21.12454639999999984,53.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Licealna, 28A',52.26863550000000202,21.1671812000000017,44.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Czerwonej Jarzębiny, 14',52.28229509999999892,21.06349549999999837,23.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Chemiczna, 1',52.26290550000000223,21.06308549999999969,24.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Wał Kościuszkowski, 11',52.24356800000000333,21.13357799999999998,38.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Rafaela, 1D',52.28243280000000225,21.06086349999999996,23.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Gdyńska, 11',52.28144129999999735,21.06687979999999883,29.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Bukowiecka, 34',52.27628200000000191,21.07396460000000004,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Chałupnicza, 8A',52.28481949999999757,21.07606150000000156,305.0,2,211.0);
-INSERT INTO travel_info VALUES('ulica Bolesławicka, 11',52.28362779999999788,21.03086330000000003,31.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Bukowiecka, 12A',52.27835710000000091,21.0712198000000015,28.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Szeroka, 136',52.2559248000000025,21.1211203999999988,52.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Czarna Droga, 31A',52.28516820000000109,21.0668179000000002,27.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Gołębia, 9A',52.28907499999999687,21.06115330000000085,27.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Fioletowa, 6',52.28320080000000302,21.05605939999999877,27.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Bukowiecka, 67A',52.26982139999999788,21.08038760000000167,28.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Zawodowa, 31',52.2658257000000006,21.16263849999999991,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Toporowska, 14',52.24808099999999911,21.1314756000000017,44.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Traczy, 9',52.25282510000000257,21.12437840000000122,47.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Birżańska, 1',52.26357310000000211,21.059808799999999,24.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 29',52.30008440000000291,21.05074809999999986,35.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 230',52.28435029999999984,21.07370720000000119,28.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Potulicka, 3',52.28159099999999882,21.08309020000000089,29.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta III, 4',52.24881030000000237,21.16774270000000158,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Rusiecka, 10',52.2921718999999996,21.07738159999999895,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Remontowa, 1',52.28063619999999645,21.06853509999999829,26.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Józefa Szymańskiego, 15A',52.2471158000000031,21.13097619999999921,44.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Płońska, 16',52.28309300000000092,21.0774973999999986,35.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 278',52.2887044000000003,21.07723460000000059,30.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Teofila Piecyka, 14C',52.27601899999999802,21.0733530999999985,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Pospolita, 4A',52.2857186000000027,21.07108949999999937,31.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Michała Reichera, 24',52.28493189999999658,21.05542820000000149,28.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Pospolita, 7',52.28646169999999672,21.07016959999999984,32.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Rajgrodzka, 25',52.27199800000000351,21.06420869999999823,21.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 38K',52.3025907000000032,21.0516198999999986,40.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Rafaela, 7',52.28302109999999914,21.06144319999999937,22.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Malborska, 51',52.30520469999999734,21.08334939999999947,30.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Michała Drzymały, 1B',52.18784389999999718,20.88790099999999939,52.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Motycka, 15',52.27536440000000084,21.04678529999999981,27.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Nauczycielska, 19',52.28524639999999835,21.07493880000000175,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 98',52.26686980000000204,21.05937809999999999,20.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Rzemieślników, 20',52.28886059999999958,21.08710010000000067,33.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Oliwska, 11DL',52.28123320000000262,21.02116690000000076,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Protazego, 63',52.28711239999999805,21.059505699999999,25.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 29',52.26786069999999996,21.16664120000000082,43.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 219',52.28233800000000286,21.07108949999999937,25.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Szafarzy, 66',52.26942280000000096,21.16136080000000063,61.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Panny, 8',52.2883903000000032,21.05773890000000037,28.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Radzymińska, 256',52.28605360000000246,21.07509939999999916,23.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Księcia Ziemowita, 76',52.26921159999999845,21.07682110000000008,28.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Nad Strugą, 17',52.28206109999999996,21.06016440000000146,25.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Nad Strugą, 27',52.28119699999999881,21.0616696999999995,27.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Nad Strugą, 29',52.28106760000000008,21.06165209999999988,27.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Łąkocińska, 5A',52.28219440000000162,21.02952910000000131,28.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Łąkocińska, 11',52.28324680000000057,21.02870569999999973,30.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Dyrekcyjna, 20',52.19702060000000187,20.88415970000000144,33.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Krośniewicka, 15',52.2817140000000009,21.06564889999999935,27.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Obwodowa, 11D',52.27441249999999684,21.03938409999999948,27.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Lisia, 23',52.27891389999999916,21.07399780000000077,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Lisia, 19',52.27887330000000076,21.07321719999999842,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Kaktusowa, 7',52.27819010000000332,21.07366599999999935,30.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Lniana, 3',52.27148700000000047,21.08955789999999908,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Mrozowska, 24',52.27981050000000351,21.06045190000000033,26.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Krzywińska, 19',52.28421860000000265,21.02915949999999867,31.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Lisia, 30',52.27833559999999836,21.07495049999999992,26.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Franciszka Adolfa Achera, 2',52.19671079999999819,20.8912614000000012,35.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Starozaciszańska, 18',52.28305619999999721,21.06925349999999852,31.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Uranowa, 46',52.27940619999999683,21.05689780000000156,27.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Starozaciszańska, 1A',52.28254830000000197,21.06720070000000077,29.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Hennela, 5',52.20139749999999879,20.89121520000000132,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Zamiejska, 18B',52.27483550000000178,21.06389390000000005,27.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Zagraniczna, 8',52.2879774000000026,21.01929170000000013,37.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Żyzna, 8',52.28061420000000225,21.06434450000000069,30.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Skrzypcowa, 17',52.28780710000000198,21.06725009999999899,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Baranowska, 9',52.1995209000000031,20.89793009999999996,53.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Ludwika Kondratowicza, 4A',52.29274749999999728,21.03203089999999876,27.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Kościeliska, 13A',52.28066059999999738,21.06696859999999916,29.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Krzywoustego, 12',52.20334079999999944,20.85895509999999931,43.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Lwa, 18',52.28864380000000267,21.05862049999999997,28.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Braterstwa Broni, 2',52.19578239999999881,20.8884678000000008,33.0,0,20.5);
-INSERT INTO travel_info VALUES('Aleja Bzów, 71',52.19088169999999849,20.88492099999999851,36.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Zabraniecka, 10',52.2616544999999988,21.0890822,31.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Spójni, 30',52.28501750000000214,21.06278259999999846,21.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Siedzibna, 29',52.28260619999999648,21.02834370000000063,27.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Warszawska, 28',52.19911630000000002,20.87230669999999933,56.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Uznamska, 28',52.2897668999999965,21.081627000000001,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Rydzyńska, 23',52.19811920000000071,20.89773660000000178,50.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Poczty Gdańskiej, 11',52.19914719999999875,20.90068069999999878,46.0,2,18.0);
-INSERT INTO travel_info VALUES('ulica Indycza, 6',52.1092885999999993,21.03104599999999991,52.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica II Armii Wojska Polskiego, 13',52.18461940000000254,20.8788885999999998,60.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Piastowska, 17A',52.18827770000000043,20.86864489999999961,35.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Fanfarowa, 10C',52.13446429999999765,21.01398149999999987,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Koronacyjna, 6',52.20411740000000122,20.86078489999999875,40.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Regulska, 66',52.18637770000000131,20.87137789999999882,43.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Królowej Bony, 55',52.1989968000000033,20.8558060999999988,50.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Władysława Syrokomli, 5D',52.2844643999999974,21.02401619999999837,31.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Władysława Jagiełły, 4',52.19668169999999919,20.88248670000000117,31.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Wincentego Kadłubka, 22A',52.20428619999999854,20.86573609999999946,36.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Słupska, 15',52.18454129999999936,20.88393509999999864,57.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 42',52.18696729999999918,20.88087439999999973,55.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Gawota, 9J',52.13630059999999844,21.01166200000000117,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Kościuszki, 11',52.1962959999999967,20.88881920000000036,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Leszka Białego, 12',52.20707860000000266,20.86226879999999895,34.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Leszka Czarnego, 19',52.20542209999999983,20.86611299999999857,35.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Królowej Bony, 39',52.19860549999999933,20.8616868999999987,46.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 11E',52.12050560000000132,21.01163539999999941,46.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Kompanii AK „Kordian”, 13A',52.18907500000000254,20.88276869999999974,50.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Kolorowa, 9',52.18936550000000096,20.8931357999999996,53.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Obrońców Helu, 6',52.19189579999999751,20.89186349999999948,50.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Henryka Melcera-Szczawińskiego, 4',52.18383140000000253,20.88678349999999995,58.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 96',52.19237150000000013,20.8803668999999985,36.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Koronacyjna, 25',52.20115880000000174,20.8612448999999991,45.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Gawota, 9N',52.13566769999999906,21.01152400000000143,41.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Koronacyjna, 14',52.20314230000000321,20.86114650000000025,42.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Leszka Białego, 15',52.20669089999999813,20.86121089999999967,36.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Władysława Laskonogiego, 5',52.20322149999999795,20.8674230999999999,39.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 53L',52.11303550000000228,21.02254479999999858,44.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Janowskiego, 16',52.15326369999999657,21.02126009999999923,30.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 51',52.11532890000000151,21.02457580000000092,41.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Fosa, 21',52.17176760000000257,21.04372370000000103,29.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Imbirowa, 2',52.15198649999999959,21.05947129999999845,36.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Zielonej Gęsi, 1A',52.20778570000000229,20.86389630000000039,31.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Gawota, 16A',52.13846589999999992,21.00897110000000012,49.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kaczorowska, 4A',52.1908373999999995,20.87959999999999994,38.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Elegijna, 59',52.16542280000000175,21.03322049999999877,30.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Fortepianowa, 52',52.13678579999999841,21.00858210000000171,45.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Hołubcowa, 50',52.1402532999999977,20.99625019999999864,51.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Elegijna, 24',52.16544619999999811,21.03367180000000047,30.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Elegijna, 5',52.164293899999997,21.03486819999999823,29.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Bażancia, 40',52.10889079999999752,21.02638400000000018,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Bekasów, 112',52.15031379999999928,21.02415459999999925,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Białogońska, 8',52.14749009999999885,21.0161403,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Dzierzby, 23',52.13409169999999904,21.02066549999999979,33.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Jana Cybisa, 16',52.15337029999999885,21.02176160000000138,30.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 57J',52.11418539999999667,21.02176040000000157,44.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Bokserska, 1B',52.16724239999999924,21.00707669999999894,30.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Zaczarowanej Dorożki, 17',52.19788479999999709,20.8603227000000011,47.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Elegancka, 8',52.12980939999999919,21.05389070000000018,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Elegijna, 31',52.16420080000000325,21.03391669999999892,28.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Chóralna, 5',52.11260269999999651,21.01690419999999904,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Jana Cybisa, 40',52.15272610000000241,21.02146880000000095,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Jerzego i Władysławy Włoczewskich, 12',52.18975850000000349,20.87048010000000176,33.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Gronostaja, 12',52.13354249999999724,21.0772100999999985,38.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Janowskiego, 7',52.15401899999999813,21.01941719999999947,28.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Pachnąca, 60',52.14722040000000191,21.0624399000000011,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Pachnąca, 59',52.14711830000000247,21.06388679999999881,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Augusta, 5',52.20445889999999878,20.86438640000000077,37.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Lelka, 20',52.1440618000000029,21.02023649999999933,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cynamonowa, 2A',52.15011810000000025,21.05397029999999959,31.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Baletowa, 26A',52.12453270000000316,21.00894170000000116,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Makowskiego, 9',52.15291090000000195,21.02242529999999831,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Migdałowa, 69',52.14663639999999845,21.06027530000000069,37.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 145',52.15220949999999789,21.05853349999999935,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Batystowa, 1D',52.12875580000000041,21.05435149999999922,42.0,0,27.0);
-INSERT INTO travel_info VALUES('ulica Kobzy, 5',52.11781959999999714,21.01554110000000008,36.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Orfeusza, 5',52.11078950000000276,20.9964069000000002,54.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 119B',52.14520610000000289,21.06648720000000096,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Trombity, 31R',52.11357439999999742,20.99803500000000156,60.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 172N',52.16844189999999771,21.04460939999999881,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Witolda Małcużyńskiego, 9',52.13822940000000016,21.05477109999999997,31.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Czterech Wiatrów, 2',52.12893629999999945,21.01214889999999969,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mewy, 4',52.1391214000000005,21.03165759999999907,41.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 17',52.14373690000000038,21.01129200000000096,40.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 99B',52.14123620000000158,21.06921219999999906,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Okaryny, 21',52.16532089999999756,21.03401020000000087,30.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Mariana Lalewicza, 1',52.15047080000000079,21.01626570000000172,33.0,1,20.0);
-INSERT INTO travel_info VALUES('Aleja Komisji Edukacji Narodowej, 98',52.16081630000000046,21.02880280000000112,23.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Kokosowa, 49',52.15427319999999867,21.06056780000000117,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kądziołeczki, 29B',52.14097979999999666,21.00027250000000123,46.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Kanarkowa, 9',52.13573739999999646,21.02819399999999917,45.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Kulczyńskiego, 10',52.14794570000000106,21.05284109999999841,31.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Karczunkowska, 45',52.1103402000000031,21.00947880000000012,45.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wędrowców, 4',52.13667519999999911,21.01644209999999902,37.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kabacki Zakątek, 15',52.12990609999999947,21.04818649999999991,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Pustułeczki, 18',52.14396399999999688,21.02714010000000044,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Żołny, 48C',52.13847049999999684,21.02121310000000065,32.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Sztajerka, 30',52.1364013999999969,20.9955923999999996,55.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Ługi, 13',52.12193990000000098,21.0102550999999984,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Łukaszczyka, 32',52.14849860000000347,21.02879090000000061,34.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Trombity, 13P',52.11285469999999976,21.00334039999999903,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Kurantów, 18',52.1076765999999978,20.99096279999999836,46.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica 27 Grudnia, 4E',52.22218850000000145,21.14656809999999965,32.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Jeżewskiego, 5B',52.13548250000000194,21.06890950000000017,40.0,0,28.5);
-INSERT INTO travel_info VALUES('ulica Krasnowolska, 49A',52.14190980000000052,21.00400189999999867,41.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Rajskich Ptaków, 10',52.13272169999999762,21.01979839999999911,31.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Poleczki, 16',52.15457229999999811,21.01210179999999995,33.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pustułeczki, 47',52.14477409999999936,21.01951760000000035,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Rybałtów, 3',52.12856519999999705,21.05558530000000061,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Pistacjowa, 16',52.15308350000000103,21.05987969999999976,63.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Macieja Rataja, 12',52.12606230000000095,21.02121070000000102,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 601',52.11320090000000249,21.01908699999999897,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Roztoki, 2',52.14380909999999858,21.01568440000000138,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cylichowska, 53A',52.19759270000000128,21.15561100000000038,53.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Chodzieska, 42F',52.18965709999999803,21.13626659999999902,54.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Cedrowa, 85',52.23490770000000082,21.1482644999999998,44.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Celulozy, 127F',52.16950450000000216,21.1732155000000013,60.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Celulozy, 109K',52.16740980000000149,21.17363410000000101,64.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Chorzowska, 58',52.213673,21.15577479999999966,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Czarnołęcka, 18',52.21095410000000214,21.18878600000000034,57.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Pustułeczki, 23',52.14368050000000209,21.02687489999999926,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Cedrowa, 51',52.23183430000000271,21.1499221999999989,49.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Cedrowa, 39',52.23081559999999968,21.15036110000000136,51.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Prawdziwka, 6',52.10468410000000005,21.09124699999999919,55.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Celulozy, 40G',52.16393089999999689,21.18205169999999882,67.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cyklamenów, 14H',52.18010689999999841,21.14237130000000064,47.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Puławska, 418A',52.12831740000000024,21.01749960000000072,31.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Puławska, 492',52.11638260000000144,21.01770529999999937,34.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Celulozy, 100',52.16773160000000331,21.17656690000000097,62.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Czarnoleska, 1',52.23451229999999868,21.14939349999999862,46.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Borków, 46L',52.19132129999999848,21.15384069999999995,56.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Borków, 46',52.19129949999999952,21.15371989999999868,65.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Czytelnicza, 8A',52.22091549999999672,21.1461900000000007,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 68',52.22552639999999969,21.14471689999999882,33.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Czeladnicza, 32',52.21456020000000108,21.1884124000000007,62.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Chodzieska, 44L',52.18886789999999821,21.13675119999999908,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Artystyczna, 39',52.19211109999999821,21.22125300000000081,63.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 1C',52.2170837999999975,21.15420429999999997,36.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 65',52.22402910000000275,21.14571869999999976,31.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Bielszowicka, 56',52.2129521999999966,21.1863551000000001,58.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Brzoskwiniowa, 14',52.19512310000000354,21.16545770000000104,57.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Brodnicka, 30',52.1659282000000033,21.1985658999999984,62.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 28ZK',52.19485819999999877,21.13083100000000058,54.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Borków, 42H',52.19061320000000137,21.15559389999999951,67.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Borowiecka, 61F',52.18288419999999662,21.15710830000000086,55.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Borowiecka, 37G',52.1842952000000011,21.15178919999999963,56.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Borysławska, 3',52.18127030000000132,21.228440599999999,55.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 47C',52.1962801999999968,21.1261258000000005,53.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Borówkowa, 7',52.17316300000000239,21.23178449999999984,61.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Burzliwa, 5',52.18421169999999876,21.19786530000000013,48.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kolarska, 6',52.20293960000000055,21.17288629999999827,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Bajkowa, 45',52.19274269999999661,21.17626840000000144,48.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 19F',52.18709239999999739,21.17180349999999934,49.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Nawigatorów, 3',52.21928820000000115,21.17396829999999852,54.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 179A',52.20510099999999909,21.16428900000000012,37.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Marecka, 4A',52.20307830000000137,21.17464439999999825,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Oliwkowa, 25',52.15994260000000082,21.22242329999999911,54.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Motylkowa, 59D',52.19945009999999997,21.14903250000000056,52.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Nad Wisłą, 14',52.15310329999999795,21.18265290000000078,61.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 137',52.20013139999999652,21.16794180000000125,45.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Naddnieprzańska, 34',52.23522299999999774,21.13315070000000163,29.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 110',52.21894970000000313,21.11236219999999975,46.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Morąska, 5B',52.17828190000000176,21.18503279999999833,62.0,0,24.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 206E',52.1986951000000019,21.13705069999999964,46.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Izbicka, 63/65',52.18293849999999879,21.2100262000000015,54.0,2,25.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 328A',52.216906299999998,21.1352751000000012,48.0,2,18.0);
-INSERT INTO travel_info VALUES('ulica Liliowa, 29N',52.16244420000000303,21.18631560000000035,64.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Gajowa, 51',52.21147249999999929,21.14954459999999869,41.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Gruszy, 41/43',52.19821379999999778,21.16691159999999883,45.0,1,22.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 177L',52.19970479999999924,21.13415110000000041,45.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Dzielnicowa, 45A',52.22192410000000251,21.14668809999999865,31.0,1,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 140/24',52.1888576999999998,21.14589810000000014,57.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Liliowa, 31U/1',52.16255259999999794,21.1854256999999997,65.0,1,26.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 319',52.21786850000000157,21.1337906999999987,48.0,2,17.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 68',52.1832029999999989,21.1467129000000007,53.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Harmonistów, 7',52.22843089999999933,21.14613729999999948,48.0,1,17.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 28HA',52.17561400000000304,21.15735049999999973,45.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Dusznicka, 12A',52.16676819999999993,21.210481699999999,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Dusznicka, 76',52.16801619999999673,21.21895980000000037,53.0,1,27.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 99',52.18853740000000129,21.14122929999999912,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Gruszy, 30',52.19739450000000147,21.16464549999999889,47.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kłodzka, 36E',52.16466059999999772,21.21831849999999875,49.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Jana Kossakowskiego, 34',52.21101699999999824,21.19165470000000084,57.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Mrągowska, 28M',52.17181529999999868,21.16731090000000037,54.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Mydlarska, 2',52.20790709999999991,21.15182610000000096,46.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Króla, 15A',52.19019579999999792,21.17532059999999917,47.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kościuszkowców, 75B',52.23404879999999651,21.15738680000000115,50.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Jana Kossakowskiego, 26/28',52.21052420000000182,21.19167699999999854,56.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Napoleona Bonaparte, 57',52.16632659999999789,21.23686629999999909,65.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Mydlarska, 29',52.20999419999999703,21.14958400000000082,43.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Paczkowska, 26',52.21001520000000084,21.15112969999999847,41.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Koryncka, 15A',52.2157106000000013,21.14373880000000127,45.0,2,19.0);
-INSERT INTO travel_info VALUES('ulica Obiegowa, 21',52.20984150000000312,21.18727930000000014,54.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Ligustrowa, 25F',52.20203459999999752,21.12426969999999927,47.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Koryncka, 17D',52.21612309999999724,21.14400990000000035,44.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Koryncka, 17A',52.21615270000000208,21.14478739999999845,43.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Koszęcińska, 5',52.1817690999999968,21.21357360000000014,54.0,2,26.5);
-INSERT INTO travel_info VALUES('ulica Liścienia, 48',52.19327969999999795,21.20701400000000091,58.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kwitnącej Akacji, 9',52.18328269999999947,21.21734650000000145,54.0,2,27.0);
-INSERT INTO travel_info VALUES('ulica Kościuszkowców, 19A',52.22847749999999679,21.16020990000000169,43.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Ogórkowa, 61F',52.16113639999999663,21.1607902999999986,54.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Korsuńska, 9',52.22926309999999717,21.14612190000000069,51.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Biernacka, 3',52.1603664000000009,21.21653080000000102,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Kaczy Dół, 22',52.21286309999999987,21.17810610000000082,54.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Jałowcowa, 33',52.17045879999999869,21.1920617,48.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dzidka Warszawiaka, 11',52.2105540000000019,21.19098879999999952,56.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jelenia, 12',52.2101417000000012,21.19572030000000141,56.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Dzięgielowa, 22',52.21896009999999678,21.20376990000000105,57.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Halki, 44',52.1818329000000034,21.18575609999999899,46.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Antenowa, 44',52.21920490000000114,21.14995010000000165,35.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 48/22',52.19579149999999857,21.12921559999999843,51.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Klimontowska, 15',52.21799970000000001,21.13762720000000072,47.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Goździków, 12',52.23834200000000294,21.13662569999999974,38.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Borków, 53B',52.19210559999999788,21.15219000000000093,63.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Goździków, 6',52.23790859999999726,21.13601129999999984,38.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Kaczeńca, 2',52.227134300000003,21.14679489999999973,42.0,0,20.5);
-INSERT INTO travel_info VALUES('Aleja Dzieci Polskich, 33',52.20789979999999986,21.19499940000000037,53.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Alpejska, 33',52.21853560000000271,21.1703733000000014,50.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Gardenii, 31',52.2163927000000001,21.15217090000000156,38.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Borowiecka, 105',52.18081169999999958,21.17071969999999937,54.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Azaliowa, 6K',52.23555910000000324,21.15601679999999974,50.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Izbicka, 141',52.18184850000000096,21.22944199999999882,53.0,2,27.0);
-INSERT INTO travel_info VALUES('ulica Jagienki, 8',52.16118989999999656,21.2068620999999986,44.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 50/16',52.19612750000000289,21.13083579999999984,53.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Kombajnistów, 19A',52.20318590000000114,21.1382519000000002,46.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Patriotów, 34A',52.16072460000000177,21.2125768999999984,43.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Płowiecka, 37',52.23228370000000353,21.132359000000001,38.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Patriotów, 110',52.17384590000000343,21.19991890000000012,36.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Podmokła, 3C',52.18640369999999962,21.22406580000000176,56.0,2,28.0);
-INSERT INTO travel_info VALUES('ulica Rogatkowa, 29',52.20227690000000109,21.16348699999999994,38.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Stradomska, 41A',52.21985579999999772,21.15933950000000153,48.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Piastowa, 14',52.23690320000000042,21.14765179999999844,41.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Rogatkowa, 4',52.19927450000000135,21.16555170000000175,44.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Pomologiczna, 14A',52.1868941000000035,21.1794961000000015,41.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Pajęcza, 28A',52.19016649999999658,21.19202930000000152,46.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Polarna, 7',52.2042550000000034,21.15812779999999905,44.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Parterowa, 20',52.16054840000000325,21.22703669999999932,56.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Sadulska, 23A',52.21648410000000239,21.14598039999999913,44.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Podkowy, 89',52.1665536000000003,21.23812200000000061,66.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Retmańska, 44',52.15135870000000295,21.17744970000000037,63.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Panoramy, 60A',52.19068130000000138,21.12694630000000017,46.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Skowronkowa, 3A',52.21164379999999739,21.18054520000000096,60.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Planetowa, 14',52.18858259999999661,21.18796760000000034,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jana Skrzyneckiego, 13',52.22733980000000286,21.14923990000000132,44.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Retmańska, 24A',52.15189079999999678,21.18085650000000086,64.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Storczykowa, 17',52.22873899999999737,21.15519630000000006,44.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Patriotów, 299',52.20330580000000253,21.16857269999999857,33.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Płowiecka, 72',52.22852189999999695,21.13967159999999979,38.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Józefa Strusia, 11',52.22833709999999741,21.14965520000000155,45.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Józefa Strusia, 35',52.23044610000000176,21.14868189999999971,50.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica ks. Sylwestra Szulczyka, 45',52.17542850000000242,21.23500220000000027,65.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Rzeźbiarska, 20',52.21205659999999682,21.16510299999999844,36.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Szachowa, 9',52.17354919999999652,21.19828400000000101,37.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 14A',52.20853329999999915,21.11163880000000149,44.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Szafirowa, 32',52.16850660000000061,21.19306230000000113,48.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Słotna, 19',52.18660040000000321,21.18077440000000066,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 40',52.17272950000000264,21.15822029999999999,49.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Patriotów, 171A',52.17788039999999939,21.19370879999999958,46.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Potockich, 22',52.22869109999999893,21.15382579999999991,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Potockich, 106',52.23658530000000155,21.15016699999999972,42.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Przewodowa, 5',52.17046640000000223,21.15797020000000117,48.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 65E',52.21333099999999661,21.10742679999999894,45.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica IX Poprzeczna, 3',52.21302680000000151,21.16318539999999971,34.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 81',52.19263689999999656,21.17030659999999998,59.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Południowa, 42',52.18949429999999979,21.14983859999999894,56.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 61B',52.21559340000000304,21.11283900000000102,47.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Słotna, 18',52.18635909999999712,21.17950360000000031,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Podkowy, 126A',52.17201089999999653,21.2478675999999993,67.0,2,33.0);
-INSERT INTO travel_info VALUES('ulica Pokrzywowa, 5A',52.20468209999999943,21.13508360000000153,47.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 82A',52.2162489999999977,21.11331579999999875,48.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Patriotów, 177',52.17912009999999868,21.19267320000000155,45.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Mrągowska, 34',52.17190329999999677,21.16480939999999933,54.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica VIII Poprzeczna, 3',52.21421620000000274,21.16136459999999886,31.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Pomologiczna, 27',52.18716229999999712,21.18305670000000163,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Podkowy, 92J',52.16482090000000226,21.24224789999999886,70.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 55/16',52.2146651999999989,21.11261379999999832,46.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica I Poprzeczna, 11A',52.22509829999999909,21.15427640000000053,32.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica I Poprzeczna, 16',52.22501160000000197,21.15597909999999971,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica III Poprzeczna, 26',52.22236039999999946,21.15949399999999869,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Pajęcza, 9',52.19106190000000111,21.18534629999999908,45.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Pajęcza, 7',52.19107369999999691,21.18495370000000121,44.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jana Skrzyneckiego, 30',52.22697310000000214,21.15220070000000164,41.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Skrzypów, 9',52.16707759999999894,21.24221680000000135,69.0,2,32.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 150C',52.22234190000000353,21.11099869999999968,40.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Mieczysława Pożaryskiego, 24C',52.20546749999999748,21.17617750000000144,49.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Warsztatowa, 5B',52.18971160000000253,21.18582839999999833,42.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 28',52.1519145999999978,21.18802260000000003,56.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Kleszczowa, 17',52.19903390000000342,20.91810540000000174,40.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Geologiczna, 11',52.18984929999999878,20.95503739999999837,39.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Geologiczna, 1',52.18948770000000081,20.95676070000000024,38.0,1,19.0);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 218',52.1867485000000002,20.95559980000000167,40.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Przyłęcka, 10',52.20586449999999701,20.90946350000000109,33.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Płomyka, 2',52.19863010000000258,20.91940749999999837,40.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Smocza, 11',52.24541500000000127,20.98557010000000033,17.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 7A',52.20446869999999962,20.92792040000000143,34.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Dźwigowa, 63A',52.21778299999999718,20.91370099999999966,32.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Dźwigowa, 67',52.21806730000000129,20.91429439999999929,32.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Konstantego Ciołkowskiego, 17A',52.25462569999999829,20.89161580000000029,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Bawełniana, 12',52.26538879999999665,20.89989840000000144,45.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Krajeńska, 7',52.2504665000000017,20.87987229999999884,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Legionowa, 6',52.21936949999999911,20.90818640000000173,39.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Księcia Bolesława, 1/3',52.25191610000000252,20.93803210000000092,26.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica płk. Kazimierza Leskiego, 5',52.26345700000000249,20.87730409999999993,43.0,2,27.5);
-INSERT INTO travel_info VALUES('ulica Kopalniana, 2Y',52.22201989999999939,20.89369230000000144,39.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Romualda Millera, 2',52.25840939999999791,20.91869099999999904,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Kawy, 12',52.26136929999999837,20.92028709999999947,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Gabriela, 8B',52.22015040000000141,20.91033769999999948,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica gen. Sylwestra Kaliskiego, 25',52.2552675000000022,20.89709930000000071,36.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Galileusza, 19',52.25778929999999889,20.8898502999999991,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Karabeli, 2A',52.22885550000000165,20.90162099999999867,32.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Sochaczewska, 26B',52.22043399999999736,20.88353479999999963,62.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Ołtarzewska, 33',52.24978540000000037,20.87876650000000111,37.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Oświatowa, 22A',52.23306279999999902,20.92020129999999866,26.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Tkaczy, 28',52.22262700000000279,20.90719819999999985,36.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica płk. Witolda Łokuciewskiego, 3',52.24605129999999776,20.89903430000000028,36.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Telefoniczna, 2',52.26596179999999948,20.90219790000000088,46.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 77',52.22784409999999867,20.8797953000000014,38.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 38A',52.21956980000000214,20.91103310000000092,40.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Marynin, 25B',52.24556429999999808,20.92422799999999939,24.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Słomiana, 15',52.22416350000000306,20.90901919999999948,33.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Zeusa, 13',52.24757579999999991,20.91033660000000082,25.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Lustrzana, 37A',52.2222180999999992,20.90493670000000037,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Szeligowska, 34A',52.22798480000000154,20.8850674000000005,40.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Reżyserska, 5',52.22791809999999658,20.90740070000000017,30.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Sternicza, 74',52.22110649999999766,20.90606389999999948,37.0,1,19.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 85',52.2362759999999966,20.91944219999999888,26.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Eugeniusza Szwankowskiego, 3',52.23343040000000314,20.89991910000000175,33.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Powstańców Śląskich, 9',52.22473060000000089,20.91588619999999921,27.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica kpt. Władysława Raginisa, 6',52.23085439999999835,20.90714180000000156,60.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Aluzyjna, 2A',52.3422111000000001,20.94332259999999834,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Sosnowiecka, 3',52.26183439999999792,20.91544019999999904,37.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Telewizyjna, 10',52.26500070000000164,20.90586289999999892,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Babinicza, 30',52.33670649999999825,21.04026920000000089,49.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Elżbiety Barszczewskiej, 3',52.33470390000000094,20.95233509999999911,53.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Pitagorasa, 9',52.2576820999999967,20.89247800000000054,35.0,1,24.0);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 183',52.23585959999999773,20.91883669999999996,26.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Rzędzińska, 6A',52.23069799999999674,20.9213534999999986,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 34C',52.22225430000000301,20.90286869999999909,40.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32Ł',52.33448870000000141,20.99230209999999986,30.0,1,25.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 68',52.2363550000000032,20.92295839999999885,27.0,0,21.5);
-INSERT INTO travel_info VALUES('Osiedle Przyjaźń, 66',52.23690799999999968,20.92276629999999927,26.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Flisaków, 20',52.36221369999999809,21.04260770000000136,55.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 32K',52.33426409999999863,20.99198499999999968,30.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Piastów Śląskich, 41',52.26446909999999946,20.91846999999999924,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Okoliczna, 4A',52.22953830000000152,20.91247590000000045,29.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Dziwna, 6',52.33723499999999973,21.04311889999999963,50.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Czołowa, 36D',52.33248979999999762,20.98846149999999966,30.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Dzikiej Kaczki, 18A',52.34434379999999721,20.94540119999999917,53.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 76',52.33193729999999988,21.05665499999999924,50.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 91',52.22632380000000296,20.90534900000000106,34.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Geodezyjna, 64B',52.30898239999999789,21.07314380000000042,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Połczyńska, 10',52.2215133999999992,20.91972840000000033,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Echa Leśne, 20A',52.3091046999999989,21.04045969999999955,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Podkowińska, 19',52.25219549999999913,20.87700380000000066,39.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Owczarska, 10',52.22367040000000315,20.91047479999999937,34.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 61A',52.22385839999999746,20.90397150000000081,38.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Fortel, 21',52.32883770000000112,20.97889149999999959,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Okrętowa, 26',52.22101609999999994,20.90224600000000166,39.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 176D',52.30931770000000113,21.03118810000000139,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 13D',52.35517289999999946,20.9785579999999996,35.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Czołowa, 40H',52.33374440000000049,20.9896180000000001,32.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 341A',52.32270090000000095,21.03099939999999891,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 224',52.31756839999999898,21.03096370000000092,39.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Ciupagi, 2F',52.33557960000000264,21.00818089999999927,44.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Celtów, 3A',52.32950890000000043,20.99205949999999988,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Eskimoska, 33',52.31080879999999667,21.05620520000000084,42.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Białołęcka, 275',52.31716430000000173,21.02920209999999913,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Brzezińska, 23Z',52.35632900000000233,20.97564480000000132,35.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Kobierzycka, 7',52.32041120000000233,20.97935580000000044,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Lapońska, 6',52.31003960000000319,21.05252649999999904,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Majorki, 38A',52.33746039999999767,20.99714240000000132,39.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Marcina z Wrocimowic, 5A',52.34194490000000143,20.93781290000000083,50.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Marywilska, 9B',52.29774660000000352,21.01199850000000068,26.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Małej Żabki, 14',52.35176359999999818,21.04145760000000109,58.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Brzozowy Zagajnik, 24',52.34901849999999968,20.98241600000000062,41.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Borecka, 10A',52.32751919999999757,21.0110297000000017,58.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Książkowa, 53C',52.32874060000000326,20.95136390000000048,50.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Adama Ciołkosza, 6',52.32636089999999741,20.93962529999999945,44.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Cieślewskich, 27N',52.33030240000000077,21.02213300000000018,49.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Inowłodzka, 3',52.29887599999999992,21.01647090000000163,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Leśnej Polanki, 11C',52.33142099999999886,20.95422659999999837,49.0,2,27.0);
-INSERT INTO travel_info VALUES('ulica Książkowa, 9G',52.33167430000000308,20.93884830000000007,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 68',52.36078330000000136,21.05115109999999845,52.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Jasiniec, 58',52.31447630000000259,21.07591010000000154,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mańkowska, 15A',52.34758450000000351,21.04942020000000013,57.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Jabłoni, 14',52.35227789999999715,20.97660520000000162,35.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kąty Grodziskie, 62',52.33085309999999879,21.05719399999999908,51.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kobiałka, 44A',52.3603278000000003,21.04421609999999987,51.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Małego Rycerza, 42',52.33412679999999995,21.04527429999999911,43.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Lewandów, 4',52.3226828000000026,21.06811379999999901,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Juranda ze Spychowa, 44',52.31743749999999694,21.04436649999999887,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Kartograficzna, 88B',52.3120139999999978,21.07973439999999954,45.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Kosobudzka, 6',52.34758539999999983,20.99892480000000105,41.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Odkryta, 27J',52.33046610000000242,20.93503450000000043,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Kaliny, 3',52.34245690000000195,20.96407909999999931,56.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Karnicka, 19',52.34164390000000111,20.98067269999999951,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Karnicka, 15',52.34113899999999831,20.98025150000000139,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Kłosowa, 9',52.35782019999999904,20.97529630000000011,29.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Kłosowa, 12',52.35768159999999938,20.97629919999999971,30.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Odłogi, 6',52.33493399999999696,21.023186299999999,53.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Ketlinga, 34A',52.33492720000000275,21.04045929999999842,47.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Ornecka, 152',52.34942800000000318,21.0132103999999984,63.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Młyńska, 23',52.33081849999999947,21.01835020000000042,61.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Józefa Mehoffera, 68D',52.33171039999999863,20.95754540000000076,46.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 109',52.31581390000000197,21.05033309999999958,38.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 227B',52.32874300000000289,20.96627960000000001,41.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Owoców Leśnych, 3',52.31475319999999841,21.04068380000000004,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 328U',52.34851689999999991,20.94911009999999862,53.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Ostródzka, 216',52.33707909999999686,21.04707919999999888,44.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Papieska, 19',52.33665839999999748,20.96706590000000148,49.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jesiennych Liści, 15C',52.31005400000000093,21.05877500000000068,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 42C',52.30697510000000249,20.97763709999999904,39.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Ogrody Przyjaciół, 57',52.33231090000000307,21.01780769999999877,59.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Feliksa Pancera, 7',52.31969039999999894,20.94588690000000142,45.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Nowodworska, 14M',52.32255589999999757,20.94169180000000096,40.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Nad Rzeczką, 8',52.31131680000000017,21.04089619999999883,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Ogniskowa, 8',52.31084150000000221,21.05075479999999999,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 241',52.33084300000000155,20.96504129999999933,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 330E',52.34937730000000044,20.94929690000000022,53.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Ołówkowa, 34A',52.34370119999999816,20.98607979999999885,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Rodowa, 3',52.31504600000000237,21.06558580000000091,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Szklarniowa, 8',52.3277313000000035,21.01932210000000011,50.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Sprawna, 14D',52.34062620000000265,20.94005419999999873,48.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Modlińska, 358',52.36150909999999926,20.93963630000000009,64.0,2,30.5);
-INSERT INTO travel_info VALUES('ulica Lucyny Messal, 24',52.33526539999999728,20.9899874000000004,30.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Myśliborska, 90A',52.3104844,20.97275880000000114,40.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 89A',52.31094130000000319,20.97891770000000022,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 217C',52.32582560000000171,20.96777900000000016,41.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Modlińska, 349',52.35059220000000124,20.94476609999999895,49.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Strumykowa, 28C',52.33072580000000328,20.94775290000000111,48.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Rustykalna, 4B',52.34087000000000244,20.96115199999999845,53.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Szamocin, 35B',52.35065620000000308,21.02784660000000016,48.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Pomorska, 7',52.32878360000000128,20.96069190000000048,45.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Skarbka z Gór, 126F',52.32007759999999764,21.06072359999999933,38.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Skuterowa, 3',52.32977029999999985,20.97593930000000028,46.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Srebrnogórska, 19',52.3277631999999997,20.98019520000000071,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Skierdowska, 2',52.35604889999999756,20.95085410000000081,60.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Sprawna, 26',52.34152279999999991,20.94455110000000176,48.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Ruskowy Bród, 15M',52.34173909999999808,21.05802539999999822,51.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Srebrnogórska, 12',52.32871289999999931,20.98225079999999921,36.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Akcent, 41',52.2977135000000004,20.87835869999999972,45.0,1,31.5);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 167K',52.28469779999999645,20.88415529999999976,41.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Łuczywo, 19',52.35486689999999755,20.97813370000000077,35.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 155',52.35350789999999677,21.02839330000000117,47.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 133',52.28499759999999697,20.89115359999999911,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Pomianowska, 5',52.33443640000000129,20.95729169999999897,46.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Przyrodnicza, 21',52.32734380000000129,21.05390590000000017,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Pomianowska, 6A',52.33478660000000104,20.95714909999999876,47.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jerzego Bajana, 9A',52.2742531000000028,20.93482589999999988,35.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Płochocińska, 81A',52.33193130000000081,21.02767640000000071,46.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 157/14',52.2848618000000016,20.88553290000000117,39.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Śreniawitów, 4',52.31586839999999939,20.96309189999999844,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Smugowa, 25C',52.32550299999999766,21.00039160000000038,51.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Pułaskiego, 37',52.32511420000000157,20.98568609999999879,44.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Szawelska, 15',52.35104960000000318,20.93767679999999842,54.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Zielonych Traw, 17',52.35387639999999721,20.97344190000000097,33.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Przydrożna, 15A',52.31950450000000074,21.0292785000000002,44.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Światowida, 47',52.31871780000000171,20.95123040000000003,38.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Arkuszowa, 154/156',52.28643619999999715,20.88487380000000115,39.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Złotokwiatu, 5',52.3603278000000003,21.04711869999999862,50.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Współczesna, 12',52.3089107999999996,21.05408339999999968,35.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Złotokwiatu, 16',52.35912909999999699,21.04688820000000149,52.0,1,33.0);
-INSERT INTO travel_info VALUES('ulica Weteranów, 17A',52.32140340000000122,20.98385559999999827,47.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Zyndrama z Maszkowic, 3G',52.32889720000000011,20.99364419999999853,39.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 79H',52.32285290000000088,21.03695210000000059,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wojdyńska, 28A',52.3515219000000016,21.0756458000000002,72.0,1,33.5);
-INSERT INTO travel_info VALUES('ulica Widna, 1C',52.35589339999999937,20.9893888000000004,46.0,2,31.5);
-INSERT INTO travel_info VALUES('ulica Wenecka, 23',52.29815099999999717,21.01899159999999967,38.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Wojdyńska, 45A',52.35121780000000057,21.08139540000000168,81.0,1,35.0);
-INSERT INTO travel_info VALUES('ulica Klaudyny, 26E',52.2827157999999983,20.97376620000000002,24.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Klaudyny, 32A',52.28344709999999652,20.97191829999999868,24.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Pelplińska, 53',52.28322870000000222,20.96910760000000095,26.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Pasterska, 31B',52.31277649999999824,20.91122449999999944,43.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Wadowicka, 10',52.35862130000000291,20.98203639999999836,38.0,1,32.5);
-INSERT INTO travel_info VALUES('ulica Pabla Nerudy, 4',52.27652870000000007,20.92886670000000037,32.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Pabla Nerudy, 5',52.27740860000000111,20.92583109999999991,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Zaułek, 1',52.3247805000000028,21.06573369999999912,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Metafory, 5',52.30801209999999913,20.931006,37.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Wałuszewska, 26W',52.33980100000000135,20.98824709999999883,34.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 65F',52.32120439999999917,21.03634969999999882,49.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Twórcza, 75H',52.32253450000000327,21.03584220000000115,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Chabrowa, 24',52.28514390000000133,20.90375290000000063,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Magiera, 12',52.27153189999999939,20.95246230000000053,29.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Hajoty, 44',52.27764880000000147,20.95225750000000176,26.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Oksywska, 34A',52.27651780000000059,20.96874589999999827,25.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Pasymska, 10',52.30691740000000322,20.92707959999999901,36.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Loteryjki, 67F',52.29319439999999731,20.88427310000000148,50.0,1,32.0);
-INSERT INTO travel_info VALUES('ulica Pasterska, 32',52.3123246999999978,20.91249780000000058,42.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 22',52.28092560000000332,20.95359619999999979,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Lisowska, 23',52.27574860000000001,20.95008169999999836,25.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Hieroglif, 1',52.30931120000000333,20.93386149999999902,40.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Lisowska, 64',52.27928479999999923,20.95232049999999902,23.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Żubrowa, 10',52.31140450000000186,20.9161937999999985,37.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Farysa, 55',52.30731070000000215,20.93476599999999977,35.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Zgrupowania AK „Żmija”, 15',52.2685760999999971,20.93836930000000152,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Jana Kasprowicza, 70',52.28704390000000046,20.93948620000000104,22.0,0,24.5);
-INSERT INTO travel_info VALUES('ulica Bluszczańska, 69C',52.20824900000000212,21.06167389999999884,30.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Królowej Jadwigi, 6',52.30726390000000236,20.92641169999999918,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Barcicka, 59',52.28216710000000233,20.95037639999999968,21.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Belwederska, 3',52.2024165999999994,21.03418320000000107,23.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 5',52.27523060000000043,20.90622670000000127,39.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Batalionu AK „Oaza”, 7',52.18959780000000137,21.06245020000000067,18.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Kalinowej Łąki, 26',52.27810490000000243,20.90457909999999942,40.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Balonowa, 17',52.19450659999999687,20.99912339999999844,24.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Bokserska, 54A',52.17187580000000224,20.99596040000000131,40.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Wóycickiego, 12',52.30589160000000248,20.90560269999999932,36.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica św. Bonifacego, 139',52.19072950000000332,21.06617490000000003,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Łomiańska, 17',52.28108900000000147,20.96901460000000129,27.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Prozy, 32',52.30680869999999772,20.94103660000000033,42.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Trylogii, 22',52.31009079999999756,20.92442090000000121,35.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Konstruktorska, 12A',52.18638279999999697,20.98764480000000177,34.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Prozy, 17',52.3059067000000013,20.94186029999999831,37.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Wrzeciono, 17',52.29114979999999946,20.93493279999999856,29.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Podczaszyńskiego, 27',52.28025159999999972,20.95698480000000074,23.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Wrzeciono, 1',52.28730029999999829,20.94170820000000077,24.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 300J',52.30003510000000233,20.88438100000000119,47.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Jana Sebastiana Bacha, 20',52.16900489999999735,21.02249769999999885,24.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Jana Sebastiana Bacha, 34',52.17210579999999709,21.02150689999999855,24.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Czerniakowska, 99/101',52.20600230000000152,21.04812829999999834,28.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Pułkowa, 48',52.30623760000000288,20.93329459999999998,29.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Kielecka, 36',52.20546970000000186,21.00523280000000171,17.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica gen. Klemensa Stanisława Rudnickiego, 4A',52.26462440000000242,20.94881790000000166,36.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Wólczyńska, 303A',52.29804550000000062,20.88574429999999893,46.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Brunona Schulza, 3',52.28409210000000229,20.96959379999999839,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Perseusza, 39',52.28191199999999839,20.90347570000000133,38.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Ksawerego Pruszyńskiego, 2A',52.27818659999999796,20.95966290000000143,19.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Grażyny, 3B',52.2038897999999989,21.02207689999999828,21.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Dyżewskiego, 14',52.2150306999999998,21.06380409999999869,38.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Klarysewska, 14',52.17936350000000089,21.06975609999999933,44.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Karola Kurpińskiego, 79',52.17729580000000311,21.02988260000000053,26.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Dyżewskiego, 9',52.21530520000000308,21.06414029999999826,39.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Oskara Kolberga, 3',52.18955629999999957,21.01018039999999943,22.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Koszykarska, 3',52.20993459999999687,21.07679429999999954,35.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Inowrocławska, 11',52.17728000000000321,21.06407959999999946,41.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Domowa, 2',52.18612089999999882,21.07069620000000043,44.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Kielecka, 48',52.206575100000002,21.00462810000000147,15.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Cypriana Godebskiego, 32',52.18861040000000173,21.06615700000000046,41.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Płatowcowa, 17',52.19560270000000201,20.99342169999999897,25.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Cypriana Godebskiego, 3',52.18567649999999958,21.06908070000000066,41.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Cybernetyki, 6',52.17588159999999676,20.99766500000000136,35.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Opoczyńska, 11',52.20594189999999913,21.00598769999999859,15.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Cybernetyki, 13',52.17624670000000008,20.99373920000000026,34.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Powsińska, 25',52.18604419999999778,21.06417000000000072,34.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Cypriana Godebskiego, 32A',52.18860320000000285,21.06630260000000021,41.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Czerniakowska, 50',52.20891780000000181,21.04896949999999833,27.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Idzikowskiego, 1',52.18872280000000074,21.03434959999999876,23.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Jodłowa, 4',52.18837659999999801,21.07021810000000173,44.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Juliusa Fučíka, 31',52.17889069999999663,21.05969890000000077,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Dzikich Jabłoni, 8',52.18269339999999801,21.041246000000001,33.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Klarysewska, 50',52.18284870000000097,21.06316259999999829,37.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Krasickiego, 45A',52.19487509999999731,21.01959499999999892,25.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 126A',52.19313900000000217,21.02366389999999897,24.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Rodzynkowa, 17',52.21458229999999646,21.07141359999999964,39.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Piaseczyńska, 56A',52.1940622999999988,21.03079350000000148,33.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Rodzynkowa, 16',52.21433679999999811,21.07109870000000029,38.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Powsińska, 15',52.18504349999999903,21.06530890000000156,40.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Rolna, 167',52.17541239999999903,21.02618550000000041,21.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Ciechocińska, 8B',52.17931399999999798,21.06846120000000156,43.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Okrężna, 43',52.18322489999999903,21.07126540000000148,41.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Powsińska, 97',52.19262559999999951,21.05416220000000038,34.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Goplańska, 6',52.17805729999999898,21.07103839999999906,44.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Pilicka, 8B',52.1907584,21.02050880000000178,19.0,0,14.0);
-INSERT INTO travel_info VALUES('Aleja Niepodległości, 119A',52.19892310000000179,21.01172229999999886,14.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Morszyńska, 71B',52.18181479999999795,21.06284139999999994,40.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 24',52.20685970000000253,21.02194890000000172,22.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Morszyńska, 43C',52.18060359999999776,21.06610489999999914,42.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Marynarska, 15',52.17804439999999744,20.99941700000000111,30.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Rymanowska, 13',52.18182379999999654,21.07106419999999857,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Wysowska, 12',52.17885530000000215,21.06171790000000144,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Macedońska, 54',52.17604939999999659,21.04589539999999915,30.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Macedońska, 11',52.17477679999999652,21.04784550000000109,32.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Wawrzyńca Żuławskiego, 4/6',52.1907710999999992,20.99121710000000007,28.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Wawrzyńca Żuławskiego, 2',52.19051819999999964,20.99226870000000033,27.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Akademicka, 5',52.21793410000000079,20.98409380000000012,23.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Limanowskiego, 28B',52.19087249999999756,21.05436500000000066,41.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Okrężna, 33',52.18422280000000057,21.07123999999999953,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Miączyńska, 48B',52.19325680000000033,20.99384219999999957,32.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Daleka, 2',52.22217479999999768,20.98912899999999837,19.0,1,8.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Józefa Madalińskiego, 97',52.20181860000000284,21.00254509999999897,19.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Modzelewskiego, 46/50',52.17731930000000062,21.01467630000000142,24.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Nabielaka, 2',52.20388820000000151,21.03397670000000019,25.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Okrężna, 69',52.17971980000000087,21.06456719999999905,44.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Rodzynkowa, 9B',52.21500050000000214,21.07014639999999873,39.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Wejnerta, 24',52.19279829999999976,21.01740069999999961,20.0,0,13.0);
-INSERT INTO travel_info VALUES('ulica Cesarskiej Korony, 4',52.20890119999999968,20.95730130000000102,33.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Tuchlińska, 2A',52.17527739999999881,21.00552300000000016,30.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Altowa, 36',52.19837499999999864,20.96288669999999854,30.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Wróbla, 26A',52.17628090000000185,21.03258960000000144,27.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Zdrojowa, 11',52.17716670000000078,21.06491109999999978,41.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Jana Pawła Woronicza, 80',52.19119409999999704,20.98703509999999995,42.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Włoska, 8',52.20277039999999858,21.03142190000000156,26.0,1,13.5);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 355',52.17949279999999846,21.01567539999999923,21.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 70E',52.20374220000000065,20.94872170000000011,36.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Żwirki i Wigury, 55A',52.20398620000000278,20.9845796,27.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Bajońska, 5',52.22561000000000319,21.05869440000000025,24.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Sardyńska, 3',52.17850109999999831,21.05275539999999879,33.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Zwierzyniecka, 8C',52.20839149999999763,21.0511595999999983,27.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Tarczyńska, 27',52.22115010000000268,20.98718410000000034,20.0,1,9.0);
-INSERT INTO travel_info VALUES('ulica Alzacka, 3C',52.2251193000000029,21.06608310000000017,28.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Wołoska, 82',52.20030890000000312,21.00134249999999981,19.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 6A',52.17475699999999961,21.0236225999999995,22.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Łowicka, 52',52.2046412999999987,21.00433629999999851,19.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Wernyhory, 6A',52.17471419999999683,21.02492769999999922,21.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Zdrojowa, 50',52.18178530000000137,21.06081779999999882,39.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 93',52.20206470000000109,20.94655630000000101,35.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica gen. Tadeusza Bora-Komorowskiego, 62',52.22716960000000341,21.07558969999999831,29.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Algierska, 17H',52.22273100000000312,21.07942680000000024,35.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Bracławska, 2',52.23195040000000233,21.07795189999999863,24.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Budrysów, 26',52.23848019999999793,21.09029140000000169,27.0,0,14.5);
-INSERT INTO travel_info VALUES('Aleja Wilanowska, 259A',52.17548169999999886,21.0390037999999997,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Skrzetuskiego, 39',52.17825899999999706,21.02455009999999902,22.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Wita Stwosza, 57B',52.17875659999999983,21.01831419999999895,24.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Wita Stwosza, 5A',52.17448120000000244,21.01847730000000069,27.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Alzacka, 4A',52.22552209999999918,21.06645509999999888,28.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Zbigniewa Wasiutyńskiego, 5',52.21522819999999854,21.06560980000000071,37.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 59C',52.20088160000000243,20.95484289999999917,43.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Boremlowska, 48',52.24953899999999863,21.09941759999999889,32.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Juliana Ursyna Niemcewicza, 24',52.22172840000000348,20.98179740000000138,43.0,2,27.0);
-INSERT INTO travel_info VALUES('ulica Włodarzewska, 62A',52.20246319999999685,20.9537489999999984,41.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Radomska, 18',52.2169134000000028,20.97781249999999887,24.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Libijska, 10',52.2243758999999983,21.07468769999999835,28.0,1,13.5);
-INSERT INTO travel_info VALUES('ulica Ateńska, 4',52.22316090000000343,21.06613589999999903,27.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Oczki, 6A',52.22433869999999701,21.0004565999999997,19.0,1,7.0);
-INSERT INTO travel_info VALUES('ulica Kopińska, 10B',52.21733940000000018,20.97890459999999991,25.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Filipinki, 10',52.20835189999999671,20.95432479999999841,33.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Filtrowa, 75',52.21899779999999681,20.98896949999999962,19.0,1,8.5);
-INSERT INTO travel_info VALUES('ulica Stadionowa, 3',52.20972170000000289,20.95477380000000168,29.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Prezydencka, 11',52.21779879999999708,21.00107819999999847,20.0,1,8.0);
-INSERT INTO travel_info VALUES('ulica Walentego Skorochód-Majewskiego, 9',52.206210200000001,20.97453829999999897,37.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Karczewska, 14',52.24076780000000042,21.09444110000000094,32.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Kresowa, 8',52.23896630000000129,21.12944909999999865,35.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Mikołajczyka, 17',52.22886330000000043,21.10159510000000082,39.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Kamionkowska, 47',52.24736349999999874,21.06878910000000004,22.0,1,13.0);
-INSERT INTO travel_info VALUES('ulica Murmańska, 1B',52.23508029999999991,21.12642740000000074,34.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Genewska, 8',52.22509629999999703,21.05807910000000049,22.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Londyńska, 13',52.23776480000000077,21.06238619999999884,27.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Międzyborska, 109',52.24420949999999664,21.07452969999999937,24.0,1,11.0);
-INSERT INTO travel_info VALUES('ulica Londyńska, 1A',52.23368399999999668,21.06417469999999881,26.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Szaserów, 86',52.24688230000000288,21.1032586000000002,32.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Tomasza Zana, 12',52.24418200000000211,21.10531399999999991,35.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Królowej Aldony, 14',52.23296109999999715,21.05663270000000154,22.0,1,10.0);
-INSERT INTO travel_info VALUES('ulica Międzynarodowa, 42A/28',52.2331278999999995,21.06788829999999991,25.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Lotnicza, 11A',52.23437340000000261,21.12378599999999907,33.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Józefa Chłopickiego, 43',52.24870119999999929,21.10737329999999901,25.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Walecznych, 38',52.23493309999999923,21.05566560000000109,20.0,1,9.0);
-INSERT INTO travel_info VALUES('ulica Wiarusów, 11',52.24349010000000248,21.11637190000000074,35.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Wąchocka, 1D',52.2278737000000035,21.05673850000000158,23.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Wąchocka, 12',52.22923579999999789,21.05579780000000056,24.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Filomatów, 6',52.2345208999999997,21.0949680000000015,29.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Grochowska, 45',52.239061999999997,21.11532719999999941,37.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Czapelska, 48',52.24447150000000306,21.0899561999999996,33.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Alfreda Nobla, 39',52.23584240000000278,21.0573282000000006,24.0,1,10.0);
-INSERT INTO travel_info VALUES('ulica Pustelnicka, 13',52.24015190000000075,21.10629099999999881,33.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Perkuna, 86',52.23353670000000192,21.09628049999999889,29.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Pułtuska, 11',52.24537949999999853,21.09811600000000098,31.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Saska, 3C',52.22582409999999698,21.06666359999999826,27.0,1,12.0);
-INSERT INTO travel_info VALUES('ulica Pokrzywnicka, 11',52.24911310000000241,21.10544499999999957,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Olszynki Grochowskiej, 47',52.24182960000000264,21.12010240000000038,39.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Osada Ojców, 2',52.23937219999999826,21.12413469999999905,41.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Zwycięzców, 2',52.23019889999999777,21.05138790000000171,19.0,1,8.5);
-INSERT INTO travel_info VALUES('ulica Czeska, 10',52.23528499999999753,21.04892040000000008,25.0,0,10.5);
-INSERT INTO travel_info VALUES('ulica Rusznikarska, 3',52.24881109999999751,21.10218199999999911,35.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Michała Paca, 19',52.24865259999999978,21.08570819999999913,25.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Fiszera, 31',52.25804899999999976,21.16607679999999903,30.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Siennicka, 23',52.25007209999999703,21.07714259999999839,26.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Optyków, 5A',52.23201600000000155,21.10895289999999846,33.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Dziewosłęby, 7',52.25982280000000201,21.1653045000000013,30.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Ostrobramska, 75A',52.23308939999999723,21.1089884000000012,33.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Rębkowska, 7',52.24802439999999848,21.07861570000000028,27.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Owsiana, 9',52.24911949999999906,21.06830259999999911,23.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Rumuńska, 22',52.22669150000000115,21.06254930000000058,28.0,0,12.5);
-INSERT INTO travel_info VALUES('Aleja „Solidarności”, 6',52.26345750000000123,21.05300499999999886,22.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Drogistów, 4',52.26334370000000006,21.15171120000000115,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 198C',52.27542859999999792,21.11954649999999844,46.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Zachariasza, 5',52.26107569999999925,21.0584895000000003,29.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Wileńska, 16',52.2591797999999983,21.04346819999999952,22.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Batalionu Platerówek, 3',52.27485990000000271,21.01627639999999886,26.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Czwartaków, 116',52.27443939999999856,21.16228359999999852,41.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Stalowa, 48',52.2614243000000016,21.04426839999999999,17.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Buławy, 6',52.25763030000000242,21.17325599999999852,35.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Chełmżyńska, 10',52.24263669999999849,21.13571549999999988,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Jagiellońska, 57',52.27141249999999673,21.01515360000000144,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Wołomińska, 22',52.25853990000000237,21.05333029999999895,21.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Mieczysława Niedziałkowskiego, 12',52.25515399999999744,21.16879420000000067,34.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 38',52.2627748999999966,21.15798840000000069,35.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Pacholęca, 18',52.2682173999999975,21.16874149999999944,58.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mieczysława Niedziałkowskiego, 25',52.25305569999999733,21.16886699999999877,36.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Łukiska, 3',52.23398399999999953,21.09567850000000178,29.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Łukiska, 15',52.23561399999999822,21.0961591999999989,28.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Ratuszowa, 2D',52.25420189999999821,21.02433089999999894,23.0,0,12.0);
-INSERT INTO travel_info VALUES('ulica Jagiellońska, 58',52.26020359999999699,21.02503240000000062,21.0,1,15.0);
-INSERT INTO travel_info VALUES('Aleja „Solidarności”, 61',52.25279679999999872,21.03104829999999836,16.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Środkowa, 11',52.26062040000000052,21.03994970000000108,20.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Wojciecha Gersona, 13',52.27824970000000348,21.01335819999999899,28.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Łukowska, 46',52.23920869999999895,21.09731610000000046,33.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Stalowa, 56',52.26177599999999757,21.04509020000000063,16.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Poświętna, 19',52.24998719999999964,21.12937960000000003,47.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Marsa, 97',52.25529929999999724,21.15518189999999877,27.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 27',52.245455800000002,21.10919510000000087,35.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 30',52.26243689999999731,21.15868490000000079,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Mokry Ług, 69',52.28474719999999821,21.1716881999999984,55.0,2,23.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 187',52.27598179999999673,21.14725579999999994,62.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Markietanki, 17',52.25915880000000157,21.17439729999999898,39.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Pielgrzymów, 27A',52.26271160000000293,21.1651959000000005,34.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Mokry Ług, 63',52.28400760000000246,21.17176879999999884,55.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 60B',52.24745819999999697,21.11114979999999975,26.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Chojnowska, 10',52.27964500000000214,21.06389599999999974,29.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Antoniego Kacpury, 74',52.25552350000000245,21.1701504000000007,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Kramarska, 14',52.27443970000000206,21.15316160000000067,54.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Kramarska, 8',52.27364570000000298,21.15089539999999957,60.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Kramarska, 9',52.27380980000000221,21.14979110000000163,59.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Kadrowa, 19D',52.26508030000000104,21.16454179999999851,40.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Księcia Witolda, 23',52.24996070000000258,21.1666950000000007,40.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Jagiellońska, 75',52.27777300000000337,21.01154250000000089,24.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Poświętna, 28',52.25054060000000077,21.12910370000000171,47.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Poświętna, 3',52.24850430000000045,21.12977379999999883,45.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Masztalerska, 6',52.26400790000000284,21.15303600000000017,37.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Masztalerska, 28A',52.26565360000000026,21.15200319999999934,40.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Ignacego Paderewskiego, 177/181',52.27503289999999936,21.14706680000000105,60.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Drapińska, 11',52.27774190000000231,21.0660652000000006,25.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Drapińska, 19',52.27927660000000287,21.06638620000000017,28.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kanonierska, 5',52.2669805000000025,21.15576970000000045,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Drapińska, 17B',52.27880789999999678,21.06683040000000062,27.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kadrowa, 65F',52.2700236000000018,21.15787519999999944,59.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Jerzego, 40A',52.27092929999999882,21.16554779999999881,63.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Gniazdowska, 7',52.28708929999999811,21.07156240000000124,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Codzienna, 29',52.28830680000000086,21.06508840000000049,26.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Stelmachów, 4',52.25519280000000321,21.12188880000000068,50.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 47',52.2689750999999987,21.1648795000000014,45.0,2,21.5);
-INSERT INTO travel_info VALUES('ulica Władysława Szeflera „Włada”, 34',52.26626360000000204,21.16057169999999842,44.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 34',52.26805230000000079,21.16673090000000101,43.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Zawodowa, 37',52.26566660000000297,21.16311470000000127,40.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zawodowa, 4',52.26385799999999904,21.15845619999999983,39.0,2,20.5);
-INSERT INTO travel_info VALUES('ulica Czerwonej Jarzębiny, 3',52.28143930000000239,21.06354430000000022,24.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Szeroka, 146',52.25737279999999885,21.12096749999999901,54.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Gilarska, 107',52.2811936000000017,21.0538059000000004,28.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Julianowska, 38',52.28486290000000025,21.03102709999999931,28.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Konwisarska, 90',52.2579484999999977,21.17976799999999927,38.0,2,25.0);
-INSERT INTO travel_info VALUES('ulica Gościeradowska, 4',52.2717489999999998,21.04459680000000076,23.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Bratka, 23',52.28659509999999955,21.06110190000000059,24.0,0,21.0);
-INSERT INTO travel_info VALUES('Aleja Komandosów, 14A',52.25372329999999721,21.16489819999999967,32.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Czerwińska, 32',52.28939069999999845,21.06413020000000102,29.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Fausta, 33',52.28662190000000009,21.0573282000000006,27.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Czerwińska, 28',52.28957539999999682,21.06357709999999984,30.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Pszczyńska, 53',52.28974410000000005,21.07915909999999826,31.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Agatowa, 18',52.28066650000000237,21.07706340000000011,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Dominiki, 13',52.28291010000000227,21.05952560000000062,23.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Hutnicza, 3',52.26485139999999774,21.06981389999999977,27.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Stefana Łyszkiewicza „Pechowca”, 14',52.25382160000000197,21.1670158000000015,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Stefana Łyszkiewicza „Pechowca”, 33',52.25281199999999871,21.17075420000000107,38.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Bolesławicka, 23A',52.28532560000000017,21.02960669999999865,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stelmachów, 16',52.25549399999999878,21.12422820000000101,48.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Czarna Droga, 5',52.28298699999999855,21.07039869999999837,28.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Gilarska, 135',52.28228680000000139,21.05322849999999946,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Gilarska, 58',52.27975560000000143,21.0549691999999986,27.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Bolesławicka, 19B',52.28487439999999964,21.02988009999999975,30.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Traczy, 7',52.25271829999999796,21.12364189999999909,47.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Birżańska, 12A',52.26357970000000108,21.06106700000000132,25.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Pszczyńska, 59',52.2903796000000014,21.07968520000000012,30.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Szafarzy, 14',52.26608600000000137,21.15170889999999915,41.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Zesłańców Polskich, 98A',52.27133280000000326,21.14645519999999834,55.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Michała Kleofasa Ogińskiego, 5A',52.28585079999999863,21.02554759999999945,31.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Michała Kleofasa Ogińskiego, 32',52.29001110000000096,21.02392220000000122,31.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Rajmunda, 25B',52.28673940000000186,21.05645429999999862,28.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Płońska, 17',52.28346319999999992,21.07690089999999827,35.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zesłańców Polskich, 58',52.26680559999999787,21.14767829999999905,43.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Strycharska, 34',52.26470309999999842,21.16516809999999893,40.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Przewoźników, 1',52.28446890000000024,21.07763819999999911,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Lidzka, 7',52.27392050000000267,21.03711859999999945,29.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Żuromińska, 12',52.28857670000000013,21.04610149999999891,29.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Jórskiego, 11C',52.27763759999999849,21.06410550000000014,28.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Jórskiego, 22',52.27836630000000184,21.0628895000000007,27.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Myszyniecka, 9',52.28935469999999697,21.01813140000000147,28.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Kościerska, 9',52.28716790000000003,21.07342999999999832,24.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Karkonoszy, 35',52.27741340000000036,21.06424369999999868,26.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Świetlicka, 13',52.2488201000000032,21.12854129999999841,47.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Michała Reichera, 8',52.28362609999999933,21.05678460000000029,26.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Oliwska, 3',52.2781279000000012,21.02396759999999887,27.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 40C',52.26861689999999783,21.16596260000000029,44.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Szyszaków, 40B',52.26854130000000253,21.16608529999999889,44.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Palestyńska, 2B',52.28137569999999812,21.02301669999999945,31.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Porannej Bryzy, 12',52.28919390000000078,21.05564079999999905,31.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Promienna, 21',52.27542840000000268,21.07024649999999966,31.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Miedzianogórska, 14',52.28256410000000187,21.06885850000000104,30.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Dzieci Warszawy, 10A',52.19214269999999801,20.91367070000000083,47.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Klukowska, 37/39',52.27254049999999808,21.07888020000000039,31.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Obwodowa, 7A',52.2742689000000027,21.04079589999999911,25.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Lewinowska, 44C',52.28502699999999948,21.08204710000000048,30.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Mroźna, 39',52.29120220000000074,21.07078789999999913,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Młodzieńcza, 49',52.29088469999999945,21.06913360000000068,29.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Liwska, 2',52.29023740000000231,21.01747860000000045,28.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Ignacego Łukasiewicza, 16',52.28946119999999809,21.06837519999999841,30.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Malborska, 39',52.30420639999999822,21.07777169999999956,29.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Jórskiego, 58',52.27972880000000088,21.05844420000000027,27.0,0,19.0);
-INSERT INTO travel_info VALUES('ulica Lisia, 23A',52.27889760000000052,21.07410520000000176,25.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Karminowa, 23',52.28270739999999961,21.05356629999999996,29.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Zamkowa, 2',52.27374180000000336,21.07801740000000023,34.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Grocholicka, 1',52.18695490000000347,20.87180400000000091,43.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica św. Wincentego, 126A',52.2951750000000004,21.05450679999999863,30.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Śmiałego, 18A',52.20258019999999988,20.86296970000000072,41.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Władysława Bełzy, 9',52.19604759999999999,20.87487559999999931,39.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Montwiłłowska, 6',52.27578919999999841,21.08437550000000015,30.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Samarytanka, 25C',52.28081329999999838,21.06066149999999836,28.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Samarytanka, 25A',52.28070360000000249,21.06066709999999987,28.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Mariana Falskiego, 22',52.19714359999999687,20.87749910000000142,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Bodycha, 104',52.18238759999999843,20.87260990000000049,44.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Wolbromska, 18',52.28153770000000122,21.07598670000000141,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Samarytanka, 34',52.28039760000000057,21.06043250000000099,28.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Zaciszańska, 4',52.29064400000000034,21.05721109999999996,30.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Wolińska, 10',52.28792940000000299,21.08641589999999865,37.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Cierlicka, 11',52.19424980000000147,20.88521509999999993,31.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Zabraniecka, 8E',52.26113660000000038,21.09346100000000135,35.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Zygmuntowska, 10',52.28455850000000282,21.06459389999999842,23.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Suwalska, 26',52.29481380000000001,21.03497700000000137,31.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Barbary Radziwiłłówny, 1',52.19836920000000191,20.86098169999999997,48.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wyborna, 15',52.28152930000000253,21.07375000000000042,30.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Warszawska, 32',52.1988478000000029,20.87164750000000169,56.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Michała Spisaka, 105',52.19255700000000075,20.88277340000000138,34.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Skoroszewska, 1B',52.19141369999999825,20.90128370000000046,47.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Ryżowa, 64',52.18766060000000095,20.90440219999999983,45.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Prawnicza, 59',52.19009870000000006,20.88161189999999934,38.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Regulska, 18',52.19397169999999875,20.88015270000000001,33.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Silnikowa, 15',52.20055260000000174,20.88765649999999851,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Imbirowa, 8J',52.15154460000000113,21.06121359999999853,38.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Skrzypcowa, 12A',52.28663439999999696,21.06782340000000176,28.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Piastowska, 2',52.19200390000000311,20.87411709999999943,39.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Królowej Bony, 17',52.19878049999999803,20.86456970000000055,43.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jaworowa, 36',52.13412079999999805,21.0489335000000004,42.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Ryżowa, 41E',52.18985719999999873,20.90777879999999911,46.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Władysława Syrokomli, 23',52.28513569999999789,21.02736670000000175,33.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Warszawska, 36',52.19869529999999714,20.87101510000000104,55.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Słupska, 1A',52.18486999999999654,20.8870590000000007,56.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Andrzeja Szomańskiego, 42',52.18832160000000186,20.87699220000000011,43.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Kompanii AK „Kordian”, 33',52.18882529999999776,20.8788829999999983,53.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Królów Polskich, 18',52.19757440000000059,20.8625505000000011,45.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 25A',52.12262489999999815,21.01273919999999861,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 15B',52.12102819999999781,21.01236700000000112,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 3',52.11162960000000055,21.03981789999999919,55.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Jagielska, 61E',52.11484639999999758,21.02169860000000056,41.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Dereniowa, 5A',52.14371500000000025,21.04323049999999995,34.0,0,23.5);
-INSERT INTO travel_info VALUES('ulica Ochocka, 2AB',52.18572730000000348,20.8760280999999992,44.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Jagiellończyka, 20A',52.20291790000000275,20.86035289999999876,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jerzego Michałowicza, 71',52.19107439999999798,20.88006890000000126,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Kuźnicy Kołłątajowskiej, 34A',52.18586429999999866,20.87832859999999969,47.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Bekasów, 98',52.15018320000000073,21.02398159999999905,37.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Aleksandra Janowskiego, 32',52.15290960000000097,21.02076999999999885,29.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Farbiarska, 48',52.13266420000000067,21.01198460000000168,40.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Bajaderki, 22',52.15576819999999714,21.05926150000000164,40.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Akustyczna, 16A',52.12895989999999813,21.01448489999999936,35.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Głęboka, 13',52.12134060000000346,21.01122760000000156,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Dezyderego Adama Chłapowskiego, 25',52.164284600000002,21.03836079999999953,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Ksawerego Bronikowskiego, 53',52.13396829999999938,21.06884600000000062,37.0,0,27.5);
-INSERT INTO travel_info VALUES('ulica Kaczorowska, 12',52.19079390000000273,20.87798910000000063,39.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Malinowa, 2',52.19374410000000352,20.88391079999999889,31.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Jesienna, 14D',52.19847159999999775,20.86449610000000021,44.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Elegijna, 47',52.16463600000000155,21.03354290000000048,29.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Głuszca, 3',52.1305874999999972,21.01551040000000014,34.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Cymbalistów, 7M',52.10781500000000221,21.01453670000000073,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Baletowa, 177',52.13257600000000024,20.98040960000000155,51.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Buszycka, 10',52.111006500000002,20.99504320000000135,56.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Zagłoby, 37',52.19210749999999877,20.86141780000000168,39.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Zagłoby, 11',52.19383340000000259,20.86946879999999994,35.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Bokserska, 77',52.17058010000000223,20.99193670000000011,38.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stefana Dembego, 14',52.13159180000000247,21.07416140000000126,37.0,0,28.5);
-INSERT INTO travel_info VALUES('ulica Anyżkowa, 10',52.16874169999999822,21.04545029999999884,28.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Elegancka, 4',52.12920559999999882,21.05384450000000029,42.0,0,27.0);
-INSERT INTO travel_info VALUES('ulica Fort Służew, 5',52.16833919999999836,21.03867959999999825,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Fort Służew, 3',52.16846919999999699,21.0397123999999991,29.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Dezyderego Adama Chłapowskiego, 19',52.16408040000000312,21.03850410000000081,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Ludwika Hirszfelda, 12',52.14491929999999798,21.04177920000000057,32.0,0,24.0);
-INSERT INTO travel_info VALUES('ulica Benedykta Polaka, 1',52.14669250000000033,21.05200990000000161,31.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Czapli, 45',52.150024700000003,21.02930599999999827,32.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Mysikrólika, 1A',52.14683930000000344,21.02189130000000005,32.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Baletowa, 106',52.12718160000000011,20.99273039999999924,39.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Ludwinowska, 47P',52.13312890000000265,21.0081914999999988,45.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Ludwinowska, 22/5',52.13477249999999686,21.01175149999999903,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Organistów, 19',52.13611379999999685,21.0129097999999992,41.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Makowskiego, 22',52.15301089999999818,21.02277919999999866,31.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 87D',52.13940370000000257,21.07136020000000087,38.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cynamonowa, 33',52.15183090000000021,21.04601459999999947,28.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Panoramiczna, 2',52.153578600000003,21.05732809999999944,33.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Głęboka, 30',52.12159969999999732,21.00883320000000154,48.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Jagielska, 55E',52.11419570000000334,21.02339160000000006,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 174E',52.16819360000000216,21.04468040000000073,27.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Zielonogórska, 2B',52.19924639999999983,20.89476579999999827,47.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Modelowa, 16',52.15459760000000244,21.05907780000000073,36.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Kuropatwy, 28W',52.10714480000000037,21.02550869999999961,47.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Karmazynowa, 7',52.11119879999999683,21.02095920000000006,37.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Welurowa, 2',52.13377979999999923,21.05076409999999853,41.0,0,26.0);
-INSERT INTO travel_info VALUES('ulica Kolibrów, 5',52.13611470000000025,21.02542640000000062,42.0,1,23.0);
-INSERT INTO travel_info VALUES('Aleja Komisji Edukacji Narodowej, 47',52.14328390000000013,21.05322029999999956,30.0,0,25.5);
-INSERT INTO travel_info VALUES('ulica Kuropatwy, 8P',52.10714339999999823,21.03257550000000009,53.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Makolągwy, 5',52.14413509999999974,21.03069920000000081,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Nowoursynowska, 172P',52.16843089999999706,21.04441599999999823,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Na Uboczu, 2',52.13969060000000155,21.05021710000000112,33.0,0,25.0);
-INSERT INTO travel_info VALUES('ulica Ludwinowska, 51A',52.13427049999999952,21.00681069999999906,43.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Moczydłowska, 67C',52.13458779999999849,21.0470657999999986,41.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Ludwinowska, 21E',52.1331969000000015,21.01309260000000023,35.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Moczydłowska, 67K',52.13389279999999815,21.04671839999999961,42.0,0,28.0);
-INSERT INTO travel_info VALUES('ulica Kotylion, 2',52.12939649999999859,21.01590799999999959,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Alpejska, 42',52.21803280000000313,21.1728039999999993,53.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Kądziołeczki, 54D',52.14505960000000328,21.0009939999999986,50.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Kanarkowa, 6C',52.1363921000000019,21.0287343,46.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Korowodu, 11',52.14064369999999827,21.01353840000000162,35.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Katarynki, 15',52.10591139999999655,21.01569290000000123,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Kądziołeczki, 50',52.14448519999999832,21.00074860000000144,49.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wełniana, 19',52.13129579999999664,21.0539948999999993,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Karczunkowska, 144',52.11063080000000269,20.99269530000000116,47.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jana Zaorskiego, 2',52.16194229999999977,21.01939429999999831,28.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Kuropatwy, 34R',52.10704770000000252,21.02334409999999921,44.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Kuropatwy, 24F',52.10722520000000201,21.0269686,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Trombity, 50',52.11736909999999768,20.99820220000000149,60.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Jana Rosoła, 50',52.14637460000000146,21.06270980000000037,36.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Rysy, 33',52.14470409999999845,21.01671250000000057,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Trombity, 22L',52.11416520000000218,21.00718080000000043,51.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Puławska, 465',52.1372207000000003,21.01856580000000107,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Związku Walki Młodych, 22',52.1609308000000027,21.03745809999999849,30.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica ppłk. Zbigniewa Stanisława Kiedacza, 22A',52.15856500000000295,21.05658150000000006,32.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Złoty Potok, 9',52.15948939999999823,20.99530590000000175,40.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Łagiewnicka, 25',52.12768450000000086,21.01337029999999828,35.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Jeża, 10',52.12998580000000004,21.08069210000000026,41.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica ppłk. Zbigniewa Stanisława Kiedacza, 16',52.15833210000000264,21.05723599999999963,32.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Kraski, 17',52.15066540000000117,21.02418420000000054,32.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Agrestowa, 10B',52.17269780000000167,21.20549589999999896,46.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Trombity, 41',52.11615050000000337,20.99979120000000065,56.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Klubowa, 1K',52.12453510000000278,21.016376300000001,35.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Wodzirejów, 23C',52.15114799999999918,21.00888640000000152,42.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Żołny, 20A',52.13773909999999745,21.03025879999999858,43.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wodzirejów, 17F',52.15088639999999743,21.00999649999999975,35.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Roztoki, 6',52.14381130000000297,21.01586580000000026,34.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Solistów, 3',52.11467580000000054,21.01618429999999905,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Żołny, 47A',52.13792910000000091,21.02312919999999963,34.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Taneczna, 59F',52.14738580000000212,21.01305070000000085,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Pozytywki, 24',52.10955690000000117,21.01238109999999893,44.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Tukana, 8E',52.11985030000000307,21.02263960000000154,41.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Sarabandy, 42',52.11428089999999714,21.01097899999999897,47.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica 27 Grudnia, 1',52.22192780000000311,21.14592620000000168,32.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Walczyka, 19',52.14551900000000017,21.01335699999999918,33.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Pozytywki, 18C',52.10953429999999998,21.01483879999999971,48.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Stryjeńskich, 15E',52.13233540000000232,21.05270700000000162,37.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Puchaczy, 35',52.13310549999999922,21.02014619999999923,30.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Ustronie, 15',52.12960149999999971,21.05123439999999845,40.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Derkaczy, 75',52.16460719999999896,21.20480470000000039,48.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Chodzieska, 44P',52.18847900000000095,21.13686709999999991,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 27',52.22051969999999699,21.15001080000000044,31.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Celulozy, 131K',52.16969879999999904,21.17225889999999922,59.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Derwida, 7',52.17578619999999746,21.19997779999999921,42.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Będzińska, 10A',52.1813945999999973,21.18742740000000068,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Borków, 55',52.19236300000000028,21.1521018000000005,62.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Bronisława Czecha, 47',52.22643099999999806,21.15487810000000123,37.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Celulozy, 107D',52.1675625000000025,21.17507230000000006,63.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Celulozy, 107A',52.16777379999999909,21.17582110000000028,62.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Dulczyńska, 5',52.15989259999999917,21.22973139999999858,60.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Ciekawa, 4',52.17244430000000221,21.18898629999999983,48.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cylichowska, 79',52.19841929999999764,21.1634266999999987,47.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Czołgistów, 20',52.18754440000000016,21.21274469999999823,56.0,2,27.0);
-INSERT INTO travel_info VALUES('ulica Dusznicka, 6',52.16692909999999728,21.20955500000000172,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Bysławska, 10L',52.15340350000000313,21.17715249999999826,58.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Artystyczna, 41',52.19217390000000023,21.22125679999999904,63.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Bystrzycka, 89',52.16670549999999907,21.20890530000000141,47.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Bielszowicka, 30A',52.20920890000000014,21.18663069999999848,52.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 47J',52.19604960000000204,21.1249299999999991,54.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Bambusowa, 16',52.16316859999999878,21.21179830000000167,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Junaków, 17',52.18489819999999924,21.18210189999999927,41.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Junaków, 18A',52.18466310000000163,21.18209939999999846,41.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Borowiecka, 63H',52.18302349999999735,21.15754529999999889,55.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Borkowska, 10',52.19077639999999719,21.17547509999999989,53.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 60',52.19691069999999656,21.12743030000000032,51.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 47K',52.19600580000000178,21.12480220000000131,54.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Bambusowa, 24',52.16367439999999789,21.21129210000000143,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Marysińska, 19',52.22293640000000181,21.15426460000000119,31.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Przewodowa, 42K',52.1707449999999966,21.17000949999999904,57.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Motylkowa, 41',52.19891179999999765,21.15153069999999857,51.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 30D/1',52.21151720000000295,21.11772589999999994,47.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 160',52.22310459999999921,21.10992939999999862,41.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Minerska, 2B',52.22854710000000011,21.14287350000000031,38.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 119B',52.1764610000000033,21.18354529999999869,53.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Orzechowskiego, 21',52.18261979999999767,21.19864090000000089,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 9',52.18561189999999784,21.17519199999999913,46.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Minerska, 9',52.22879360000000303,21.14169250000000134,37.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Michalinki, 3',52.15483369999999753,21.21384490000000156,52.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Mirtowa, 1M',52.2080087000000006,21.14994790000000079,46.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Odrodzenia, 1A',52.22156660000000272,21.16347590000000168,43.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 33F',52.18846570000000184,21.16838519999999946,47.0,2,24.0);
-INSERT INTO travel_info VALUES('ulica Poprawna, 44J',52.21315609999999908,21.11791889999999939,46.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Ogrody, 27',52.21505479999999722,21.11160209999999893,47.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Motylkowa, 1D',52.19677169999999933,21.15171859999999882,56.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Potockich, 103',52.2363330000000019,21.14964670000000169,42.0,0,22.0);
-INSERT INTO travel_info VALUES('ulica Mydlarska, 17M',52.20807229999999777,21.1469844000000009,48.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Masłowiecka, 12D',52.20067050000000108,21.1304936000000012,45.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Motylkowa, 3R/2',52.19602660000000327,21.14669689999999846,60.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Odmienna, 1',52.18054790000000053,21.23596170000000071,63.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Macierzanki, 9',52.17344200000000142,21.19402949999999919,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Motylkowa, 3M/2',52.19623229999999837,21.14784900000000078,59.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 57',52.21529249999999678,21.11341570000000089,48.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Olchy, 8',52.18395170000000149,21.20171099999999953,51.0,2,25.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 299',52.21630700000000047,21.13236579999999876,46.0,2,17.5);
-INSERT INTO travel_info VALUES('ulica Lipkowska, 63',52.19401990000000068,21.19784519999999973,54.0,1,28.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 253F/2',52.21044469999999649,21.13300549999999945,48.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Gruntowa, 67',52.16741830000000135,21.21916759999999868,51.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Dzielnicowa, 56',52.22167489999999646,21.14735729999999947,30.0,1,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 339/2',52.21971340000000338,21.13507119999999873,45.0,1,17.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 243A',52.20793139999999966,21.13208630000000098,51.0,2,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 271F',52.2129936999999984,21.13010729999999882,46.0,2,18.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 205B',52.20277070000000207,21.13255699999999848,46.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Limby, 6',52.18473079999999698,21.19571789999999822,45.0,1,25.0);
-INSERT INTO travel_info VALUES('Aleja Dzieci Polskich, 71D/2',52.21190699999999652,21.20505299999999949,49.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Gajowa, 8',52.21090939999999848,21.1507897999999983,42.0,1,19.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 140/11',52.18849480000000085,21.1461295999999983,58.0,2,21.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 140/22',52.18868309999999867,21.14709590000000005,59.0,2,21.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 140/3',52.18905819999999807,21.14225940000000036,55.0,2,20.5);
-INSERT INTO travel_info VALUES('Aleja Dzieci Polskich, 27',52.20767889999999767,21.19354840000000095,51.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Dusznicka, 74',52.16797809999999914,21.21865250000000102,52.0,1,27.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 231A',52.20560739999999811,21.13353469999999845,49.0,1,18.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 360B',52.22032169999999951,21.13678880000000149,44.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Michała Kajki, 67C',52.21930679999999825,21.16352819999999823,45.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Lokalna, 90',52.16890800000000183,21.21885669999999991,54.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Filmowa, 34/36A',52.15879989999999822,21.22083659999999838,51.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Klimontowska, 80',52.21760600000000351,21.15067429999999859,38.0,1,19.0);
-INSERT INTO travel_info VALUES('Aleja Dzieci Polskich, 84A',52.21004179999999906,21.20954929999999906,49.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Gruszy, 30A',52.19741590000000286,21.16481669999999938,47.0,1,22.0);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 339A',52.21995720000000318,21.13456950000000135,46.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Kąkolowa, 20E',52.17543400000000275,21.20191619999999944,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Niecodzienna, 22',52.18401779999999946,21.23467279999999846,66.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Kazimierza Króla, 31A',52.19000379999999951,21.18008830000000132,43.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Kwidzyńska, 48',52.21277059999999893,21.15459290000000081,36.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Krawiecka, 6',52.2246491000000006,21.16378040000000027,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Kwidzyńska, 45A',52.21283329999999979,21.15357549999999876,36.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Ogórkowa, 45B',52.15868189999999772,21.16245689999999868,57.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Napoleona Bonaparte, 37A',52.17063869999999782,21.22963869999999887,60.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Napoleona Bonaparte, 5',52.17335580000000305,21.22509349999999984,60.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Jana Kossakowskiego, 37B',52.21172669999999983,21.19067719999999966,58.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Kuligowska, 23B',52.18487530000000162,21.13598220000000083,45.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Ogórkowa, 67EC',52.16222450000000065,21.16052110000000041,54.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Kwiatowa Polana, 10',52.17381840000000181,21.16586399999999913,57.0,1,29.5);
-INSERT INTO travel_info VALUES('ulica Kwitnącej Akacji, 55',52.19147159999999986,21.21954669999999865,62.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Lebiodowa, 27N',52.20909019999999857,21.13909230000000151,56.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Jana Kossakowskiego, 4A',52.2080681999999996,21.19208970000000036,51.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Ligustrowa, 25H',52.20206739999999713,21.12443569999999938,48.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Koszęcińska, 25',52.18149480000000295,21.21763950000000065,55.0,2,27.0);
-INSERT INTO travel_info VALUES('ulica Liścienia, 36/38',52.19203600000000164,21.20691419999999994,57.0,1,28.5);
-INSERT INTO travel_info VALUES('Trakt Lubelski, 233M',52.2052059999999969,21.13101239999999948,49.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Kosynierów, 27',52.21459600000000023,21.16900199999999899,50.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Korkowa, 120',52.23899639999999778,21.15233239999999882,42.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Kąkolowa, 20B',52.17528930000000286,21.20155330000000049,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Obiegowa, 2B',52.20763099999999924,21.18782029999999849,51.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 28P',52.19451990000000307,21.12916829999999991,53.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Astry, 14',52.18986919999999686,21.2098545999999999,58.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Kalinowa, 1',52.1728244000000032,21.22948590000000024,60.0,2,29.5);
-INSERT INTO travel_info VALUES('ulica Izbicka, 88',52.1821318000000005,21.21513519999999887,54.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Kartonowa, 19',52.19622979999999757,21.16458880000000064,56.0,0,23.0);
-INSERT INTO travel_info VALUES('ulica Herbaciana, 3',52.18119190000000173,21.20247069999999923,50.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Klimontowska, 36B',52.2173195000000021,21.14202889999999969,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Hermanowska, 19',52.22873009999999994,21.14346949999999836,40.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Ezopa, 39',52.19359719999999925,21.19060599999999895,48.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Klimontowska, 15F',52.21799060000000025,21.1381774,46.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Goździków, 22',52.23861310000000202,21.13798699999999898,37.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Gruntowa, 9',52.16630690000000214,21.21082609999999846,47.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Gardenii, 24',52.21666570000000007,21.15258580000000065,38.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Klimatyczna, 37A',52.18887540000000058,21.18120019999999926,41.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Bychowska, 22A',52.23548279999999978,21.14551339999999868,40.0,0,21.5);
-INSERT INTO travel_info VALUES('ulica Karpacka, 4C',52.23329160000000115,21.14868200000000086,47.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Klimontowska, 23',52.21798290000000264,21.14010120000000014,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Hafciarska, 52J',52.21360709999999728,21.18438929999999943,62.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 28G',52.19422370000000199,21.1277727000000013,52.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Jeziorowa, 49B',52.1965465999999978,21.12670729999999964,52.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica ks. Sylwestra Szulczyka, 85F',52.1832544000000027,21.23870910000000122,79.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Patriotów, 195',52.18208340000000333,21.19004659999999874,43.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Stoczniowców, 9',52.22164049999999947,21.10655560000000008,36.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Płowiecka, 105/107',52.2274924000000027,21.14379950000000008,35.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Sobierajska, 15B',52.19141319999999951,21.18922690000000131,46.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Pod Brzozami, 66',52.19973269999999844,21.12559939999999869,48.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Szparagowa, 16',52.22321910000000144,21.14168150000000068,36.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Planetowa, 74',52.18800250000000318,21.20217530000000039,49.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Polarna, 17',52.20382670000000047,21.15587760000000017,46.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 67FW',52.17410339999999991,21.17000390000000109,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Parterowa, 3',52.1588749000000007,21.22583420000000132,54.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Podkowy, 42',52.16206849999999662,21.2244558000000012,54.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Szparagowa, 6',52.22397560000000282,21.14344589999999969,34.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Patriotów, 201',52.18256619999999658,21.18883579999999967,42.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Retmańska, 12',52.15236010000000277,21.18393539999999931,61.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 67HA',52.174118,21.17061670000000006,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stawiszyńska, 8',52.1588464000000016,21.21893760000000028,50.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Planetowa, 21A',52.18885910000000194,21.18934439999999953,43.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Płowiecka, 68',52.22875090000000142,21.13915109999999942,39.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 75G',52.17307900000000131,21.16434399999999983,56.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Strzygłowska, 52ZB',52.17294110000000273,21.15962920000000124,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Panny Wodnej, 21',52.18429679999999849,21.17922120000000063,45.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Pajęcza, 17',52.19098410000000143,21.18704089999999952,44.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Mrągowska, 7F',52.16812259999999669,21.16595369999999932,69.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Połaniecka, 5',52.15685500000000018,21.18114040000000031,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Szafranów, 3',52.19428450000000196,21.14349610000000012,54.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Mozaikowa, 117',52.17614770000000135,21.18491590000000002,51.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Przewodowa, 66A',52.1724022000000005,21.17688150000000035,54.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica VII Poprzeczna, 10',52.21463490000000007,21.16038089999999983,31.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Miłkowskiego, 10',52.22071809999999914,21.13883540000000139,43.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Podkowy, 109E',52.17034319999999781,21.24006089999999958,63.0,2,32.0);
-INSERT INTO travel_info VALUES('ulica X Poprzeczna, 5A',52.21134800000000097,21.16349710000000072,35.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 27C',52.21125169999999827,21.11419739999999833,47.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Mrągowska, 26',52.17085139999999655,21.16548299999999827,56.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Poprawna, 44D',52.21298219999999902,21.11719980000000164,45.0,1,16.5);
-INSERT INTO travel_info VALUES('ulica Marty, 26',52.19049799999999806,21.20522869999999927,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Poezji, 3',52.15528019999999998,21.20291429999999977,58.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Prymulki, 45',52.17984990000000067,21.17996790000000117,52.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Mrówcza, 78',52.19912389999999647,21.16898589999999914,42.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica III Poprzeczna, 2A',52.22159789999999902,21.15352139999999892,31.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Związkowa, 8A',52.23607319999999988,21.14041720000000169,40.0,0,20.0);
-INSERT INTO travel_info VALUES('ulica Turkusowa, 4',52.20490540000000123,21.18780059999999921,53.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 16R',52.20899070000000108,21.11270820000000014,45.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Tęczowa, 14B',52.22987520000000216,21.1458516000000003,50.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Zasobna, 1',52.18365409999999827,21.17217120000000107,48.0,2,22.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 20A',52.20176020000000249,21.14370939999999877,53.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 44P',52.15373430000000354,21.19012419999999964,59.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Tytoniowa, 22',52.23606050000000067,21.13114679999999979,38.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Złotej Jesieni, 17',52.17149040000000326,21.23303220000000024,58.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Tytoniowa, 26',52.23665580000000119,21.13174259999999905,37.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 64/10',52.21381540000000143,21.10903499999999866,45.0,1,15.0);
-INSERT INTO travel_info VALUES('ulica Wilgi, 3',52.18607039999999842,21.18818770000000029,35.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 88',52.21614430000000339,21.10688959999999881,36.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Sęczkowa, 44B',52.21154299999999893,21.10945720000000137,44.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 186',52.1686692999999977,21.15741249999999952,47.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Zorzy, 28B',52.21601400000000126,21.17262559999999994,53.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Złotej Jesieni, 44',52.16866749999999798,21.24042010000000147,62.0,2,31.0);
-INSERT INTO travel_info VALUES('ulica Trawiasta, 29B',52.22466239999999971,21.15548649999999852,34.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 36P',52.15318260000000094,21.19259720000000158,54.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Żywokostowa, 6',52.15830499999999859,21.20977870000000109,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 102',52.16026200000000301,21.17318050000000084,56.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Rusinowska, 1A',52.15812919999999764,21.22372590000000159,54.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Wilgi, 29',52.18605320000000347,21.19700539999999833,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wiślanego Nurtu, 24',52.15250910000000317,21.17861230000000105,63.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Tyszowiecka, 7',52.16019519999999688,21.23108609999999886,60.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 414A/22',52.19767130000000321,21.12608660000000071,46.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Wakacyjna, 6',52.16114869999999826,21.22804959999999852,58.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Sępia, 19',52.23352620000000001,21.13776049999999885,32.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Wisełki, 46A',52.18637079999999884,21.19927219999999935,47.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wiślanego Nurtu, 22',52.15259029999999996,21.17892170000000007,63.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Skalnicowa, 66D',52.18594480000000146,21.15182130000000172,54.0,2,21.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 69',52.15441330000000164,21.18343090000000117,56.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 186B',52.16885599999999812,21.1579675000000016,48.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Przyleśna, 15',52.19454720000000236,21.19522249999999986,53.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Wisienki, 18',52.20803889999999826,21.20389690000000015,50.0,2,25.5);
-INSERT INTO travel_info VALUES('ulica Sobierajska, 3A',52.18836509999999862,21.19032680000000112,42.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 8B',52.15041730000000086,21.18931200000000103,56.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Radłowa, 13A',52.17940109999999976,21.20676519999999954,48.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Szafirowa, 25B',52.16885059999999897,21.19047039999999882,51.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Północna, 25D',52.20586759999999771,21.15780549999999848,46.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Trzykrotki, 4',52.21021559999999795,21.20047389999999865,47.0,2,24.5);
-INSERT INTO travel_info VALUES('ulica Wielostronna, 14',52.18748260000000271,21.1778334000000008,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Rogatkowa, 41D',52.20466270000000008,21.16177580000000091,38.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Wał Miedzeszyński, 414B/21',52.19750049999999675,21.12636669999999838,47.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Spadowa, 18',52.22517140000000068,21.13616730000000032,47.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 7N',52.19935629999999805,21.13919740000000047,55.0,1,21.5);
-INSERT INTO travel_info VALUES('ulica Rozchodnikowa, 7',52.16101830000000205,21.17227349999999931,55.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Przyjaźni, 1',52.22703229999999764,21.15920429999999897,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Przyjaźni, 5',52.22785460000000057,21.15910009999999986,44.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Reszelska, 2A',52.23820309999999978,21.15077150000000116,42.0,0,22.5);
-INSERT INTO travel_info VALUES('ulica Wiązana, 47H',52.20367250000000325,21.13944130000000144,56.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Bartosza Głowackiego, 96',52.25297640000000143,21.23431950000000157,33.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 37D',52.17733170000000342,21.23092899999999972,62.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Zwoleńska, 58A',52.19969360000000335,21.14674109999999985,49.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Aleksandra Fredry, 5',52.24086779999999664,21.19804530000000042,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Włókiennicza, 37',52.15895780000000314,21.20774739999999881,48.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 50A',52.18087469999999684,21.23722349999999893,66.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Wacława Wojtyszki, 50C',52.18362110000000342,21.15405420000000091,56.0,2,22.0);
-INSERT INTO travel_info VALUES('ulica Śpiewna, 11',52.15783540000000328,21.21313819999999951,49.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Cypriana Godebskiego, 3/5',52.24555769999999911,21.22742709999999989,40.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Zabielska, 1D',52.20437629999999985,21.11636449999999954,46.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Wacława Wojtyszki, 9A',52.18557919999999939,21.14671680000000009,55.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Zabrzańska, 1',52.17830049999999887,21.20868240000000071,50.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Wrzosowa, 5',52.16399040000000297,21.21351900000000157,39.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Świebodzińska, 14',52.20372199999999908,21.18155169999999999,53.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 54F',52.18208080000000137,21.23728510000000113,65.0,2,29.0);
-INSERT INTO travel_info VALUES('ulica Dzikiej Róży, 5',52.21465750000000127,21.23216899999999896,60.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Irysów, 18A',52.2134890000000027,21.24049739999999887,59.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Żwanowiecka, 37',52.17227129999999847,21.20534250000000042,45.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Włókiennicza, 15',52.15515930000000111,21.21149619999999914,50.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Włókiennicza, 17',52.15535679999999986,21.21145070000000032,50.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Wąbrzeska, 10',52.21473240000000259,21.1312104000000005,44.0,2,17.0);
-INSERT INTO travel_info VALUES('ulica Żeglarska, 3',52.17801450000000329,21.197190599999999,46.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Zagórzańska, 65K',52.18481680000000011,21.23277769999999976,59.0,2,30.0);
-INSERT INTO travel_info VALUES('ulica Zasadowa, 38',52.17790060000000096,21.17322479999999985,69.0,2,23.5);
-INSERT INTO travel_info VALUES('ulica Leona Wyczółkowskiego, 10',52.22021399999999858,21.14037139999999937,41.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Źródlana, 20',52.20115609999999862,21.15754910000000066,46.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Wągrowiecka, 12',52.18241609999999753,21.18200410000000033,47.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Żegańska, 7',52.2057750000000027,21.17195480000000174,36.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Promienna, 24',52.21087610000000012,21.24265409999999932,32.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Europejska, 117A',52.15423270000000144,21.09332350000000033,46.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Juliana Ursyna Niemcewicza, 52',52.24613039999999842,21.21967580000000097,39.0,2,25.0);
-INSERT INTO travel_info VALUES('ulica Adama Mickiewicza, 24',52.24434310000000181,21.21573950000000153,21.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Piotrusia Pana, 21',52.21414279999999764,21.23184069999999935,60.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Konwaliowa, 58',52.21403589999999895,21.24303099999999844,61.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Cicha Dolina, 72',52.17286070000000108,21.11613660000000081,56.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Tadeusza Kościuszki, 4',52.24599179999999877,21.21898099999999943,40.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Krokusów, 4',52.21804600000000107,21.24524159999999995,57.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Biwakowa, 11',52.15944329999999952,21.09194289999999939,46.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Kubusia Puchatka, 5',52.2491930999999994,21.2310844000000003,6.0,0,4.5);
-INSERT INTO travel_info VALUES('ulica Piotrusia Pana, 31',52.21408149999999893,21.23365850000000065,59.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Liryczna, 10',52.22014370000000127,21.24972860000000096,39.0,2,26.0);
-INSERT INTO travel_info VALUES('ulica Mazowiecka, 99A/1',52.22461080000000066,21.24836009999999931,62.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Krzywa, 6B',52.21833759999999814,21.21600180000000079,60.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Tadeusza Kościuszki, 9',52.24506660000000124,21.21968650000000168,43.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Juliana Ursyna Niemcewicza, 7',52.24827909999999776,21.19675110000000017,51.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Dobrodzieja, 25',52.13398879999999736,21.10810680000000162,58.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Kosiarzy, 5',52.17268579999999645,21.08499709999999894,48.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Kosiarzy, 24A',52.17063180000000244,21.0789055999999988,39.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Glebowa, 26',52.17950849999999719,21.09955409999999887,47.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Gąsek, 76',52.12993529999999965,21.08343879999999971,42.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Jara, 4F',52.17572630000000089,21.1137523999999992,52.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Cicha Dolina, 6',52.17239320000000191,21.1134738000000013,53.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Europejska, 53',52.1573385000000016,21.0966351000000003,50.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Kruszyny, 7C',52.21812049999999772,21.21726590000000101,59.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Prymasa Augusta Hlonda, 11L',52.1560945000000018,21.06699910000000031,50.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Nizinna, 10A',52.22738979999999743,21.23858800000000002,28.0,1,14.5);
-INSERT INTO travel_info VALUES('ulica gen. Władysława Sikorskiego, 8A',52.25243869999999902,21.2259291999999995,46.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Skoczna, 6',52.22199979999999898,21.24896329999999978,58.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Marii Konopnickiej, 11',52.25100179999999739,21.22884290000000007,15.0,0,7.5);
-INSERT INTO travel_info VALUES('ulica Poezji, 17',52.21932929999999829,21.24855919999999899,62.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Marii Rodziewiczówny, 54',52.2184548000000035,21.25187490000000067,33.0,1,18.5);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 11',52.22415790000000157,21.21992189999999923,50.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Radosna, 10',52.2211490999999981,21.24213609999999975,43.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Armii Krajowej, 57',52.25041000000000224,21.22970109999999977,35.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica gen. Władysława Sikorskiego, 80',52.25157649999999876,21.2449458,51.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Armii Krajowej, 41',52.25050430000000289,21.22727659999999972,33.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Skalista, 28',52.21793350000000089,21.2328854999999983,59.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Leśnych Ziół, 5',52.21636240000000128,21.24920180000000159,60.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Marii Konopnickiej, 6',52.25068279999999988,21.23015110000000049,15.0,0,7.5);
-INSERT INTO travel_info VALUES('ulica Marii Konopnickiej, 5',52.25101190000000173,21.22810240000000092,15.0,0,7.5);
-INSERT INTO travel_info VALUES('ulica Tymiankowa, 36',52.21567939999999908,21.24641090000000076,59.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Adama Mickiewicza, 8D',52.24429829999999698,21.21010349999999889,17.0,0,14.5);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 58B',52.22294899999999985,21.23268219999999929,51.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Sosnowa, 7',52.24888010000000093,21.1844676000000014,49.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 25D',52.21781190000000094,21.23506109999999936,57.0,1,25.0);
-INSERT INTO travel_info VALUES('Trakt Brzeski, 1',52.22449069999999694,21.21073910000000141,45.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Agawy, 30B',52.213904399999997,21.22019510000000154,52.0,2,25.0);
-INSERT INTO travel_info VALUES('ulica Józefa Dwernickiego, 3',52.25130599999999959,21.24030349999999956,41.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Szlachecka, 21',52.21888990000000063,21.24702750000000151,42.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Urocza, 74A',52.24053229999999815,21.19307219999999959,61.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jana Pawła II, 128',52.21617909999999796,21.2321667000000005,57.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Armii Krajowej, 14A',52.2506631999999982,21.21797660000000007,34.0,2,26.5);
-INSERT INTO travel_info VALUES('ulica Agatowa, 2',52.22155659999999955,21.2268517999999986,26.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Borkowska, 2A',52.2222654999999989,21.2201884000000014,52.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Błękitna, 11A',52.24804739999999726,21.18671649999999929,35.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Cieplarniana, 36',52.21763289999999814,21.23440420000000017,57.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Jagiellońska, 25',52.23952349999999712,21.18516550000000009,15.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Bartosza Głowackiego, 22',52.25408360000000129,21.21536730000000048,35.0,1,29.0);
-INSERT INTO travel_info VALUES('ulica Diamentowa, 38',52.21746670000000278,21.22740890000000035,60.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Klimatyczna, 24',52.21791730000000342,21.23984550000000126,42.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Hiacyntowa, 68',52.21481920000000087,21.24319510000000121,59.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Sarmacka, 28B',52.15573719999999725,21.08040270000000049,43.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 155B',52.17527940000000086,21.10936759999999879,49.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Żeglarska, 4',52.23959020000000208,21.18675130000000095,64.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 73B',52.16042699999999855,21.12455280000000001,62.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Wschodnia, 39',52.24271410000000059,21.20251229999999864,60.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Europejska, 6',52.1600129999999993,21.0930250000000008,47.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Wiedeńska, 89M',52.14519889999999692,21.08468549999999909,54.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Hoserów, 12',52.14910669999999727,21.13252019999999831,56.0,1,30.0);
-INSERT INTO travel_info VALUES('ulica Grabalówki, 7C',52.14891750000000314,21.12872679999999904,56.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 117N',52.17017249999999962,21.11017770000000126,49.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Europejska, 37',52.15819429999999813,21.09668599999999827,52.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Sążnista, 1D',52.16289629999999989,21.12439720000000065,57.0,1,28.0);
-INSERT INTO travel_info VALUES('ulica Biedronki, 74',52.17420260000000098,21.08746550000000041,51.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Dobrodzieja, 9',52.1322574000000003,21.10898669999999911,57.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Sarmacka, 5K',52.16422250000000104,21.07490669999999966,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Europejska, 121A',52.15387669999999787,21.09335929999999948,45.0,1,22.0);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 4A',52.14392029999999779,21.14331560000000109,58.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Środkowa, 5A',52.2494415000000032,21.18593170000000114,21.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Władysława Broniewskiego, 24A',52.26683179999999851,20.96672810000000097,27.0,0,20.5);
-INSERT INTO travel_info VALUES('ulica Okrąg, 4A',52.22967859999999974,21.03677319999999896,21.0,0,8.0);
-INSERT INTO travel_info VALUES('ulica Józefa Lewartowskiego, 24',52.24901810000000068,20.98848369999999975,18.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Hanki Czaki, 2',52.27093760000000344,20.97571440000000109,19.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Piwna, 3/5',52.24797879999999851,21.01311510000000026,17.0,1,11.5);
-INSERT INTO travel_info VALUES('ulica Leona Schillera, 8',52.24674300000000215,21.00629680000000121,18.0,0,9.5);
-INSERT INTO travel_info VALUES('ulica Nowolipie, 1',52.2454155,20.99877460000000084,11.0,0,11.5);
-INSERT INTO travel_info VALUES('ulica Wspólna, 4',52.22854470000000048,21.01977679999999893,55.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Jasna, 14/16',52.23532300000000105,21.01168380000000013,3.0,0,2.5);
-INSERT INTO travel_info VALUES('ulica Mokotowska, 54',52.2260362000000029,21.02225969999999933,16.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Królewska, 43',52.23754040000000031,21.00511470000000002,7.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Kazimierza Brodzińskiego, 30',52.26539319999999834,20.98165669999999849,22.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Topiel, 6A',52.23790259999999819,21.02633009999999914,14.0,0,6.0);
-INSERT INTO travel_info VALUES('ulica Mokotowska, 57',52.22537940000000133,21.0214938999999994,15.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Mokotowska, 73',52.22764879999999721,21.02232869999999921,15.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Solipska, 21',52.20106690000000071,20.90940039999999911,43.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Noakowskiego, 12',52.2212857000000028,21.01050030000000035,17.0,0,8.0);
-INSERT INTO travel_info VALUES('ulica Senatorska, 27',52.24355030000000255,21.00727829999999941,14.0,0,6.0);
-INSERT INTO travel_info VALUES('ulica Mokotowska, 46A',52.22489780000000081,21.02152159999999981,15.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Mango, 21',52.16763110000000125,21.05946060000000131,42.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Królewicza Jakuba, 43',52.17329519999999832,21.0744574,48.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Rosochata, 11',52.13126419999999684,21.1267429,48.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Warszawska, 42A',52.24457290000000142,21.18577930000000009,42.0,1,30.5);
-INSERT INTO travel_info VALUES('ulica Petyhorska, 17',52.1739367999999999,21.08305710000000133,47.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Warszawska, 106',52.24505609999999934,21.20014000000000109,56.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Syta, 179N',52.18004760000000175,21.09710570000000018,50.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Przekorna, 63A',52.12469140000000322,21.10136089999999954,48.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Zapiecek, 6',52.21830309999999998,21.25192829999999944,66.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Królowej Marysieńki, 3A',52.16822700000000168,21.07856590000000096,39.0,1,20.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 36A',52.15701659999999862,21.12982470000000034,51.0,1,28.5);
-INSERT INTO travel_info VALUES('ulica Wilanowska, 14',52.24350390000000032,21.18212889999999859,21.0,0,8.5);
-INSERT INTO travel_info VALUES('ulica Syta, 108A',52.1678607999999997,21.10795089999999874,49.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Przyczółkowa, 50/52',52.1232929000000027,21.10310499999999934,45.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Opieńki, 6',52.10865069999999833,21.09979290000000062,64.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Przyczółkowa, 126B',52.13180210000000158,21.10279609999999906,50.0,1,24.5);
-INSERT INTO travel_info VALUES('ulica Królewicza Jakuba, 17A',52.17122260000000011,21.07612299999999906,40.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Władysława Lercha, 15',52.1623681000000019,21.11661309999999858,49.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Ponczowa, 13',52.12373529999999989,21.09394989999999836,48.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Królewicza Jakuba, 62',52.17506560000000348,21.07318599999999976,47.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Ponczowa, 9D',52.12303390000000291,21.09357400000000026,48.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Przyczółkowa, 368',52.16127430000000231,21.08659210000000072,41.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Poranek, 11',52.14340709999999746,21.12649340000000108,72.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Królewicza Jakuba, 84A',52.17684009999999973,21.07136489999999896,44.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Rumiana, 65',52.17477639999999895,21.07524099999999833,45.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Bolecha, 80',52.24787119999999874,20.94508420000000015,22.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Obozowa, 74',52.24733040000000272,20.94964530000000024,29.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Antoniego Dobiszewskiego, 3L',52.24551220000000029,20.95497220000000027,28.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Górczewska, 8',52.23698610000000286,20.96962549999999937,20.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Karolkowa, 22/24',52.22783950000000174,20.9789835999999994,15.0,0,10.0);
-INSERT INTO travel_info VALUES('ulica Obozowa, 63/65',52.24715520000000168,20.95394160000000027,27.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Działdowska, 8',52.234892600000002,20.96744759999999986,13.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Jana Olbrachta, 94B',52.2359300000000033,20.92906370000000038,26.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Marcina Kasprzaka, 92',52.22818290000000018,20.95502670000000122,20.0,1,13.5);
-INSERT INTO travel_info VALUES('Plac Zamkowy, 4',52.24774070000000136,21.01413159999999892,15.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Stefana Czarnieckiego, 37',52.26725139999999926,20.99106060000000084,23.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Młynarska, 16',52.23639239999999973,20.97283660000000082,18.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Krakowskie Przedmieście, 33',52.24414019999999681,21.01393039999999957,13.0,1,8.0);
-INSERT INTO travel_info VALUES('ulica Zygmunta Vogla, 26',52.16012340000000335,21.09101400000000126,45.0,1,24.0);
-INSERT INTO travel_info VALUES('ulica Piechoty Łanowej, 51',52.17493710000000106,21.08278079999999832,48.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Jana Olbrachta, 61',52.23395750000000248,20.92426229999999876,25.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Fort Wola, 2',52.2244784000000024,20.92979830000000164,23.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Potułkały, 5',52.11672879999999708,21.09879460000000151,55.0,1,27.5);
-INSERT INTO travel_info VALUES('ulica Stanisława Żółkiewskiego, 24',52.24978740000000243,21.24388099999999823,38.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Złotej Jesieni, 6',52.21904020000000201,21.23168009999999839,60.0,2,28.5);
-INSERT INTO travel_info VALUES('ulica Rumiana, 118',52.17764660000000276,21.07262199999999908,45.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Syta, 179D',52.18036810000000258,21.09781540000000178,50.0,1,22.5);
-INSERT INTO travel_info VALUES('ulica Bruzdowa, 4D',52.14462689999999868,21.14333759999999885,59.0,1,31.0);
-INSERT INTO travel_info VALUES('ulica Rumiana, 1C',52.16904219999999981,21.08117969999999986,44.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Sarmacka, 4B',52.1668141000000034,21.07230380000000025,40.0,1,23.0);
-INSERT INTO travel_info VALUES('ulica Rumiana, 1A',52.1693070999999975,21.0809117999999991,45.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Zielna, 37B',52.23602340000000054,21.00621200000000144,3.0,0,6.5);
-INSERT INTO travel_info VALUES('ulica Przyrynek, 14A',52.25501909999999839,21.00828569999999828,21.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Szczera, 22E',52.20176539999999932,20.91044739999999891,43.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Rybnicka, 71',52.21169679999999858,20.9097009000000007,40.0,2,19.0);
-INSERT INTO travel_info VALUES('ulica Rybnicka, 27',52.20694379999999768,20.9048638000000011,37.0,2,20.0);
-INSERT INTO travel_info VALUES('ulica Rybnicka, 41A',52.20901179999999898,20.90649619999999942,39.0,2,19.5);
-INSERT INTO travel_info VALUES('ulica Sklepowa, 13J',52.2019925000000029,20.91195169999999948,43.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Franciszka Szuberta, 59',52.21034519999999902,20.9017033000000012,49.0,0,21.0);
-INSERT INTO travel_info VALUES('ulica Radarowa, 12',52.19083239999999791,20.96534829999999871,40.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Bieniewicka, 18A',52.27333959999999991,20.97621409999999998,20.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Batalionu AK „Zośka”, 3A',52.23441900000000259,20.94646669999999843,24.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Zakamarek, 36A',52.13407080000000348,21.11425459999999888,53.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 284',52.1302619000000007,21.09451659999999861,42.0,1,25.0);
-INSERT INTO travel_info VALUES('ulica Akurat, 5',52.20002310000000278,20.91566419999999837,41.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Dukatowa, 2',52.20001620000000031,20.92124550000000127,42.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Erazma Ciołka, 26K',52.24510180000000048,20.94497619999999927,25.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Łokciowa, 10',52.16606589999999955,21.1128032999999995,53.0,1,26.0);
-INSERT INTO travel_info VALUES('ulica Batalionu AK „Pięść”, 5D',52.24041189999999802,20.94769970000000114,18.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 214',52.12951069999999732,21.09497629999999902,45.0,1,26.5);
-INSERT INTO travel_info VALUES('ulica Zapłocie, 260',52.1291848999999985,21.0935302,43.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Wiedeńska, 94AL',52.1461749999999995,21.08939780000000041,53.0,1,25.5);
-INSERT INTO travel_info VALUES('ulica Bolesława Chrobrego, 26A',52.20250860000000159,20.91478539999999953,37.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Wiertnicza, 113',52.17490310000000164,21.0772630999999997,42.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Bolesława Chrobrego, 31',52.20101780000000246,20.9148764000000007,35.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Żelazna, 65',52.23507670000000047,20.99032190000000143,16.0,0,8.5);
-INSERT INTO travel_info VALUES('ulica Łowcza, 17A',52.17415909999999713,21.07255560000000116,47.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Latarnika, 46A',52.20982200000000261,20.89909139999999966,43.0,1,21.0);
-INSERT INTO travel_info VALUES('ulica Komitetu Obrony Robotników, 45D',52.18182550000000219,20.96614990000000134,43.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Komitetu Obrony Robotników, 43',52.18298930000000268,20.96886320000000125,43.0,1,18.5);
-INSERT INTO travel_info VALUES('Aleja Krakowska, 235',52.18958839999999811,20.95715810000000089,37.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Leonidasa, 17',52.18207960000000156,20.94569260000000099,51.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Leonidasa, 60',52.18705150000000259,20.94266550000000037,46.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Mikołajska, 42',52.20927420000000296,20.93167980000000127,45.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Jutrzenki, 185A',52.20263460000000321,20.94031640000000038,33.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Leonidasa, 68',52.18744509999999793,20.94306560000000061,45.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Obotrycka, 5',52.18043070000000227,20.93154120000000163,46.0,1,20.0);
-INSERT INTO travel_info VALUES('ulica Płużańska, 28A',52.20771369999999934,20.92410659999999822,39.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Przasnyska, 8',52.26260789999999901,20.96686400000000105,26.0,1,17.5);
-INSERT INTO travel_info VALUES('ulica Nastrojowa, 16',52.20971169999999973,20.91657719999999899,35.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Jutrzenki, 63',52.18447780000000335,20.92364159999999985,34.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Muszkieterów, 74',52.18334080000000341,20.94169679999999901,54.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Komitetu Obrony Robotników, 36',52.18100220000000177,20.97603080000000019,40.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Mikołaja Kopernika, 43',52.23774259999999714,21.01909900000000064,9.0,0,5.0);
-INSERT INTO travel_info VALUES('ulica Przepiórki, 6',52.20377100000000325,20.90271359999999845,42.0,0,20.0);
-INSERT INTO travel_info VALUES('Plac Joachima Lelewela, 4',52.27240969999999721,20.98221669999999861,20.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Malownicza, 28',52.17810370000000119,20.93833000000000055,50.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Cyprysowa, 27',52.18020680000000055,20.94324509999999861,46.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Wyrzyska, 13',52.20653140000000291,20.92809649999999877,37.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Ryżowa, 24E',52.19726070000000106,20.91113010000000116,43.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Ryżowa, 24C',52.19695719999999995,20.91133010000000069,43.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Ryżowa, 24',52.19710039999999652,20.91145720000000096,42.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Świetlana, 9',52.21006609999999882,20.90621300000000104,38.0,0,19.5);
-INSERT INTO travel_info VALUES('ulica Antonia Corazziego, 7',52.24352919999999756,21.00339209999999924,10.0,0,7.0);
-INSERT INTO travel_info VALUES('ulica Słowicza, 13A',52.19072640000000262,20.96421020000000012,42.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Żwirki i Wigury, 1',52.17232949999999648,20.97238820000000103,43.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Syreny, 35',52.24147880000000299,20.96064369999999854,19.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Tunelowa, 10AB',52.22060280000000176,20.96208490000000068,18.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Władysława Przanowskiego, 24',52.23863159999999795,20.93358089999999905,20.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Zbocze, 6',52.20194099999999793,20.92519920000000156,36.0,0,16.5);
-INSERT INTO travel_info VALUES('ulica Cyprysowa, 7',52.17963910000000282,20.94592300000000051,15.0,1,5.0);
-INSERT INTO travel_info VALUES('ulica Wszemirowska, 6',52.20443259999999697,20.89862529999999908,39.0,0,20.5);
-INSERT INTO travel_info VALUES('Aleja Prymasa Tysiąclecia, 78B',52.24263959999999685,20.95827630000000142,22.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Dziupli, 30',52.2079736999999966,20.92852080000000114,42.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Cyprysowa, 48',52.18103020000000213,20.94047399999999825,50.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Chmielna, 30',52.23210310000000333,21.01297690000000174,9.0,0,4.0);
-INSERT INTO travel_info VALUES('ulica Chmielna, 35',52.23172939999999898,21.01192029999999989,5.0,0,1.0);
-INSERT INTO travel_info VALUES('ulica Łamana, 14',52.20490589999999998,20.91435829999999996,36.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Ulrychowska, 30',52.24075690000000093,20.93912630000000164,19.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Zawiszy, 5',52.24320860000000266,20.96367310000000117,22.0,0,17.5);
-INSERT INTO travel_info VALUES('ulica Wincentego Pola, 15',52.23182460000000304,20.92276199999999875,24.0,1,19.0);
-INSERT INTO travel_info VALUES('Aleja „Solidarności”, 169',52.23595490000000296,20.97980700000000098,14.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica 1 Sierpnia, 6',52.19107549999999663,20.98332549999999941,31.0,1,16.0);
-INSERT INTO travel_info VALUES('ulica Szarych Szeregów, 5CD',52.22666790000000247,20.97534269999999879,19.0,0,11.0);
-INSERT INTO travel_info VALUES('ulica Redutowa, 30',52.23188170000000241,20.9422965000000012,20.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Szlenkierów, 22/28',52.23998389999999859,20.96972609999999904,23.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Tylna, 5B',52.22902280000000274,20.95510639999999824,17.0,1,15.5);
-INSERT INTO travel_info VALUES('ulica Skierniewicka, 34',52.23279939999999755,20.96875830000000107,12.0,0,12.5);
-INSERT INTO travel_info VALUES('ulica Sokołowska, 5BE',52.23363049999999675,20.95952159999999864,15.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Wincentego Pola, 32A',52.23345520000000163,20.92374609999999891,25.0,1,19.5);
-INSERT INTO travel_info VALUES('ulica Kaniowska, 66',52.26795280000000332,20.99585629999999981,27.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Łopuszańska, 106',52.1958322999999993,20.93215359999999948,37.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Franciszkańska, 1',52.25337069999999784,21.00650710000000032,20.0,0,13.5);
-INSERT INTO travel_info VALUES('ulica Czerniakowska, 201A',52.22618880000000274,21.0380110000000009,19.0,0,9.0);
-INSERT INTO travel_info VALUES('ulica Górnośląska, 13',52.22525089999999893,21.03809689999999933,19.0,0,8.5);
-INSERT INTO travel_info VALUES('ulica Juliana Bartoszewicza, 1A',52.23765070000000321,21.0225434,12.0,0,6.0);
-INSERT INTO travel_info VALUES('ulica Poli Gojawiczyńskiej, 13',52.26861819999999881,20.97002970000000133,22.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Poli Gojawiczyńskiej, 11',52.26852079999999746,20.97061330000000012,23.0,0,18.5);
-INSERT INTO travel_info VALUES('ulica Dzika, 15',52.25310569999999899,20.98611800000000116,17.0,1,12.5);
-INSERT INTO travel_info VALUES('ulica Żegoty, 7',52.18185439999999887,20.94435169999999857,50.0,1,19.0);
-INSERT INTO travel_info VALUES('ulica Sierpecka, 6',52.26985379999999993,20.97872269999999873,19.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Marii Kazimiery, 29',52.27725790000000216,20.97789819999999849,22.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Władysława Niegolewskiego, 21/3',52.26570470000000057,20.98211810000000099,22.0,0,16.0);
-INSERT INTO travel_info VALUES('ulica Marii Kazimiery, 20',52.27556549999999902,20.9783785000000016,25.0,0,17.0);
-INSERT INTO travel_info VALUES('Plac Słoneczny, 1',52.26958710000000252,20.99311589999999939,24.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Zodiakalna, 22',52.21219740000000086,20.91133359999999897,34.0,2,19.0);
-INSERT INTO travel_info VALUES('ulica Gwiaździsta, 5D',52.27664990000000244,20.98990189999999956,26.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Stanisława Dygata, 6',52.25473949999999946,20.96609339999999832,21.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Śmiała, 61',52.26749290000000058,20.99316490000000001,25.0,0,14.5);
-INSERT INTO travel_info VALUES('ulica Śmiała, 35',52.2651015000000001,20.99259650000000121,19.0,1,14.0);
-INSERT INTO travel_info VALUES('ulica Franciszka Rymkiewicza, 9',52.27552879999999647,20.97688109999999995,24.0,0,17.0);
-INSERT INTO travel_info VALUES('ulica Brzozowa, 1/3',52.24991909999999962,21.01368499999999884,19.0,1,10.5);
-INSERT INTO travel_info VALUES('ulica Zygmunta Krasińskiego, 67A',52.2594341,20.9644079000000012,28.0,1,17.0);
-INSERT INTO travel_info VALUES('ulica Zodiakalna, 2',52.21254760000000061,20.91211170000000052,33.0,2,19.0);
-INSERT INTO travel_info VALUES('ulica Bednarska, 24',52.24505080000000134,21.01661560000000151,16.0,1,9.5);
-INSERT INTO travel_info VALUES('ulica Komitetu Obrony Robotników, 57',52.18502970000000118,20.95690709999999867,43.0,1,18.5);
-INSERT INTO travel_info VALUES('ulica Stefana Pogonowskiego, 32',52.26725059999999701,20.98621800000000092,18.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Dziennikarska, 13',52.27129870000000266,20.98972039999999951,21.0,0,15.5);
-INSERT INTO travel_info VALUES('ulica Rydygiera 10',52.25943680000000313,20.97949759999999841,23.0,1,18.0);
-INSERT INTO travel_info VALUES('ulica Szulborska 6',52.2312749000000025,20.93604119999999824,25.0,1,27.0);
-INSERT INTO travel_info VALUES('ulica Jana Kazimierza 66',52.22154419999999675,20.93006859999999846,20.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Jana Kazimierza 31',52.2234847000000002,20.94215750000000042,24.0,1,23.5);
-INSERT INTO travel_info VALUES('ulica Zajączka 7',52.26109329999999887,20.99207619999999964,15.0,0,15.0);
-INSERT INTO travel_info VALUES('ulica Inflancka, 4',52.2559681999999981,20.99217760000000155,13.0,0,14.0);
-INSERT INTO travel_info VALUES('ulica Dymińska, 4',52.24785949999999702,20.98052279999999926,13.0,0,18.0);
-INSERT INTO travel_info VALUES('ulica Alojzego Felińskiego, 15',52.25013400000000274,20.97772959999999998,18.0,0,16.0);
-COMMIT;
@@ -0,0 +1,30 @@
+import numpy as np
+
+from palettes import duration_rgb
+
+
+def idw_values(index, values, latitudes, longitudes, radius_m=1000, power=2, chunk_size=4096):
+    """
+    Inverse-distance weighted average of `values` (one per point of the GridIndex `index`) within `radius_m`
+    meters of every query point, NaN where no sample is in range.
+    Queries are paired with their samples `chunk_size` at a time, which bounds memory in dense areas.
+    """
+    surface = np.full(len(latitudes), np.nan)
+    for start in range(0, len(latitudes), chunk_size):
+        end = min(start + chunk_size, len(latitudes))
+        cells, samples, distances = index.pairs_within(latitudes[start:end], longitudes[start:end], radius_m)
+        # Samples closer than a meter would dominate anyway, the floor only avoids division by zero
+        weights = 1.0 / np.maximum(distances, 1.0) ** power
+        weighted = np.bincount(cells, weights * values[samples], minlength=end - start)
+        total = np.bincount(cells, weights, minlength=end - start)
+        covered = total > 0
+        surface[start:end][covered] = weighted[covered] / total[covered]
+    return surface
+
+
+def surface_rgba(surface, alpha=255, rgb=duration_rgb):
+    """Colors a surface with a palette (travel times by default), leaving cells without data transparent"""
+    rgba = np.zeros(surface.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = rgb(surface)
+    rgba[..., 3] = np.where(np.isnan(surface), 0, alpha)
+    return rgba